@@ -9,8 +9,11 @@ use crate::randomized::randomized::{
     ensemble_cell_rust,
     hamming_distance_rust,
     purity_cell_rust,
+    echo_cell_rust,
+    overlap_echo_core_rust,
 };
 use crate::randomized::construct::{ cycling_slice_rust, qubit_selector_rust };
+use crate::randomized::packed::{ entangled_entropy_core_packed_rust, purity_cell_packed_rust };
 
 #[pymodule]
 fn boorust(py: Python<'_>, m: &PyModule) -> PyResult<()> {
@@ -24,6 +27,10 @@ fn register_child_module(py: Python<'_>, parent_module: &PyModule) -> PyResult<(
     randomized.add_function(wrap_pyfunction!(ensemble_cell_rust, randomized)?)?;
     randomized.add_function(wrap_pyfunction!(hamming_distance_rust, randomized)?)?;
     randomized.add_function(wrap_pyfunction!(purity_cell_rust, randomized)?)?;
+    randomized.add_function(wrap_pyfunction!(echo_cell_rust, randomized)?)?;
+    randomized.add_function(wrap_pyfunction!(overlap_echo_core_rust, randomized)?)?;
+    randomized.add_function(wrap_pyfunction!(entangled_entropy_core_packed_rust, randomized)?)?;
+    randomized.add_function(wrap_pyfunction!(purity_cell_packed_rust, randomized)?)?;
 
     let construct = PyModule::new(py, "construct")?;
     construct.add_function(wrap_pyfunction!(qubit_selector_rust, construct)?)?;
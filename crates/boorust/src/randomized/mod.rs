@@ -1,2 +1,3 @@
 pub(crate) mod randomized;
-pub(crate) mod construct;
\ No newline at end of file
+pub(crate) mod construct;
+pub(crate) mod packed;
\ No newline at end of file
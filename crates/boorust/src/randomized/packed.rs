@@ -0,0 +1,186 @@
+extern crate pyo3;
+extern crate rayon;
+
+use pyo3::prelude::*;
+use pyo3::buffer::{ PyBuffer, Element };
+use pyo3::exceptions::PyValueError;
+use rayon::prelude::*;
+use std::collections::HashMap;
+use std::time::Instant;
+
+use crate::randomized::construct::{ qubit_selector_rust, QubitDegree };
+use crate::randomized::randomized::bitstring_range_rust;
+
+fn buffer_slice<'a, T: Element>(buffer: &'a PyBuffer<T>, name: &str) -> PyResult<&'a [T]> {
+    // The buffer protocol is read without copying,
+    // the exporter like NumPy array is kept alive by the buffer while the slice is borrowed.
+    if !buffer.is_c_contiguous() {
+        return Err(PyValueError::new_err(format!("'{}' should be C-contiguous.", name)));
+    }
+    if buffer.item_count() == 0 {
+        return Ok(&[]);
+    }
+    Ok(unsafe { std::slice::from_raw_parts(buffer.buf_ptr() as *const T, buffer.item_count()) })
+}
+
+fn bit_mask(length: i32) -> u64 {
+    if length >= 64 { u64::MAX } else { (1u64 << length) - 1 }
+}
+
+pub fn slice_packed_rust(outcome: u64, num_bits: i32, start: i32, end: i32) -> u64 {
+    // The same as `slice_packed_bitstrings` in `qurry.process.utils.counts`,
+    // the first character of a bitstring is the highest bit of its integer.
+    if start < 0 && 0 <= end {
+        let tail: u64 = outcome & bit_mask(-start);
+        let head: u64 = if end > 0 {
+            outcome.checked_shr((num_bits - end) as u32).unwrap_or(0)
+        } else {
+            0
+        };
+        return tail.checked_shl(end as u32).unwrap_or(0) | head;
+    }
+
+    let normalize = |i: i32| -> i32 { (if i < 0 { i + num_bits } else { i }).clamp(0, num_bits) };
+    let (start, end) = (normalize(start), normalize(end));
+    let length: i32 = (end - start).max(0);
+    outcome.checked_shr((num_bits - end) as u32).unwrap_or(0) & bit_mask(length)
+}
+
+pub fn purity_cell_packed_core(
+    outcomes: &[u64],
+    values: &[i64],
+    num_bits: i32,
+    bit_string_range: (i32, i32),
+    subsystem_size: i32
+) -> f64 {
+    let shots: i64 = values.iter().sum();
+    let mut single_counts_under_degree: HashMap<u64, i64> = HashMap::new();
+    for (outcome, count) in outcomes.iter().zip(values.iter()) {
+        let key = slice_packed_rust(*outcome, num_bits, bit_string_range.0, bit_string_range.1);
+        *single_counts_under_degree.entry(key).or_insert(0) += count;
+    }
+
+    let probs: Vec<(u64, f64)> = single_counts_under_degree
+        .iter()
+        .map(|(outcome, count)| (*outcome, (*count as f64) / (shots as f64)))
+        .collect();
+    let mut purity_cell: f64 = 0.0;
+    for (s_ai, p_ai) in probs.iter() {
+        for (s_aj, p_aj) in probs.iter() {
+            let diff: i32 = (s_ai ^ s_aj).count_ones() as i32;
+            purity_cell += f64::powi(2.0, subsystem_size) * f64::powi(-2.0, -diff) * p_ai * p_aj;
+        }
+    }
+    purity_cell
+}
+
+#[pyfunction]
+pub fn purity_cell_packed_rust(
+    py: Python<'_>,
+    idx: i32,
+    outcomes: PyBuffer<u64>,
+    values: PyBuffer<i64>,
+    num_bits: i32,
+    bit_string_range: (i32, i32),
+    subsystem_size: i32
+) -> PyResult<(i32, f64)> {
+    let outcomes: &[u64] = buffer_slice(&outcomes, "outcomes")?;
+    let values: &[i64] = buffer_slice(&values, "values")?;
+    if outcomes.len() != values.len() {
+        return Err(
+            PyValueError::new_err(
+                format!(
+                    "The length of outcomes {} does not match the length of values {}.",
+                    outcomes.len(),
+                    values.len()
+                )
+            )
+        );
+    }
+
+    let purity_cell: f64 = py.allow_threads(|| {
+        purity_cell_packed_core(outcomes, values, num_bits, bit_string_range, subsystem_size)
+    });
+    Ok((idx, purity_cell))
+}
+
+#[allow(dead_code)]
+#[pyfunction]
+pub fn entangled_entropy_core_packed_rust(
+    py: Python<'_>,
+    shots: i64,
+    outcomes: PyBuffer<u64>,
+    values: PyBuffer<i64>,
+    offsets: PyBuffer<i64>,
+    num_bits: i32,
+    degree: Option<QubitDegree>,
+    measure: Option<(i32, i32)>
+) -> PyResult<(HashMap<i32, f64>, (i32, i32), (i32, i32), &'static str, f64)> {
+    let outcomes: &[u64] = buffer_slice(&outcomes, "outcomes")?;
+    let values: &[i64] = buffer_slice(&values, "values")?;
+    let offsets: &[i64] = buffer_slice(&offsets, "offsets")?;
+    if outcomes.len() != values.len() {
+        return Err(
+            PyValueError::new_err(
+                format!(
+                    "The length of outcomes {} does not match the length of values {}.",
+                    outcomes.len(),
+                    values.len()
+                )
+            )
+        );
+    }
+    if
+        offsets.len() < 2 ||
+        offsets[0] != 0 ||
+        offsets[offsets.len() - 1] != (outcomes.len() as i64) ||
+        offsets.windows(2).any(|w| w[0] > w[1])
+    {
+        return Err(
+            PyValueError::new_err(
+                "The offsets should be increasing from 0 to the length of outcomes."
+            )
+        );
+    }
+
+    // check if the sum of shots is equal to the sum of all counts
+    let sample_shots: i64 = values[offsets[0] as usize..offsets[1] as usize].iter().sum();
+    assert!(shots == sample_shots, "shots {} does not match sample_shots {}", shots, sample_shots);
+
+    let bitstring_range: (i32, i32) = bitstring_range_rust(num_bits, degree)?;
+    let subsystems_size: i32 = bitstring_range.1 - bitstring_range.0;
+
+    let actual_measure: (i32, i32) = match measure {
+        Some(m) => m,
+        None =>
+            qubit_selector_rust(
+                num_bits,
+                Some(QubitDegree::Pair(bitstring_range.0, bitstring_range.1))
+            )?,
+    };
+
+    let begin: Instant = Instant::now();
+
+    let result_vec: Vec<(i32, f64)> = py.allow_threads(|| {
+        offsets
+            .par_windows(2)
+            .enumerate()
+            .map(|(identifier, window)| {
+                let (start, end) = (window[0] as usize, window[1] as usize);
+                let purity_cell: f64 = purity_cell_packed_core(
+                    &outcomes[start..end],
+                    &values[start..end],
+                    num_bits,
+                    bitstring_range,
+                    subsystems_size
+                );
+                (identifier as i32, purity_cell)
+            })
+            .collect()
+    });
+    let purity_loader: HashMap<i32, f64> = result_vec.into_iter().collect();
+
+    let duration: f64 = begin.elapsed().as_secs_f64() as f64;
+
+    Ok((purity_loader, bitstring_range, actual_measure, "", duration))
+}
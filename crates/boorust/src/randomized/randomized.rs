@@ -3,6 +3,7 @@ extern crate rayon;
 
 use std::panic;
 use pyo3::prelude::*;
+use pyo3::exceptions::PyValueError;
 use rayon::prelude::*;
 use rayon::iter::IntoParallelRefIterator;
 use std::collections::HashMap;
@@ -89,28 +90,13 @@ pub fn purity_cell_rust(
     (idx, purity_cell)
 }
 
-#[allow(dead_code)]
-#[pyfunction]
-pub fn entangled_entropy_core_rust(
-    shots: i32,
-    counts: Vec<HashMap<String, i32>>,
-    degree: Option<QubitDegree>,
-    measure: Option<(i32, i32)>
-) -> (HashMap<i32, f64>, (i32, i32), (i32, i32), &'static str, f64) {
-    // check if the sum of shots is equal to the sum of all counts
-    let sample_shots: i32 = counts[0].values().sum();
-    assert!(shots == sample_shots);
-
-    // Determine the size of the allsystems
-    let allsystems_size: i32 = counts[0].keys().next().unwrap().len() as i32;
+pub fn bitstring_range_rust(
+    allsystems_size: i32,
+    degree: Option<QubitDegree>
+) -> PyResult<(i32, i32)> {
+    let bitstring_range: (i32, i32) = qubit_selector_rust(allsystems_size, degree)?;
 
-    // Determine degree
-    let actual_deg: (i32, i32) = qubit_selector_rust(allsystems_size, degree).unwrap();
-    let subsystems_size: i32 = actual_deg.1 - actual_deg.0;
-
-    let bitstring_range: (i32, i32) = actual_deg.clone();
-
-    // Check if the bitstring_range is valid and panic if not
+    // Check if the bitstring_range is valid
     let mut bitstring_check: HashMap<&str, bool> = HashMap::new();
     bitstring_check.insert("b > a", bitstring_range.1 > bitstring_range.0);
     bitstring_check.insert("a >= -allsystemSize", bitstring_range.0 >= -allsystems_size);
@@ -132,8 +118,34 @@ pub fn entangled_entropy_core_rust(
         .collect();
     error_message.push_str(&invalid_ranges.join(";"));
     if !bitstring_check.values().all(|&value: &bool| value) {
-        panic!("{}", error_message);
+        return Err(PyValueError::new_err(error_message));
     }
+    Ok(bitstring_range)
+}
+
+#[allow(dead_code)]
+#[pyfunction]
+pub fn entangled_entropy_core_rust(
+    py: Python<'_>,
+    shots: i32,
+    counts: Vec<HashMap<String, i32>>,
+    degree: Option<QubitDegree>,
+    measure: Option<(i32, i32)>
+) -> (HashMap<i32, f64>, (i32, i32), (i32, i32), &'static str, f64) {
+    // check if the sum of shots is equal to the sum of all counts
+    let sample_shots: i32 = counts[0].values().sum();
+    assert!(shots == sample_shots);
+
+    // Determine the size of the allsystems
+    let allsystems_size: i32 = counts[0].keys().next().unwrap().len() as i32;
+
+    // Determine degree
+    let bitstring_range: (i32, i32) = match bitstring_range_rust(allsystems_size, degree) {
+        Ok(val) => val,
+        Err(e) => panic!("Error: {}", e),
+    };
+    let subsystems_size: i32 = bitstring_range.1 - bitstring_range.0;
+    let actual_deg: (i32, i32) = bitstring_range.clone();
 
     let actual_measure: (i32, i32) = match measure {
         Some(m) => {
@@ -155,27 +167,170 @@ pub fn entangled_entropy_core_rust(
     let begin: Instant = Instant::now();
 
     let mut purity_loader_2: HashMap<i32, f64> = HashMap::new();
-    let result_vec = counts
+    // The counts are already converted, so the GIL is released during the computation.
+    let result_vec: Vec<(i32, f64)> = py.allow_threads(|| {
+        counts
+            .par_iter()
+            .enumerate()
+            .map(|(identifier, data)| {
+                let result: (i32, f64) = purity_cell_rust(
+                    identifier as i32,
+                    data.clone(),
+                    bitstring_range,
+                    subsystems_size
+                );
+                // println!("| purity_cell: {:?} {}", result, subsystems_size);
+                result
+            })
+            .collect()
+    });
+    result_vec
+        .iter()
+        .for_each(|(idx, purity_cell)| {
+            purity_loader_2.insert(*idx, *purity_cell);
+        });
+
+    let duration_2: f64 = begin.elapsed().as_secs_f64() as f64;
+
+    (purity_loader_2, bitstring_range, actual_measure, "", duration_2)
+}
+
+fn counts_under_degree_rust(
+    single_counts: &HashMap<String, i32>,
+    bit_string_range: (i32, i32)
+) -> HashMap<String, i32> {
+    let mut single_counts_under_degree: HashMap<String, i32> = HashMap::new();
+    for (bit_string, count) in single_counts {
+        let substring: String = if 0 <= bit_string_range.0 && 0 <= bit_string_range.1 {
+            bit_string[bit_string_range.0 as usize..bit_string_range.1 as usize].to_string()
+        } else {
+            match cycling_slice_rust(&bit_string, bit_string_range.0, bit_string_range.1, 1) {
+                Ok(string) => string,
+                Err(err) => { panic!("Error: {}", err) }
+            }
+        };
+        let entry = single_counts_under_degree.entry(substring).or_insert(0);
+        *entry += count;
+    }
+    single_counts_under_degree
+}
+
+fn echo_cell_core_rust(
+    first_counts: &HashMap<String, i32>,
+    second_counts: &HashMap<String, i32>,
+    bit_string_range: (i32, i32),
+    subsystem_size: i32
+) -> f64 {
+    let shots: i32 = first_counts.values().sum();
+    let shots2: i32 = second_counts.values().sum();
+    assert!(shots == shots2, "shots {} does not match shots2 {}", shots, shots2);
+
+    let first_counts_under_degree = counts_under_degree_rust(first_counts, bit_string_range);
+    let second_counts_under_degree = counts_under_degree_rust(second_counts, bit_string_range);
+
+    let mut echo_cell: f64 = 0.0;
+    for (s_i, s_i_meas) in first_counts_under_degree.iter() {
+        for (s_j, s_j_meas) in second_counts_under_degree.iter() {
+            echo_cell += ensemble_cell_rust(
+                s_i,
+                *s_i_meas,
+                s_j,
+                *s_j_meas,
+                subsystem_size,
+                shots
+            );
+        }
+    }
+    echo_cell
+}
+
+#[pyfunction]
+pub fn echo_cell_rust(
+    idx: i32,
+    first_counts: HashMap<String, i32>,
+    second_counts: HashMap<String, i32>,
+    bit_string_range: (i32, i32),
+    subsystem_size: i32
+) -> (i32, f64) {
+    (idx, echo_cell_core_rust(&first_counts, &second_counts, bit_string_range, subsystem_size))
+}
+
+#[allow(dead_code)]
+#[pyfunction]
+pub fn overlap_echo_core_rust(
+    shots: i32,
+    counts: Vec<HashMap<String, i32>>,
+    degree: Option<QubitDegree>,
+    measure: Option<(i32, i32)>
+) -> (HashMap<i32, f64>, (i32, i32), (i32, i32), &'static str, f64) {
+    // check if the sum of shots is equal to the sum of all counts
+    let sample_shots: i32 = counts[0].values().sum();
+    assert!(shots == sample_shots);
+
+    // Determine the size of the allsystems
+    let allsystems_size: i32 = counts[0].keys().next().unwrap().len() as i32;
+
+    // Determine degree, the pair of degree is taken as it is
+    let actual_deg: (i32, i32) = match degree {
+        Some(QubitDegree::Pair(a, b)) => (a.min(b), a.max(b)),
+        other => {
+            match qubit_selector_rust(allsystems_size, other) {
+                Ok(val) => val,
+                Err(e) => panic!("Error: {}", e),
+            }
+        }
+    };
+    let subsystems_size: i32 = actual_deg.1 - actual_deg.0;
+
+    let actual_measure: (i32, i32) = match measure {
+        Some(m) => m,
+        None => {
+            match qubit_selector_rust(allsystems_size, None) {
+                Ok(val) => val,
+                Err(e) => panic!("Error: {}", e),
+            }
+        }
+    };
+    if actual_deg.0 < actual_measure.0 || actual_deg.1 > actual_measure.1 {
+        panic!(
+            "Measure range '{:?}' does not contain subsystem '{:?}'.",
+            actual_measure,
+            actual_deg
+        );
+    }
+
+    let bitstring_range: (i32, i32) = (
+        actual_deg.0 - actual_measure.0,
+        actual_deg.1 - actual_measure.0,
+    );
+
+    assert!(counts.len() % 2 == 0, "counts {} is not even.", counts.len());
+    let times: usize = counts.len() / 2;
+
+    let begin: Instant = Instant::now();
+
+    let mut echo_loader: HashMap<i32, f64> = HashMap::new();
+    let result_vec = counts[..times]
         .par_iter()
+        .zip(counts[times..].par_iter())
         .enumerate()
-        .map(|(identifier, data)| {
-            let result: (i32, f64) = purity_cell_rust(
-                identifier as i32,
-                data.clone(),
+        .map(|(identifier, (first_counts, second_counts))| {
+            let echo_cell: f64 = echo_cell_core_rust(
+                first_counts,
+                second_counts,
                 bitstring_range,
                 subsystems_size
             );
-            // println!("| purity_cell: {:?} {}", result, subsystems_size);
-            result
+            (identifier as i32, echo_cell)
         });
     result_vec
         .collect::<Vec<(i32, f64)>>()
         .iter()
-        .for_each(|(idx, purity_cell)| {
-            purity_loader_2.insert(*idx, *purity_cell);
+        .for_each(|(idx, echo_cell)| {
+            echo_loader.insert(*idx, *echo_cell);
         });
 
-    let duration_2: f64 = begin.elapsed().as_secs_f64() as f64;
+    let duration: f64 = begin.elapsed().as_secs_f64() as f64;
 
-    (purity_loader_2, bitstring_range, actual_measure, "", duration_2)
+    (echo_loader, bitstring_range, actual_measure, "", duration)
 }
@@ -6,6 +6,8 @@ Randomized in Cython
 
 """
 
+import numpy as np
+
 # pylint: disable=invalid-name, missing-function-docstring, unused-argument
 def ensembleCell(
     sAi: str,
@@ -32,5 +34,19 @@ def echoCellCore(
     bitStringRange: tuple[int, int],
     subsystemSize: int,
 ) -> float: ...
+def purityCellsPacked(
+    outcomes: np.ndarray,
+    values: np.ndarray,
+    offsets: np.ndarray,
+    subsystemSize: int,
+    result: np.ndarray,
+) -> None: ...
+def echoCellsPacked(
+    outcomes: np.ndarray,
+    values: np.ndarray,
+    offsets: np.ndarray,
+    subsystemSize: int,
+    result: np.ndarray,
+) -> None: ...
 
 # pylint: enable=invalid-name, missing-function-docstring, unused-argument
@@ -1,4 +1,7 @@
+cimport cython
+from cython.parallel cimport prange
 from libc.math cimport pow
+from libc.stdint cimport uint64_t, int64_t
 
 cpdef double ensembleCell(
     str sAi,
@@ -101,4 +104,104 @@ cpdef double echoCellCore(
             echoCell += ensembleCell(
                 sAi, sAiMeas, sAj, sAjMeas, subsystemSize, shots)
 
-    return echoCell
\ No newline at end of file
+    return echoCell
+
+
+cdef inline int popcount64(uint64_t x) noexcept nogil:
+    x = x - ((x >> 1) & 0x5555555555555555ULL)
+    x = (x & 0x3333333333333333ULL) + ((x >> 2) & 0x3333333333333333ULL)
+    x = (x + (x >> 4)) & 0x0F0F0F0F0F0F0F0FULL
+    return <int>((x * 0x0101010101010101ULL) >> 56)
+
+cdef void ensembleWeights(int aNum, double* weights) noexcept nogil:
+    cdef int diff
+    for diff in range(65):
+        weights[diff] = pow(2, aNum) * pow(-0.5, diff)
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef double ensembleSumPacked(
+    const uint64_t[::1] outcomes,
+    const int64_t[::1] values,
+    Py_ssize_t firstBegin,
+    Py_ssize_t firstEnd,
+    Py_ssize_t secondBegin,
+    Py_ssize_t secondEnd,
+    const double* weights,
+) noexcept nogil:
+    """Sum the ensemble cells of all pairs between two integer-encoded counts.
+    """
+    cdef Py_ssize_t i, j
+    cdef double firstShots = 0.0
+    cdef double secondShots = 0.0
+    cdef double partial
+    cdef double total = 0.0
+
+    for i in range(firstBegin, firstEnd):
+        firstShots += values[i]
+    for j in range(secondBegin, secondEnd):
+        secondShots += values[j]
+
+    for i in range(firstBegin, firstEnd):
+        partial = 0.0
+        for j in range(secondBegin, secondEnd):
+            partial += weights[popcount64(outcomes[i] ^ outcomes[j])] * values[j]
+        total += partial * values[i]
+
+    return total / (firstShots * secondShots)
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def purityCellsPacked(
+    const uint64_t[::1] outcomes,
+    const int64_t[::1] values,
+    const int64_t[::1] offsets,
+    int subsystemSize,
+    double[::1] result,
+):
+    """Calculate the purity cells of the marginal integer-encoded counts into `result`,
+    the counts of index `i` is in `[offsets[i], offsets[i+1])` of `outcomes` and `values`.
+    The cells are calculated without GIL in parallel by OpenMP.
+    """
+    cdef Py_ssize_t numCells = offsets.shape[0] - 1
+    cdef Py_ssize_t idx
+    cdef double weights[65]
+    assert result.shape[0] >= numCells, "result is shorter than the number of counts."
+    ensembleWeights(subsystemSize, weights)
+
+    with nogil:
+        for idx in prange(numCells, schedule="dynamic"):
+            result[idx] = ensembleSumPacked(
+                outcomes, values,
+                offsets[idx], offsets[idx + 1],
+                offsets[idx], offsets[idx + 1],
+                weights,
+            )
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def echoCellsPacked(
+    const uint64_t[::1] outcomes,
+    const int64_t[::1] values,
+    const int64_t[::1] offsets,
+    int subsystemSize,
+    double[::1] result,
+):
+    """Calculate the echo cells of the marginal integer-encoded counts into `result`,
+    the counts of the first half are paired with the counts of the second half in order.
+    The cells are calculated without GIL in parallel by OpenMP.
+    """
+    cdef Py_ssize_t times = (offsets.shape[0] - 1) // 2
+    cdef Py_ssize_t idx
+    cdef double weights[65]
+    assert result.shape[0] >= times, "result is shorter than the number of pairs."
+    ensembleWeights(subsystemSize, weights)
+
+    with nogil:
+        for idx in prange(times, schedule="dynamic"):
+            result[idx] = ensembleSumPacked(
+                outcomes, values,
+                offsets[idx], offsets[idx + 1],
+                offsets[idx + times], offsets[idx + times + 1],
+                weights,
+            )
@@ -100,3 +100,7 @@ class QurryDummyRunnerWarning(QurryWarning):
 
 class QurryHashIDInvalid(QurryWarning):
     """Hash ID invalid warning."""
+
+
+class QurryStatevectorReuseUnavailable(QurryWarning):
+    """The statevector reuse is unavailable, the circuits are executed on backend instead."""
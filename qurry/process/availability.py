@@ -7,7 +7,7 @@ Availability for the post-processing module.
 
 from typing import Union, Literal, Optional, Callable
 
-PostProcessingBackendLabel = Literal["Cython", "Rust", "Python"]
+PostProcessingBackendLabel = Literal["Cython", "Rust", "NumPy", "Python", "Histogram"]
 """The backend label for post-processing."""
 
 
@@ -47,11 +47,14 @@ def availablility(
 
 default_postprocessing_backend: Callable[[bool, bool], PostProcessingBackendLabel] = (
     lambda rust_available=False, cython_available=False: (
-        "Rust" if rust_available else "Cython" if cython_available else "Python"
+        "Rust" if rust_available else "Cython" if cython_available else "NumPy"
     )
 )
 """Return the default post-processing backend.
 
+The vectorized NumPy backend is chosen ahead of pure Python,
+so it should only be used by the modules which declare the NumPy backend.
+
 Args:
     rust_available (bool): Rust availability.
     cython_available (bool): Cython availability.
@@ -0,0 +1,127 @@
+"""
+================================================================
+Postprocessing - Exact Purity
+(:mod:`qurry.process.exact_purity`)
+================================================================
+
+The exact purity of the subsystem of a pure state,
+which is the reference of the purity estimated by randomized measurement.
+
+"""
+
+import time
+from typing import Union, Optional, TypedDict
+import numpy as np
+
+from .randomized_measure.entropy_core import bitstring_range_check
+
+
+class ExactEntangledEntropy(TypedDict):
+    """The exact purity and entropy of the subsystem."""
+
+    purity: float
+    entropy: float
+    bitStringRange: tuple[int, int]
+    subsystem: tuple[int, ...]
+    measureActually: tuple[int, int]
+    takingTime: float
+
+
+def partial_trace_purity(
+    state: np.ndarray,
+    subsystem: Union[tuple[int, int], list[int]],
+) -> float:
+    """Calculate the purity Tr(rho_A^2) of the subsystem of a pure state by partial trace.
+
+    The statevector is reshaped into the matrix between the subsystem and its complement
+    without copying more than one statevector,
+    then the smaller side of both is contracted,
+    since the purities of both sides of a pure state are equal.
+    So the memory is O(2^n) instead of O(4^n) for the density matrix.
+
+    Args:
+        state (np.ndarray): The statevector in the little-endian order of Qiskit.
+        subsystem (Union[tuple[int, int], list[int]]):
+            The qubit range `[a, b)` of the subsystem, or the list of its qubits.
+
+    Returns:
+        float: The purity of the subsystem.
+    """
+    num_qubits = int(state.size).bit_length() - 1
+    assert 2**num_qubits == state.size, f"The size of statevector {state.size} is invalid."
+    if isinstance(subsystem, tuple):
+        subsystem = list(range(*subsystem))
+    subsystem = sorted(q % num_qubits for q in subsystem)
+    complement = [q for q in range(num_qubits) if q not in subsystem]
+    if len(subsystem) == 0 or len(complement) == 0:
+        return 1.0
+
+    # The first axis of C-order is the most significant qubit.
+    axes = [num_qubits - 1 - q for q in subsystem + complement]
+    psi = np.transpose(np.asarray(state).reshape((2,) * num_qubits), axes).reshape(
+        2 ** len(subsystem), 2 ** len(complement)
+    )
+    if psi.shape[0] <= psi.shape[1]:
+        reduced = psi @ psi.conj().T
+    else:
+        reduced = psi.conj().T @ psi
+    return float(np.sum(np.abs(reduced) ** 2) / np.abs(np.trace(reduced)) ** 2)
+
+
+def bitstring_range_qubits(
+    bitstring_range: tuple[int, int],
+    measure: tuple[int, int],
+) -> tuple[int, ...]:
+    """The qubits of the subsystem selected by the range of bitstring of measured qubits.
+
+    The bitstring is from qubit `measure[1] - 1` to qubit `measure[0]`,
+    and the cycling range with negative start, like :func:`qurry.process.utils.cycling_slice`,
+    wraps modulo the number of measured qubits, not the whole register.
+
+    Args:
+        bitstring_range (tuple[int, int]): The range of bitstring.
+        measure (tuple[int, int]): Measuring range on quantum circuits.
+
+    Returns:
+        tuple[int, ...]: The sorted qubits of the subsystem.
+    """
+    measured_size = measure[1] - measure[0]
+    return tuple(sorted(measure[1] - 1 - i % measured_size for i in range(*bitstring_range)))
+
+
+def exact_entangled_entropy(
+    state: np.ndarray,
+    degree: Optional[Union[tuple[int, int], int]],
+    measure: Optional[tuple[int, int]] = None,
+) -> ExactEntangledEntropy:
+    """Calculate the exact purity and the Second Order Rényi Entropy of the subsystem,
+    which is selected by `degree` in the same way as
+    :func:`qurry.process.randomized_measure.entangled_entropy.randomized_entangled_entropy`.
+
+    Args:
+        state (np.ndarray): The statevector in the little-endian order of Qiskit.
+        degree (Optional[Union[tuple[int, int], int]]):
+            Degree of the subsystem on the bitstring of measured qubits.
+        measure (Optional[tuple[int, int]], optional):
+            Measuring range on quantum circuits. Defaults to None for all qubits.
+
+    Returns:
+        ExactEntangledEntropy:
+            The exact purity and entropy of the subsystem, with the qubits of the subsystem.
+    """
+    begin = time.time()
+    num_qubits = int(state.size).bit_length() - 1
+    if measure is None:
+        measure = (0, num_qubits)
+    bitstring_range, _, _ = bitstring_range_check(measure[1] - measure[0], degree)
+    subsystem = bitstring_range_qubits(bitstring_range, measure)
+    purity = partial_trace_purity(state, list(subsystem))
+
+    return {
+        "purity": purity,
+        "entropy": float(-np.log2(purity)),
+        "bitStringRange": bitstring_range,
+        "subsystem": subsystem,
+        "measureActually": measure,
+        "takingTime": time.time() - begin,
+    }
@@ -11,6 +11,12 @@ from typing import Union
 import numpy as np
 
 from ..utils import ensemble_cell as ensemble_cell_py
+from ..utils.randomized import ensemble_cell_matrix_sum
+from ..utils.counts import (
+    PackedCounts,
+    flatten_packed_counts,
+    marginal_flattened_counts,
+)
 from ..availability import (
     availablility,
     default_postprocessing_backend,
@@ -19,13 +25,13 @@ from ..availability import (
 from ..exceptions import (
     PostProcessingCythonImportError,
     PostProcessingCythonUnavailableWarning,
-    # PostProcessingRustImportError,
-    # PostProcessingRustUnavailableWarning,
+    PostProcessingRustImportError,
+    PostProcessingRustUnavailableWarning,
 )
 
 
 try:
-    from ...boost.randomized import echoCellCore  # type: ignore
+    from ...boost.randomized import echoCellCore, echoCellsPacked  # type: ignore
 
     CYTHON_AVAILABLE = True
     FAILED_PYX_IMPORT = None
@@ -40,92 +46,168 @@ except ImportError as err:
             "Cython is not available, using python to calculate purity cell."
         ) from FAILED_PYX_IMPORT
 
+    def echoCellsPacked(*args, **kwargs):
+        """Dummy function for echoCellsPacked."""
+        raise PostProcessingCythonImportError(
+            "Cython is not available, using python to calculate echo cell."
+        ) from FAILED_PYX_IMPORT
+
     # pylint: enable=invalid-name, unused-argument
 
-# try:
-#     from ...boorust import randomized  # type: ignore
+try:
+    from ...boorust import randomized  # type: ignore
 
-#     purity_cell_rust_source = randomized.echo_cell_rust
+    echo_cell_rust_source = randomized.echo_cell_rust
 
-#     RUST_AVAILABLE = True
-#     FAILED_RUST_IMPORT = None
-# except ImportError as err:
-#     RUST_AVAILABLE = False
-#     FAILED_RUST_IMPORT = err
+    RUST_AVAILABLE = True
+    FAILED_RUST_IMPORT = None
+except ImportError as err:
+    RUST_AVAILABLE = False
+    FAILED_RUST_IMPORT = err
 
-#     def purity_cell_rust_source(*args, **kwargs):
-#         """Dummy function for purity_cell_rust."""
-#         raise PostProcessingRustImportError(
-#             "Rust is not available, using python to calculate purity cell."
-#         ) from FAILED_RUST_IMPORT
+    def echo_cell_rust_source(*args, **kwargs):
+        """Dummy function for echo_cell_rust."""
+        raise PostProcessingRustImportError(
+            "Rust is not available, using python to calculate echo cell."
+        ) from FAILED_RUST_IMPORT
 
 
 PostProcessingBackendStatement = availablility(
-    "randomized_measure.entangled_entropy",
+    "randomized_measure.echo_cell",
     [
-        # ("Rust", RUST_AVAILABLE, FAILED_RUST_IMPORT),
+        ("Rust", RUST_AVAILABLE, FAILED_RUST_IMPORT),
         ("Cython", CYTHON_AVAILABLE, FAILED_PYX_IMPORT),
+        ("NumPy", True, None),
     ],
 )
 DEFAULT_PROCESS_BACKEND = default_postprocessing_backend(
-    # RUST_AVAILABLE,
-    False,
+    RUST_AVAILABLE,
     CYTHON_AVAILABLE,
 )
 
 
-# def echo_cell_rust(
-#     idx: int,
-#     first_counts: dict[str, int],
-#     second_counts: dict[str, int],
-#     bitstring_range: tuple[int, int],
-#     subsystem_size: int,
-# ) -> tuple[int, float]:
-#     """Calculate the echo cell, one of overlap, of a subsystem by Rust.
+def echo_cell_rust(
+    idx: int,
+    first_counts: Union[dict[str, int], PackedCounts],
+    second_counts: Union[dict[str, int], PackedCounts],
+    bitstring_range: tuple[int, int],
+    subsystem_size: int,
+) -> tuple[int, float]:
+    """Calculate the echo cell, one of overlap, of a subsystem by Rust.
 
-#     Args:
-#         idx (int): Index of the cell (counts).
-#         first_counts (dict[str, int]): Counts measured by the first quantum circuit.
-#         second_counts (dict[str, int]): Counts measured by the second quantum circuit.
-#         bitstring_range (tuple[int, int]): The range of the subsystem.
-#         subsystem_size (int): Subsystem size included.
+    Args:
+        idx (int): Index of the cell (counts).
+        first_counts (Union[dict[str, int], PackedCounts]):
+            Counts measured by the first quantum circuit.
+        second_counts (Union[dict[str, int], PackedCounts]):
+            Counts measured by the second quantum circuit.
+        bitstring_range (tuple[int, int]): The range of the subsystem.
+        subsystem_size (int): Subsystem size included.
 
-#     Returns:
-#         tuple[int, float]: Index, one of overlap purity.
-#     """
-#     return idx, purity_cell_rust_source(
-#         dict(first_counts), dict(second_counts), bitstring_range, subsystem_size
-#     )
+    Returns:
+        tuple[int, float]: Index, one of overlap purity.
+    """
+
+    if isinstance(first_counts, PackedCounts) or isinstance(
+        second_counts, PackedCounts
+    ):
+        first_counts, second_counts = (
+            PackedCounts.from_dict(first_counts).marginal(bitstring_range).to_dict(),
+            PackedCounts.from_dict(second_counts).marginal(bitstring_range).to_dict(),
+        )
+        bitstring_range = (0, subsystem_size)
+
+    return echo_cell_rust_source(
+        idx, dict(first_counts), dict(second_counts), bitstring_range, subsystem_size
+    )
 
 
 def echo_cell_cy(
     idx: int,
-    first_counts: dict[str, int],
-    second_counts: dict[str, int],
+    first_counts: Union[dict[str, int], PackedCounts],
+    second_counts: Union[dict[str, int], PackedCounts],
     bitstring_range: tuple[int, int],
     subsystem_size: int,
 ) -> tuple[int, float]:
     """Calculate the echo cell, one of overlap, of a subsystem by Cython.
 
+    The counts are calculated as integer-encoded outcomes by the kernel without GIL,
+    the bitstrings longer than 64 bits are calculated as strings instead.
+
     Args:
         idx (int): Index of the cell (counts).
-        first_counts (dict[str, int]): Counts measured by the first quantum circuit.
-        second_counts (dict[str, int]): Counts measured by the second quantum circuit.
+        first_counts (Union[dict[str, int], PackedCounts]):
+            Counts measured by the first quantum circuit.
+        second_counts (Union[dict[str, int], PackedCounts]):
+            Counts measured by the second quantum circuit.
         bitstring_range (tuple[int, int]): The range of the subsystem.
         subsystem_size (int): Subsystem size included.
 
     Returns:
         tuple[int, float]: Index, one of overlap purity.
     """
+
+    try:
+        return idx, echo_cells_cy(
+            [first_counts, second_counts], bitstring_range, subsystem_size
+        )[0]
+    except ValueError:
+        pass
+
+    if isinstance(first_counts, PackedCounts) or isinstance(
+        second_counts, PackedCounts
+    ):
+        first_counts, second_counts = (
+            PackedCounts.from_dict(first_counts).marginal(bitstring_range).to_dict(),
+            PackedCounts.from_dict(second_counts).marginal(bitstring_range).to_dict(),
+        )
+        bitstring_range = (0, subsystem_size)
     return idx, echoCellCore(
         dict(first_counts), dict(second_counts), bitstring_range, subsystem_size
     )
 
 
+def echo_cells_cy(
+    counts: list[Union[dict[str, int], PackedCounts]],
+    bitstring_range: tuple[int, int],
+    subsystem_size: int,
+) -> np.ndarray:
+    """Calculate the echo cells of all pairs of counts by Cython at once,
+    the counts of the first half are paired with the counts of the second half in order,
+    and the cells are calculated without GIL in parallel by OpenMP threads.
+
+    Args:
+        counts (list[Union[dict[str, int], PackedCounts]]):
+            Counts of the experiment on quantum machine.
+        bitstring_range (tuple[int, int]): The range of the subsystem.
+        subsystem_size (int): Subsystem size included.
+
+    Raises:
+        ValueError: The bitstrings are longer than 64 bits or not the same length.
+
+    Returns:
+        np.ndarray: The echo cell of each pair.
+    """
+    times = len(counts) // 2
+    assert len(counts) == 2 * times, f"counts {len(counts)} is not even."
+    shots = [sum(c.values()) for c in counts]
+    for i in range(times):
+        assert (
+            shots[i] == shots[i + times]
+        ), f"shots {shots[i]} does not match shots2 {shots[i + times]}"
+
+    outcomes, values, offsets, _ = marginal_flattened_counts(
+        *flatten_packed_counts(counts), bitstring_range
+    )
+    result = np.empty(times, dtype=np.float64)
+    echoCellsPacked(outcomes, values, offsets, subsystem_size, result)
+    return result
+
+
 def echo_cell_py(
     idx: int,
-    first_counts: dict[str, int],
-    second_counts: dict[str, int],
+    first_counts: Union[dict[str, int], PackedCounts],
+    second_counts: Union[dict[str, int], PackedCounts],
     bitstring_range: tuple[int, int],
     subsystem_size: int,
 ) -> tuple[int, np.float64]:
@@ -133,8 +215,10 @@ def echo_cell_py(
 
     Args:
         idx (int): Index of the cell (counts).
-        first_counts (dict[str, int]): Counts measured by the first quantum circuit.
-        second_counts (dict[str, int]): Counts measured by the second quantum circuit.
+        first_counts (Union[dict[str, int], PackedCounts]):
+            Counts measured by the first quantum circuit.
+        second_counts (Union[dict[str, int], PackedCounts]):
+            Counts measured by the second quantum circuit.
         bitstring_range (tuple[int, int]): The range of the subsystem.
         subsystem_size (int): Subsystem size included.
 
@@ -142,6 +226,15 @@ def echo_cell_py(
         tuple[int, float]: Index, one of overlap purity.
     """
 
+    if isinstance(first_counts, PackedCounts) or isinstance(
+        second_counts, PackedCounts
+    ):
+        first_counts, second_counts = (
+            PackedCounts.from_dict(first_counts).marginal(bitstring_range).to_dict(),
+            PackedCounts.from_dict(second_counts).marginal(bitstring_range).to_dict(),
+        )
+        bitstring_range = (0, subsystem_size)
+
     shots = sum(first_counts.values())
     shots2 = sum(second_counts.values())
     assert shots == shots2, f"shots {shots} does not match shots2 {shots2}"
@@ -172,10 +265,60 @@ def echo_cell_py(
     return idx, _echo_cell
 
 
+def echo_cell_np(
+    idx: int,
+    first_counts: Union[dict[str, int], PackedCounts],
+    second_counts: Union[dict[str, int], PackedCounts],
+    bitstring_range: tuple[int, int],
+    subsystem_size: int,
+) -> tuple[int, np.float64]:
+    """Calculate the echo cell, one of overlap, of a subsystem by NumPy.
+
+    The marginal outcomes of both counts are integer-encoded,
+    then the pairs are summed by the hamming distance matrix of XOR and popcount
+    instead of the pairwise loop in Python.
+    The bitstrings longer than 64 bits are calculated by Python instead.
+
+    Args:
+        idx (int): Index of the cell (counts).
+        first_counts (Union[dict[str, int], PackedCounts]):
+            Counts measured by the first quantum circuit.
+        second_counts (Union[dict[str, int], PackedCounts]):
+            Counts measured by the second quantum circuit.
+        bitstring_range (tuple[int, int]): The range of the subsystem.
+        subsystem_size (int): Subsystem size included.
+
+    Returns:
+        tuple[int, float]: Index, one of overlap purity.
+    """
+
+    try:
+        first_marginal = PackedCounts.from_dict(first_counts).marginal(bitstring_range)
+        second_marginal = PackedCounts.from_dict(second_counts).marginal(
+            bitstring_range
+        )
+    except ValueError:
+        return echo_cell_py(
+            idx, first_counts, second_counts, bitstring_range, subsystem_size
+        )
+
+    shots = first_marginal.shots
+    shots2 = second_marginal.shots
+    assert shots == shots2, f"shots {shots} does not match shots2 {shots2}"
+
+    return idx, ensemble_cell_matrix_sum(
+        first_marginal.outcomes,
+        first_marginal.probabilities(),
+        second_marginal.outcomes,
+        second_marginal.probabilities(),
+        subsystem_size,
+    )
+
+
 def echo_cell(
     idx: int,
-    first_counts: dict[str, int],
-    second_counts: dict[str, int],
+    first_counts: Union[dict[str, int], PackedCounts],
+    second_counts: Union[dict[str, int], PackedCounts],
     bitstring_range: tuple[int, int],
     subsystem_size: int,
     backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
@@ -184,36 +327,43 @@ def echo_cell(
 
     Args:
         idx (int): Index of the cell (counts).
-        first_counts (dict[str, int]): Counts measured by the first quantum circuit.
-        second_counts (dict[str, int]): Counts measured by the second quantum circuit.
+        first_counts (Union[dict[str, int], PackedCounts]):
+            Counts measured by the first quantum circuit.
+        second_counts (Union[dict[str, int], PackedCounts]):
+            Counts measured by the second quantum circuit.
         bitstring_range (tuple[int, int]): The range of the subsystem.
         subsystem_size (int): Subsystem size included.
 
     Returns:
         tuple[int, float]: Index, one of overlap purity.
     """
-    # if not RUST_AVAILABLE and backend == "Rust":
-    #     warnings.warn(
-    #         "Rust is not available, using Cython or Python to calculate purity cell."
-    #         + f"Check the error: {FAILED_RUST_IMPORT}",
-    #         PostProcessingRustUnavailableWarning,
-    #     )
-    #     backend = "Cython" if CYTHON_AVAILABLE else "Python"
+    if not RUST_AVAILABLE and backend == "Rust":
+        warnings.warn(
+            "Rust is not available, using Cython or NumPy to calculate echo cell."
+            + f"Check the error: {FAILED_RUST_IMPORT}",
+            PostProcessingRustUnavailableWarning,
+        )
+        backend = "Cython" if CYTHON_AVAILABLE else "NumPy"
     if not CYTHON_AVAILABLE and backend == "Cython":
         warnings.warn(
-            "Cython is not available, using Python or Rust to calculate purity cell."
+            "Cython is not available, using NumPy or Rust to calculate echo cell."
             + f"Check the error: {FAILED_PYX_IMPORT}",
             PostProcessingCythonUnavailableWarning,
         )
-        # backend = "Rust" if RUST_AVAILABLE else "Python"
-        backend = "Python"
+        backend = "Rust" if RUST_AVAILABLE else "NumPy"
 
     if backend == "Cython":
         return echo_cell_cy(
             idx, first_counts, second_counts, bitstring_range, subsystem_size
         )
-    # if backend == "Rust":
-    #     return purity_cell_rust(idx, single_counts, bitstring_range, subsystem_size)
+    if backend == "Rust":
+        return echo_cell_rust(
+            idx, first_counts, second_counts, bitstring_range, subsystem_size
+        )
+    if backend == "NumPy":
+        return echo_cell_np(
+            idx, first_counts, second_counts, bitstring_range, subsystem_size
+        )
     return echo_cell_py(
         idx, first_counts, second_counts, bitstring_range, subsystem_size
     )
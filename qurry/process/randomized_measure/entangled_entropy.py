@@ -12,7 +12,13 @@ import tqdm
 
 
 from ..availability import PostProcessingBackendLabel
-from .entropy_core import entangled_entropy_core, DEFAULT_PROCESS_BACKEND
+from ..utils.counts import PackedCounts
+from ...tools import ParallelManager
+from .entropy_core import (
+    entangled_entropy_core,
+    entangled_entropy_core_batch,
+    DEFAULT_PROCESS_BACKEND,
+)
 from .error_mitigation import depolarizing_error_mitgation
 
 
@@ -51,12 +57,14 @@ class RandomizedEntangledEntropyComplex(TypedDict):
 
 def randomized_entangled_entropy(
     shots: int,
-    counts: list[dict[str, int]],
+    counts: list[Union[dict[str, int], PackedCounts]],
     degree: Optional[Union[tuple[int, int], int]],
     measure: Optional[tuple[int, int]] = None,
     backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
     workers_num: Optional[int] = None,
     pbar: Optional[tqdm.tqdm] = None,
+    shared_counts: bool = False,
+    pool: Optional[ParallelManager] = None,
 ) -> dict[str, Union[np.float64, float]]:
     """Calculate entangled entropy.
 
@@ -93,7 +101,8 @@ def randomized_entangled_entropy(
 
     Args:
         shots (int): Shots of the experiment on quantum machine.
-        counts (list[dict[str, int]]): Counts of the experiment on quantum machine.
+        counts (list[Union[dict[str, int], PackedCounts]]):
+            Counts of the experiment on quantum machine.
         degree (Optional[Union[tuple[int, int], int]]): Degree of the subsystem.
         measure (Optional[tuple[int, int]], optional):
             Measuring range on quantum circuits. Defaults to None.
@@ -105,6 +114,11 @@ def randomized_entangled_entropy(
             if not specified, then use the number of all cpu counts by `os.cpu_count()`.
             Defaults to None.
         pbar (Optional[tqdm.tqdm], optional): Progress bar. Defaults to None.
+        shared_counts (bool, optional):
+            Whether to send the counts to the workers by a shared memory block
+            instead of pickling them. Defaults to False.
+        pool (Optional[ParallelManager], optional):
+            The persistent process manager to reuse. Defaults to None.
 
     Returns:
         dict[str,Union[np.float64, float]]: A dictionary contains purity, entropy,
@@ -126,6 +140,8 @@ def randomized_entangled_entropy(
         measure=measure,
         backend=backend,
         multiprocess_pool_size=workers_num,
+        shared_counts=shared_counts,
+        pool=pool,
     )
     purity_cell_list: list[Union[float, np.float64]] = list(purity_cell_dict.values())
 
@@ -161,13 +177,15 @@ class ExistingAllSystemSource(TypedDict):
 
 def randomized_entangled_entropy_mitigated(
     shots: int,
-    counts: list[dict[str, int]],
+    counts: list[Union[dict[str, int], PackedCounts]],
     degree: Optional[Union[tuple[int, int], int]],
     measure: Optional[tuple[int, int]] = None,
     backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
     workers_num: Optional[int] = None,
     existed_all_system: Optional[ExistingAllSystemSource] = None,
     pbar: Optional[tqdm.tqdm] = None,
+    shared_counts: bool = False,
+    pool: Optional[ParallelManager] = None,
 ) -> RandomizedEntangledEntropyComplex:
     """Calculate entangled entropy.
 
@@ -204,7 +222,8 @@ def randomized_entangled_entropy_mitigated(
 
     Args:
         shots (int): Shots of the experiment on quantum machine.
-        counts (list[dict[str, int]]): Counts of the experiment on quantum machine.
+        counts (list[Union[dict[str, int], PackedCounts]]):
+            Counts of the experiment on quantum machine.
         degree (Optional[Union[tuple[int, int], int]]): Degree of the subsystem.
         measure (Optional[tuple[int, int]], optional):
             Measuring range on quantum circuits. Defaults to None.
@@ -218,6 +237,11 @@ def randomized_entangled_entropy_mitigated(
         existed_all_system (Optional[ExistingAllSystemSource], optional):
             Existing all system source. Defaults to None.
         pbar (Optional[tqdm.tqdm], optional): Progress bar. Defaults to None.
+        shared_counts (bool, optional):
+            Whether to send the counts to the workers by a shared memory block
+            instead of pickling them. Defaults to False.
+        pool (Optional[ParallelManager], optional):
+            The persistent process manager to reuse. Defaults to None.
 
     Returns:
         dict[str,Union[np.float64, float]]: A dictionary contains
@@ -274,8 +298,9 @@ def randomized_entangled_entropy_mitigated(
         measure=measure,
         backend=backend,
         multiprocess_pool_size=workers_num,
+        shared_counts=shared_counts,
+        pool=pool,
     )
-    purity_cell_list: list[Union[float, np.float64]] = list(purity_cell_dict.values())
 
     if existed_all_system is None:
         if isinstance(pbar, tqdm.tqdm):
@@ -293,8 +318,9 @@ def randomized_entangled_entropy_mitigated(
             measure=measure,
             backend=backend,
             multiprocess_pool_size=workers_num,
+            shared_counts=shared_counts,
+            pool=pool,
         )
-        purity_cell_list_allsys: list[Union[float, np.float64]] = list(purity_cell_dict_allsys.values())  # type: ignore
         source = "independent"
     else:
         for k, msg in [
@@ -309,12 +335,80 @@ def randomized_entangled_entropy_mitigated(
         if isinstance(pbar, tqdm.tqdm):
             pbar.set_description_str(f"Using existing all system from '{source}'")
         purity_cell_dict_allsys = existed_all_system["purityCellsAllSys"]
-        purity_cell_list_allsys = list(purity_cell_dict_allsys.values())
         bitstring_range_allsys = existed_all_system["bitStringRange"]
         measure_range_allsys = existed_all_system["measureActually"]
         _msg_allsys = f"Use all system from {source}."
         taken_allsys = 0
 
+    return entangled_entropy_complex_from_cells(
+        purity_cell_dict=purity_cell_dict,
+        bitstring_range=bitstring_range,
+        measure_range=measure_range,
+        msg=msg,
+        taken=taken,
+        purity_cell_dict_allsys=purity_cell_dict_allsys,
+        bitstring_range_allsys=bitstring_range_allsys,
+        measure_range_allsys=measure_range_allsys,
+        taken_allsys=taken_allsys,
+        source=source,
+        counts=counts,
+        degree=degree,
+        measure=measure,
+        pbar=pbar,
+    )
+
+
+def entangled_entropy_complex_from_cells(
+    purity_cell_dict: Union[dict[int, float], dict[int, np.float64]],
+    bitstring_range: tuple[int, int],
+    measure_range: tuple[int, int],
+    msg: str,
+    taken: float,
+    purity_cell_dict_allsys: Union[dict[int, float], dict[int, np.float64]],
+    bitstring_range_allsys: tuple[int, int],
+    measure_range_allsys: tuple[int, int],
+    taken_allsys: float,
+    source: str,
+    counts: list[Union[dict[str, int], PackedCounts]],
+    degree: Optional[Union[tuple[int, int], int]],
+    measure: Optional[tuple[int, int]] = None,
+    pbar: Optional[tqdm.tqdm] = None,
+) -> RandomizedEntangledEntropyComplex:
+    """Summarize the purity cells of the subsystem and the all system
+    into entangled entropy with error mitigation.
+
+    Args:
+        purity_cell_dict (Union[dict[int, float], dict[int, np.float64]]):
+            Purity of each cell of the subsystem.
+        bitstring_range (tuple[int, int]): Partition range of the subsystem.
+        measure_range (tuple[int, int]): Measuring range of the subsystem.
+        msg (str): Message from the core function of the subsystem.
+        taken (float): Time to calculate the subsystem.
+        purity_cell_dict_allsys (Union[dict[int, float], dict[int, np.float64]]):
+            Purity of each cell of the all system.
+        bitstring_range_allsys (tuple[int, int]): Partition range of the all system.
+        measure_range_allsys (tuple[int, int]): Measuring range of the all system.
+        taken_allsys (float): Time to calculate the all system.
+        source (str): The source of the all system.
+        counts (list[Union[dict[str, int], PackedCounts]]):
+            Counts of the experiment on quantum machine.
+        degree (Optional[Union[tuple[int, int], int]]): Degree of the subsystem.
+        measure (Optional[tuple[int, int]], optional):
+            Measuring range on quantum circuits. Defaults to None.
+        pbar (Optional[tqdm.tqdm], optional): Progress bar. Defaults to None.
+
+    Returns:
+        RandomizedEntangledEntropyComplex: A dictionary contains
+            purity, entropy, a list of each overlap, puritySD,
+            purity of all system, entropy of all system,
+            a list of each overlap in all system, puritySD of all system,
+            degree, actual measure range, actual measure range in all system, bitstring range.
+    """
+    purity_cell_list: list[Union[float, np.float64]] = list(purity_cell_dict.values())
+    purity_cell_list_allsys: list[Union[float, np.float64]] = list(
+        purity_cell_dict_allsys.values()
+    )
+
     if isinstance(pbar, tqdm.tqdm):
         pbar.set_description_str(
             f"Preparing error mitigation of {bitstring_range} on {measure}"
@@ -385,3 +479,127 @@ def randomized_entangled_entropy_mitigated(
         "takingTimeAllSys": taken_allsys,
     }
     return quantity
+
+
+def randomized_entangled_entropy_batch(
+    shots: int,
+    counts: list[Union[dict[str, int], PackedCounts]],
+    degrees: list[Optional[Union[tuple[int, int], int]]],
+    measure: Optional[tuple[int, int]] = None,
+    backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+    workers_num: Optional[int] = None,
+    existed_all_system: Optional[ExistingAllSystemSource] = None,
+    pbar: Optional[tqdm.tqdm] = None,
+    shared_counts: bool = False,
+    pool: Optional[ParallelManager] = None,
+) -> list[RandomizedEntangledEntropyComplex]:
+    """Calculate entangled entropy with error mitigation for multiple degrees at once.
+
+    It is the batched version of :func:`randomized_entangled_entropy_mitigated`,
+    the counts are walked only once for all degrees and the all system
+    by :func:`entangled_entropy_core_batch`.
+
+    Args:
+        shots (int): Shots of the experiment on quantum machine.
+        counts (list[Union[dict[str, int], PackedCounts]]):
+            Counts of the experiment on quantum machine.
+        degrees (list[Optional[Union[tuple[int, int], int]]]): Degrees of the subsystems.
+        measure (Optional[tuple[int, int]], optional):
+            Measuring range on quantum circuits. Defaults to None.
+        backend (PostProcessingBackendLabel, optional):
+            Backend for the process. Defaults to DEFAULT_PROCESS_BACKEND.
+        workers_num (Optional[int], optional):
+            Number of multi-processing workers,
+            if sets to 1, then disable to using multi-processing;
+            if not specified, then use the number of all cpu counts by `os.cpu_count()`.
+            Defaults to None.
+        existed_all_system (Optional[ExistingAllSystemSource], optional):
+            Existing all system source. Defaults to None.
+        pbar (Optional[tqdm.tqdm], optional): Progress bar. Defaults to None.
+        shared_counts (bool, optional):
+            Whether to send the counts to the workers by a shared memory block
+            instead of pickling them. Defaults to False.
+        pool (Optional[ParallelManager], optional):
+            The persistent process manager to reuse. Defaults to None.
+
+    Returns:
+        list[RandomizedEntangledEntropyComplex]: The result of each degree in order.
+    """
+    if any(len(c) == 0 for c in counts):
+        return [
+            randomized_entangled_entropy_mitigated(
+                shots=shots,
+                counts=counts,
+                degree=degree,
+                measure=measure,
+                backend=backend,
+                workers_num=workers_num,
+                existed_all_system=existed_all_system,
+                pbar=pbar,
+                shared_counts=shared_counts,
+                pool=pool,
+            )
+            for degree in degrees
+        ]
+
+    if isinstance(pbar, tqdm.tqdm):
+        pbar.set_description_str(
+            f"Calculate {len(degrees)} degrees"
+            + (" and all system" if existed_all_system is None else "")
+            + f" by {backend}."
+        )
+    core_results = entangled_entropy_core_batch(
+        shots=shots,
+        counts=counts,
+        degrees=list(degrees) + ([None] if existed_all_system is None else []),
+        measure=measure,
+        backend=backend,
+        multiprocess_pool_size=workers_num,
+        shared_counts=shared_counts,
+        pool=pool,
+    )
+
+    if existed_all_system is None:
+        (
+            purity_cell_dict_allsys,
+            bitstring_range_allsys,
+            measure_range_allsys,
+            _msg_allsys,
+            taken_allsys,
+        ) = core_results.pop()
+        source = "independent"
+    else:
+        for k in ["purityCellsAllSys", "bitStringRange", "measureActually", "source"]:
+            assert k in existed_all_system, f"{k} is not in existed_all_system."
+
+        source = existed_all_system["source"]
+        purity_cell_dict_allsys = existed_all_system["purityCellsAllSys"]
+        bitstring_range_allsys = existed_all_system["bitStringRange"]
+        measure_range_allsys = existed_all_system["measureActually"]
+        taken_allsys = 0
+
+    return [
+        entangled_entropy_complex_from_cells(
+            purity_cell_dict=purity_cell_dict,
+            bitstring_range=bitstring_range,
+            measure_range=measure_range,
+            msg=msg,
+            taken=taken,
+            purity_cell_dict_allsys=purity_cell_dict_allsys,
+            bitstring_range_allsys=bitstring_range_allsys,
+            measure_range_allsys=measure_range_allsys,
+            taken_allsys=taken_allsys,
+            source=source,
+            counts=counts,
+            degree=degree,
+            measure=measure,
+            pbar=pbar,
+        )
+        for degree, (
+            purity_cell_dict,
+            bitstring_range,
+            measure_range,
+            msg,
+            taken,
+        ) in zip(degrees, core_results)
+    ]
@@ -8,17 +8,29 @@ Postprocessing - Randomized Measure - Entangled Entropy
 
 import time
 import warnings
-from typing import Union, Optional
+from typing import Union, Optional, Callable, Any
 import numpy as np
 
 from .purity_cell import (
     purity_cell_py,
     purity_cell_cy,
     purity_cell_rust,
+    purity_cell_hist,
+    purity_cell_np,
+    purity_cells_cy,
     CYTHON_AVAILABLE,
     FAILED_PYX_IMPORT,
 )
 from ..utils import cycling_slice as cycling_slice_py, qubit_selector
+from ..utils.counts import (
+    PackedCounts,
+    SharedCountsBlock,
+    unpack_counts,
+    flatten_packed_counts,
+    share_counts,
+    shared_counts_item,
+    release_shared_counts,
+)
 from ..availability import (
     availablility,
     default_postprocessing_backend,
@@ -29,17 +41,20 @@ from ..exceptions import (
     PostProcessingRustImportError,
     PostProcessingRustUnavailableWarning,
 )
-from ...tools import ParallelManager, workers_distribution
+from ...tools import ParallelManager, shared_parallel_manager, workers_distribution
 
 
 try:
     from ...boorust import randomized  # type: ignore
 
     entangled_entropy_core_rust_source = randomized.entangled_entropy_core_rust
+    entangled_entropy_core_packed_rust_source = (
+        randomized.entangled_entropy_core_packed_rust
+    )
 
     RUST_AVAILABLE = True
     FAILED_RUST_IMPORT = None
-except ImportError as err:
+except (ImportError, AttributeError) as err:
     RUST_AVAILABLE = False
     FAILED_RUST_IMPORT = err
 
@@ -49,12 +64,20 @@ except ImportError as err:
             "Rust is not available, using python to calculate entangled entropy."
         ) from FAILED_RUST_IMPORT
 
+    def entangled_entropy_core_packed_rust_source(*args, **kwargs):
+        """Dummy function for entangled_entropy_core_packed_rust."""
+        raise PostProcessingRustImportError(
+            "Rust is not available, using python to calculate entangled entropy."
+        ) from FAILED_RUST_IMPORT
+
 
 PostProcessingBackendStatement = availablility(
     "randomized_measure.entangled_entropy",
     [
         ("Rust", RUST_AVAILABLE, FAILED_RUST_IMPORT),
         ("Cython", CYTHON_AVAILABLE, FAILED_PYX_IMPORT),
+        ("NumPy", True, None),
+        ("Histogram", True, None),
     ],
 )
 DEFAULT_PROCESS_BACKEND = default_postprocessing_backend(
@@ -62,64 +85,24 @@ DEFAULT_PROCESS_BACKEND = default_postprocessing_backend(
 )
 
 
-def entangled_entropy_core_pycyrust(
-    shots: int,
-    counts: list[dict[str, int]],
+def bitstring_range_check(
+    allsystem_size: int,
     degree: Optional[Union[tuple[int, int], int]],
-    measure: Optional[tuple[int, int]] = None,
-    multiprocess_pool_size: Optional[int] = None,
-    backend: PostProcessingBackendLabel = "Cython",
-) -> tuple[
-    Union[dict[int, float], dict[int, np.float64]],
-    tuple[int, int],
-    tuple[int, int],
-    str,
-    float,
-]:
-    """The core function of entangled entropy by Cython, Python, or Rust for just purity cell part.
+) -> tuple[tuple[int, int], int, bool]:
+    """Determine and check the range of bitstring of the subsystem.
 
     Args:
-        shots (int): Shots of the experiment on quantum machine.
-        counts (list[dict[str, int]]): Counts of the experiment on quantum machine.
+        allsystem_size (int): The size of the all system.
         degree (Optional[Union[tuple[int, int], int]]): Degree of the subsystem.
-        measure (Optional[tuple[int, int]], optional):
-            Measuring range on quantum circuits. Defaults to None.
-        multiprocess_pool_size(Optional[int], optional):
-            Number of multi-processing workers,
-            if sets to 1, then disable to using multi-processing;
-            if not specified, then use the number of all cpu counts by `os.cpu_count()`.
-            Defaults to None.
-        use_cython (bool, optional): Use cython to calculate purity cell. Defaults to True.
-        _hide_print (bool, optional): Hide print. Defaults to False.
 
     Raises:
-        ValueError: Get degree neither 'int' nor 'tuple[int, int]'.
-        ValueError: Measure range does not contain subsystem.
+        ValueError: The range of bitstring is invalid.
 
     Returns:
-        tuple[
-            Union[dict[int, float], dict[int, np.float64]],
-            tuple[int, int],
-            tuple[int, int],
-            str,
-            float,
-        ]:
-            Purity of each cell, Partition range, Measuring range, Message, Time to calculate.
+        tuple[tuple[int, int], int, bool]:
+            The range of bitstring, the size of subsystem,
+            and whether the range is a cycling slice.
     """
-
-    # check shots
-    sample_shots = sum(counts[0].values())
-    assert (
-        sample_shots == shots
-    ), f"shots {shots} does not match sample_shots {sample_shots}"
-
-    # Determine worker number
-    launch_worker = workers_distribution(multiprocess_pool_size)
-
-    # Determine subsystem size
-    allsystem_size = len(list(counts[0].keys())[0])
-
-    # Determine degree
     degree = qubit_selector(allsystem_size, degree=degree)
     subsystems_size = max(degree) - min(degree)
 
@@ -139,9 +122,6 @@ def entangled_entropy_core_pycyrust(
             + ", ".join([f" {k};" for k, v in bitstring_check.items() if not v])
         )
 
-    if measure is None:
-        measure = qubit_selector(len(list(counts[0].keys())[0]))
-
     _dummy_string = "".join(str(ds) for ds in range(allsystem_size))
     _dummy_string_slice = cycling_slice_py(
         _dummy_string, bitstring_range[0], bitstring_range[1], 1
@@ -155,6 +135,22 @@ def entangled_entropy_core_pycyrust(
             + f"does not match dummyStringSlice '{_dummy_string_slice}'"
         )
 
+    return bitstring_range, subsystems_size, is_avtive_cycling_slice
+
+
+def purity_cell_selector(
+    backend: PostProcessingBackendLabel,
+) -> tuple[PostProcessingBackendLabel, Callable[..., tuple[int, Any]]]:
+    """Select the function of purity cell by the backend,
+    and fall back to the available one if the backend is not available.
+
+    Args:
+        backend (PostProcessingBackendLabel): Backend for the process.
+
+    Returns:
+        tuple[PostProcessingBackendLabel, Callable[..., tuple[int, Any]]]:
+            The actual backend and the function of purity cell.
+    """
     if backend not in PostProcessingBackendStatement[1]:
         warnings.warn(
             f"Unknown backend '{backend}', using {DEFAULT_PROCESS_BACKEND} instead.",
@@ -163,25 +159,168 @@ def entangled_entropy_core_pycyrust(
 
     if not RUST_AVAILABLE and backend == "Rust":
         warnings.warn(
-            "Rust is not available, using Cython or Python to calculate purity cell."
+            "Rust is not available, using Cython or NumPy to calculate purity cell."
             + f"Check the error: {FAILED_RUST_IMPORT}",
             PostProcessingRustUnavailableWarning,
         )
-        backend = "Cython" if CYTHON_AVAILABLE else "Python"
+        backend = "Cython" if CYTHON_AVAILABLE else "NumPy"
     if not CYTHON_AVAILABLE and backend == "Cython":
         warnings.warn(
-            "Cython is not available, using Python to calculate purity cell."
+            "Cython is not available, using Rust or NumPy to calculate purity cell."
             + f"Check the error: {FAILED_PYX_IMPORT}",
             PostProcessingCythonUnavailableWarning,
         )
-        backend = "Rust" if RUST_AVAILABLE else "Python"
+        backend = "Rust" if RUST_AVAILABLE else "NumPy"
+
+    cell_calculation = {
+        "Cython": purity_cell_cy,
+        "Rust": purity_cell_rust,
+        "Histogram": purity_cell_hist,
+        "NumPy": purity_cell_np,
+    }.get(backend, purity_cell_py)
+
+    return backend, cell_calculation
+
+
+def call_with_shared_counts(
+    func: Callable[..., tuple[int, Any]],
+    idx: int,
+    block: SharedCountsBlock,
+    *args,
+) -> tuple[int, Any]:
+    """Call the function of cell with the counts read from the shared memory block,
+    so only the location of counts is sent to the worker.
+
+    Args:
+        func (Callable[..., tuple[int, Any]]):
+            The function of cell, which takes the index and the counts as the first two arguments.
+        idx (int): Index of the cell (counts).
+        block (SharedCountsBlock): The location of counts in the shared memory.
+        *args: Other arguments of the function.
+
+    Returns:
+        tuple[int, Any]: The result of the function.
+    """
+    return func(idx, shared_counts_item(block, idx), *args)
+
+
+def starmap_cells(
+    pool: ParallelManager,
+    func: Callable[..., tuple[int, Any]],
+    counts: list[Union[dict[str, int], PackedCounts]],
+    args: tuple,
+    shared_counts: bool = False,
+) -> list[tuple[int, Any]]:
+    """Map the function of cell over the counts by the pool of workers.
+
+    Args:
+        pool (ParallelManager): The pool of workers.
+        func (Callable[..., tuple[int, Any]]):
+            The function of cell, which takes the index and the counts as the first two arguments.
+        counts (list[Union[dict[str, int], PackedCounts]]):
+            Counts of the experiment on quantum machine.
+        args (tuple): Other arguments of the function.
+        shared_counts (bool, optional):
+            Whether to lay out the counts in a shared memory block once
+            and send only its location to the workers instead of pickling each counts.
+            Defaults to False.
+
+    Returns:
+        list[tuple[int, Any]]: The results of the function.
+    """
+    if not shared_counts:
+        return pool.starmap(func, [(i, c, *args) for i, c in enumerate(counts)])
+
+    shm, block = share_counts(counts)
+    try:
+        return pool.starmap(
+            call_with_shared_counts,
+            [(func, i, block, *args) for i in range(len(counts))],
+        )
+    finally:
+        release_shared_counts(shm)
+
+
+def entangled_entropy_core_pycyrust(
+    shots: int,
+    counts: list[Union[dict[str, int], PackedCounts]],
+    degree: Optional[Union[tuple[int, int], int]],
+    measure: Optional[tuple[int, int]] = None,
+    multiprocess_pool_size: Optional[int] = None,
+    backend: PostProcessingBackendLabel = "Cython",
+    shared_counts: bool = False,
+    pool: Optional[ParallelManager] = None,
+) -> tuple[
+    Union[dict[int, float], dict[int, np.float64]],
+    tuple[int, int],
+    tuple[int, int],
+    str,
+    float,
+]:
+    """The core function of entangled entropy by Cython, Python, or Rust for just purity cell part.
 
-    cell_calculation = (
-        purity_cell_cy
-        if backend == "Cython"
-        else (purity_cell_rust if backend == "Rust" else purity_cell_py)
+    Args:
+        shots (int): Shots of the experiment on quantum machine.
+        counts (list[Union[dict[str, int], PackedCounts]]):
+            Counts of the experiment on quantum machine.
+        degree (Optional[Union[tuple[int, int], int]]): Degree of the subsystem.
+        measure (Optional[tuple[int, int]], optional):
+            Measuring range on quantum circuits. Defaults to None.
+        multiprocess_pool_size(Optional[int], optional):
+            Number of multi-processing workers,
+            if sets to 1, then disable to using multi-processing;
+            if not specified, then use the number of all cpu counts by `os.cpu_count()`.
+            Defaults to None.
+        backend (PostProcessingBackendLabel, optional):
+            Backend for the purity cell. Defaults to "Cython".
+        shared_counts (bool, optional):
+            Whether to send the counts to the workers by a shared memory block
+            instead of pickling them, the bitstrings can not be longer than 64.
+            Defaults to False.
+        pool (Optional[ParallelManager], optional):
+            The persistent process manager to reuse, its workers number overrides
+            `multiprocess_pool_size`. If not specified,
+            the shared one of :func:`shared_parallel_manager` is used. Defaults to None.
+
+    Raises:
+        ValueError: Get degree neither 'int' nor 'tuple[int, int]'.
+        ValueError: Measure range does not contain subsystem.
+
+    Returns:
+        tuple[
+            Union[dict[int, float], dict[int, np.float64]],
+            tuple[int, int],
+            tuple[int, int],
+            str,
+            float,
+        ]:
+            Purity of each cell, Partition range, Measuring range, Message, Time to calculate.
+    """
+
+    # check shots
+    sample_shots = sum(counts[0].values())
+    assert (
+        sample_shots == shots
+    ), f"shots {shots} does not match sample_shots {sample_shots}"
+
+    # Determine worker number
+    launch_worker = (
+        workers_distribution(multiprocess_pool_size) if pool is None else pool.workers_num
     )
 
+    # Determine subsystem size
+    allsystem_size = len(list(counts[0].keys())[0])
+
+    # Determine degree
+    bitstring_range, subsystems_size, is_avtive_cycling_slice = bitstring_range_check(
+        allsystem_size, degree
+    )
+
+    if measure is None:
+        measure = qubit_selector(len(list(counts[0].keys())[0]))
+
+    backend, cell_calculation = purity_cell_selector(backend)
+
     msg = (
         "| Partition: "
         + ("cycling-" if is_avtive_cycling_slice else "")
@@ -191,7 +330,19 @@ def entangled_entropy_core_pycyrust(
     times = len(counts)
     begin = time.time()
 
-    if launch_worker == 1:
+    purity_cell_items = None
+    if backend == "Cython":
+        try:
+            purity_cell_items = list(
+                enumerate(purity_cells_cy(counts, bitstring_range, subsystems_size))
+            )
+            msg += f", OpenMP threads, {times} overlaps."
+        except ValueError:
+            purity_cell_items = None
+
+    if purity_cell_items is not None:
+        taken = round(time.time() - begin, 3)
+    elif launch_worker == 1:
         purity_cell_items = []
         msg += f", single process, {times} overlaps, it will take a lot of time."
         print(msg)
@@ -202,12 +353,17 @@ def entangled_entropy_core_pycyrust(
         taken = round(time.time() - begin, 3)
 
     else:
-        msg += f", {launch_worker} workers, {times} overlaps."
+        msg += f", {launch_worker} workers, {times} overlaps"
+        msg += ", shared counts." if shared_counts else "."
 
-        pool = ParallelManager(launch_worker)
-        purity_cell_items = pool.starmap(
+        if pool is None:
+            pool = shared_parallel_manager(launch_worker)
+        purity_cell_items = starmap_cells(
+            pool,
             cell_calculation,
-            [(i, c, bitstring_range, subsystems_size) for i, c in enumerate(counts)],
+            counts,
+            (bitstring_range, subsystems_size),
+            shared_counts,
         )
         taken = round(time.time() - begin, 3)
 
@@ -219,7 +375,7 @@ def entangled_entropy_core_pycyrust(
 
 def entangled_entropy_core_allrust(
     shots: int,
-    counts: list[dict[str, int]],
+    counts: list[Union[dict[str, int], PackedCounts]],
     degree: Optional[Union[tuple[int, int], int]],
     measure: Optional[tuple[int, int]] = None,
 ) -> tuple[
@@ -231,9 +387,15 @@ def entangled_entropy_core_allrust(
 ]:
     """The core function of entangled entropy by Rust.
 
+    The counts are packed into contiguous arrays which are read by Rust
+    through the buffer protocol without converting each bitstring,
+    and the GIL is released during the computation.
+    The bitstrings longer than 64 bits are sent as dictionaries instead.
+
     Args:
         shots (int): Shots of the experiment on quantum machine.
-        counts (list[dict[str, int]]): Counts of the experiment on quantum machine.
+        counts (list[Union[dict[str, int], PackedCounts]]):
+            Counts of the experiment on quantum machine.
         degree (Optional[Union[tuple[int, int], int]]): Degree of the subsystem.
         measure (Optional[tuple[int, int]], optional):
             Measuring range on quantum circuits. Defaults to None.
@@ -247,16 +409,26 @@ def entangled_entropy_core_allrust(
             Purity of each cell, Partition range, Measuring range, Message, Time to calculate.
     """
 
-    return entangled_entropy_core_rust_source(shots, counts, degree, measure)
+    try:
+        outcomes, values, offsets, num_bits = flatten_packed_counts(counts)
+    except ValueError:
+        return entangled_entropy_core_rust_source(
+            shots, unpack_counts(counts), degree, measure
+        )
+    return entangled_entropy_core_packed_rust_source(
+        shots, outcomes, values, offsets, num_bits, degree, measure
+    )
 
 
 def entangled_entropy_core(
     shots: int,
-    counts: list[dict[str, int]],
+    counts: list[Union[dict[str, int], PackedCounts]],
     degree: Optional[Union[tuple[int, int], int]],
     measure: Union[tuple[int, int], list[int], None] = None,
     backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
     multiprocess_pool_size: Optional[int] = None,
+    shared_counts: bool = False,
+    pool: Optional[ParallelManager] = None,
 ) -> tuple[
     Union[dict[int, float], dict[int, np.float64]],
     tuple[int, int],
@@ -268,7 +440,8 @@ def entangled_entropy_core(
 
     Args:
         shots (int): Shots of the experiment on quantum machine.
-        counts (list[dict[str, int]]): Counts of the experiment on quantum machine.
+        counts (list[Union[dict[str, int], PackedCounts]]):
+            Counts of the experiment on quantum machine.
         degree (Optional[Union[tuple[int, int], int]]): Degree of the subsystem.
         measure (Optional[tuple[int, int]], optional):
             Measuring range on quantum circuits. Defaults to None.
@@ -279,6 +452,14 @@ def entangled_entropy_core(
             if sets to 1, then disable to using multi-processing;
             if not specified, then use the number of all cpu counts by `os.cpu_count()`.
             Defaults to None.
+        shared_counts (bool, optional):
+            Whether to send the counts to the workers by a shared memory block
+            instead of pickling them, it will be ignored if backend is Rust.
+            Defaults to False.
+        pool (Optional[ParallelManager], optional):
+            The persistent process manager to reuse, its workers number overrides
+            `multiprocess_pool_size`. If not specified,
+            the shared one of :func:`shared_parallel_manager` is used. Defaults to None.
 
     Raises:
         ValueError: Get degree neither 'int' nor 'tuple[int, int]'.
@@ -298,7 +479,7 @@ def entangled_entropy_core(
     if backend == "Rust":
         if RUST_AVAILABLE:
             return entangled_entropy_core_allrust(shots, counts, degree, measure)
-        backend = "Cython" if CYTHON_AVAILABLE else "Python"
+        backend = "Cython" if CYTHON_AVAILABLE else "NumPy"
         warnings.warn(
             f"Rust is not available, using {backend} to calculate purity cell."
             + f" Check the error: {FAILED_RUST_IMPORT}",
@@ -306,5 +487,217 @@ def entangled_entropy_core(
         )
 
     return entangled_entropy_core_pycyrust(
-        shots, counts, degree, measure, multiprocess_pool_size, backend
+        shots,
+        counts,
+        degree,
+        measure,
+        multiprocess_pool_size,
+        backend,
+        shared_counts,
+        pool,
     )
+
+
+def nested_marginal(
+    packed_counts: PackedCounts,
+    marginals: dict[tuple[int, int], PackedCounts],
+    bitstring_range: tuple[int, int],
+) -> PackedCounts:
+    """Marginalize the counts onto the range of bitstring,
+    reusing the smallest cached marginal which contains the range.
+
+    Args:
+        packed_counts (PackedCounts): Counts measured by the single quantum circuit.
+        marginals (dict[tuple[int, int], PackedCounts]):
+            The cache of computed marginals keyed by the normalized range,
+            the new marginal will be added into it.
+        bitstring_range (tuple[int, int]): The range of the subsystem.
+
+    Returns:
+        PackedCounts: The marginal counts.
+    """
+    if bitstring_range[0] < 0 <= bitstring_range[1]:
+        return packed_counts.marginal(bitstring_range)
+
+    start, end, _ = slice(*bitstring_range).indices(packed_counts.num_bits)
+    if (start, end) in marginals:
+        return marginals[(start, end)]
+
+    containers = [
+        (outer_start, outer_end)
+        for outer_start, outer_end in marginals
+        if outer_start <= start and end <= outer_end
+    ]
+    if len(containers) > 0:
+        outer_start, outer_end = min(containers, key=lambda r: r[1] - r[0])
+        marginal = marginals[(outer_start, outer_end)].marginal(
+            (start - outer_start, end - outer_start)
+        )
+    else:
+        marginal = packed_counts.marginal((start, end))
+    marginals[(start, end)] = marginal
+    return marginal
+
+
+def purity_cells_batch(
+    idx: int,
+    single_counts: Union[dict[str, int], PackedCounts],
+    bitstring_ranges: list[tuple[int, int]],
+    cell_calculation: Callable[..., tuple[int, Any]],
+) -> tuple[int, list[Union[float, np.float64]]]:
+    """Calculate the purity cells of one counts for multiple subsystems,
+    the counts is parsed once and the marginals of nested subsystems are reused.
+
+    Args:
+        idx (int): Index of the cell (counts).
+        single_counts (Union[dict[str, int], PackedCounts]):
+            Counts measured by the single quantum circuit.
+        bitstring_ranges (list[tuple[int, int]]): The ranges of the subsystems.
+        cell_calculation (Callable[..., tuple[int, Any]]):
+            The function of purity cell from :func:`purity_cell_selector`.
+
+    Returns:
+        tuple[int, list[Union[float, np.float64]]]:
+            Index, the purity cells in the order of `bitstring_ranges`.
+    """
+    packed_counts = PackedCounts.from_dict(single_counts)
+    marginals: dict[tuple[int, int], PackedCounts] = {}
+    purity_cells: dict[int, Union[float, np.float64]] = {}
+
+    # larger subsystems first, so the smaller ones can reuse their marginals.
+    for order in sorted(
+        range(len(bitstring_ranges)),
+        key=lambda o: bitstring_ranges[o][0] - bitstring_ranges[o][1],
+    ):
+        marginal = nested_marginal(packed_counts, marginals, bitstring_ranges[order])
+        _, purity_cells[order] = cell_calculation(
+            idx, marginal, (0, marginal.num_bits), marginal.num_bits
+        )
+
+    return idx, [purity_cells[order] for order in range(len(bitstring_ranges))]
+
+
+def entangled_entropy_core_batch(
+    shots: int,
+    counts: list[Union[dict[str, int], PackedCounts]],
+    degrees: list[Optional[Union[tuple[int, int], int]]],
+    measure: Optional[tuple[int, int]] = None,
+    backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+    multiprocess_pool_size: Optional[int] = None,
+    shared_counts: bool = False,
+    pool: Optional[ParallelManager] = None,
+) -> list[
+    tuple[
+        Union[dict[int, float], dict[int, np.float64]],
+        tuple[int, int],
+        tuple[int, int],
+        str,
+        float,
+    ]
+]:
+    """The core function of entangled entropy for multiple degrees at once.
+
+    Each counts is parsed only once for all degrees,
+    and all degrees are calculated in the same pool of workers.
+    The bitstrings are packed by :cls:`PackedCounts`, so they can not be longer than 64.
+
+    Args:
+        shots (int): Shots of the experiment on quantum machine.
+        counts (list[Union[dict[str, int], PackedCounts]]):
+            Counts of the experiment on quantum machine.
+        degrees (list[Optional[Union[tuple[int, int], int]]]): Degrees of the subsystems.
+        measure (Optional[tuple[int, int]], optional):
+            Measuring range on quantum circuits. Defaults to None.
+        backend (PostProcessingBackendLabel, optional):
+            Backend for the purity cell. Defaults to DEFAULT_PROCESS_BACKEND.
+        multiprocess_pool_size(Optional[int], optional):
+            Number of multi-processing workers,
+            if sets to 1, then disable to using multi-processing;
+            if not specified, then use the number of all cpu counts by `os.cpu_count()`.
+            Defaults to None.
+        shared_counts (bool, optional):
+            Whether to send the counts to the workers by a shared memory block
+            instead of pickling them. Defaults to False.
+        pool (Optional[ParallelManager], optional):
+            The persistent process manager to reuse, its workers number overrides
+            `multiprocess_pool_size`. If not specified,
+            the shared one of :func:`shared_parallel_manager` is used. Defaults to None.
+
+    Raises:
+        ValueError: Get degree neither 'int' nor 'tuple[int, int]'.
+
+    Returns:
+        list[tuple[
+            Union[dict[int, float], dict[int, np.float64]],
+            tuple[int, int],
+            tuple[int, int],
+            str,
+            float,
+        ]]:
+            For each degree in order,
+            purity of each cell, partition range, measuring range, message, time to calculate.
+    """
+
+    # check shots
+    sample_shots = sum(counts[0].values())
+    assert (
+        sample_shots == shots
+    ), f"shots {shots} does not match sample_shots {sample_shots}"
+
+    launch_worker = (
+        workers_distribution(multiprocess_pool_size) if pool is None else pool.workers_num
+    )
+    allsystem_size = len(list(counts[0].keys())[0])
+
+    range_checks = [bitstring_range_check(allsystem_size, d) for d in degrees]
+    bitstring_ranges = [bitstring_range for bitstring_range, _, _ in range_checks]
+
+    if measure is None:
+        measure = qubit_selector(allsystem_size)
+
+    if backend == "Rust" and RUST_AVAILABLE:
+        # The all-Rust core takes one degree per call, use Rust purity cell instead.
+        backend, cell_calculation = "Rust", purity_cell_rust
+    else:
+        backend, cell_calculation = purity_cell_selector(backend)
+
+    times = len(counts)
+    begin = time.time()
+    msg_common = f", Measure: {measure}, backend: {backend}, batch of {len(degrees)}"
+
+    if launch_worker == 1:
+        msg_common += f", single process, {times} overlaps."
+        purity_cells_items = [
+            purity_cells_batch(i, c, bitstring_ranges, cell_calculation)
+            for i, c in enumerate(counts)
+        ]
+    else:
+        msg_common += f", {launch_worker} workers, {times} overlaps"
+        msg_common += ", shared counts." if shared_counts else "."
+        if pool is None:
+            pool = shared_parallel_manager(launch_worker)
+        purity_cells_items = starmap_cells(
+            pool,
+            purity_cells_batch,
+            counts,
+            (bitstring_ranges, cell_calculation),
+            shared_counts,
+        )
+    taken = round(time.time() - begin, 3)
+
+    purity_cells_of_each = dict(purity_cells_items)
+    return [
+        (
+            {i: purity_cells_of_each[i][order] for i in range(times)},
+            bitstring_range,
+            measure,
+            "| Partition: "
+            + ("cycling-" if is_avtive_cycling_slice else "")
+            + f"{bitstring_range}"
+            + msg_common,
+            taken,
+        )
+        for order, (bitstring_range, _, is_avtive_cycling_slice) in enumerate(
+            range_checks
+        )
+    ]
@@ -14,6 +14,18 @@ from ..utils import (
     ensemble_cell as ensemble_cell_py,
     cycling_slice as cycling_slice_py,
 )
+from ..utils.counts import (
+    PackedCounts,
+    flatten_packed_counts,
+    marginal_flattened_counts,
+)
+from ..utils.randomized import (
+    popcount,
+    walsh_hadamard_transform,
+    hamming_distance_histogram,
+    ensemble_cell_from_histogram,
+    ensemble_cell_matrix_sum,
+)
 from ..exceptions import (
     PostProcessingCythonImportError,
     PostProcessingCythonUnavailableWarning,
@@ -23,7 +35,7 @@ from ..exceptions import (
 
 
 try:
-    from ...boost.randomized import purityCellCore  # type: ignore
+    from ...boost.randomized import purityCellCore, purityCellsPacked  # type: ignore
 
     CYTHON_AVAILABLE = True
     FAILED_PYX_IMPORT = None
@@ -38,6 +50,12 @@ except ImportError as err:
             "Cython is not available, using python to calculate purity cell."
         ) from FAILED_PYX_IMPORT
 
+    def purityCellsPacked(*args, **kwargs):
+        """Dummy function for purityCellsPacked."""
+        raise PostProcessingCythonImportError(
+            "Cython is not available, using python to calculate purity cell."
+        ) from FAILED_PYX_IMPORT
+
     # pylint: enable=invalid-name, unused-argument
 
 try:
@@ -50,10 +68,11 @@ try:
     from ...boorust import randomized  # type: ignore
 
     purity_cell_rust_source = randomized.purity_cell_rust
+    purity_cell_packed_rust_source = randomized.purity_cell_packed_rust
 
     RUST_AVAILABLE = True
     FAILED_RUST_IMPORT = None
-except ImportError as err:
+except (ImportError, AttributeError) as err:
     RUST_AVAILABLE = False
     FAILED_RUST_IMPORT = err
 
@@ -63,24 +82,32 @@ except ImportError as err:
             "Rust is not available, using python to calculate purity cell."
         ) from FAILED_RUST_IMPORT
 
+    def purity_cell_packed_rust_source(*args, **kwargs):
+        """Dummy function for purity_cell_packed_rust."""
+        raise PostProcessingRustImportError(
+            "Rust is not available, using python to calculate purity cell."
+        ) from FAILED_RUST_IMPORT
 
-ExistingProcessBackendLabel = Literal["Cython", "Rust", "Python"]
+
+ExistingProcessBackendLabel = Literal["Cython", "Rust", "NumPy", "Python", "Histogram"]
 BackendAvailabilities: dict[
     ExistingProcessBackendLabel, Union[bool, ImportError, None]
 ] = {
     "Cython": CYTHON_AVAILABLE if CYTHON_AVAILABLE else FAILED_PYX_IMPORT,
     "Rust": RUST_AVAILABLE if RUST_AVAILABLE else FAILED_RUST_IMPORT,
+    "NumPy": True,
     "Python": True,
+    "Histogram": True,
 }
 DEFAULT_PROCESS_BACKEND: ExistingProcessBackendLabel = (
-    "Rust" if RUST_AVAILABLE else ("Cython" if CYTHON_AVAILABLE else "Python")
+    "Rust" if RUST_AVAILABLE else ("Cython" if CYTHON_AVAILABLE else "NumPy")
 )
 
 
 # Randomized measure
 def purity_cell_py(
     idx: int,
-    single_counts: dict[str, int],
+    single_counts: Union[dict[str, int], PackedCounts],
     bitstring_range: tuple[int, int],
     subsystem_size: int,
 ) -> tuple[int, np.float64]:
@@ -88,7 +115,8 @@ def purity_cell_py(
 
     Args:
         idx (int): Index of the cell (counts).
-        single_counts (dict[str, int]): Counts measured by the single quantum circuit.
+        single_counts (Union[dict[str, int], PackedCounts]):
+            Counts measured by the single quantum circuit.
         bitstring_range (tuple[int, int]): The range of the subsystem.
         subsystem_size (int): Subsystem size included.
 
@@ -96,6 +124,10 @@ def purity_cell_py(
         tuple[int, float]: Index, one of overlap purity.
     """
 
+    if isinstance(single_counts, PackedCounts):
+        single_counts = single_counts.marginal(bitstring_range).to_dict()
+        bitstring_range = (0, subsystem_size)
+
     shots = sum(single_counts.values())
 
     _dummy_string = "".join(str(ds) for ds in range(subsystem_size))
@@ -133,17 +165,124 @@ def purity_cell_py(
     return idx, _purity_cell
 
 
+HISTOGRAM_TRANSFORM_MAX_SIZE = 24
+"""The largest subsystem size for the Walsh-Hadamard transform in :func:`purity_cell_hist`,
+the probability vector of length 2^n will be too large to allocate above it."""
+
+
+def purity_cell_hist(
+    idx: int,
+    single_counts: Union[dict[str, int], PackedCounts],
+    bitstring_range: tuple[int, int],
+    subsystem_size: int,
+) -> tuple[int, np.float64]:
+    """Calculate the purity cell, one of overlap, of a subsystem
+    by the histogram of outcomes instead of the pairwise loop.
+
+    The outcomes are binned into an integer-indexed probability vector `p`,
+    then the purity cell `sum_{s, s'} 2^n (-2)^{-D(s, s')} p(s) p(s')`
+    equals to `2^{-n} sum_k 3^{|k|} (W p)_k^2`,
+    where `W` is the Walsh-Hadamard transform and `|k|` is the number of set bits of `k`.
+    It costs O(n 2^n) instead of O(K^2 n) for K distinct outcomes.
+    When the subsystem is too large or the distinct outcomes are few,
+    the pairs are summed by hamming distance histogramming with array operations.
+
+    Args:
+        idx (int): Index of the cell (counts).
+        single_counts (Union[dict[str, int], PackedCounts]):
+            Counts measured by the single quantum circuit.
+        bitstring_range (tuple[int, int]): The range of the subsystem.
+        subsystem_size (int): Subsystem size included.
+
+    Returns:
+        tuple[int, float]: Index, one of overlap purity.
+    """
+
+    if isinstance(single_counts, PackedCounts):
+        marginal = single_counts.marginal(bitstring_range)
+    else:
+        marginal = PackedCounts(
+            [
+                int(cycling_slice_py(k, bitstring_range[0], bitstring_range[1], 1), 2)
+                for k in single_counts
+            ],
+            list(single_counts.values()),
+            subsystem_size,
+        ).marginal((0, subsystem_size))
+    outcomes, probs = marginal.outcomes, marginal.probabilities()
+
+    if (
+        subsystem_size <= HISTOGRAM_TRANSFORM_MAX_SIZE
+        and subsystem_size * (1 << subsystem_size) <= len(outcomes) ** 2
+    ):
+        transformed = walsh_hadamard_transform(
+            np.bincount(
+                outcomes.astype(np.int64), weights=probs, minlength=1 << subsystem_size
+            )
+        )
+        weights = np.float_power(
+            3, popcount(np.arange(1 << subsystem_size, dtype=np.uint64))
+        )
+        return idx, np.dot(weights, transformed**2) / np.float_power(
+            2, subsystem_size, dtype=np.float64
+        )
+
+    return idx, ensemble_cell_from_histogram(
+        hamming_distance_histogram(outcomes, probs, outcomes, probs, subsystem_size),
+        subsystem_size,
+    )
+
+
+def purity_cell_np(
+    idx: int,
+    single_counts: Union[dict[str, int], PackedCounts],
+    bitstring_range: tuple[int, int],
+    subsystem_size: int,
+) -> tuple[int, np.float64]:
+    """Calculate the purity cell, one of overlap, of a subsystem by NumPy.
+
+    The marginal outcomes are integer-encoded,
+    then the pairs are summed by the hamming distance matrix of XOR and popcount
+    instead of the pairwise loop in Python.
+    The bitstrings longer than 64 bits are calculated by Python instead.
+
+    Args:
+        idx (int): Index of the cell (counts).
+        single_counts (Union[dict[str, int], PackedCounts]):
+            Counts measured by the single quantum circuit.
+        bitstring_range (tuple[int, int]): The range of the subsystem.
+        subsystem_size (int): Subsystem size included.
+
+    Returns:
+        tuple[int, float]: Index, one of overlap purity.
+    """
+
+    try:
+        marginal = PackedCounts.from_dict(single_counts).marginal(bitstring_range)
+    except ValueError:
+        return purity_cell_py(idx, single_counts, bitstring_range, subsystem_size)
+    probs = marginal.probabilities()
+
+    return idx, ensemble_cell_matrix_sum(
+        marginal.outcomes, probs, marginal.outcomes, probs, subsystem_size
+    )
+
+
 def purity_cell_cy(
     idx: int,
-    single_counts: dict[str, int],
+    single_counts: Union[dict[str, int], PackedCounts],
     bitstring_range: tuple[int, int],
     subsystem_size: int,
 ) -> tuple[int, float]:
     """Calculate the purity cell, one of overlap, of a subsystem by Cython.
 
+    The counts are calculated as integer-encoded outcomes by the kernel without GIL,
+    the bitstrings longer than 64 bits are calculated as strings instead.
+
     Args:
         idx (int): Index of the cell (counts).
-        single_counts (dict[str, int]): Counts measured by the single quantum circuit.
+        single_counts (Union[dict[str, int], PackedCounts]):
+            Counts measured by the single quantum circuit.
         bitstring_range (tuple[int, int]): The range of the subsystem.
         subsystem_size (int): Subsystem size included.
 
@@ -151,20 +290,57 @@ def purity_cell_cy(
         tuple[int, float]: Index, one of overlap purity.
     """
 
-    return idx, purityCellCore(dict(single_counts), bitstring_range, subsystem_size)
+    try:
+        return idx, purity_cells_cy([single_counts], bitstring_range, subsystem_size)[0]
+    except ValueError:
+        return idx, purityCellCore(
+            dict(single_counts), bitstring_range, subsystem_size
+        )
+
+
+def purity_cells_cy(
+    counts: list[Union[dict[str, int], PackedCounts]],
+    bitstring_range: tuple[int, int],
+    subsystem_size: int,
+) -> np.ndarray:
+    """Calculate the purity cells of all counts by Cython at once,
+    the cells are calculated without GIL in parallel by OpenMP threads.
+
+    Args:
+        counts (list[Union[dict[str, int], PackedCounts]]):
+            Counts of the experiment on quantum machine.
+        bitstring_range (tuple[int, int]): The range of the subsystem.
+        subsystem_size (int): Subsystem size included.
+
+    Raises:
+        ValueError: The bitstrings are longer than 64 bits or not the same length.
+
+    Returns:
+        np.ndarray: The purity cell of each counts.
+    """
+    outcomes, values, offsets, _ = marginal_flattened_counts(
+        *flatten_packed_counts(counts), bitstring_range
+    )
+    result = np.empty(len(counts), dtype=np.float64)
+    purityCellsPacked(outcomes, values, offsets, subsystem_size, result)
+    return result
 
 
 def purity_cell_rust(
     idx: int,
-    single_counts: dict[str, int],
+    single_counts: Union[dict[str, int], PackedCounts],
     bitstring_range: tuple[int, int],
     subsystem_size: int,
 ) -> tuple[int, float]:
     """Calculate the purity cell, one of overlap, of a subsystem by Rust.
 
+    The packed counts are read by Rust through the buffer protocol without converting,
+    and the GIL is released during the computation.
+
     Args:
         idx (int): Index of the cell (counts).
-        single_counts (dict[str, int]): Counts measured by the single quantum circuit.
+        single_counts (Union[dict[str, int], PackedCounts]):
+            Counts measured by the single quantum circuit.
         bitstring_range (tuple[int, int]): The range of the subsystem.
         subsystem_size (int): Subsystem size included.
 
@@ -172,12 +348,22 @@ def purity_cell_rust(
         tuple[int, float]: Index, one of overlap purity.
     """
 
+    if isinstance(single_counts, PackedCounts):
+        return purity_cell_packed_rust_source(
+            idx,
+            single_counts.outcomes,
+            single_counts.values_array,
+            single_counts.num_bits,
+            bitstring_range,
+            subsystem_size,
+        )
+
     return purity_cell_rust_source(idx, single_counts, bitstring_range, subsystem_size)
 
 
 def purity_cell(
     idx: int,
-    single_counts: dict[str, int],
+    single_counts: Union[dict[str, int], PackedCounts],
     bitstring_range: tuple[int, int],
     subsystem_size: int,
     backend: ExistingProcessBackendLabel = DEFAULT_PROCESS_BACKEND,
@@ -186,7 +372,8 @@ def purity_cell(
 
     Args:
         idx (int): Index of the cell (counts).
-        single_counts (dict[str, int]): Counts measured by the single quantum circuit.
+        single_counts (Union[dict[str, int], PackedCounts]):
+            Counts measured by the single quantum circuit.
         bitstring_range (tuple[int, int]): The range of the subsystem.
         subsystem_size (int): Subsystem size included.
         backend (ExistingProcessBackendLabel, optional):
@@ -197,21 +384,25 @@ def purity_cell(
     """
     if not RUST_AVAILABLE and backend == "Rust":
         warnings.warn(
-            "Rust is not available, using Cython or Python to calculate purity cell."
+            "Rust is not available, using Cython or NumPy to calculate purity cell."
             + f"Check the error: {FAILED_RUST_IMPORT}",
             PostProcessingRustUnavailableWarning,
         )
-        backend = "Cython" if CYTHON_AVAILABLE else "Python"
+        backend = "Cython" if CYTHON_AVAILABLE else "NumPy"
     if not CYTHON_AVAILABLE and backend == "Cython":
         warnings.warn(
-            "Cython is not available, using Python or Rust to calculate purity cell."
+            "Cython is not available, using NumPy or Rust to calculate purity cell."
             + f"Check the error: {FAILED_PYX_IMPORT}",
             PostProcessingCythonUnavailableWarning,
         )
-        backend = "Rust" if RUST_AVAILABLE else "Python"
+        backend = "Rust" if RUST_AVAILABLE else "NumPy"
 
     if backend == "Cython":
         return purity_cell_cy(idx, single_counts, bitstring_range, subsystem_size)
+    if backend == "Histogram":
+        return purity_cell_hist(idx, single_counts, bitstring_range, subsystem_size)
     if backend == "Rust":
         return purity_cell_rust(idx, single_counts, bitstring_range, subsystem_size)
+    if backend == "NumPy":
+        return purity_cell_np(idx, single_counts, bitstring_range, subsystem_size)
     return purity_cell_py(idx, single_counts, bitstring_range, subsystem_size)
@@ -15,11 +15,14 @@ import tqdm
 from .echo_cell import (
     echo_cell_py,
     echo_cell_cy,
-    # echo_cell_rust,
+    echo_cell_rust,
+    echo_cell_np,
+    echo_cells_cy,
     CYTHON_AVAILABLE,
     FAILED_PYX_IMPORT,
 )
 from ..utils import qubit_selector
+from ..utils.counts import PackedCounts, unpack_counts
 from ..availability import (
     availablility,
     default_postprocessing_backend,
@@ -27,52 +30,54 @@ from ..availability import (
 )
 from ..exceptions import (
     PostProcessingCythonUnavailableWarning,
-    # PostProcessingRustImportError,
-    # PostProcessingRustUnavailableWarning,
+    PostProcessingRustImportError,
+    PostProcessingRustUnavailableWarning,
 )
 from ...tools import (
     ParallelManager,
+    shared_parallel_manager,
     workers_distribution,
 )
 
-# try:
-#     from ..boorust import randomized  # type: ignore
+try:
+    from ...boorust import randomized  # type: ignore
 
-#     overlap_echo_core_rust_source = randomized.overlap_echo_core
+    overlap_echo_core_rust_source = randomized.overlap_echo_core_rust
 
-#     RUST_AVAILABLE = True
-#     FAILED_RUST_IMPORT = None
-# except ImportError as err:
-#     RUST_AVAILABLE = False
-#     FAILED_RUST_IMPORT = err
+    RUST_AVAILABLE = True
+    FAILED_RUST_IMPORT = None
+except ImportError as err:
+    RUST_AVAILABLE = False
+    FAILED_RUST_IMPORT = err
 
-#     def overlap_echo_core_rust_source(*args, **kwargs):
-#         """Dummy function for entangled_entropy_core_rust."""
-#         raise PostProcessingRustImportError(
-#             "Rust is not available, using python to calculate overlap echo."
-#         ) from FAILED_RUST_IMPORT
+    def overlap_echo_core_rust_source(*args, **kwargs):
+        """Dummy function for overlap_echo_core_rust."""
+        raise PostProcessingRustImportError(
+            "Rust is not available, using python to calculate overlap echo."
+        ) from FAILED_RUST_IMPORT
 
 PostProcessingBackendStatement = availablility(
-    "randomized_measure.entangled_entropy",
+    "randomized_measure.wavefunction_overlap",
     [
-        # ("Rust", RUST_AVAILABLE, FAILED_RUST_IMPORT),
+        ("Rust", RUST_AVAILABLE, FAILED_RUST_IMPORT),
         ("Cython", CYTHON_AVAILABLE, FAILED_PYX_IMPORT),
+        ("NumPy", True, None),
     ],
 )
 DEFAULT_PROCESS_BACKEND = default_postprocessing_backend(
-    # RUST_AVAILABLE,
-    False,
+    RUST_AVAILABLE,
     CYTHON_AVAILABLE,
 )
 
 
 def overlap_echo_core_pycyrust(
     shots: int,
-    counts: list[dict[str, int]],
+    counts: list[Union[dict[str, int], PackedCounts]],
     degree: Optional[Union[tuple[int, int], int]] = None,
     measure: Optional[tuple[int, int]] = None,
     multiprocess_pool_size: Optional[int] = None,
     backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+    pool: Optional[ParallelManager] = None,
 ) -> tuple[
     Union[dict[int, float], dict[int, np.float64]],
     tuple[int, int],
@@ -84,7 +89,8 @@ def overlap_echo_core_pycyrust(
 
     Args:
         shots (int): Shots of the experiment on quantum machine.
-        counts (list[dict[str, int]]): Counts of the experiment on quantum machine.
+        counts (list[Union[dict[str, int], PackedCounts]]):
+            Counts of the experiment on quantum machine.
         degree (Union[tuple[int, int], int]): Degree of the subsystem.
         measure (tuple[int, int], optional): Measuring range on quantum circuits. Defaults to None.
         workers_num (Optional[int], optional):
@@ -95,6 +101,10 @@ def overlap_echo_core_pycyrust(
         backend (PostProcessingBackendLabel, optional):
             The backend of the process, 'Cython', 'Rust' or 'Python'.
             Defaults to DEFAULT_PROCESS_BACKEND.
+        pool (Optional[ParallelManager], optional):
+            The persistent process manager to reuse, its workers number overrides
+            `multiprocess_pool_size`. If not specified,
+            the shared one of :func:`shared_parallel_manager` is used. Defaults to None.
 
     Raises:
         ValueError: Get degree neither 'int' nor 'tuple[int, int]'.
@@ -118,7 +128,9 @@ def overlap_echo_core_pycyrust(
     ), f"shots {shots} does not match sample_shots {sample_shots}"
 
     # Determine worker number
-    launch_worker = workers_distribution(multiprocess_pool_size)
+    launch_worker = (
+        workers_distribution(multiprocess_pool_size) if pool is None else pool.workers_num
+    )
 
     # Determine degree
     if degree is None:
@@ -166,30 +178,40 @@ def overlap_echo_core_pycyrust(
         )
         backend = DEFAULT_PROCESS_BACKEND
 
-    # if not RUST_AVAILABLE and backend == "Rust":
-    #     warnings.warn(
-    #         "Rust is not available, using Cython or Python to calculate purity cell."
-    #         + f"Check the error: {FAILED_RUST_IMPORT}",
-    #         PostProcessingRustUnavailableWarning,
-    #     )
-    #     backend = "Cython" if CYTHON_AVAILABLE else "Python"
+    if not RUST_AVAILABLE and backend == "Rust":
+        warnings.warn(
+            "Rust is not available, using Cython or NumPy to calculate echo cell."
+            + f"Check the error: {FAILED_RUST_IMPORT}",
+            PostProcessingRustUnavailableWarning,
+        )
+        backend = "Cython" if CYTHON_AVAILABLE else "NumPy"
     if not CYTHON_AVAILABLE and backend == "Cython":
         warnings.warn(
-            "Cython is not available, using Python to calculate purity cell."
+            "Cython is not available, using Rust or NumPy to calculate echo cell."
             + f"Check the error: {FAILED_PYX_IMPORT}",
             PostProcessingCythonUnavailableWarning,
         )
-        # backend = "Rust" if RUST_AVAILABLE else "Python"
-        backend = "Python"
-
-    cell_calculation = (
-        echo_cell_cy
-        if backend == "Cython"
-        # else (echo_cell_rust if backend == "Rust" else echo_cell_py)
-        else echo_cell_py
-    )
+        backend = "Rust" if RUST_AVAILABLE else "NumPy"
+
+    cell_calculation = {
+        "Cython": echo_cell_cy,
+        "Rust": echo_cell_rust,
+        "NumPy": echo_cell_np,
+    }.get(backend, echo_cell_py)
+
+    echo_cell_items = None
+    if backend == "Cython":
+        try:
+            echo_cell_items = list(
+                enumerate(echo_cells_cy(counts, bitstring_range, subsystem_size))
+            )
+            msg += f", OpenMP threads, {times} overlaps."
+        except ValueError:
+            echo_cell_items = None
 
-    if launch_worker == 1:
+    if echo_cell_items is not None:
+        take_time = round(time.time() - begin_time, 3)
+    elif launch_worker == 1:
         echo_cell_items = []
         msg += f", single process, {times} overlaps, it will take a lot of time."
         print(msg)
@@ -202,7 +224,8 @@ def overlap_echo_core_pycyrust(
     else:
         msg += f", {launch_worker} workers, {times} overlaps."
 
-        pool = ParallelManager(launch_worker)
+        if pool is None:
+            pool = shared_parallel_manager(launch_worker)
         echo_cell_items = pool.starmap(
             cell_calculation,
             [
@@ -218,43 +241,44 @@ def overlap_echo_core_pycyrust(
     return echo_cell_dict, bitstring_range, measure, msg, take_time
 
 
-# def overlap_echo_allrust(
-#     shots: int,
-#     counts: list[dict[str, int]],
-#     degree: Union[tuple[int, int], int],
-#     measure: tuple[int, int] = None,
-# ) -> tuple[dict[int, float], tuple[int, int], tuple[int, int], str, float]:
-#     """The core function of entangled entropy.
+def overlap_echo_core_allrust(
+    shots: int,
+    counts: list[Union[dict[str, int], PackedCounts]],
+    degree: Optional[Union[tuple[int, int], int]] = None,
+    measure: Optional[tuple[int, int]] = None,
+) -> tuple[dict[int, float], tuple[int, int], tuple[int, int], str, float]:
+    """The core function of wavefunction overlap by Rust.
 
-#     Args:
-#         shots (int): Shots of the experiment on quantum machine.
-#         counts (list[dict[str, int]]): Counts of the experiment on quantum machine.
-#         degree (Union[tuple[int, int], int]): Degree of the subsystem.
-#         measure (tuple[int, int], optional):
-#             Measuring range on quantum circuits. Defaults to None.
-#         backend (PostProcessingBackendLabel, optional):
-#             The backend of the process, 'Cython', 'Rust' or 'Python'.
-#             Defaults to DEFAULT_PROCESS_BACKEND.
+    Args:
+        shots (int): Shots of the experiment on quantum machine.
+        counts (list[Union[dict[str, int], PackedCounts]]):
+            Counts of the experiment on quantum machine.
+        degree (Union[tuple[int, int], int]): Degree of the subsystem.
+        measure (tuple[int, int], optional):
+            Measuring range on quantum circuits. Defaults to None.
 
-#     Raises:
-#         ValueError: Get degree neither 'int' nor 'tuple[int, int]'.
-#         ValueError: Measure range does not contain subsystem.
+    Raises:
+        ValueError: Get degree neither 'int' nor 'tuple[int, int]'.
+        ValueError: Measure range does not contain subsystem.
 
-#     Returns:
-#         tuple[dict[int, float], tuple[int, int], tuple[int, int], str, float]:
-#             Purity of each cell, Partition range, Measuring range, Message, Time to calculate.
-#     """
+    Returns:
+        tuple[dict[int, float], tuple[int, int], tuple[int, int], str, float]:
+            Purity of each cell, Partition range, Measuring range, Message, Time to calculate.
+    """
 
-#     return overlap_echo_core_rust_source(shots, counts, degree, measure)
+    return overlap_echo_core_rust_source(
+        shots, unpack_counts(counts), degree, measure
+    )
 
 
 def overlap_echo_core(
     shots: int,
-    counts: list[dict[str, int]],
+    counts: list[Union[dict[str, int], PackedCounts]],
     degree: Optional[Union[tuple[int, int], int]],
     measure: Optional[tuple[int, int]] = None,
     multiprocess_pool_size: Optional[int] = None,
     backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+    pool: Optional[ParallelManager] = None,
 ) -> tuple[
     Union[dict[int, float], dict[int, np.float64]],
     tuple[int, int],
@@ -266,7 +290,8 @@ def overlap_echo_core(
 
     Args:
         shots (int): Shots of the experiment on quantum machine.
-        counts (list[dict[str, int]]): Counts of the experiment on quantum machine.
+        counts (list[Union[dict[str, int], PackedCounts]]):
+            Counts of the experiment on quantum machine.
         degree (Union[tuple[int, int], int]): Degree of the subsystem.
         measure (tuple[int, int], optional): Measuring range on quantum circuits. Defaults to None.
         workers_num (Optional[int], optional):
@@ -277,6 +302,10 @@ def overlap_echo_core(
         backend (PostProcessingBackendLabel, optional):
             The backend of the process, 'Cython', 'Rust' or 'Python'.
             Defaults to DEFAULT_PROCESS_BACKEND.
+        pool (Optional[ParallelManager], optional):
+            The persistent process manager to reuse, its workers number overrides
+            `multiprocess_pool_size`. If not specified,
+            the shared one of :func:`shared_parallel_manager` is used. Defaults to None.
 
     Raises:
         ValueError: Get degree neither 'int' nor 'tuple[int, int]'.
@@ -296,29 +325,30 @@ def overlap_echo_core(
     if isinstance(measure, list):
         measure = tuple(measure)  # type: ignore
 
-    # if backend == "Rust":
-    #     if RUST_AVAILABLE:
-    #         return eoverlap_echo_core_allrust(shots, counts, degree, measure)
-    #     backend = "Cython" if CYTHON_AVAILABLE else "Python"
-    #     warnings.warn(
-    #         f"Rust is not available, using {backend} to calculate purity cell."
-    #         + f" Check the error: {FAILED_RUST_IMPORT}",
-    #         PostProcessingRustUnavailableWarning,
-    #     )
+    if backend == "Rust":
+        if RUST_AVAILABLE:
+            return overlap_echo_core_allrust(shots, counts, degree, measure)
+        backend = "Cython" if CYTHON_AVAILABLE else "NumPy"
+        warnings.warn(
+            f"Rust is not available, using {backend} to calculate echo cell."
+            + f" Check the error: {FAILED_RUST_IMPORT}",
+            PostProcessingRustUnavailableWarning,
+        )
 
     return overlap_echo_core_pycyrust(
-        shots, counts, degree, measure, multiprocess_pool_size, backend
+        shots, counts, degree, measure, multiprocess_pool_size, backend, pool
     )
 
 
 def randomized_overlap_echo(
     shots: int,
-    counts: list[dict[str, int]],
+    counts: list[Union[dict[str, int], PackedCounts]],
     degree: Optional[Union[tuple[int, int], int]] = None,
     measure: Optional[tuple[int, int]] = None,
     backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
     workers_num: Optional[int] = None,
     pbar: Optional[tqdm.tqdm] = None,
+    pool: Optional[ParallelManager] = None,
 ) -> dict[str, float]:
     """Calculate entangled entropy.
 
@@ -351,7 +381,8 @@ def randomized_overlap_echo(
 
     Args:
         shots (int): Shots of the experiment on quantum machine.
-        counts (list[dict[str, int]]): Counts of the experiment on quantum machine.
+        counts (list[Union[dict[str, int], PackedCounts]]):
+            Counts of the experiment on quantum machine.
         degree (Union[tuple[int, int], int]): Degree of the subsystem.
         measure (tuple[int, int], optional): Measuring range on quantum circuits. Defaults to None.
         workers_num (Optional[int], optional):
@@ -360,6 +391,8 @@ def randomized_overlap_echo(
             if not specified, then use the number of all cpu counts - 2 by `cpu_count() - 2`.
             Defaults to None.
         pbar (Optional[tqdm.tqdm], optional): Progress bar. Defaults to None.
+        pool (Optional[ParallelManager], optional):
+            The persistent process manager to reuse. Defaults to None.
         all_system_source (Optional['EntropyRandomizedAnalysis'], optional):
             The source of the all system. Defaults to None.
         use_cython (bool, optional): Use cython to calculate purity cell. Defaults to True.
@@ -385,6 +418,7 @@ def randomized_overlap_echo(
         measure=measure,
         backend=backend,
         multiprocess_pool_size=workers_num,
+        pool=pool,
     )
     echo_cell_list: Union[list[float], list[np.float64]] = list(
         echo_cell_dict.values()
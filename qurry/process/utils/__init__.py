@@ -13,3 +13,12 @@ from .randomized import (
     hamming_distance,
     ensemble_cell,
 )
+from .counts import (
+    PackedCounts,
+    pack_counts,
+    unpack_counts,
+    SharedCountsBlock,
+    share_counts,
+    shared_counts_item,
+    release_shared_counts,
+)
@@ -0,0 +1,437 @@
+"""
+================================================================
+Packed Counts for PostProcessing
+(:mod:`qurry.process.utils.counts`)
+================================================================
+
+"""
+
+from collections.abc import Mapping
+from multiprocessing import shared_memory
+from typing import Iterator, Union, Optional, NamedTuple
+import numpy as np
+
+
+MAX_PACKED_BITS = 64
+"""The maximum length of bitstrings which can be packed into `uint64`."""
+
+
+def _bit_mask(length: int) -> np.uint64:
+    """Return the mask with the lowest `length` bits set.
+
+    Args:
+        length (int): The number of bits.
+
+    Returns:
+        np.uint64: The mask.
+    """
+    return np.uint64((1 << length) - 1)
+
+
+def _strip_register_separators(bitstring: str) -> str:
+    """Remove the spaces between classical registers from a bitstring,
+    like `'01 10'` from the counts of multiple registers.
+
+    Args:
+        bitstring (str): The bitstring.
+
+    Returns:
+        str: The bitstring without separators.
+    """
+    return bitstring.replace(" ", "")
+
+
+def slice_packed_bitstrings(
+    outcomes: np.ndarray,
+    num_bits: int,
+    start: int,
+    end: int,
+) -> tuple[np.ndarray, int]:
+    """Slice the integer-encoded bitstrings by bit masks and shifts,
+    which is the same as :func:`qurry.process.utils.cycling_slice` on the bitstrings.
+
+    The first character of a bitstring is the highest bit of its integer.
+
+    Args:
+        outcomes (np.ndarray): The integer-encoded bitstrings.
+        num_bits (int): The length of bitstrings.
+        start (int): Index of start.
+        end (int): Index of end.
+
+    Raises:
+        IndexError: Slice out of range.
+
+    Returns:
+        tuple[np.ndarray, int]: The sliced integer-encoded bitstrings and their length.
+    """
+    if start <= -num_bits and end >= num_bits:
+        raise IndexError(
+            f"Slice out of range, start: {start}, end: {end}, length: {num_bits}."
+        )
+    outcomes = np.asarray(outcomes, dtype=np.uint64)
+    if start < 0 <= end:
+        tail_length = -start
+        tail = outcomes & _bit_mask(tail_length)
+        head = (
+            outcomes >> np.uint64(num_bits - end)
+            if end > 0
+            else np.zeros_like(outcomes)
+        )
+        return (tail << np.uint64(end)) | head, tail_length + end
+
+    start, end, _ = slice(start, end).indices(num_bits)
+    length = max(end - start, 0)
+    return (outcomes >> np.uint64(num_bits - end)) & _bit_mask(length), length
+
+
+class PackedCounts(Mapping):
+    """The counts of a single circuit stored as integer-encoded outcomes and their counts.
+
+    It is a read-only mapping from bitstrings to counts,
+    so it can be used everywhere `dict[str, int]` counts is used,
+    but it is stored as two contiguous arrays,
+    which is much smaller in memory and cheap to pickle to workers.
+    """
+
+    __slots__ = ("outcomes", "values_array", "num_bits")
+
+    outcomes: np.ndarray
+    """The integer-encoded outcomes as `uint64`,
+    the first character of bitstring is the highest bit."""
+    values_array: np.ndarray
+    """The counts of each outcome as `int64`."""
+    num_bits: int
+    """The length of bitstrings."""
+
+    def __init__(
+        self,
+        outcomes: Union[np.ndarray, list[int]],
+        values: Union[np.ndarray, list[int]],
+        num_bits: int,
+    ):
+        if num_bits > MAX_PACKED_BITS:
+            raise ValueError(
+                f"Bitstrings of length {num_bits} can not be packed, "
+                + f"the maximum is {MAX_PACKED_BITS}."
+            )
+        self.outcomes = np.ascontiguousarray(outcomes, dtype=np.uint64)
+        self.values_array = np.ascontiguousarray(values, dtype=np.int64)
+        self.num_bits = num_bits
+        assert self.outcomes.shape == self.values_array.shape, (
+            f"The shape of outcomes {self.outcomes.shape} "
+            + f"does not match the shape of values {self.values_array.shape}."
+        )
+
+    @classmethod
+    def from_dict(
+        cls,
+        single_counts: Mapping,
+        num_bits: Optional[int] = None,
+    ) -> "PackedCounts":
+        """Pack the counts from a dictionary,
+        the spaces between classical registers in bitstrings are removed.
+
+        Args:
+            single_counts (Mapping[str, int]): Counts measured by the single quantum circuit.
+            num_bits (Optional[int], optional):
+                The length of bitstrings. Defaults to None for the length of the first key.
+
+        Raises:
+            ValueError: The bitstrings are not the same length.
+
+        Returns:
+            PackedCounts: The packed counts.
+        """
+        if isinstance(single_counts, PackedCounts):
+            return single_counts
+        bitstrings = [_strip_register_separators(bitstring) for bitstring in single_counts]
+        if num_bits is None:
+            num_bits = len(bitstrings[0]) if len(bitstrings) > 0 else 0
+        for bitstring in bitstrings:
+            if len(bitstring) != num_bits:
+                raise ValueError(
+                    f"Bitstring '{bitstring}' is not the same length as {num_bits}."
+                )
+        return cls(
+            [int(bitstring, 2) if bitstring else 0 for bitstring in bitstrings],
+            list(single_counts.values()),
+            num_bits,
+        )
+
+    def to_dict(self) -> dict[str, int]:
+        """Unpack the counts into a dictionary.
+
+        Returns:
+            dict[str, int]: The counts.
+        """
+        return dict(self.items())
+
+    @property
+    def shots(self) -> int:
+        """The total number of counts."""
+        return int(self.values_array.sum())
+
+    def marginal(self, bitstring_range: tuple[int, int]) -> "PackedCounts":
+        """Marginalize the counts onto a range of bitstring,
+        the range can be cycling like :func:`qurry.process.utils.cycling_slice`.
+
+        Args:
+            bitstring_range (tuple[int, int]): The range of the subsystem.
+
+        Returns:
+            PackedCounts: The marginal counts.
+        """
+        sliced, length = slice_packed_bitstrings(
+            self.outcomes, self.num_bits, bitstring_range[0], bitstring_range[1]
+        )
+        outcomes, inverse = np.unique(sliced, return_inverse=True)
+        values = np.bincount(
+            inverse.reshape(-1), weights=self.values_array, minlength=len(outcomes)
+        )
+        return PackedCounts(outcomes, values.astype(np.int64), length)
+
+    def probabilities(self) -> np.ndarray:
+        """The probabilities of each outcome.
+
+        Returns:
+            np.ndarray: The probabilities.
+        """
+        return self.values_array / np.float64(self.shots)
+
+    def items(self) -> list[tuple[str, int]]:
+        return list(zip(self, self.values_array.tolist()))
+
+    def values(self) -> list[int]:
+        return self.values_array.tolist()
+
+    def __getitem__(self, key: str) -> int:
+        bitstring = _strip_register_separators(key)
+        if len(bitstring) != self.num_bits:
+            raise KeyError(key)
+        try:
+            outcome = int(bitstring, 2) if bitstring else 0
+            found = np.flatnonzero(self.outcomes == np.uint64(outcome))
+        except ValueError as err:
+            raise KeyError(key) from err
+        if len(found) == 0:
+            raise KeyError(key)
+        return int(self.values_array[found].sum())
+
+    def __iter__(self) -> Iterator[str]:
+        for outcome in self.outcomes.tolist():
+            # An empty slice is the empty bitstring, not '0'.
+            yield format(outcome, f"0{self.num_bits}b") if self.num_bits > 0 else ""
+
+    def __len__(self) -> int:
+        return len(self.outcomes)
+
+    def __reduce__(self):
+        return (self.__class__, (self.outcomes, self.values_array, self.num_bits))
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}(num_bits={self.num_bits}, "
+            + f"outcomes={len(self)}, shots={self.shots})>"
+        )
+
+
+def pack_counts(
+    counts: list[Union[dict[str, int], PackedCounts]],
+) -> list[PackedCounts]:
+    """Pack a list of counts.
+
+    Args:
+        counts (list[Union[dict[str, int], PackedCounts]]): The counts.
+
+    Returns:
+        list[PackedCounts]: The packed counts.
+    """
+    return [PackedCounts.from_dict(c) for c in counts]
+
+
+def flatten_packed_counts(
+    counts: list[Union[dict[str, int], PackedCounts]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """Concatenate a list of counts into contiguous arrays,
+    which can be read by the kernels through the buffer protocol without copying.
+
+    Args:
+        counts (list[Union[dict[str, int], PackedCounts]]): The counts.
+
+    Raises:
+        ValueError: The bitstrings of the counts are not the same length.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+            The outcomes as `uint64`, the values as `int64`, the offsets as `int64`,
+            and the length of bitstrings,
+            the counts of index `i` is in `[offsets[i], offsets[i+1])` of both arrays.
+    """
+    packed = pack_counts(counts)
+    num_bits_set = {c.num_bits for c in packed if len(c) > 0}
+    if len(num_bits_set) > 1:
+        raise ValueError(
+            f"The bitstrings of counts are not the same length: {num_bits_set}."
+        )
+    num_bits = num_bits_set.pop() if len(num_bits_set) > 0 else 0
+
+    offsets = np.zeros(len(packed) + 1, dtype=np.int64)
+    np.cumsum([len(c) for c in packed], out=offsets[1:])
+    outcomes = np.concatenate([c.outcomes for c in packed] + [np.empty(0, np.uint64)])
+    values = np.concatenate([c.values_array for c in packed] + [np.empty(0, np.int64)])
+    return outcomes, values, offsets, num_bits
+
+
+def marginal_flattened_counts(
+    outcomes: np.ndarray,
+    values: np.ndarray,
+    offsets: np.ndarray,
+    num_bits: int,
+    bitstring_range: tuple[int, int],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """Marginalize the counts from :func:`flatten_packed_counts` onto a range of bitstring,
+    the outcomes of each counts are merged and sorted by array operations at once.
+
+    Args:
+        outcomes (np.ndarray): The outcomes as `uint64`.
+        values (np.ndarray): The values as `int64`.
+        offsets (np.ndarray): The offsets of each counts as `int64`.
+        num_bits (int): The length of bitstrings.
+        bitstring_range (tuple[int, int]): The range of the subsystem.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+            The marginal outcomes, values, offsets and the length of bitstrings.
+    """
+    sliced, length = slice_packed_bitstrings(
+        outcomes, num_bits, bitstring_range[0], bitstring_range[1]
+    )
+    num_counts = len(offsets) - 1
+    counts_idx = np.repeat(np.arange(num_counts, dtype=np.int64), np.diff(offsets))
+    order = np.lexsort((sliced, counts_idx))
+    sliced, counts_idx, values = sliced[order], counts_idx[order], values[order]
+
+    is_new = np.ones(len(sliced), dtype=bool)
+    is_new[1:] = (sliced[1:] != sliced[:-1]) | (counts_idx[1:] != counts_idx[:-1])
+    merged_values = np.bincount(
+        np.cumsum(is_new) - 1, weights=values, minlength=int(is_new.sum())
+    ).astype(np.int64)
+
+    merged_offsets = np.zeros(num_counts + 1, dtype=np.int64)
+    np.cumsum(
+        np.bincount(counts_idx[is_new], minlength=num_counts), out=merged_offsets[1:]
+    )
+    return (
+        np.ascontiguousarray(sliced[is_new]),
+        np.ascontiguousarray(merged_values),
+        merged_offsets,
+        length,
+    )
+
+
+def unpack_counts(
+    counts: list[Union[dict[str, int], PackedCounts]],
+) -> list[dict[str, int]]:
+    """Unpack a list of counts into dictionaries.
+
+    Args:
+        counts (list[Union[dict[str, int], PackedCounts]]): The counts.
+
+    Returns:
+        list[dict[str, int]]: The counts as dictionaries.
+    """
+    return [c.to_dict() if isinstance(c, PackedCounts) else c for c in counts]
+
+
+class SharedCountsBlock(NamedTuple):
+    """The location of a list of counts laid out in a shared memory block.
+
+    The block contains the outcomes of all counts as `uint64`
+    followed by their values as `int64`,
+    the counts of index `i` is in `[offsets[i], offsets[i+1])` of both arrays.
+    It is small and cheap to be sent to the workers instead of the counts.
+    """
+
+    name: str
+    """The name of the shared memory block."""
+    num_bits: tuple[int, ...]
+    """The length of bitstrings of each counts."""
+    offsets: tuple[int, ...]
+    """The offsets of each counts in the arrays."""
+
+    @property
+    def total(self) -> int:
+        """The total number of outcomes in the block."""
+        return self.offsets[-1]
+
+
+def share_counts(
+    counts: list[Union[dict[str, int], PackedCounts]],
+) -> tuple[shared_memory.SharedMemory, SharedCountsBlock]:
+    """Lay out a list of counts into a shared memory block.
+
+    The caller owns the returned shared memory,
+    and should call :func:`release_shared_counts` after the workers finished.
+
+    Args:
+        counts (list[Union[dict[str, int], PackedCounts]]): The counts.
+
+    Returns:
+        tuple[shared_memory.SharedMemory, SharedCountsBlock]:
+            The shared memory and the location of counts in it.
+    """
+    packed = pack_counts(counts)
+    offsets = np.zeros(len(packed) + 1, dtype=np.int64)
+    np.cumsum([len(c) for c in packed], out=offsets[1:])
+    total = int(offsets[-1])
+
+    shm = shared_memory.SharedMemory(create=True, size=max(total * 16, 1))
+    outcomes = np.ndarray((total,), dtype=np.uint64, buffer=shm.buf)
+    values = np.ndarray((total,), dtype=np.int64, buffer=shm.buf, offset=total * 8)
+    for i, c in enumerate(packed):
+        outcomes[offsets[i] : offsets[i + 1]] = c.outcomes
+        values[offsets[i] : offsets[i + 1]] = c.values_array
+    del outcomes, values
+
+    return shm, SharedCountsBlock(
+        shm.name,
+        tuple(c.num_bits for c in packed),
+        tuple(offsets.tolist()),
+    )
+
+
+def shared_counts_item(block: SharedCountsBlock, idx: int) -> PackedCounts:
+    """Read the counts of index `idx` from the shared memory block.
+
+    Args:
+        block (SharedCountsBlock): The location of counts.
+        idx (int): Index of the counts.
+
+    Returns:
+        PackedCounts: The counts copied out of the shared memory.
+    """
+    shm = shared_memory.SharedMemory(name=block.name)
+    try:
+        start, end = block.offsets[idx], block.offsets[idx + 1]
+        outcomes = np.ndarray(
+            (end - start,), dtype=np.uint64, buffer=shm.buf, offset=start * 8
+        ).copy()
+        values = np.ndarray(
+            (end - start,),
+            dtype=np.int64,
+            buffer=shm.buf,
+            offset=(block.total + start) * 8,
+        ).copy()
+    finally:
+        shm.close()
+    return PackedCounts(outcomes, values, block.num_bits[idx])
+
+
+def release_shared_counts(shm: shared_memory.SharedMemory) -> None:
+    """Close and free the shared memory block from :func:`share_counts`.
+
+    Args:
+        shm (shared_memory.SharedMemory): The shared memory.
+    """
+    shm.close()
+    shm.unlink()
@@ -380,3 +380,140 @@ def cycling_slice_rust(target: str, start: int, end: int, step: int = 1) -> str:
         PostProcessingRustUnavailableWarning,
     )
     return cycling_slice(target, start, end, step)
+
+
+def popcount(arr: np.ndarray) -> np.ndarray:
+    """Count the set bits of each element of an unsigned integer array.
+
+    Args:
+        arr (np.ndarray): Array of unsigned integers.
+
+    Returns:
+        np.ndarray: The number of set bits of each element.
+    """
+    arr = np.ascontiguousarray(arr, dtype=np.uint64)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(arr).astype(np.int64)
+    return np.unpackbits(arr.view(np.uint8).reshape(-1, 8), axis=1).sum(
+        axis=1, dtype=np.int64
+    ).reshape(arr.shape)
+
+
+def walsh_hadamard_transform(vector: np.ndarray) -> np.ndarray:
+    """Apply the unnormalized Walsh-Hadamard transform on a vector of length 2^n.
+
+    Args:
+        vector (np.ndarray): The vector of length 2^n.
+
+    Returns:
+        np.ndarray: The transformed vector.
+    """
+    length = len(vector)
+    assert length & (length - 1) == 0, f"Length {length} is not a power of 2."
+    transformed = np.array(vector, dtype=np.float64)
+    half = 1
+    while half < length:
+        transformed = transformed.reshape(-1, 2, half)
+        transformed = np.stack(
+            (
+                transformed[:, 0] + transformed[:, 1],
+                transformed[:, 0] - transformed[:, 1],
+            ),
+            axis=1,
+        )
+        half *= 2
+    return transformed.reshape(length)
+
+
+def hamming_distance_histogram(
+    indices_i: np.ndarray,
+    probs_i: np.ndarray,
+    indices_j: np.ndarray,
+    probs_j: np.ndarray,
+    a_num: int,
+) -> np.ndarray:
+    """Accumulate the products of probabilities by the hamming distance between outcomes.
+
+    Args:
+        indices_i (np.ndarray): Integer-encoded outcomes of the first distribution.
+        probs_i (np.ndarray): Probabilities of the first distribution.
+        indices_j (np.ndarray): Integer-encoded outcomes of the second distribution.
+        probs_j (np.ndarray): Probabilities of the second distribution.
+        a_num (int): Degree of freedom, the length of outcomes.
+
+    Returns:
+        np.ndarray: The histogram of length `a_num + 1`,
+            the sum of `p_i * p_j` over all pairs with the hamming distance as index.
+    """
+    indices_j = np.asarray(indices_j, dtype=np.uint64)
+    probs_j = np.asarray(probs_j, dtype=np.float64)
+    histogram = np.zeros(a_num + 1, dtype=np.float64)
+    for s_i, p_i in zip(np.asarray(indices_i, dtype=np.uint64), probs_i):
+        histogram += np.bincount(
+            popcount(indices_j ^ s_i), weights=probs_j * p_i, minlength=a_num + 1
+        )
+    return histogram
+
+
+def ensemble_cell_from_histogram(histogram: np.ndarray, a_num: int) -> np.float64:
+    """Reduce a hamming distance histogram into the value of ensemble average.
+
+    Args:
+        histogram (np.ndarray): The histogram from :func:`hamming_distance_histogram`.
+        a_num (int): Degree of freedom.
+
+    Returns:
+        np.float64: The sum of :func:`ensemble_cell` over all pairs.
+    """
+    return np.float_power(2, a_num, dtype=np.float64) * np.dot(
+        np.float_power(-2, -np.arange(a_num + 1), dtype=np.float64), histogram
+    )
+
+
+HAMMING_MATRIX_BLOCK_ELEMENTS = 2**22
+"""The maximum number of elements of the hamming distance matrix
+in :func:`ensemble_cell_matrix_sum` at once, the rows are chunked above it."""
+
+
+def ensemble_cell_matrix_sum(
+    indices_i: np.ndarray,
+    probs_i: np.ndarray,
+    indices_j: np.ndarray,
+    probs_j: np.ndarray,
+    a_num: int,
+    block_elements: int = HAMMING_MATRIX_BLOCK_ELEMENTS,
+) -> np.float64:
+    """Sum :func:`ensemble_cell` over all pairs of outcomes by array operations.
+
+    The hamming distance matrix between both outcomes is calculated by XOR and popcount,
+    mapped into the weights `2^n (-2)^{-D}` by a lookup table,
+    then reduced by `p_i @ W @ p_j`.
+    The rows are chunked so the matrix is at most `block_elements` at once.
+
+    Args:
+        indices_i (np.ndarray): Integer-encoded outcomes of the first distribution.
+        probs_i (np.ndarray): Probabilities of the first distribution.
+        indices_j (np.ndarray): Integer-encoded outcomes of the second distribution.
+        probs_j (np.ndarray): Probabilities of the second distribution.
+        a_num (int): Degree of freedom, the length of outcomes.
+        block_elements (int, optional):
+            The maximum number of elements of the matrix at once.
+            Defaults to HAMMING_MATRIX_BLOCK_ELEMENTS.
+
+    Returns:
+        np.float64: The sum of :func:`ensemble_cell` over all pairs.
+    """
+    indices_i = np.asarray(indices_i, dtype=np.uint64)
+    probs_i = np.asarray(probs_i, dtype=np.float64)
+    indices_j = np.asarray(indices_j, dtype=np.uint64)
+    probs_j = np.asarray(probs_j, dtype=np.float64)
+    weights_table = np.float_power(2, a_num, dtype=np.float64) * np.float_power(
+        -2, -np.arange(a_num + 1), dtype=np.float64
+    )
+
+    rows = max(1, block_elements // max(1, len(indices_j)))
+    total = np.float64(0)
+    for start in range(0, len(indices_i), rows):
+        distances = popcount(indices_i[start : start + rows, None] ^ indices_j[None, :])
+        total += probs_i[start : start + rows] @ weights_table[distances] @ probs_j
+    return total
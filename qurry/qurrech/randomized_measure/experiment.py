@@ -16,7 +16,7 @@ from ...process.randomized_measure.wavefunction_overlap import (
     PostProcessingBackendLabel,
     DEFAULT_PROCESS_BACKEND,
 )
-from ...tools import qurry_progressbar, DEFAULT_POOL_SIZE
+from ...tools import qurry_progressbar, ParallelManager, DEFAULT_POOL_SIZE
 
 
 class EchoRandomizedArguments(NamedTuple):
@@ -28,6 +28,9 @@ class EchoRandomizedArguments(NamedTuple):
     measure: Optional[tuple[int, int]] = None
     unitary_loc: Optional[tuple[int, int]] = None
     workers_num: int = DEFAULT_POOL_SIZE
+    parameterized: bool = False
+    random_unitary_seed: Optional[int] = None
+    statevector_reuse: bool = False
 
 
 class EchoRandomizedExperiment(ExperimentPrototype):
@@ -64,6 +67,9 @@ class EchoRandomizedExperiment(ExperimentPrototype):
     __name__ = "qurrechRandomized.Experiment"
     shortName = "qurrech_haar.exp"
 
+    pool_handleable = True
+    """The handleable of the persistent process manager."""
+
     Arguments = EchoRandomizedArguments
     args: EchoRandomizedArguments
 
@@ -75,6 +81,7 @@ class EchoRandomizedExperiment(ExperimentPrototype):
         degree: Optional[Union[tuple[int, int], int]] = None,
         workers_num: Optional[int] = None,
         pbar: Optional[tqdm.tqdm] = None,
+        pool: Optional[ParallelManager] = None,
     ) -> EchoRandomizedAnalysis:
         """Calculate entangled entropy with more information combined.
 
@@ -85,6 +92,9 @@ class EchoRandomizedExperiment(ExperimentPrototype):
                 if sets to 1, then disable to using multi-processing;
                 if not specified, then use the number of all cpu counts - 2 by `cpu_count() - 2`.
                 Defaults to None.
+            pbar (Optional[tqdm.tqdm], optional): Progress bar. Defaults to None.
+            pool (Optional[ParallelManager], optional):
+                The persistent process manager to reuse. Defaults to None.
 
         Returns:
             dict[str, float]: A dictionary contains
@@ -111,6 +121,7 @@ class EchoRandomizedExperiment(ExperimentPrototype):
                 measure=measure,
                 workers_num=workers_num,
                 pbar=pbar,
+                pool=pool,
             )
 
         else:
@@ -127,6 +138,7 @@ class EchoRandomizedExperiment(ExperimentPrototype):
                     measure=measure,
                     workers_num=workers_num,
                     pbar=pb_self,
+                    pool=pool,
                 )
                 pb_self.update()
 
@@ -151,6 +163,7 @@ class EchoRandomizedExperiment(ExperimentPrototype):
         backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
         workers_num: Optional[int] = None,
         pbar: Optional[tqdm.tqdm] = None,
+        pool: Optional[ParallelManager] = None,
     ) -> dict[str, float]:
         """Calculate entangled entropy with more information combined.
 
@@ -166,6 +179,8 @@ class EchoRandomizedExperiment(ExperimentPrototype):
                 if not specified, then use the number of all cpu counts - 2 by `cpu_count() - 2`.
                 Defaults to None.
             pbar (Optional[tqdm.tqdm], optional): Progress bar. Defaults to None.
+            pool (Optional[ParallelManager], optional):
+                The persistent process manager to reuse. Defaults to None.
             use_cython (bool, optional): Use cython to calculate purity cell. Defaults to True.
 
         Returns:
@@ -186,4 +201,5 @@ class EchoRandomizedExperiment(ExperimentPrototype):
             backend=backend,
             workers_num=workers_num,
             pbar=pbar,
+            pool=pool,
         )
@@ -64,6 +64,11 @@ class EntropyRandomizedAnalysis(AnalysisPrototype):
         mitigatedEntropy: Optional[float] = None
         """The mitigated entanglement entropy of the subsystem."""
 
+        exactPurity: Optional[float] = None
+        """The exact purity of the subsystem from the statevector of wave."""
+        exactEntropy: Optional[float] = None
+        """The exact entanglement entropy of the subsystem from the statevector of wave."""
+
         num_qubits: Optional[int] = None
         """The number of qubits of the system."""
         measure: Optional[tuple[str, Union[list[int], tuple[int, int]]]] = None
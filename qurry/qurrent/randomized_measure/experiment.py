@@ -14,14 +14,17 @@ from .analysis import EntropyRandomizedAnalysis
 from ...qurrium.experiment import ExperimentPrototype
 from ...process.randomized_measure.entangled_entropy import (
     entangled_entropy_core,
+    randomized_entangled_entropy_batch,
     RandomizedEntangledEntropyComplex,
+    ExistingAllSystemSource,
 )
 from ...process.randomized_measure.entropy_core import (
     PostProcessingBackendLabel,
     DEFAULT_PROCESS_BACKEND,
 )
 from ...process.randomized_measure.error_mitigation import depolarizing_error_mitgation
-from ...tools import qurry_progressbar, DEFAULT_POOL_SIZE
+from ...process.exact_purity import exact_entangled_entropy
+from ...tools import qurry_progressbar, ParallelManager, DEFAULT_POOL_SIZE
 
 
 def randomized_entangled_entropy_complex(
@@ -33,6 +36,7 @@ def randomized_entangled_entropy_complex(
     backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
     workers_num: Optional[int] = None,
     pbar: Optional[tqdm.tqdm] = None,
+    pool: Optional[ParallelManager] = None,
 ) -> RandomizedEntangledEntropyComplex:
     """Calculate entangled entropy.
 
@@ -83,6 +87,8 @@ def randomized_entangled_entropy_complex(
             if not specified, then use the number of all cpu counts by `os.cpu_count()`.
             Defaults to None.
         pbar (Optional[tqdm.tqdm], optional): Progress bar. Defaults to None.
+        pool (Optional[ParallelManager], optional):
+            The persistent process manager to reuse. Defaults to None.
 
     Returns:
         dict[str, float]: A dictionary contains
@@ -139,6 +145,7 @@ def randomized_entangled_entropy_complex(
         measure=measure,
         backend=backend,
         multiprocess_pool_size=workers_num,
+        pool=pool,
     )
     purity_cell_list: Union[list[float], list[np.float64]] = list(
         purity_cell_dict.values()
@@ -160,6 +167,7 @@ def randomized_entangled_entropy_complex(
             measure=measure,
             backend=backend,
             multiprocess_pool_size=workers_num,
+            pool=pool,
         )
         purity_cell_list_allsys: Union[list[float], list[np.float64]] = list(
             purity_cell_dict_allsys.values()
@@ -259,6 +267,9 @@ class EntropyRandomizedArguments(NamedTuple):
     measure: Optional[tuple[int, int]] = None
     unitary_loc: Optional[tuple[int, int]] = None
     workers_num: int = DEFAULT_POOL_SIZE
+    parameterized: bool = False
+    random_unitary_seed: Optional[int] = None
+    statevector_reuse: bool = False
 
 
 class EntropyRandomizedExperiment(ExperimentPrototype):
@@ -269,6 +280,8 @@ class EntropyRandomizedExperiment(ExperimentPrototype):
 
     tqdm_handleable = True
     """The handleable of tqdm."""
+    pool_handleable = True
+    """The handleable of the persistent process manager."""
 
     Arguments = EntropyRandomizedArguments
     args: EntropyRandomizedArguments
@@ -283,6 +296,8 @@ class EntropyRandomizedExperiment(ExperimentPrototype):
         independent_all_system: bool = False,
         backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
         pbar: Optional[tqdm.tqdm] = None,
+        statevector: Optional[np.ndarray] = None,
+        pool: Optional[ParallelManager] = None,
     ) -> EntropyRandomizedAnalysis:
         """Calculate entangled entropy with more information combined.
 
@@ -298,6 +313,13 @@ class EntropyRandomizedExperiment(ExperimentPrototype):
             backend (PostProcessingBackendLabel, optional):
                 Backend for the process. Defaults to DEFAULT_PROCESS_BACKEND.
             pbar (Optional[tqdm.tqdm], optional): Progress bar. Defaults to None.
+            statevector (Optional[np.ndarray], optional):
+                The statevector of wave, like the one cached by
+                :meth:`EntropyRandomizedMeasure.statevector`,
+                then the exact purity and entropy are added as reference.
+                Defaults to None.
+            pool (Optional[ParallelManager], optional):
+                The persistent process manager to reuse. Defaults to None.
 
         Returns:
             dict[str, float]: A dictionary contains
@@ -336,6 +358,7 @@ class EntropyRandomizedExperiment(ExperimentPrototype):
                 all_system_source=all_system_source,
                 backend=backend,
                 workers_num=workers_num,
+                pool=pool,
                 pbar=pbar,
             )
 
@@ -354,10 +377,16 @@ class EntropyRandomizedExperiment(ExperimentPrototype):
                     all_system_source=all_system_source,
                     backend=backend,
                     workers_num=workers_num,
+                    pool=pool,
                     pbar=pb_self,
                 )
                 pb_self.update()
 
+        if statevector is not None:
+            exact = exact_entangled_entropy(statevector, degree, measure)
+            qs["exactPurity"] = exact["purity"]
+            qs["exactEntropy"] = exact["entropy"]
+
         serial = len(self.reports)
         analysis = self.analysis_container(
             serial=serial,
@@ -369,6 +398,118 @@ class EntropyRandomizedExperiment(ExperimentPrototype):
         self.reports[serial] = analysis
         return analysis
 
+    def analyze_degrees(
+        self,
+        degrees: list[Union[tuple[int, int], int]],
+        workers_num: Optional[int] = None,
+        independent_all_system: bool = False,
+        backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
+        pbar: Optional[tqdm.tqdm] = None,
+        statevector: Optional[np.ndarray] = None,
+        pool: Optional[ParallelManager] = None,
+    ) -> list[EntropyRandomizedAnalysis]:
+        """Calculate entangled entropy for multiple degrees at once,
+        the counts are walked only once and one report is added for each degree.
+
+        Args:
+            degrees (list[Union[tuple[int, int], int]]): Degrees of the subsystems.
+            workers_num (Optional[int], optional):
+                Number of multi-processing workers,
+                if sets to 1, then disable to using multi-processing;
+                if not specified, then use the number of all cpu counts - 2 by `cpu_count() - 2`.
+                Defaults to None.
+            independent_all_system (bool, optional):
+                If True, then calculate the all system independently.
+            backend (PostProcessingBackendLabel, optional):
+                Backend for the process. Defaults to DEFAULT_PROCESS_BACKEND.
+            pbar (Optional[tqdm.tqdm], optional): Progress bar. Defaults to None.
+            statevector (Optional[np.ndarray], optional):
+                The statevector of wave, then the exact purity and entropy are added
+                as reference of each degree. Defaults to None.
+            pool (Optional[ParallelManager], optional):
+                The persistent process manager to reuse. Defaults to None.
+
+        Returns:
+            list[EntropyRandomizedAnalysis]: The analysis of each degree in order.
+        """
+        if len(degrees) == 0:
+            raise ValueError("degrees should be specified.")
+
+        self.args: EntropyRandomizedExperiment.Arguments
+        self.reports: dict[int, EntropyRandomizedAnalysis]
+        shots = self.commons.shots
+        measure = self.args.measure
+        unitary_loc = self.args.unitary_loc
+        counts = self.afterwards.counts
+
+        available_all_system_source = [
+            k
+            for k, v in self.reports.items()
+            if v.content.allSystemSource == "independent"
+        ]
+
+        if len(available_all_system_source) > 0 and not independent_all_system:
+            all_system_source = self.reports[available_all_system_source[-1]]
+            existed_all_system: Optional[ExistingAllSystemSource] = {
+                "purityCellsAllSys": all_system_source.content.purityCellsAllSys,
+                "bitStringRange": all_system_source.content.bitStringRange,
+                "measureActually": all_system_source.content.measureActually,
+                "source": str(all_system_source.header),
+            }
+        else:
+            existed_all_system = None
+
+        if isinstance(pbar, tqdm.tqdm):
+            qs_list = randomized_entangled_entropy_batch(
+                shots=shots,
+                counts=counts,
+                degrees=degrees,
+                measure=measure,
+                backend=backend,
+                workers_num=workers_num,
+                pool=pool,
+                existed_all_system=existed_all_system,
+                pbar=pbar,
+            )
+
+        else:
+            pbar_selfhost = qurry_progressbar(
+                range(1),
+                bar_format="simple",
+            )
+
+            with pbar_selfhost as pb_self:
+                qs_list = randomized_entangled_entropy_batch(
+                    shots=shots,
+                    counts=counts,
+                    degrees=degrees,
+                    measure=measure,
+                    backend=backend,
+                    workers_num=workers_num,
+                    pool=pool,
+                    existed_all_system=existed_all_system,
+                    pbar=pb_self,
+                )
+                pb_self.update()
+
+        analyses = []
+        for degree, qs in zip(degrees, qs_list):
+            if statevector is not None:
+                exact = exact_entangled_entropy(statevector, degree, measure)
+                qs["exactPurity"] = exact["purity"]
+                qs["exactEntropy"] = exact["entropy"]
+            serial = len(self.reports)
+            analysis = self.analysis_container(
+                serial=serial,
+                shots=shots,
+                unitary_loc=unitary_loc,
+                **qs,
+            )
+            self.reports[serial] = analysis
+            analyses.append(analysis)
+
+        return analyses
+
     @classmethod
     def quantities(
         cls,
@@ -380,6 +521,7 @@ class EntropyRandomizedExperiment(ExperimentPrototype):
         backend: PostProcessingBackendLabel = DEFAULT_PROCESS_BACKEND,
         workers_num: Optional[int] = None,
         pbar: Optional[tqdm.tqdm] = None,
+        pool: Optional[ParallelManager] = None,
     ) -> RandomizedEntangledEntropyComplex:
         """Calculate entangled entropy.
 
@@ -430,6 +572,8 @@ class EntropyRandomizedExperiment(ExperimentPrototype):
                 if not specified, then use the number of all cpu counts by `os.cpu_count()`.
                 Defaults to None.
             pbar (Optional[tqdm.tqdm], optional): Progress bar. Defaults to None.
+            pool (Optional[ParallelManager], optional):
+                The persistent process manager to reuse. Defaults to None.
 
         Returns:
             dict[str, float]: A dictionary contains
@@ -450,5 +594,6 @@ class EntropyRandomizedExperiment(ExperimentPrototype):
             all_system_source=all_system_source,
             backend=backend,
             workers_num=workers_num,
+            pool=pool,
             pbar=pbar,
         )
@@ -6,23 +6,32 @@ Second Renyi Entropy - Randomized Measurement
 
 """
 
+import warnings
 from pathlib import Path
 from typing import Union, Optional, Hashable, Any, Type
 import tqdm
+import numpy as np
 
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.circuit import Parameter
 from qiskit.quantum_info import Operator
+from qiskit.result import Result
 
 from .experiment import EntropyRandomizedExperiment
 from ...qurrium.qurrium import QurryPrototype
 from ...qurrium.container import ExperimentContainer
+from ...qurrium.utils import CircuitTemplate, counts_to_result
 from ...qurrium.utils.randomized import (
-    local_random_unitary_operators,
-    local_random_unitary_pauli_coeff,
-    random_unitary,
+    local_unitary_u_parameters,
+    batch_unitary_u_values,
+    pauli_coeff_array,
+    random_unitary_batch,
+    local_unitary_sampled_counts,
 )
 from ...process.utils import qubit_selector
-from ...tools import ParallelManager
+from ...process.exact_purity import exact_entangled_entropy, ExactEntangledEntropy
+from ...tools.backend import backendName, is_noiseless_simulator
+from ...exceptions import QurryStatevectorReuseUnavailable
 
 
 def circuit_method_core(
@@ -68,6 +77,48 @@ def circuit_method_core(
     return qc_exp1
 
 
+def circuit_method_template(
+    target_circuit: QuantumCircuit,
+    exp_name: str,
+    unitary_loc: tuple[int, int],
+    u_parameters: dict[int, tuple[Parameter, Parameter, Parameter]],
+    measure: tuple[int, int],
+) -> QuantumCircuit:
+    """Build the parameterized template circuit for the experiment,
+    the random unitary operators are replaced by parameterized U gates.
+
+    Args:
+        target_circuit (QuantumCircuit): Target circuit.
+        exp_name (str): Experiment name.
+        unitary_loc (tuple[int, int]): Unitary operator location.
+        u_parameters (dict[int, tuple[Parameter, Parameter, Parameter]]):
+            The parameters of U gate for each qubit.
+        measure (tuple[int, int]): Measure range.
+
+    Returns:
+        QuantumCircuit: The template circuit for the experiment.
+    """
+    num_qubits = target_circuit.num_qubits
+
+    q_func1 = QuantumRegister(num_qubits, "q1")
+    c_meas1 = ClassicalRegister(measure[1] - measure[0], "c1")
+    qc_exp1 = QuantumCircuit(q_func1, c_meas1)
+    qc_exp1.name = f"{exp_name}-template"
+
+    qc_exp1.compose(
+        target_circuit, [q_func1[i] for i in range(num_qubits)], inplace=True
+    )
+
+    qc_exp1.barrier()
+    for j in range(*unitary_loc):
+        qc_exp1.u(*u_parameters[j], j)
+
+    for j in range(*measure):
+        qc_exp1.measure(q_func1[j], c_meas1[j - measure[0]])
+
+    return qc_exp1
+
+
 class EntropyRandomizedMeasure(QurryPrototype):
     """Randomized Measure Experiment.
 
@@ -120,6 +171,8 @@ class EntropyRandomizedMeasure(QurryPrototype):
         times: int = 100,
         measure: Optional[Union[tuple[int, int], int]] = None,
         unitary_loc: Optional[Union[tuple[int, int], int]] = None,
+        parameterized: bool = False,
+        statevector_reuse: bool = False,
         **other_kwargs,
     ) -> tuple[
         EntropyRandomizedExperiment.Arguments,
@@ -142,6 +195,17 @@ class EntropyRandomizedMeasure(QurryPrototype):
                 This name is also used for creating a folder to store the exports.
                 Defaults to `'exps'`.
 
+            parameterized (bool, optional):
+                Build one template with parameterized U gates instead of the random unitary
+                gates, which is transpiled once and bound into each circuit.
+                Defaults to False.
+
+            statevector_reuse (bool, optional):
+                On a noiseless simulator, simulate the statevector of wave once,
+                and sample the counts of each random unitary layer from it
+                instead of simulating each circuit.
+                Defaults to False.
+
             other_kwargs (any):
                 Other arguments.
 
@@ -176,6 +240,8 @@ class EntropyRandomizedMeasure(QurryPrototype):
             times=times,
             measure=measure,
             unitary_loc=unitary_loc,
+            parameterized=parameterized,
+            statevector_reuse=statevector_reuse,
             **other_kwargs,
         )
 
@@ -183,7 +249,7 @@ class EntropyRandomizedMeasure(QurryPrototype):
         self,
         exp_id: str,
         _pbar: Optional[tqdm.tqdm] = None,
-    ) -> list[QuantumCircuit]:
+    ) -> Union[list[QuantumCircuit], list[CircuitTemplate]]:
         assert exp_id in self.exps
         assert self.exps[exp_id].commons.exp_id == exp_id
         current_exp = self.exps[exp_id]
@@ -192,80 +258,151 @@ class EntropyRandomizedMeasure(QurryPrototype):
         circuit = self.waves[commons.wave_key]
         _num_qubits = circuit.num_qubits
 
-        pool = ParallelManager(args.workers_num)
+        pool = self.parallel_manager(args.workers_num)
 
         if isinstance(_pbar, tqdm.tqdm):
             _pbar.set_description_str(
-                f"Preparing {args.times} random unitary with {args.workers_num} workers."
+                f"Preparing {args.times} random unitary."
             )
 
-        # DO NOT USE MULTI-PROCESSING HERE !!!!!
-        # See https://github.com/numpy/numpy/issues/9650
-        # And https://github.com/harui2019/qurry/issues/78
-        # The random seed will be duplicated in each process,
-        # and it will make duplicated result.
-        # unitaryList = pool.starmap(
-        #     local_random_unitary, [(args.unitary_loc, None) for _ in range(args.times)])
-
-        unitary_dict = {
-            i: {j: random_unitary(2) for j in range(*args.unitary_loc)}
-            for i in range(args.times)
-        }
+        unitaries = random_unitary_batch(
+            args.times,
+            args.unitary_loc[1] - args.unitary_loc[0],
+            args.random_unitary_seed,
+        )
 
         if isinstance(_pbar, tqdm.tqdm):
             _pbar.set_description_str(
                 f"Building {args.times} circuits with {args.workers_num} workers."
             )
-        qc_list = pool.starmap(
-            circuit_method_core,
-            [
-                (
-                    i,
-                    circuit,
-                    args.exp_name,
-                    args.unitary_loc,
-                    unitary_dict[i],
-                    args.measure,
+        if args.parameterized:
+            u_parameters = local_unitary_u_parameters(args.unitary_loc)
+            qc_list = [
+                CircuitTemplate(
+                    circuit_method_template(
+                        circuit,
+                        args.exp_name,
+                        args.unitary_loc,
+                        u_parameters,
+                        args.measure,
+                    ),
+                    batch_unitary_u_values(u_parameters, args.unitary_loc, unitaries),
+                    [f"{args.exp_name}-{i}" for i in range(args.times)],
                 )
-                for i in range(args.times)
-            ],
-        )
+            ]
+        else:
+            unitary_dict = {
+                i: {
+                    j: Operator(draw[j - args.unitary_loc[0]])
+                    for j in range(*args.unitary_loc)
+                }
+                for i, draw in enumerate(unitaries)
+            }
+            qc_list = pool.starmap(
+                circuit_method_core,
+                [
+                    (
+                        i,
+                        circuit,
+                        args.exp_name,
+                        args.unitary_loc,
+                        unitary_dict[i],
+                        args.measure,
+                    )
+                    for i in range(args.times)
+                ],
+            )
 
         if isinstance(_pbar, tqdm.tqdm):
-            _pbar.set_description_str(
-                f"Writing 'unitaryOP' with {args.workers_num} workers."
-            )
-        unitary_operator_list = pool.starmap(
-            local_random_unitary_operators,
-            [(args.unitary_loc, unitary_dict[i]) for i in range(args.times)],
-        )
-        current_exp.beforewards.side_product["unitaryOP"] = dict(
-            enumerate(unitary_operator_list)
+            _pbar.set_description_str("Writing 'unitaryOP' and 'randomized'.")
+        # The arrays are written as binary sidecar,
+        # the first two axes are the index of draw and the qubit from `unitary_loc[0]`.
+        current_exp.beforewards.side_product["unitaryOP"] = unitaries
+        current_exp.beforewards.side_product["randomized"] = pauli_coeff_array(
+            unitaries
         )
 
-        # currentExp.beforewards.side_product['unitaryOP'] = {
-        #     k: {i: np.array(v[i]).tolist() for i in range(*args.unitary_loc)}
-        #     for k, v in unitaryList.items()}
+        return qc_list
+
+    def simulate(self, exp_id: str) -> Optional[Result]:
+        """Sample the counts from the cached statevector of wave
+        when `statevector_reuse` is enabled and the backend is a noiseless simulator.
 
-        if isinstance(_pbar, tqdm.tqdm):
-            _pbar.set_description_str(
-                f"Writing 'randomized' with {args.workers_num} workers."
+        Args:
+            exp_id (str): The ID of the experiment.
+
+        Returns:
+            Optional[Result]: The result, or None for executing the circuits on backend.
+        """
+        current_exp = self.exps[exp_id]
+        args = current_exp.args
+        commons = current_exp.commons
+        if not args.statevector_reuse:
+            return None
+        if not is_noiseless_simulator(commons.backend):
+            warnings.warn(
+                f"The backend '{backendName(commons.backend)}' is not a noiseless simulator, "
+                + "the circuits are executed on it without reusing statevector.",
+                QurryStatevectorReuseUnavailable,
             )
-        randomized_list = pool.starmap(
-            local_random_unitary_pauli_coeff,
-            [(args.unitary_loc, unitary_operator_list[i]) for i in range(args.times)],
+            return None
+        unitaries = current_exp.beforewards.side_product.get("unitaryOP")
+        if not isinstance(unitaries, np.ndarray):
+            warnings.warn(
+                "The 'unitaryOP' is not an array of unitary operators, "
+                + "the circuits are executed on backend without reusing statevector.",
+                QurryStatevectorReuseUnavailable,
+            )
+            return None
+        if not (
+            args.unitary_loc[0] <= args.measure[0] and args.measure[1] <= args.unitary_loc[1]
+        ):
+            warnings.warn(
+                f"The measure range '{args.measure}' is not inside "
+                + f"the unitary_loc range '{args.unitary_loc}', "
+                + "the circuits are executed on backend without reusing statevector.",
+                QurryStatevectorReuseUnavailable,
+            )
+            return None
+
+        counts = local_unitary_sampled_counts(
+            self.statevector(commons.wave_key),
+            unitaries,
+            args.unitary_loc,
+            args.measure,
+            commons.shots,
+            commons.run_args.get("seed_simulator"),
         )
-        current_exp.beforewards.side_product["randomized"] = dict(
-            enumerate(randomized_list)
+        return counts_to_result(
+            counts,
+            [circ.name for circ in current_exp.beforewards.circuit],
+            commons.shots,
         )
 
-        # currentExp.beforewards.side_product['randomized'] = {i: {
-        #     j: qubitOpToPauliCoeff(
-        #         unitaryList[i][j])
-        #     for j in range(*args.unitary_loc)
-        # } for i in range(args.times)}
+    def exact_entropy(
+        self,
+        wave_key: Hashable,
+        degree: Optional[Union[tuple[int, int], int]],
+        measure: Optional[Union[tuple[int, int], int]] = None,
+    ) -> ExactEntangledEntropy:
+        """Calculate the exact purity and entropy of the subsystem
+        from the cached statevector of wave, as the reference of the randomized measurement.
 
-        return qc_list
+        Args:
+            wave_key (Hashable): The key of wave in `.waves`.
+            degree (Optional[Union[tuple[int, int], int]]):
+                Degree of the subsystem on the bitstring of measured qubits.
+            measure (Optional[Union[tuple[int, int], int]], optional):
+                Measuring range on quantum circuits. Defaults to None for all qubits.
+
+        Returns:
+            ExactEntangledEntropy: The exact purity and entropy of the subsystem.
+        """
+        state = self.statevector(wave_key)
+        num_qubits = self.waves[wave_key].num_qubits
+        return exact_entangled_entropy(
+            state, degree, qubit_selector(num_qubits, degree=measure)
+        )
 
     def measure(
         self,
@@ -8,10 +8,9 @@ Analysis Instance
 
 from typing import Optional, NamedTuple, Iterable, Any
 from abc import abstractmethod
-from pathlib import Path
-import json
 import gc
 
+from ..utils.archive import ExportSource, load_export_json
 from ...capsule import jsonablize
 from ...capsule.hoshi import Hoshi
 from ...exceptions import QurryInvalidInherition
@@ -249,14 +248,14 @@ class AnalysisPrototype:
     def read(
         cls,
         file_index: dict[str, str],
-        save_location: Path,
+        save_location: ExportSource,
         encoding: str = "utf-8",
     ) -> dict[str, "AnalysisPrototype"]:
         """Read the analysis from file index.
 
         Args:
             file_index (dict[str, str]): The file index.
-            save_location (Path): The save location.
+            save_location (ExportSource): The save location, or the archive of it.
             encoding (str, optional): The encoding of the file. Defaults to "utf-8".
 
         Returns:
@@ -268,13 +267,11 @@ class AnalysisPrototype:
         for filekey, filename in file_index.items():
             filekeydiv = filekey.split(".")
             if filekey == "reports":
-                with open(save_location / filename, "r", encoding=encoding) as f:
-                    export_set["reports"] = json.load(f)
+                export_set["reports"] = load_export_json(save_location, filename, encoding)
                 export_material_set["reports"] = export_set["reports"]["reports"]
 
             elif filekeydiv[0] == "reports" and filekeydiv[1] == "tales":
-                with open(save_location / filename, "r", encoding=encoding) as f:
-                    export_set[filekey] = json.load(f)
+                export_set[filekey] = load_export_json(save_location, filename, encoding)
                 if "tales_report" not in export_material_set:
                     export_material_set["tales_report"] = {}
                 export_material_set["tales_report"][filekeydiv[2]] = export_set[filekey]
@@ -11,12 +11,46 @@ from ..analysis import AnalysisPrototype
 
 
 class AnalysesContainer(dict[Hashable, AnalysisPrototype]):
-    """A customized dictionary for storing `AnalysisPrototype` objects."""
+    """A customized dictionary for storing `AnalysisPrototype` objects.
+
+    It tracks whether the analyses have been changed since the last export by :attr:`dirty`.
+    """
 
     __name__ = "AnalysisContainer"
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.dirty = True
+        """Whether the analyses have been changed since they were written or read."""
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self.dirty = True
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self.dirty = True
+
+    def clear(self) -> None:
+        super().clear()
+        self.dirty = True
+
+    def pop(self, *args):
+        self.dirty = True
+        return super().pop(*args)
+
+    def popitem(self):
+        self.dirty = True
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self.dirty = True
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self.dirty = True
 
     def export(
         self,
@@ -6,21 +6,188 @@ The experiment container
 
 """
 
+import os
 import json
+import hashlib
 from typing import Union, Optional, NamedTuple, Hashable, TypedDict, Any
 from pathlib import Path
+import numpy as np
 
 from qiskit import QuantumCircuit
 from qiskit.result import Result
 from qiskit.providers import Backend
 
+from ..utils.archive import ExportSource, load_export_json, load_export_array
 from ...tools import backendName
 from ...tools.datetime import DatetimeDict
 from ...capsule import jsonablize
+from ...process.utils.counts import (
+    PackedCounts,
+    unpack_counts,
+    flatten_packed_counts,
+)
 
 REQUIRED_FOLDER = ["args", "advent", "legacy", "tales", "reports"]
 """The required folder for exporting experiment."""
 
+BINARY_TALES_SUFFIX = ".npy"
+"""The suffix of the `tales.*` files written as binary sidecar by :func:`numpy.save`."""
+BINARY_COUNTS_SUFFIX = ".counts.npy"
+"""The suffix of the `legacy.counts` file written as binary by :func:`numpy.save`."""
+
+
+class HashingWriter:
+    """Write the bytes to a file and hash them at the same time,
+    so the hash of a written file does not need to read it again."""
+
+    __slots__ = ("file", "hasher")
+
+    def __init__(self, file: Any):
+        self.file = file
+        self.hasher = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        """Write the bytes and update the hash.
+
+        Args:
+            data (bytes): The bytes.
+
+        Returns:
+            int: The number of written bytes.
+        """
+        self.hasher.update(data)
+        return self.file.write(data)
+
+    def hexdigest(self) -> str:
+        """The hexadecimal SHA-256 digest of the written bytes."""
+        return self.hasher.hexdigest()
+
+
+def write_binary_tales(filename: Union[Path, str], content: np.ndarray) -> str:
+    """Write a side product array as binary sidecar by :func:`numpy.save`.
+
+    The file is written into a temporary file then replaced,
+    so the memory-mapped array read from the same file before is still valid.
+
+    Args:
+        filename (Union[Path, str]): The file.
+        content (np.ndarray): The array.
+
+    Returns:
+        str: The SHA-256 hash of the content of file.
+    """
+    tmp_filename = f"{filename}.{os.getpid()}.tmp"
+    with open(tmp_filename, "wb") as f:
+        writer = HashingWriter(f)
+        np.save(writer, content, allow_pickle=False)  # type: ignore
+    os.replace(tmp_filename, filename)
+    return writer.hexdigest()
+
+
+def write_json(
+    content: Any,
+    filename: Union[Path, str],
+    mode: str = "w+",
+    indent: int = 2,
+    encoding: str = "utf-8",
+    jsonable: bool = False,
+) -> str:
+    """Write the content as json file and hash the serialized bytes.
+
+    Args:
+        content (Any): The content.
+        filename (Union[Path, str]): The file.
+        mode (str, optional): Mode for :func:`open` function. Defaults to "w+".
+        indent (int, optional): Indent length for json. Defaults to 2.
+        encoding (str, optional): Encoding method. Defaults to "utf-8".
+        jsonable (bool, optional): Whether to jsonablize the content. Defaults to False.
+
+    Returns:
+        str: The SHA-256 hash of the content of file.
+    """
+    dumped = json.dumps(
+        jsonablize(content) if jsonable else content, indent=indent, ensure_ascii=False
+    )
+    # No newline translation, so the file is exactly the hashed bytes.
+    with open(filename, mode, encoding=encoding, newline="") as f:
+        f.write(dumped)
+    return hashlib.sha256(dumped.encode(encoding)).hexdigest()
+
+
+def read_binary_tales(filename: Union[Path, str]) -> np.ndarray:
+    """Read a side product array from binary sidecar lazily,
+    the array is memory-mapped and only loaded when it is accessed.
+
+    Args:
+        filename (Union[Path, str]): The file.
+
+    Returns:
+        np.ndarray: The memory-mapped array.
+    """
+    return np.load(filename, mmap_mode="r", allow_pickle=False)
+
+
+def pack_legacy_counts(
+    counts: list[Union[dict[str, int], PackedCounts]],
+) -> Optional[tuple[np.ndarray, dict[str, Any]]]:
+    """Pack the counts of all circuits into one table for the binary legacy.
+
+    The table is a `(2, K)` array of `uint64`,
+    the first row is the integer-encoded outcomes and the second row is their counts,
+    the counts of circuit `i` is in the columns `[offsets[i], offsets[i+1])`.
+    The offsets are small and kept in the `legacy` file as `counts_index`.
+
+    Args:
+        counts (list[Union[dict[str, int], PackedCounts]]): The counts of all circuits.
+
+    Returns:
+        Optional[tuple[np.ndarray, dict[str, Any]]]:
+            The table and its index, or None when the counts can not be packed,
+            like the bitstrings are longer than 64 bits or contain spaces.
+    """
+    try:
+        outcomes, values, offsets, num_bits = flatten_packed_counts(counts)
+    except ValueError:
+        return None
+    return np.stack([outcomes, values.view(np.uint64)]), {
+        "offsets": offsets.tolist(),
+        "num_bits": num_bits,
+    }
+
+
+def unpack_legacy_counts(
+    table: np.ndarray,
+    counts_index: dict[str, Any],
+) -> list[PackedCounts]:
+    """Unpack the table from :func:`pack_legacy_counts` into the counts of each circuit,
+    the counts are views of the table, so a memory-mapped table is not loaded here.
+
+    Args:
+        table (np.ndarray): The table.
+        counts_index (dict[str, Any]): The index of table.
+
+    Returns:
+        list[PackedCounts]: The counts of all circuits.
+    """
+    offsets = counts_index["offsets"]
+    values = table[1].view(np.int64)
+    return [
+        PackedCounts(table[0, start:end], values[start:end], counts_index["num_bits"])
+        for start, end in zip(offsets[:-1], offsets[1:])
+    ]
+
+
+class LazySource(NamedTuple):
+    """The location of the exported files of an experiment which is read lazily,
+    the sections `advent`, `legacy` and `reports` are read from them on first access."""
+
+    file_index: dict[str, str]
+    """The index of exported experiment file."""
+    save_location: ExportSource
+    """The location of exported experiment file, or the archive of it."""
+    encoding: str
+    """The encoding of exported experiment file."""
+
 
 class ArgumentsPrototype(NamedTuple):
     """Construct the experiment's parameters for specific options,
@@ -203,7 +370,7 @@ class Commonparams(NamedTuple):
         cls,
         exp_id: str,
         file_index: dict[str, str],
-        save_location: Path,
+        save_location: ExportSource,
         encoding: str = "utf-8",
     ) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
         """Read the exported experiment file.
@@ -211,7 +378,8 @@ class Commonparams(NamedTuple):
         Args:
             exp_id (str): The ID of experiment.
             file_index (dict[str, str]): The index of exported experiment file.
-            save_location (Path): The location of exported experiment file.
+            save_location (ExportSource):
+                The location of exported experiment file, or the archive of it.
             encoding (str, optional): The encoding of exported experiment file. Defaults to "utf-8".
 
         Returns:
@@ -220,9 +388,7 @@ class Commonparams(NamedTuple):
                 the experiment's common parameters,
                 and the experiment's side product.
         """
-        raw_data = {}
-        with open(save_location / file_index["args"], "r", encoding=encoding) as f:
-            raw_data = json.load(f)
+        raw_data = load_export_json(save_location, file_index["args"], encoding)
         data_args: dict[str, dict[str, Any]] = {
             "arguments": raw_data["arguments"],
             "commonparams": raw_data["commonparams"],
@@ -306,14 +472,15 @@ class Before(NamedTuple):
     def read(
         cls,
         file_index: dict[str, str],
-        save_location: Path,
+        save_location: ExportSource,
         encoding: str = "utf-8",
     ) -> "Before":
         """Read the exported experiment file.
 
         Args:
             file_index (dict[str, str]): The index of exported experiment file.
-            save_location (Path): The location of exported experiment file.
+            save_location (ExportSource):
+                The location of exported experiment file, or the archive of it.
             encoding (str, optional): The encoding of exported experiment file. Defaults to "utf-8".
 
         Returns:
@@ -322,9 +489,7 @@ class Before(NamedTuple):
                 the experiment's common parameters,
                 and the experiment's side product.
         """
-        raw_data = {}
-        with open(save_location / file_index["advent"], "r", encoding=encoding) as f:
-            raw_data = json.load(f)
+        raw_data = load_export_json(save_location, file_index["advent"], encoding)
         advent: dict[str, Any] = raw_data["adventures"]
         for k, nk in cls.v5_to_v7_field().items():
             if k in advent:
@@ -337,8 +502,14 @@ class Before(NamedTuple):
         for filekey, filename in file_index.items():
             filekeydiv = filekey.split(".")
             if filekeydiv[0] == "tales":
-                with open(save_location / filename, "r", encoding=encoding) as f:
-                    advent["side_product"][filekeydiv[1]] = json.load(f)
+                if str(filename).endswith(BINARY_TALES_SUFFIX):
+                    advent["side_product"][filekeydiv[1]] = load_export_array(
+                        save_location, filename
+                    )
+                    continue
+                advent["side_product"][filekeydiv[1]] = load_export_json(
+                    save_location, filename, encoding
+                )
 
         return cls(**advent)
 
@@ -405,8 +576,9 @@ class After(NamedTuple):
     # Measurement Result
     result: list[Result]
     """Results of experiment."""
-    counts: list[dict[str, int]]
-    """Counts of experiment."""
+    counts: list[Union[dict[str, int], PackedCounts]]
+    """Counts of experiment,
+    which can be :cls:`PackedCounts` when the result is read with `packed_counts=True`."""
 
     @staticmethod
     def default_value():
@@ -420,14 +592,16 @@ class After(NamedTuple):
     def read(
         cls,
         file_index: dict[str, str],
-        save_location: Path,
+        save_location: ExportSource,
         encoding: str = "utf-8",
     ) -> "After":
-        """Read the exported experiment file.
+        """Read the exported experiment file,
+        the counts written as binary table are memory-mapped instead of parsed from json.
 
         Args:
             file_index (dict[str, str]): The index of exported experiment file.
-            save_location (Path): The location of exported experiment file.
+            save_location (ExportSource):
+                The location of exported experiment file, or the archive of it.
             encoding (str, optional): The encoding of exported experiment file. Defaults to "utf-8".
 
         Returns:
@@ -436,10 +610,14 @@ class After(NamedTuple):
                 the experiment's common parameters,
                 and the experiment's side product.
         """
-        raw_data = {}
-        with open(save_location / file_index["legacy"], encoding=encoding) as f:
-            raw_data = json.load(f)
+        raw_data = load_export_json(save_location, file_index["legacy"], encoding)
         legacy: dict[str, Any] = raw_data["legacy"]
+        counts_index = legacy.pop("counts_index", None)
+        if counts_index is not None:
+            legacy["counts"] = unpack_legacy_counts(
+                load_export_array(save_location, file_index["legacy.counts"]),
+                counts_index,
+            )
         for k, dv in cls.default_value().items():
             if k not in legacy:
                 legacy[k] = dv
@@ -449,11 +627,16 @@ class After(NamedTuple):
     def export(
         self,
         unexports: list[str],
+        counts_index: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
         """Export the experiment's data after executing.
 
         Args:
             unexports (Optional[list[str]], optional): The list of unexported key. Defaults to None.
+            counts_index (Optional[dict[str, Any]], optional):
+                The index of the binary table from :func:`pack_legacy_counts`,
+                the counts are replaced by it when it's given.
+                Defaults to None for exporting the counts as json.
 
         Returns:
             dict[str, Any]: The experiment's data after executing.
@@ -462,7 +645,14 @@ class After(NamedTuple):
         # pylint: disable=no-member
         for k, v in self._asdict().items():
             # pylint: enable=no-member
-            if k not in unexports:
+            if k in unexports:
+                ...
+            elif k == "counts":
+                if counts_index is None:
+                    legacy[k] = unpack_counts(v)
+                else:
+                    legacy["counts_index"] = counts_index
+            else:
                 legacy[k] = v
 
         return legacy
@@ -8,19 +8,20 @@ The experiment prototype which is the basic class of all experiments.
 
 import gc
 import os
-import json
+import numbers
 import warnings
 from abc import abstractmethod, ABC
 from uuid import uuid4, UUID
 from typing import Union, Optional, Hashable, Any
 from pathlib import Path
 import tqdm
+import numpy as np
 
 from qiskit.providers import Backend
 
-from ...tools import ParallelManager, DEFAULT_POOL_SIZE
+from ...tools import ParallelManager, DEFAULT_POOL_SIZE, qurry_progressbar
 from ...tools.datetime import current_time, DatetimeDict
-from ...capsule import jsonablize, quickJSON
+from ...capsule import jsonablize
 from ...capsule.hoshi import Hoshi
 from ...exceptions import (
     QurryInvalidInherition,
@@ -31,15 +32,21 @@ from ...exceptions import (
     QurryHashIDInvalid,
 )
 from ..utils.iocontrol import RJUST_LEN
+from ..utils.archive import ArchiveReader, find_archive, member_name, load_export_json
+from ..utils.catalog import ExperimentCatalog, CatalogRecord, open_catalog
 from ..analysis import AnalysisPrototype
 from .container import (
     ArgumentsPrototype,
     Commonparams as ExperimentCommonparams,
     Before as ExperimentBefore,
     After as ExperimentAfter,
+    LazySource,
+    BINARY_TALES_SUFFIX,
+    BINARY_COUNTS_SUFFIX,
+    pack_legacy_counts,
 )
 from .analyses import AnalysesContainer
-from .export import Export
+from .export import Export, EXPORT_SECTIONS, section_of_filekey, merge_qurryinfo
 
 
 class ExperimentPrototype(ABC):
@@ -68,6 +75,14 @@ class ExperimentPrototype(ABC):
     """
     tqdm_handleable = False
     """Whether the method :meth:`execute` can handle the processing bar from :module:`tqdm`."""
+    pool_handleable = False
+    """Whether the method :meth:`analyze` can reuse the persistent process manager."""
+    _lazy_sections = {
+        "advent": "_beforewards",
+        "legacy": "_afterwards",
+        "reports": "_reports",
+    }
+    """The sections which can be read lazily and their attributes."""
 
     # Analysis Property
     @classmethod
@@ -201,6 +216,8 @@ class ExperimentPrototype(ABC):
             **commons,
         )
         self.outfields: dict[str, Any] = outfields
+        self._lazy_source: Optional[LazySource] = None
+        """The exported files where the sections are read from on first access."""
         self.beforewards = (
             beforewards
             if isinstance(beforewards, self.Before)
@@ -258,10 +275,166 @@ class ExperimentPrototype(ABC):
         self.mute_auto_lock = False
         """Whether mute the auto-lock message."""
 
+        self.dirty_sections: set[str] = set(EXPORT_SECTIONS)
+        """The sections changed since the last write or read,
+        the `reports` section is tracked by :attr:`AnalysesContainer.dirty` additionally."""
+        self.written_hashes: dict[str, str] = {}
+        """The content hashes of files from the last write or read."""
+
+    @property
+    def beforewards(self) -> ExperimentBefore:
+        """The data of experiment generated before executing,
+        it's read from the `advent` and `tales` files on first access when read lazily."""
+        if self._beforewards is None:
+            assert self._lazy_source is not None, "The beforewards is not available."
+            self._beforewards = self.Before.read(**self._lazy_source._asdict())
+        return self._beforewards
+
+    @beforewards.setter
+    def beforewards(self, value: Optional[ExperimentBefore]) -> None:
+        self._beforewards = value
+
+    @property
+    def afterwards(self) -> ExperimentAfter:
+        """The data of experiment generated after executing,
+        it's read from the `legacy` file on first access when read lazily."""
+        if self._afterwards is None:
+            assert self._lazy_source is not None, "The afterwards is not available."
+            self._afterwards = self.After.read(**self._lazy_source._asdict())
+        return self._afterwards
+
+    @afterwards.setter
+    def afterwards(self, value: Optional[ExperimentAfter]) -> None:
+        self._afterwards = value
+
+    @property
+    def reports(self) -> AnalysesContainer:
+        """The analyses of experiment,
+        they are read from the `reports` files on first access when read lazily."""
+        if self._reports is None:
+            assert self._lazy_source is not None, "The reports is not available."
+            self._reports = AnalysesContainer(
+                **self.analysis_container.read(**self._lazy_source._asdict())
+            )
+            self._reports.dirty = False
+        return self._reports
+
+    @reports.setter
+    def reports(self, value: Optional[AnalysesContainer]) -> None:
+        self._reports = value
+
+    @property
+    def loaded_sections(self) -> tuple[str, ...]:
+        """The sections which are in memory, the others will be read on first access."""
+        return tuple(
+            section
+            for section, attr in self._lazy_sections.items()
+            if getattr(self, attr) is not None
+        )
+
+    def release(self, *sections: str) -> tuple[str, ...]:
+        """Release the sections from memory,
+        they will be read from the files of the last read or write on next access.
+        The sections changed since then are kept, so nothing unwritten is lost.
+
+        Args:
+            *sections (str):
+                The sections in `advent`, `legacy` and `reports`,
+                release all of them if not given.
+
+        Returns:
+            tuple[str, ...]: The released sections.
+        """
+        if self._lazy_source is None:
+            return ()
+
+        released = []
+        for section in sections if len(sections) > 0 else self._lazy_sections:
+            if section not in self._lazy_sections:
+                raise ValueError(
+                    f"'{section}' can not be released, "
+                    + f"only {tuple(self._lazy_sections)} are available."
+                )
+            attr = self._lazy_sections[section]
+            if getattr(self, attr) is None or section in self.dirty_sections:
+                continue
+            if section == "reports" and self._reports.dirty:  # type: ignore
+                continue
+            setattr(self, attr, None)
+            released.append(section)
+
+        if len(released) > 0:
+            gc.collect()
+        return tuple(released)
+
+    def mark_dirty(self, *sections: str) -> None:
+        """Mark the sections as changed, so they will be written by the next write.
+
+        Args:
+            *sections (str):
+                The sections in `EXPORT_SECTIONS`, mark all sections if not given.
+        """
+        self.dirty_sections.update(sections if len(sections) > 0 else EXPORT_SECTIONS)
+        if len(sections) == 0 or "reports" in sections:
+            self.reports.dirty = True
+
+    def mark_clean(self, hashes: dict[str, str]) -> None:
+        """Mark all sections as unchanged after they are written or read.
+
+        Args:
+            hashes (dict[str, str]): The content hashes of files.
+        """
+        self.dirty_sections.clear()
+        if self._reports is not None:
+            self._reports.dirty = False
+        self.written_hashes = dict(hashes)
+
+    def unchanged_files(
+        self,
+        files: dict[str, str],
+        save_location: Union[Path, str],
+    ) -> tuple[str, ...]:
+        """Find the files which do not need to be written again,
+        they are in unchanged sections, have recorded hashes and exist.
+        The `args` section is always written for it's small and contains the datetimes.
+
+        Args:
+            files (dict[str, str]): The files to be exported.
+            save_location (Union[Path, str]): The location of files.
+
+        Returns:
+            tuple[str, ...]: The keys of unchanged files.
+        """
+        clean_sections = {
+            section
+            for section in EXPORT_SECTIONS
+            if section != "args" and section not in self.dirty_sections
+        }
+        if self._reports is not None and self._reports.dirty:
+            clean_sections.discard("reports")
+
+        sections_files: dict[str, list[str]] = {}
+        for filekey in files:
+            section = section_of_filekey(filekey)
+            if section in clean_sections:
+                sections_files.setdefault(section, []).append(filekey)
+
+        return tuple(
+            filekey
+            for section_filekeys in sections_files.values()
+            if all(
+                filekey in self.written_hashes
+                and os.path.exists(Path(save_location) / files[filekey])
+                for filekey in section_filekeys
+            )
+            for filekey in section_filekeys
+        )
+
     def reset_counts(self, summoner_id: str) -> None:
         """Reset the counts of the experiment."""
         if summoner_id == self.commons.summoner_id:
             self.afterwards = self.afterwards._replace(counts=[])
+            self.mark_dirty("legacy")
             gc.collect()
         else:
             warnings.warn(
@@ -294,10 +467,12 @@ class ExperimentPrototype(ABC):
     def __setitem__(self, key, value) -> None:
         if key in self.beforewards._fields:
             self.beforewards = self.beforewards._replace(**{key: value})
+            self.mark_dirty("advent")
 
         elif key in self.afterwards._fields:
             if self.after_lock and isinstance(self.after_lock, bool):
                 self.afterwards = self.afterwards._replace(**{key: value})
+                self.mark_dirty("legacy")
             else:
                 raise QurryProtectContent(
                     f"Can't set value to :cls:`afterward` field {key} "
@@ -513,6 +688,9 @@ class ExperimentPrototype(ABC):
         self,
         save_location: Optional[Union[Path, str]] = None,
         export_transpiled_circuit: bool = False,
+        skip_unchanged: bool = False,
+        binary_tales: bool = True,
+        binary_counts: bool = False,
     ) -> Export:
         """Export the data of experiment.
 
@@ -608,6 +786,25 @@ class ExperimentPrototype(ABC):
         }
         ```
 
+        Args:
+            save_location (Optional[Union[Path, str]], optional):
+                Where to save the export content as `json` file.
+                Defaults to None for the `save_location` in :attr:`commons`.
+            export_transpiled_circuit (bool, optional):
+                Export the transpiled circuit. Defaults to False.
+            skip_unchanged (bool, optional):
+                Whether to skip the sections which are not changed since the last write,
+                their files are recorded in :attr:`Export.unchanged_files`
+                and their content is left empty. Defaults to False.
+            binary_tales (bool, optional):
+                Whether to write the side products which are arrays as `.npy` binary sidecar,
+                otherwise they are written as json for compatibility. Defaults to True.
+            binary_counts (bool, optional):
+                Whether to write the counts as a memory-mappable `.counts.npy` table
+                by :func:`pack_legacy_counts` instead of json in the `legacy` file,
+                the counts which can not be packed are still written as json.
+                Defaults to False.
+
         Returns:
             Export: A namedtuple containing the data of experiment
                 which can be more easily to export as json file.
@@ -630,12 +827,33 @@ class ExperimentPrototype(ABC):
         if self.commons.save_location != save_location:
             self.commons = self.commons._replace(save_location=save_location)
 
-        adventures, tales = self.beforewards.export(
-            unexports=self._unexports,
-            export_transpiled_circuit=export_transpiled_circuit,
+        # The unchanged sections which are not loaded are not read for exporting,
+        # their tales are listed from the files of the last read or write instead.
+        lazy_files = {} if self._lazy_source is None else self._lazy_source.file_index
+        unloaded_sections = tuple(
+            section
+            for section in ("advent", "reports")
+            if skip_unchanged
+            and self._lazy_source is not None
+            and getattr(self, self._lazy_sections[section]) is None
+            and section not in self.dirty_sections
+            and not (section == "advent" and export_transpiled_circuit)
+        )
+        exp_name = (
+            self.args.exp_name
+            if self._beforewards is None
+            else self._beforewards.exp_name
         )
-        legacy = self.afterwards.export(unexports=self._unexports)
-        reports, tales_reports = self.reports.export()
+
+        if "reports" in unloaded_sections:
+            reports = {}
+            tales_reports = {
+                filekey[len("reports.tales.") :]: {}
+                for filekey in lazy_files
+                if filekey.startswith("reports.tales.")
+            }
+        else:
+            reports, tales_reports = self.reports.export()
 
         # filename
         filename = ""
@@ -652,22 +870,24 @@ class ExperimentPrototype(ABC):
         ):
             folder += f"./{self.commons.summoner_name}/"
             filename += f"index={self.commons.serial}.id={self.commons.exp_id}"
+        elif "folder" in lazy_files and "args" in lazy_files:
+            # Reuse the folder of the last read or write,
+            # so the unchanged files in it are not written again.
+            folder += f"./{Path(lazy_files['folder']).name}/"
+            filename += Path(lazy_files["args"]).name[: -len(".args.json")]
         else:
             repeat_times = 1
-            tmp = (
-                folder
-                + f"./{self.beforewards.exp_name}.{str(repeat_times).rjust(RJUST_LEN, '0')}/"
-            )
-            while os.path.exists(tmp):
+            tmp = folder + f"./{exp_name}.{str(repeat_times).rjust(RJUST_LEN, '0')}/"
+            while os.path.exists(save_location / tmp):
                 repeat_times += 1
                 tmp = (
                     folder
-                    + f"./{self.beforewards.exp_name}."
+                    + f"./{exp_name}."
                     + f"{str(repeat_times).rjust(RJUST_LEN, '0')}/"
                 )
             folder = tmp
             filename += (
-                f"{self.beforewards.exp_name}."
+                f"{exp_name}."
                 + f"{str(repeat_times).rjust(RJUST_LEN, '0')}.id={self.commons.exp_id}"
             )
 
@@ -679,15 +899,87 @@ class ExperimentPrototype(ABC):
             "advent": folder + f"advent/{filename}.advent.json",
             "legacy": folder + f"legacy/{filename}.legacy.json",
         }
-        for k in tales:
-            files[f"tales.{k}"] = folder + f"tales/{filename}.{k}.json"
+        if "advent" in unloaded_sections:
+            # The unchanged tales keep their format of the last write.
+            binary_side_product = {
+                filekey[len("tales.") :]: str(path).endswith(BINARY_TALES_SUFFIX)
+                for filekey, path in lazy_files.items()
+                if filekey.startswith("tales.")
+            }
+        else:
+            binary_side_product = {
+                k: binary_tales and isinstance(v, np.ndarray)
+                for k, v in self.beforewards.side_product.items()
+            }
+        for k, is_binary in binary_side_product.items():
+            files[f"tales.{k}"] = folder + (
+                f"tales/{filename}.{k}{BINARY_TALES_SUFFIX}"
+                if is_binary
+                else f"tales/{filename}.{k}.json"
+            )
+        # The counts are packed only when the legacy will be written,
+        # an unchanged legacy keeps its binary table from the last write.
+        packed_counts = None
+        keep_binary_counts = (
+            skip_unchanged
+            and "legacy" not in self.dirty_sections
+            and "legacy.counts" in self.written_hashes
+        )
+        if not binary_counts and "legacy.counts" in self.written_hashes:
+            # The legacy of the last write refers to the binary table.
+            self.mark_dirty("legacy")
+        if binary_counts and not keep_binary_counts:
+            packed_counts = pack_legacy_counts(self.afterwards.counts)
+        if packed_counts is not None or (binary_counts and keep_binary_counts):
+            files["legacy.counts"] = folder + f"legacy/{filename}{BINARY_COUNTS_SUFFIX}"
         files["reports"] = folder + f"reports/{filename}.reports.json"
         for k in tales_reports:
             files[f"reports.tales.{k}"] = folder + f"tales/{filename}.{k}.reports.json"
 
+        unchanged_files = (
+            self.unchanged_files(files, save_location) if skip_unchanged else ()
+        )
+        if export_transpiled_circuit:
+            unchanged_files = tuple(
+                filekey
+                for filekey in unchanged_files
+                if section_of_filekey(filekey) != "advent"
+            )
+        if any(section not in unchanged_files for section in unloaded_sections):
+            # The files of the unloaded sections are missing at this location,
+            # so they are read and exported again.
+            for section in unloaded_sections:
+                if section not in unchanged_files:
+                    getattr(self, "beforewards" if section == "advent" else section)
+            return self.export(
+                save_location=save_location,
+                export_transpiled_circuit=export_transpiled_circuit,
+                skip_unchanged=skip_unchanged,
+                binary_tales=binary_tales,
+                binary_counts=binary_counts,
+            )
+
+        if "advent" in unchanged_files:
+            adventures = {}
+            tales = {k: {} for k in binary_side_product}
+        else:
+            adventures, tales = self.beforewards.export(
+                unexports=self._unexports,
+                export_transpiled_circuit=export_transpiled_circuit,
+            )
+        if "legacy" in unchanged_files:
+            legacy = {}
+        else:
+            if "legacy.counts" in files and packed_counts is None:
+                packed_counts = pack_legacy_counts(self.afterwards.counts)
+            legacy = self.afterwards.export(
+                unexports=self._unexports,
+                counts_index=None if packed_counts is None else packed_counts[1],
+            )
+
         return Export(
             exp_id=str(self.commons.exp_id),
-            exp_name=str(self.beforewards.exp_name),
+            exp_name=str(exp_name),
             serial=(None if self.commons.serial is None else int(self.commons.serial)),
             summoner_id=(
                 None if self.commons.summoner_id else str(self.commons.summoner_id)
@@ -702,9 +994,19 @@ class ExperimentPrototype(ABC):
             outfields=jsonablize(self.outfields),
             adventures=jsonablize(adventures),
             legacy=jsonablize(legacy),
-            tales=jsonablize(tales),
+            tales={
+                k: (
+                    v
+                    if binary_tales and isinstance(v, np.ndarray)
+                    else jsonablize(v.tolist() if isinstance(v, np.ndarray) else v)
+                )
+                for k, v in tales.items()
+            },
             reports=reports,
             tales_reports=tales_reports,
+            unchanged_files=unchanged_files,
+            previous_hashes=self.written_hashes,
+            legacy_counts=None if packed_counts is None else packed_counts[0],
         )
 
     def write(
@@ -715,10 +1017,16 @@ class ExperimentPrototype(ABC):
         encoding: str = "utf-8",
         jsonable: bool = False,
         export_transpiled_circuit: bool = False,
+        incremental: bool = True,
+        binary_tales: bool = True,
+        binary_counts: bool = False,
+        catalog: Optional[Union[ExperimentCatalog, Path, str]] = None,
         _pbar: Optional[tqdm.tqdm] = None,
         _qurryinfo_hold_access: Optional[str] = None,
-    ) -> tuple[str, dict[str, str]]:
+    ) -> tuple[str, dict[str, Any]]:
         """Export the experiment data, if there is a previous export, then will overwrite.
+        Only the sections changed since the last write or read are written again
+        when `incremental` is True, and the content hashes are recorded in `qurryinfo`.
 
         - example of filename:
 
@@ -763,13 +1071,27 @@ class ExperimentPrototype(ABC):
                 for :func:`mori.quickJSON`. Defaults to False.
             mute (bool, optional):
                 Whether to mute the output, for :func:`mori.quickJSON`. Defaults to False.
+            export_transpiled_circuit (bool, optional):
+                Export the transpiled circuit. Defaults to False.
+            incremental (bool, optional):
+                Whether to skip the unchanged sections. Defaults to True.
+            binary_tales (bool, optional):
+                Whether to write the side products which are arrays as `.npy` binary sidecar,
+                otherwise they are written as json for compatibility. Defaults to True.
+            binary_counts (bool, optional):
+                Whether to write the counts as a memory-mappable `.counts.npy` table.
+                Defaults to False.
+            catalog (Optional[Union[ExperimentCatalog, Path, str]], optional):
+                The catalog or its location to index the written experiment.
+                Defaults to None for no catalog.
             _qurryinfo_hold_access (str, optional):
                 Whether to hold the I/O of `qurryinfo`, then export by :cls:`multimanager`,
                 it should be control by :cls:`multimanager`.
                 Defaults to None.
 
         Returns:
-            tuple[str, dict[str, str]]: The id of the experiment and the files location.
+            tuple[str, dict[str, Any]]:
+                The id of the experiment and the files location with their hashes.
         """
         if _pbar is not None:
             _pbar.set_description_str("Preparing to export...")
@@ -778,6 +1100,9 @@ class ExperimentPrototype(ABC):
         export_material = self.export(
             save_location=save_location,
             export_transpiled_circuit=export_transpiled_circuit,
+            skip_unchanged=incremental,
+            binary_tales=binary_tales,
+            binary_counts=binary_counts,
         )
         exp_id, files = export_material.write(
             mode=mode,
@@ -786,63 +1111,99 @@ class ExperimentPrototype(ABC):
             jsonable=jsonable,
             _pbar=_pbar,
         )
+        self.mark_clean(files["hashes"])
         assert "qurryinfo" in files, "qurryinfo location is not in files."
         # qurryinfo write
         real_save_location = Path(self.commons.save_location)
+        self._lazy_source = LazySource(files, real_save_location, encoding)
         if (
             _qurryinfo_hold_access == self.commons.summoner_id
             and self.commons.summoner_id is not None
         ):
             ...
-        elif os.path.exists(real_save_location / export_material.files["qurryinfo"]):
-            with open(
-                real_save_location / export_material.files["qurryinfo"],
-                "r",
-                encoding="utf-8",
-            ) as f:
-                qurryinfo_found: dict[str, dict[str, str]] = json.load(f)
-                content = {**qurryinfo_found, **{exp_id: files}}
-
-            quickJSON(
-                content=content,
-                filename=str(real_save_location / files["qurryinfo"]),
-                mode=mode,
-                indent=indent,
-                encoding=encoding,
-                jsonable=jsonable,
-                mute=True,
-            )
         else:
-            quickJSON(
-                content={exp_id: files},
-                filename=str(real_save_location / files["qurryinfo"]),
+            merge_qurryinfo(
+                real_save_location / files["qurryinfo"],
+                {exp_id: files},
                 mode=mode,
                 indent=indent,
                 encoding=encoding,
                 jsonable=jsonable,
-                mute=True,
             )
 
+        opened_catalog = open_catalog(catalog)
+        if opened_catalog is not None:
+            opened_catalog.add_experiments([self.catalog_record(files)])
+
         del export_material
         gc.collect()
 
         return exp_id, files
 
+    def catalog_record(self, files: dict[str, Any]) -> CatalogRecord:
+        """The record of experiment for :cls:`ExperimentCatalog`,
+        with the scalar arguments and the scalar quantities of all reports.
+
+        Args:
+            files (dict[str, Any]): The files written by :meth:`write`.
+
+        Returns:
+            CatalogRecord: The record.
+        """
+
+        def is_scalar(value: Any) -> bool:
+            return value is None or isinstance(value, (str, bool, numbers.Real))
+
+        quantities = {}
+        for key, analysis in self.reports.items():
+            quantities[str(key)] = {
+                name: float(value)
+                for name, value in analysis.content._asdict().items()
+                if name not in analysis.side_product_fields
+                and isinstance(value, numbers.Real)
+                and not isinstance(value, bool)
+            }
+
+        return CatalogRecord(
+            exp_id=self.commons.exp_id,
+            exp_name=self.args.exp_name,
+            wave_key=self.commons.wave_key,
+            serial=self.commons.serial,
+            summoner_id=self.commons.summoner_id,
+            summoner_name=self.commons.summoner_name,
+            tags=tuple(self.commons.tags),
+            datetimes=dict(self.commons.datetimes),
+            arguments={
+                k: v
+                for k, v in self.args._asdict().items()
+                if is_scalar(v)
+                or (isinstance(v, (tuple, list)) and all(is_scalar(vv) for vv in v))
+            },
+            quantities=quantities,
+            save_location=self.commons.save_location,
+            files=files,
+        )
+
     @classmethod
     def _read_core(
         cls,
         exp_id: str,
         file_index: dict[str, str],
-        save_location: Union[Path, str] = Path("./"),
+        save_location: Union[Path, str, ArchiveReader] = Path("./"),
         encoding: str = "utf-8",
+        lazy: bool = False,
     ) -> "ExperimentPrototype":
         """Core of read function.
 
         Args:
             exp_id (str): The id of the experiment to be read.
             file_index (dict[str, str]): The index of the experiment to be read.
-            save_location (Union[Path, str]): The location of the experiment to be read.
+            save_location (Union[Path, str, ArchiveReader]):
+                The location of the experiment to be read, or the archive of it.
             encoding (str): Encoding method, for :func:`mori.quickJSON`.
+            lazy (bool, optional):
+                Whether to read only the `args` file,
+                and read the other sections on first access. Defaults to False.
 
         Raises:
             ValueError: 'save_location' needs to be the type of 'str' or 'Path'.
@@ -852,13 +1213,23 @@ class ExperimentPrototype(ABC):
             QurryExperiment: The experiment to be read.
         """
 
-        if isinstance(save_location, (Path, str)):
+        if isinstance(save_location, ArchiveReader):
+            if not lazy:
+                # Read all files of the experiment forward in the shards at once.
+                save_location.prefetch(
+                    filename
+                    for filekey, filename in file_index.items()
+                    if filekey not in ("folder", "qurryinfo", "hashes")
+                )
+        elif isinstance(save_location, (Path, str)):
             save_location = Path(save_location)
+            if not os.path.exists(save_location):
+                raise FileNotFoundError(
+                    f"'save_location' does not exist, '{save_location}'."
+                )
         else:
-            raise ValueError("'save_location' needs to be the type of 'str' or 'Path'.")
-        if not os.path.exists(save_location):
-            raise FileNotFoundError(
-                f"'save_location' does not exist, '{save_location}'."
+            raise ValueError(
+                "'save_location' needs to be the type of 'str', 'Path' or 'ArchiveReader'."
             )
 
         # Construct the experiment
@@ -874,24 +1245,29 @@ class ExperimentPrototype(ABC):
             save_location=save_location,
             encoding=encoding,
         )
+        lazy_source = LazySource(file_index, save_location, encoding)
         exp_instance = cls(
             **export_material_set["commonparams"],
             **export_material_set["arguments"],
             **export_material_set["outfields"],
-            beforewards=cls.Before.read(
-                file_index=file_index, save_location=save_location, encoding=encoding
-            ),
-            afterwards=cls.After.read(
-                file_index=file_index, save_location=save_location, encoding=encoding
-            ),
-            reports=AnalysesContainer(
-                **cls.analysis_container.read(
-                    file_index=file_index,
-                    save_location=save_location,
-                    encoding=encoding,
+            beforewards=None if lazy else cls.Before.read(**lazy_source._asdict()),
+            afterwards=None if lazy else cls.After.read(**lazy_source._asdict()),
+            reports=(
+                None
+                if lazy
+                else AnalysesContainer(
+                    **cls.analysis_container.read(**lazy_source._asdict())
                 )
             ),
         )
+        # pylint: disable=protected-access
+        exp_instance._lazy_source = lazy_source
+        # pylint: enable=protected-access
+        if lazy:
+            exp_instance.mark_clean(file_index.get("hashes", {}))  # type: ignore
+            exp_instance.release()
+        elif "hashes" in file_index:
+            exp_instance.mark_clean(file_index["hashes"])  # type: ignore
         return exp_instance
 
     @classmethod
@@ -920,10 +1296,17 @@ class ExperimentPrototype(ABC):
         save_location: Union[Path, str] = Path("./"),
         encoding: str = "utf-8",
         workers_num: Optional[int] = None,
+        lazy: bool = False,
+        from_archive: Union[bool, ArchiveReader] = False,
     ) -> list["ExperimentPrototype"]:
         """Read the experiment from file.
         Replacement of :func:`QurryV4().readLegacy`
 
+        When `lazy` is True, only `qurryinfo.json` and the `args` files are read here,
+        the `advent`, `tales`, `legacy` and `reports` files of each experiment
+        are read on the first access of :attr:`beforewards`, :attr:`afterwards`
+        and :attr:`reports`, and can be released by :meth:`release` after using.
+
         Args:
             name_or_id (Union[Path, str]):
                 The name or id of the experiment to be read.
@@ -934,6 +1317,15 @@ class ExperimentPrototype(ABC):
                 Indent length for json, for :func:`mori.quickJSON`. Defaults to 2.
             encoding (str, optional):
                 Encoding method, for :func:`mori.quickJSON`. Defaults to 'utf-8'.
+            workers_num (Optional[int], optional):
+                The number of workers for reading. Defaults to None.
+            lazy (bool, optional):
+                Whether to read the experiments lazily. Defaults to False.
+            from_archive (Union[bool, ArchiveReader], optional):
+                Whether to read the files straight from the archive of the experiments
+                by :cls:`ArchiveReader` without extracting it, or the opened reader,
+                the archive is also used when the export folder does not exist.
+                Defaults to False.
 
         Raises:
             ValueError: 'save_location' needs to be the type of 'str' or 'Path'.
@@ -951,22 +1343,55 @@ class ExperimentPrototype(ABC):
             )
 
         export_location = save_location / name_or_id
-        if not os.path.exists(export_location):
-            raise FileNotFoundError(
-                f"'ExportLoaction' does not exist, '{export_location}'."
-            )
+        archive = from_archive if isinstance(from_archive, ArchiveReader) else None
+        if archive is None and (from_archive or not os.path.exists(export_location)):
+            if find_archive(save_location, member_name(name_or_id)) is None:
+                raise FileNotFoundError(
+                    f"'ExportLoaction' does not exist, '{export_location}'."
+                )
+            archive = ArchiveReader(save_location, member_name(name_or_id))
 
         qurryinfo: dict[str, dict[str, str]] = {}
         qurryinfo_location = export_location / "qurryinfo.json"
-        if not os.path.exists(qurryinfo_location):
+        if not (
+            os.path.exists(qurryinfo_location)
+            if archive is None
+            else qurryinfo_location.relative_to(save_location) in archive
+        ):
             raise FileNotFoundError(
                 f"'qurryinfo.json' does not exist at '{save_location}'. "
                 + "It's required for loading all experiment data."
             )
 
-        with open(qurryinfo_location, "r", encoding=encoding) as f:
-            qurryinfo_found: dict[str, dict[str, str]] = json.load(f)
-            qurryinfo = {**qurryinfo_found, **qurryinfo}
+        qurryinfo_found: dict[str, dict[str, str]] = load_export_json(
+            save_location if archive is None else archive,
+            qurryinfo_location.relative_to(save_location),
+            encoding,
+        )
+        qurryinfo = {**qurryinfo_found, **qurryinfo}
+
+        if archive is not None:
+            # The experiments are read in the order of their files in the shards,
+            # so the compressed shards are decompressed forward only.
+            loaded = {
+                exp_id: cls._read_core(exp_id, file_index, archive, encoding, lazy=lazy)
+                for exp_id, file_index in qurry_progressbar(
+                    sorted(qurryinfo.items(), key=lambda item: member_name(item[1]["args"])),
+                    desc=f"{len(qurryinfo)} experiments found, loading from archive.",
+                )
+            }
+            return [loaded[exp_id] for exp_id in qurryinfo]
+
+        if lazy:
+            # The args files are small,
+            # reading them here is faster than pickling experiments back from workers.
+            return [
+                cls._read_core(exp_id, file_index, save_location, encoding, lazy=True)
+                for exp_id, file_index in qurry_progressbar(
+                    qurryinfo.items(),
+                    desc=f"{len(qurryinfo)} experiments found, loading lazily.",
+                )
+            ]
 
         if workers_num is None:
             workers_num = DEFAULT_POOL_SIZE
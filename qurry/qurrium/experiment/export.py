@@ -7,17 +7,92 @@ Export data structure for qurry.expertiment.ExperimentPrototype
 """
 
 import os
+import json
+import hashlib
 from typing import Optional, NamedTuple, Any, Hashable, Union
 from pathlib import Path
 import warnings
 import gc
 import tqdm
+import numpy as np
 
-from .container import CommonparamsDict, REQUIRED_FOLDER
+from .container import CommonparamsDict, REQUIRED_FOLDER, write_binary_tales, write_json
 from ...tools import ParallelManager
 from ...capsule import quickJSON
 
 
+EXPORT_SECTIONS = ("args", "advent", "legacy", "reports")
+"""The sections of exported files of an experiment,
+`advent` contains the `tales.*` files and `reports` contains the `reports.tales.*` files."""
+
+
+def section_of_filekey(filekey: str) -> str:
+    """Get the section of the exported file.
+
+    Args:
+        filekey (str): The key of the file in `files`.
+
+    Returns:
+        str: The section which the file belongs to.
+    """
+    filekeydiv = filekey.split(".")
+    if filekeydiv[0] == "tales":
+        return "advent"
+    return filekeydiv[0]
+
+
+def file_content_hash(filename: Union[Path, str]) -> str:
+    """Calculate the SHA-256 hash of the content of file,
+    the same hash as the one returned by writing it.
+
+    Args:
+        filename (Union[Path, str]): The file.
+
+    Returns:
+        str: The hexadecimal digest.
+    """
+    hasher = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def merge_qurryinfo(
+    qurryinfo_location: Union[Path, str],
+    qurryinfo_items: dict[str, dict[str, Any]],
+    mode: str = "w+",
+    indent: int = 2,
+    encoding: str = "utf-8",
+    jsonable: bool = False,
+) -> None:
+    """Merge the files of experiments into `qurryinfo.json`, create it if not exists.
+
+    Args:
+        qurryinfo_location (Union[Path, str]): The location of `qurryinfo.json`.
+        qurryinfo_items (dict[str, dict[str, Any]]): The files of each experiment.
+        mode (str, optional): Mode for :func:`open` function. Defaults to "w+".
+        indent (int, optional): Indent length for json. Defaults to 2.
+        encoding (str, optional): Encoding method. Defaults to "utf-8".
+        jsonable (bool, optional): Whether to jsonablize the content. Defaults to False.
+    """
+    content = {}
+    if os.path.exists(qurryinfo_location):
+        with open(qurryinfo_location, "r", encoding=encoding) as f:
+            content = json.load(f)
+    content.update(qurryinfo_items)
+
+    quickJSON(
+        content=content,
+        filename=str(qurryinfo_location),
+        mode=mode,
+        indent=indent,
+        encoding=encoding,
+        jsonable=jsonable,
+        mute=True,
+    )
+
+
 class Export(NamedTuple):
     """Data-stored namedtuple with all experiments data which is jsonable."""
 
@@ -115,7 +190,8 @@ class Export(NamedTuple):
     ~The Legacy remains from the achievement of ancestors~"""
     tales: dict[str, Any]
     """Recording the data of 'side_product' in 'afterward' and 'beforewards' for API, 
-    which will be packed into `.*.tales.json`. 
+    which will be packed into `.*.tales.json`,
+    or `.*.tales.npy` binary sidecar for the arrays.
     ~Tales of braves circulate~"""
 
     reports: dict[Hashable, dict[str, Any]]
@@ -126,6 +202,15 @@ class Export(NamedTuple):
     which will be packed into `.*.reprts.json`. 
     ~Tales of braves circulate~"""
 
+    unchanged_files: tuple[str, ...] = ()
+    """The keys of files which are not changed since the last write,
+    they will not be written again and their content may be left empty."""
+    previous_hashes: Optional[dict[str, str]] = None
+    """The content hashes of files from the last write."""
+    legacy_counts: Optional[np.ndarray] = None
+    """The binary table of counts from :func:`pack_legacy_counts`,
+    which will be written as `.counts.npy` instead of the counts in `.legacy.json`."""
+
     def write(
         self,
         mode: str = "w+",
@@ -135,7 +220,7 @@ class Export(NamedTuple):
         mute: bool = False,
         multiprocess: bool = False,
         _pbar: Optional[tqdm.tqdm] = None,
-    ) -> tuple[str, dict[str, str]]:
+    ) -> tuple[str, dict[str, Any]]:
         """Export the experiment data, if there is a previous export, then will overwrite.
 
         - example of filename:
@@ -171,24 +256,28 @@ class Export(NamedTuple):
                 Defaults to `None`.
 
             mode (str):
-                Mode for :func:`open` function, for :func:`mori.quickJSON`. Defaults to 'w+'.
+                Mode for :func:`open` function, for :func:`write_json`. Defaults to 'w+'.
             indent (int, optional):
-                Indent length for json, for :func:`mori.quickJSON`. Defaults to 2.
+                Indent length for json, for :func:`write_json`. Defaults to 2.
             encoding (str, optional):
-                Encoding method, for :func:`mori.quickJSON`. Defaults to 'utf-8'.
+                Encoding method, for :func:`write_json`. Defaults to 'utf-8'.
             jsonable (bool, optional):
                 Whether to transpile all object to jsonable via :func:`mori.jsonablize`,
-                for :func:`mori.quickJSON`. Defaults to False.
+                for :func:`write_json`. Defaults to False.
             mute (bool, optional):
-                Whether to mute the output, for :func:`mori.quickJSON`. Defaults to False.
+                Whether to mute the output. Defaults to False.
             multiprocess (bool, optional):
                 Whether to use multiprocess to export, Defaults to False.
                 It's dangerous to use multiprocess to export. It may cause memory leak.
 
         Returns:
-            tuple[str, dict[str, str]]:
+            tuple[str, dict[str, Any]]:
                 The first element is the id of experiment,
-                the second element is the file location.
+                the second element is the file location,
+                with the SHA-256 hashes of the content of files in `hashes`,
+                which are calculated from the serialized bytes while writing.
+                The files in :attr:`unchanged_files` are not written
+                and their hashes are taken from :attr:`previous_hashes`.
                 They can combine as `qurryinfo` like:
                 ```python
                 key, value = export.write()
@@ -225,13 +314,18 @@ class Export(NamedTuple):
             "legacy": self.legacy,
         }
         # tales ..............  # tales
+        binary_set: dict[str, np.ndarray] = {}
         for tk, tv in self.tales.items():
-            if isinstance(tv, (dict, list, tuple)):
+            if isinstance(tv, np.ndarray):
+                binary_set[f"tales.{tk}"] = tv
+            elif isinstance(tv, (dict, list, tuple)):
                 export_set[f"tales.{tk}"] = tv
             else:
                 export_set[f"tales.{tk}"] = [tv]
             if f"tales.{tk}" not in self.files:
                 warnings.warn(f"tales.{tk} is not in export_names, it's not exported.")
+        if self.legacy_counts is not None:
+            binary_set["legacy.counts"] = self.legacy_counts
         # reports ............  # reports
         export_set["reports"] = {
             "files": self.files,
@@ -257,49 +351,62 @@ class Export(NamedTuple):
         folder = Path(self.commons["save_location"]) / Path(
             self.files["folder"]  # just ignore it.
         )
-        if not os.path.exists(folder):
-            os.mkdir(folder)
+        # exist_ok for the experiments written concurrently into the same folder.
+        os.makedirs(folder, exist_ok=True)
         for k in REQUIRED_FOLDER:
-            if not os.path.exists(folder / k):
-                os.mkdir(folder / k)
+            os.makedirs(folder / k, exist_ok=True)
+
+        for filekey in self.unchanged_files:
+            export_set.pop(filekey, None)
+            binary_set.pop(filekey, None)
+
+        hashes: dict[str, str] = {}
+        for filekey, content in binary_set.items():
+            if filekey in self.files:
+                hashes[filekey] = write_binary_tales(
+                    Path(self.commons["save_location"]) / self.files[filekey], content
+                )
 
         if multiprocess:
             pool = ParallelManager()
-            pool.starmap(
-                quickJSON,
+            json_hashes = pool.starmap(
+                write_json,
                 [
                     (
                         content,
-                        str(
-                            Path(self.commons["save_location"])  # type: ignore
-                            / self.files[filekey]  # just ignore it.
-                        ),
+                        Path(self.commons["save_location"])  # type: ignore
+                        / self.files[filekey],  # just ignore it.
                         mode,
                         indent,
                         encoding,
                         jsonable,
-                        Path("./"),
-                        mute,
                     )
                     for filekey, content in export_set.items()
                 ],
             )
+            hashes.update(zip(export_set, json_hashes))
         else:
             for filekey, content in export_set.items():
-                quickJSON(
+                hashes[filekey] = write_json(
                     content=content,
-                    filename=str(
-                        Path(self.commons["save_location"])  # type: ignore
-                        / self.files[filekey]  # just ignore it.
-                    ),
+                    filename=Path(self.commons["save_location"])  # type: ignore
+                    / self.files[filekey],  # just ignore it.
                     mode=mode,
                     indent=indent,
                     encoding=encoding,
                     jsonable=jsonable,
-                    save_location=Path("./"),
-                    mute=mute,
                 )
+        if not mute:
+            print(f"| Export {len(hashes)} files to '{folder}'.")
+
+        previous_hashes = {} if self.previous_hashes is None else self.previous_hashes
+        hashes = {
+            filekey: (hashes[filekey] if filekey in hashes else previous_hashes[filekey])
+            for filekey in self.files
+            if filekey in hashes
+            or (filekey in self.unchanged_files and filekey in previous_hashes)
+        }
 
-        del export_set
+        del export_set, binary_set
         gc.collect()
-        return self.exp_id, self.files
+        return self.exp_id, {**self.files, "hashes": hashes}
@@ -10,5 +10,7 @@ from .container import (
     PENDING_STRATEGY,
     PendingTargetProviderLiteral,
     PENDING_TARGET_PROVIDER,
+    MultiFileTypeLiteral,
+    MULTI_FILETYPE,
     TagListKeyable,
 )
@@ -12,6 +12,7 @@ import json
 from qiskit.result import Result
 from qiskit.providers import Backend
 
+from ..utils.archive import ArchiveReader
 from ...tools.datetime import DatetimeDict
 from ...capsule import quickRead
 from ...capsule.mori import TagList
@@ -32,6 +33,14 @@ PENDING_TARGET_PROVIDER: list[PendingTargetProviderLiteral] = [
     # "Azure_Q"
 ]
 """List of backend provider."""
+MultiFileTypeLiteral = Literal["json", "npy"]
+"""Type of the files of multimanager.
+- "json": All data are written as json.
+- "npy": The counts of experiments are written as memory-mappable `.counts.npy` tables,
+    the others are still written as json.
+"""
+MULTI_FILETYPE: list[MultiFileTypeLiteral] = ["json", "npy"]
+"""List of the filetype of multimanager."""
 
 
 class MultiCommonparams(NamedTuple):
@@ -68,7 +77,18 @@ class MultiCommonparams(NamedTuple):
     manager_run_args: dict[str, any]
     """Other arguments will be passed to `IBMQJobManager()`"""
 
-    filetype: Literal["json"]
+    filetype: MultiFileTypeLiteral
+    """The filetype of the files of multimanager, see :attr:`MultiFileTypeLiteral`."""
+
+    @property
+    def taglist_filetype(self) -> Literal["json"]:
+        """The filetype of taglists and quantities, which are always json."""
+        return "json"
+
+    @property
+    def binary_counts(self) -> bool:
+        """Whether the counts of experiments are written as binary tables."""
+        return self.filetype == "npy"
 
     # header
     datetimes: DatetimeDict
@@ -111,10 +131,17 @@ class MultiCommonparams(NamedTuple):
         save_location: Union[Path, str],
         export_location: Union[Path, str],
         encoding: Optional[str] = None,
+        archive: Optional[ArchiveReader] = None,
     ) -> dict[str, Any]:
         rawread_multiconfig = {}
-        with open(mutlticonfig_name, "r", encoding=encoding) as f:
-            rawread_multiconfig: dict[str, Any] = json.load(f)
+        if archive is not None:
+            rawread_multiconfig = archive.read_json(
+                Path(mutlticonfig_name).relative_to(save_location),
+                encoding=encoding or "utf-8",
+            )
+        else:
+            with open(mutlticonfig_name, "r", encoding=encoding) as f:
+                rawread_multiconfig: dict[str, Any] = json.load(f)
         for k, nk in cls.v5_to_v7_field().items():
             if k in rawread_multiconfig:
                 rawread_multiconfig[nk] = rawread_multiconfig.pop(k)
@@ -8,19 +8,31 @@ MultiManager for Qurry (:mod:`qurry.qurrium.multimanager`)
 import os
 import gc
 import shutil
-import tarfile
+import tempfile
 import warnings
 
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import Literal, Union, Optional, Hashable, Any
+from typing import Literal, Union, Optional, Hashable, Iterator, Any
 from uuid import uuid4, UUID
 
-from .container import MultiCommonparams, Before, After
-from .process import multiprocess_exporter_and_writer
+from .container import MultiCommonparams, Before, After, MULTI_FILETYPE
+from .process import parallel_exporter_and_writer
 from ..experiment import ExperimentPrototype
+from ..experiment.export import merge_qurryinfo
 from ..container import ExperimentContainer, QuantityContainer
 from ..utils.iocontrol import naming, RJUST_LEN
-from ...tools import qurry_progressbar, current_time, DatetimeDict
+from ..utils.catalog import ExperimentCatalog, open_catalog
+from ..utils.archive import (
+    CompressCodecLiteral,
+    ArchiveStats,
+    ArchiveReader,
+    member_name,
+    find_archive,
+    read_archive,
+    write_archive,
+)
+from ...tools import qurry_progressbar, current_time, DatetimeDict, ParallelManager
 from ...declare.multimanager import multicommonConfig
 from ...capsule import quickJSON
 from ...capsule.mori import TagList, GitSyncControl
@@ -149,6 +161,10 @@ class MultiManager:
 
     quantity_container: QuantityContainer
     """The container of quantity."""
+    archive_stats: Optional[ArchiveStats] = None
+    """The statistics of the last compressing or decompressing."""
+    archive_reader: Optional[ArchiveReader] = None
+    """The reader of the archive, when the multimanager is read from it without extracting."""
 
     def __init__(
         self,
@@ -159,6 +175,8 @@ class MultiManager:
         is_read: bool = False,
         encoding: str = "utf-8",
         read_from_tarfile: bool = False,
+        read_from_archive: bool = False,
+        codec: Optional[CompressCodecLiteral] = None,
         version: Literal["v4", "v5"] = "v5",
         **kwargs,
     ) -> None:
@@ -172,8 +190,16 @@ class MultiManager:
             is_read (bool, optional): Whether read the experiment. Defaults to False.
             encoding (str, optional): The encoding of json file. Defaults to "utf-8".
             read_from_tarfile (bool, optional): Whether read from tarfile. Defaults to False.
-            filetype (TagList._availableFileType, optional):
-                The filetype of json file. Defaults to "json".
+            read_from_archive (bool, optional):
+                Whether read the files straight from the archive without extracting it,
+                only the small files of the multimanager itself are extracted
+                into a temporary folder for reading. Defaults to False.
+            codec (Optional[CompressCodecLiteral], optional):
+                The expected codec of the archive to read.
+                Defaults to None for the codec recorded in its manifest.
+            filetype (MultiFileTypeLiteral, optional):
+                The filetype of multimanager, "npy" writes the counts of experiments
+                as memory-mappable binary tables. Defaults to "json".
             version (Literal[&quot;v4&quot;, &quot;v5&quot;], optional):
                 The version of json file. Defaults to "v5".
             **kwargs (Any): The other arguments of multi-experiment.
@@ -212,7 +238,10 @@ class MultiManager:
             save_location=save_location,
         )
 
-        is_tarfile_existed = os.path.exists(self.naming_complex.tarLocation)
+        is_tarfile_existed = (
+            find_archive(self.naming_complex.save_location, self.naming_complex.expsName)
+            is not None
+        )
         multiconfig_name_v5 = (
             self.naming_complex.export_location
             / f"{self.naming_complex.expsName}.multiConfig.json"
@@ -225,23 +254,42 @@ class MultiManager:
                 f"| Found the tarfile '{self.naming_complex.tarName}' "
                 + f"in '{self.naming_complex.save_location}', decompressing is available."
             )
-            if (not multiconfig_name_v5.exists()) and (
+            if read_from_archive and not read_from_tarfile:
+                archive_reader = ArchiveReader(
+                    self.naming_complex.save_location,
+                    self.naming_complex.expsName,
+                    codec=codec,
+                )
+                if (
+                    multiconfig_name_v7.relative_to(self.naming_complex.save_location)
+                    in archive_reader
+                ):
+                    print(f"| Reading from the archive without extracting, {archive_reader}.")
+                    self.archive_reader = archive_reader
+                else:
+                    print(
+                        "| No multi.config.json in the archive, "
+                        + "decompressing all files in the archive."
+                    )
+                    archive_reader.close()
+                    self.easydecompress(codec=codec)
+            elif (not multiconfig_name_v5.exists()) and (
                 not multiconfig_name_v7.exists()
             ):
                 print(
                     "| No multi.config file found, "
                     + f"decompressing all files in the tarfile '{self.naming_complex.tarName}'."
                 )
-                self.easydecompress()
+                self.easydecompress(codec=codec)
             elif read_from_tarfile:
                 print(
                     f"| Decompressing all files in the tarfile '{self.naming_complex.tarName}'"
                     + f", replace all files in '{self.naming_complex.export_location}'."
                 )
-                self.easydecompress()
+                self.easydecompress(codec=codec)
 
         if is_read and version == "v5":
-            if multiconfig_name_v5.exists():
+            if self.archive_reader is None and multiconfig_name_v5.exists():
                 print("| Found the multiConfig.json, reading in 'v5' file structure.")
                 rawread_multiconfig = self.MultiCommonparams._read_as_dict(
                     mutlticonfig_name=multiconfig_name_v5,
@@ -271,29 +319,31 @@ class MultiManager:
                         name=f"{self.naming_complex.expsName}.{qk}",
                     )
 
-            elif multiconfig_name_v7.exists():
+            elif multiconfig_name_v7.exists() or self.archive_reader is not None:
                 rawread_multiconfig = self.MultiCommonparams._read_as_dict(
                     mutlticonfig_name=multiconfig_name_v7,
                     save_location=self.naming_complex.save_location,
                     export_location=self.naming_complex.export_location,
                     encoding=encoding,
+                    archive=self.archive_reader,
                 )
                 files = rawread_multiconfig["files"]
 
-                self.beforewards = self.Before._read(
-                    export_location=self.naming_complex.export_location, version="v7"
-                )
-                self.afterwards = self.After._read(
-                    export_location=self.naming_complex.export_location, version="v7"
-                )
-                self.quantity_container = QuantityContainer()
-                for qk in files["quantity"].keys():
-                    self.quantity_container.read(
-                        key=qk,
-                        save_location=self.naming_complex.export_location,
-                        taglist_name="quantity",
-                        name=f"{qk}",
+                with self._manager_location(encoding) as manager_location:
+                    self.beforewards = self.Before._read(
+                        export_location=manager_location, version="v7"
+                    )
+                    self.afterwards = self.After._read(
+                        export_location=manager_location, version="v7"
                     )
+                    self.quantity_container = QuantityContainer()
+                    for qk in files["quantity"].keys():
+                        self.quantity_container.read(
+                            key=qk,
+                            save_location=manager_location,
+                            taglist_name="quantity",
+                            name=f"{qk}",
+                        )
             else:
                 print(f"| v5: {multiconfig_name_v5}")
                 print(f"| v7: {multiconfig_name_v7}")
@@ -337,6 +387,11 @@ class MultiManager:
                 outfields = {**rawread_multiconfig[k]}
             else:
                 outfields[k] = rawread_multiconfig[k]
+        if multicommons["filetype"] not in MULTI_FILETYPE:
+            raise ValueError(
+                f"filetype '{multicommons['filetype']}' is not supported, "
+                + f"use one of {MULTI_FILETYPE}."
+            )
 
         # datetimes
         if "datetimes" not in multicommons:
@@ -349,7 +404,9 @@ class MultiManager:
         if "build" not in multicommons["datetimes"] and not is_read:
             multicommons["datetimes"]["bulid"] = current_time()
 
-        if is_tarfile_existed:
+        if self.archive_reader is not None:
+            multicommons["datetimes"].add_serial("archiveRead")
+        elif is_tarfile_existed:
             if not multiconfig_name_v5.exists() or not multiconfig_name_v7.exists():
                 multicommons["datetimes"].add_serial("decompress")
             elif read_from_tarfile:
@@ -391,6 +448,48 @@ class MultiManager:
                         if path.exists():
                             path.unlink()
 
+    @contextmanager
+    def _manager_location(self, encoding: str = "utf-8") -> Iterator[Path]:
+        """The folder of the files of the multimanager itself.
+        When reading from the archive, the files except the ones of experiments
+        are extracted into a temporary folder, which is removed after reading.
+
+        Args:
+            encoding (str, optional): The encoding of `qurryinfo.json`. Defaults to "utf-8".
+
+        Yields:
+            Path: The folder of the files of the multimanager.
+        """
+        if self.archive_reader is None:
+            yield self.naming_complex.export_location
+            return
+
+        root = member_name(
+            self.naming_complex.export_location.relative_to(self.naming_complex.save_location)
+        )
+        qurryinfo_name = f"{root}/qurryinfo.json"
+        experiment_files = {qurryinfo_name}
+        if qurryinfo_name in self.archive_reader:
+            for file_index in self.archive_reader.read_json(
+                qurryinfo_name, encoding=encoding
+            ).values():
+                experiment_files.update(
+                    member_name(filename)
+                    for filekey, filename in file_index.items()
+                    if filekey not in ("folder", "hashes")
+                )
+
+        with tempfile.TemporaryDirectory() as tmp_location:
+            self.archive_reader.extract(
+                (
+                    name
+                    for name in self.archive_reader.members
+                    if name.startswith(f"{root}/") and name not in experiment_files
+                ),
+                tmp_location,
+            )
+            yield Path(tmp_location) / root
+
     def register(
         self,
         current_id: str,
@@ -481,10 +580,16 @@ class MultiManager:
         indent: int = 2,
         encoding: str = "utf-8",
         export_transpiled_circuit: bool = False,
+        workers_num: Optional[int] = None,
+        catalog: Optional[Union[ExperimentCatalog, Path, str]] = None,
+        pool: Optional[ParallelManager] = None,
         _only_quantity: bool = False,
     ) -> dict[str, Any]:
         """Export the multi-experiment.
 
+        The experiments are exported batch by batch and written by a pool of workers,
+        then `qurryinfo.json` and `files_taglist` are merged and written at the end.
+
         Args:
             save_location (Union[Path, str], optional): Location of saving experiment.
                 Defaults to None.
@@ -494,6 +599,16 @@ class MultiManager:
             encoding (str, optional): The encoding of json file. Defaults to "utf-8".
             export_transpiled_circuit (bool, optional): 
                 Export the transpiled circuit. Defaults to False.
+            workers_num (Optional[int], optional):
+                The number of workers to write the experiments,
+                if sets to 1, then write them one by one.
+                Defaults to None for the number of all cpu counts.
+            catalog (Optional[Union[ExperimentCatalog, Path, str]], optional):
+                The catalog or its location to index the multimanager and its experiments.
+                Defaults to None for no catalog.
+            pool (Optional[ParallelManager], optional):
+                The persistent process manager to reuse, `workers_num` is ignored if given.
+                Defaults to None for a new one closed after writing.
             _only_quantity (bool, optional): Whether only export quantity. Defaults to False.
 
         Returns:
@@ -507,6 +622,7 @@ class MultiManager:
             self.update_save_location(save_location=save_location, without_serial=True)
 
         self.gitignore.ignore("*.json")
+        self.gitignore.ignore("*.npy")
         self.gitignore.sync("qurryinfo.json")
         if not os.path.exists(save_location):
             os.makedirs(save_location)
@@ -542,7 +658,7 @@ class MultiManager:
                 filename = tmp.export(
                     save_location=self.multicommons.export_location,
                     taglist_name=f"{exporting_name[k]}",
-                    filetype=self.multicommons.filetype,
+                    filetype=self.multicommons.taglist_filetype,
                     open_args={
                         "mode": "w+",
                         "encoding": encoding,
@@ -552,7 +668,9 @@ class MultiManager:
                     },
                 )
                 self.multicommons.files[exporting_name[k]] = str(filename)
-                self.gitignore.sync(f"{exporting_name[k]}.{self.multicommons.filetype}")
+                self.gitignore.sync(
+                    f"{exporting_name[k]}.{self.multicommons.taglist_filetype}"
+                )
 
             elif isinstance(self[k], (dict, list)):
                 export_progress.set_description_str(f"{k} as {exporting_name[k]}")
@@ -584,11 +702,11 @@ class MultiManager:
         # tagMapQuantity or quantity
         self.multicommons.files["quantity"] = self.quantity_container.write(
             save_location=self.multicommons.export_location,
-            filetype=self.multicommons.filetype,
+            filetype=self.multicommons.taglist_filetype,
             indent=indent,
             encoding=encoding,
         )
-        self.gitignore.sync(f"*.quantity.{self.multicommons.filetype}")
+        self.gitignore.sync(f"*.quantity.{self.multicommons.taglist_filetype}")
         # multiConfig
         multiconfig = self._write_multiconfig(encoding=encoding, mute=True)
         print(f"| Export multi.config.json for {self.summoner_id}")
@@ -596,47 +714,32 @@ class MultiManager:
         self.gitignore.export(self.multicommons.export_location)
 
         if exps_container is not None:
-            # pool = ProcessManager(6)
             all_qurryinfo_loc = self.multicommons.export_location / "qurryinfo.json"
 
-            # all_qurryinfo_items = pool.process_map(
-            #     multiprocess_exporter_and_writer_wrapper,
-            #     [
-            #         (
-            #             id_exec,
-            #             exps_container[id_exec],
-            #             self.multicommons.save_location,
-            #             "w+",
-            #             indent,
-            #             encoding,
-            #             True,
-            #             True,
-            #         )
-            #         for id_exec in self.beforewards.exps_config
-            #     ],
-            #     desc="Exporting and writring...",
-            # )
             exps_export_progress = qurry_progressbar(
-                self.beforewards.exps_config,
+                None,
+                total=len(self.beforewards.exps_config),
                 desc="Exporting and writring...",
                 bar_format="qurry-barless",
             )
-            all_qurryinfo = {}
-            for id_exec in exps_export_progress:
-                tmp_id, tmp_qurryinfo = multiprocess_exporter_and_writer(
-                    id_exec=id_exec,
-                    exps=exps_container[id_exec],
+            with (
+                ParallelManager(workers_num) if pool is None else nullcontext(pool)
+            ) as writing_pool:
+                all_qurryinfo = parallel_exporter_and_writer(
+                    id_execs=self.beforewards.exps_config,
+                    exps_container=exps_container,
                     save_location=self.multicommons.save_location,
+                    pool=writing_pool,
                     mode="w+",
                     indent=indent,
                     encoding=encoding,
                     jsonable=True,
                     mute=True,
                     export_transpiled_circuit=export_transpiled_circuit,
-                    _pbar=None,
+                    binary_counts=self.multicommons.binary_counts,
+                    _pbar=exps_export_progress,
                 )
-                assert id_exec == tmp_id, "ID is not consistent."
-                all_qurryinfo[id_exec] = tmp_qurryinfo
+            exps_export_progress.close()
 
             # for id_exec, files in all_qurryinfo_items:
             for id_exec, files in all_qurryinfo.items():
@@ -646,7 +749,7 @@ class MultiManager:
             self.beforewards.files_taglist.export(
                 save_location=self.multicommons.export_location,
                 taglist_name=f"{exporting_name['files_taglist']}",
-                filetype=self.multicommons.filetype,
+                filetype=self.multicommons.taglist_filetype,
                 open_args={
                     "mode": "w+",
                     "encoding": encoding,
@@ -668,6 +771,26 @@ class MultiManager:
                 mute=True,
             )
 
+        opened_catalog = open_catalog(catalog)
+        if opened_catalog is not None:
+            if exps_container is not None:
+                # The experiments are written by workers, so their records are made here.
+                opened_catalog.add_experiments(
+                    exps_container[id_exec]
+                    .catalog_record(files)
+                    ._replace(save_location=self.multicommons.save_location)
+                    for id_exec, files in all_qurryinfo.items()
+                )
+            opened_catalog.add_multimanager(
+                summoner_id=self.multicommons.summoner_id,
+                summoner_name=self.multicommons.summoner_name,
+                save_location=self.multicommons.save_location,
+                export_location=self.multicommons.export_location,
+                tags=self.multicommons.tags,
+                datetimes=self.multicommons.datetimes,
+                files=self.multicommons.files,
+            )
+
         gc.collect()
         return multiconfig
 
@@ -675,17 +798,29 @@ class MultiManager:
         self,
         compress_overwrite: bool = False,
         remain_only_compressed: bool = False,
+        codec: CompressCodecLiteral = "xz",
+        level: Optional[int] = None,
+        shards: int = 1,
+        workers_num: Optional[int] = None,
     ) -> Path:
-        """Compress the export_location to tar.xz.
+        """Compress the export_location to the sharded archive.
 
         Args:
             compress_overwrite (bool, optional):
-                Reproduce all the compressed files. Defaults to False.
+                Deprecated, the previous archive is always replaced. Defaults to False.
             remain_only_compressed (bool, optional):
                 Remove uncompressed files. Defaults to False.
+            codec (CompressCodecLiteral, optional):
+                The codec of archive, "xz", "zstd" or uncompressed "tar". Defaults to "xz".
+            level (Optional[int], optional):
+                The compression level, the preset for "xz". Defaults to None.
+            shards (int, optional):
+                The number of shards compressed in parallel. Defaults to 1.
+            workers_num (Optional[int], optional):
+                The number of threads. Defaults to None for all cores.
 
         Returns:
-            Path: Path of the compressed file.
+            Path: Path of the manifest of the compressed files.
         """
 
         if remain_only_compressed:
@@ -695,7 +830,13 @@ class MultiManager:
         print(
             f"| Compress multimanager of '{self.naming_complex.expsName}'...", end="\r"
         )
-        loc = self.easycompress(overwrite=compress_overwrite)
+        loc = self.easycompress(
+            overwrite=compress_overwrite,
+            codec=codec,
+            level=level,
+            shards=shards,
+            workers_num=workers_num,
+        )
         print(f"| Compress multimanager of '{self.naming_complex.expsName}'...done")
 
         if remain_only_compressed:
@@ -718,6 +859,7 @@ class MultiManager:
         specific_analysis_args: Optional[
             dict[Hashable, Union[dict[str, Any], bool]]
         ] = None,
+        pool: Optional[ParallelManager] = None,
         **analysis_args: Any,
     ) -> str:
         """Run the analysis for multiple experiments.
@@ -729,6 +871,9 @@ class MultiManager:
             specificAnalysisArgs (dict[Hashable, dict[str, Any]], optional):
                 Specific some experiment to run the analysis arguments for each experiment.
                 Defaults to {}.
+            pool (Optional[ParallelManager], optional):
+                The persistent process manager to reuse by the experiments
+                which can handle it and are not given `workers_num`. Defaults to None.
 
         Raises:
             ValueError: No positional arguments allowed except `summoner_id`.
@@ -759,8 +904,10 @@ class MultiManager:
                 "| {n_fmt}/{total_fmt} - Analysis: {desc} - {elapsed} < {remaining}"
             ),
         )
+        analyzed_qurryinfo: dict[str, dict[str, Any]] = {}
         for k in all_counts_progress:
             tqdm_handleable = wave_continer[k].tqdm_handleable
+            pool_handleable = pool is not None and wave_continer[k].pool_handleable
 
             if k in specific_analysis_args:
                 v_args = specific_analysis_args[k]
@@ -773,22 +920,47 @@ class MultiManager:
                     report = wave_continer[k].analyze(
                         **analysis_args,
                         **({"pbar": all_counts_progress} if tqdm_handleable else {}),
+                        **(
+                            {"pool": pool}
+                            if pool_handleable and "workers_num" not in analysis_args
+                            else {}
+                        ),
                     )
                 else:
                     report = wave_continer[k].analyze(
                         **v_args,
                         **({"pbar": all_counts_progress} if tqdm_handleable else {}),
+                        **(
+                            {"pool": pool}
+                            if pool_handleable and "workers_num" not in v_args
+                            else {}
+                        ),
                     )
             else:
                 report = wave_continer[k].analyze(
                     **analysis_args,
                     **({"pbar": all_counts_progress} if tqdm_handleable else {}),
+                    **(
+                        {"pool": pool}
+                        if pool_handleable and "workers_num" not in analysis_args
+                        else {}
+                    ),
                 )
 
-            wave_continer[k].write()
+            exp_id, files = wave_continer[k].write(
+                binary_counts=self.multicommons.binary_counts,
+                _qurryinfo_hold_access=self.summoner_id,
+            )
+            analyzed_qurryinfo[exp_id] = files
             main, _tales = report.export()
             self.quantity_container[name][wave_continer[k].commons.tags].append(main)
 
+        merge_qurryinfo(
+            self.multicommons.export_location / "qurryinfo.json",
+            analyzed_qurryinfo,
+            jsonable=True,
+        )
+
         self.multicommons.datetimes.add_only(name)
 
         return name
@@ -806,48 +978,72 @@ class MultiManager:
     def easycompress(
         self,
         overwrite: bool = False,
+        codec: CompressCodecLiteral = "xz",
+        level: Optional[int] = None,
+        shards: int = 1,
+        workers_num: Optional[int] = None,
     ) -> Path:
-        """Compress the export_location to tar.xz.
+        """Compress the export_location to the sharded archive.
 
         Args:
-            overwrite (bool, optional): Reproduce all the compressed files. Defaults to False.
+            overwrite (bool, optional):
+                Deprecated, the previous archive is always replaced. Defaults to False.
+            codec (CompressCodecLiteral, optional): The codec of archive. Defaults to "xz".
+            level (Optional[int], optional): The compression level. Defaults to None.
+            shards (int, optional): The number of shards. Defaults to 1.
+            workers_num (Optional[int], optional): The number of threads. Defaults to None.
 
         Returns:
-            Path: Path of the compressed file.
+            Path: Path of the manifest of the compressed files.
         """
 
         self.multicommons.datetimes.add_serial("compressed")
         _multiconfig = self._write_multiconfig()
 
-        is_exists = os.path.exists(self.naming_complex.tarLocation)
-        if is_exists and overwrite:
-            os.remove(self.naming_complex.tarLocation)
-            with tarfile.open(self.naming_complex.tarLocation, "x:xz") as tar:
-                tar.add(
-                    self.naming_complex.export_location,
-                    arcname=os.path.basename(self.naming_complex.export_location),
-                )
+        if overwrite:
+            warnings.warn(
+                "'overwrite' is deprecated, the previous archive is always replaced.",
+                DeprecationWarning,
+            )
+        manifest, stats = write_archive(
+            self.naming_complex.export_location,
+            self.naming_complex.expsName,
+            codec=codec,
+            level=level,
+            shards=shards,
+            workers_num=workers_num,
+        )
+        self.archive_stats = stats
+        print(stats.report("Compressed"))
 
-        else:
-            with tarfile.open(self.naming_complex.tarLocation, "w:xz") as tar:
-                tar.add(
-                    self.naming_complex.export_location,
-                    arcname=os.path.basename(self.naming_complex.export_location),
-                )
+        return manifest
 
-        return self.naming_complex.tarLocation
+    def easydecompress(
+        self,
+        codec: Optional[CompressCodecLiteral] = None,
+        workers_num: Optional[int] = None,
+    ) -> Path:
+        """Decompress the archive of experiment, all shards are decompressed in parallel.
 
-    def easydecompress(self) -> Path:
-        """Decompress the tar.xz file of experiment.
+        Args:
+            codec (Optional[CompressCodecLiteral], optional):
+                The expected codec of archive. Defaults to None for any codec.
+            workers_num (Optional[int], optional): The number of threads. Defaults to None.
 
         Returns:
             Path: Path of the decompressed file.
         """
 
-        with tarfile.open(self.naming_complex.tarLocation, "r:xz") as tar:
-            tar.extractall(self.naming_complex.save_location)
+        stats = read_archive(
+            self.naming_complex.save_location,
+            self.naming_complex.expsName,
+            codec=codec,
+            workers_num=workers_num,
+        )
+        self.archive_stats = stats
+        print(stats.report("Decompressed"))
 
-        return self.naming_complex.tarLocation
+        return self.naming_complex.export_location
 
     @property
     def name(self) -> Hashable:
@@ -5,18 +5,22 @@ Multiprocess component for multimanager
 ================================================================
 """
 from pathlib import Path
-from typing import Union, Hashable, Optional
+from typing import Union, Hashable, Optional, Iterable, Mapping, Any
 import gc
 import tqdm
 
 from ..experiment import ExperimentPrototype
 from ..experiment.export import Export
+from ...tools import ParallelManager
+from ...tools.parallelmanager import CHUNKS_PER_WORKER
 
 
 def exporter(
     id_exec: Hashable,
     exps: ExperimentPrototype,
     save_location: Union[Path, str],
+    export_transpiled_circuit: bool = False,
+    binary_counts: bool = False,
 ) -> tuple[Hashable, Export]:
     """Multiprocess exporter for experiment.
 
@@ -24,12 +28,21 @@ def exporter(
         id_exec (Hashable): ID of experiment.
         exps (ExperimentPrototype): The experiment.
         save_location (Union[Path, str]): Location of saving experiment.
+        export_transpiled_circuit (bool, optional):
+            Export the transpiled circuit. Defaults to False.
+        binary_counts (bool, optional):
+            Write the counts as a memory-mappable binary table. Defaults to False.
 
     Returns:
         tuple[Hashable, Export]: The ID of experiment and the export of experiment.
     """
 
-    exps_export = exps.export(save_location=save_location)
+    exps_export = exps.export(
+        save_location=save_location,
+        export_transpiled_circuit=export_transpiled_circuit,
+        skip_unchanged=True,
+        binary_counts=binary_counts,
+    )
     return id_exec, exps_export
 
 
@@ -55,7 +68,7 @@ def writer(
     encoding: str = "utf-8",
     jsonable: bool = False,
     mute: bool = True,
-) -> tuple[Hashable, dict[str, str]]:
+) -> tuple[Hashable, dict[str, Any]]:
     """Multiprocess writer for experiment.
 
     Args:
@@ -68,7 +81,7 @@ def writer(
         mute (bool, optional): The mute of writing. Defaults to True.
 
     Returns:
-        tuple[Hashable, dict[str, str]]: The ID of experiment and the files of experiment.
+        tuple[Hashable, dict[str, Any]]: The ID of experiment and the files of experiment.
     """
 
     qurryinfo_exp_id, qurryinfo_files = exps_export.write(
@@ -86,7 +99,7 @@ def writer(
 
 def writer_wrapper(
     args: tuple[Hashable, Export, str, int, str, bool, bool],
-) -> tuple[Hashable, dict[str, str]]:
+) -> tuple[Hashable, dict[str, Any]]:
     """Multiprocess writer for experiment.
 
     Args:
@@ -94,7 +107,7 @@ def writer_wrapper(
             The arguments of multiprocess writer.
 
     Returns:
-        tuple[Hashable, dict[str, str]]: The ID of experiment and the files of experiment.
+        tuple[Hashable, dict[str, Any]]: The ID of experiment and the files of experiment.
     """
     return writer(*args)
 
@@ -109,8 +122,9 @@ def multiprocess_exporter_and_writer(
     jsonable: bool = False,
     mute: bool = True,
     export_transpiled_circuit: bool = False,
+    binary_counts: bool = False,
     _pbar: Optional[tqdm.tqdm] = None,
-) -> tuple[Hashable, dict[str, str]]:
+) -> tuple[Hashable, dict[str, Any]]:
     """Multiprocess exporter and writer for experiment.
 
     Args:
@@ -123,14 +137,18 @@ def multiprocess_exporter_and_writer(
         jsonable (bool, optional): The jsonable of writing. Defaults to False.
         mute (bool, optional): The mute of writing. Defaults to True.
         export_transpiled_circuit (bool, optional) : Export the transpiled circuit. Defaults to False.
+        binary_counts (bool, optional):
+            Write the counts as a memory-mappable binary table. Defaults to False.
         _pbar (Optional[tqdm.tqdm], optional): The progress bar. Defaults to None.
 
     Returns:
-        tuple[Hashable, dict[str, str]]: The ID of experiment and the files of experiment.
+        tuple[Hashable, dict[str, Any]]: The ID of experiment and the files of experiment.
     """
     exps_export = exps.export(
         save_location=save_location,
         export_transpiled_circuit=export_transpiled_circuit,
+        skip_unchanged=True,
+        binary_counts=binary_counts,
     )
     qurryinfo_exp_id, qurryinfo_files = exps_export.write(
         mode=mode,
@@ -144,7 +162,135 @@ def multiprocess_exporter_and_writer(
     assert id_exec == qurryinfo_exp_id, (
         f"{id_exec} is not equal to {qurryinfo_exp_id}" + " which is not supported."
     )
+    exps.mark_clean(qurryinfo_files["hashes"])
     del exps_export
     gc.collect()
     return qurryinfo_exp_id, qurryinfo_files
 
+
+def worker_exporter_and_writer(
+    id_exec: Hashable,
+    exps: ExperimentPrototype,
+    save_location: Union[Path, str],
+    mode: str = "w+",
+    indent: int = 2,
+    encoding: str = "utf-8",
+    jsonable: bool = False,
+    mute: bool = True,
+    export_transpiled_circuit: bool = False,
+    binary_counts: bool = False,
+) -> tuple[Hashable, dict[str, Any], str]:
+    """Exporter and writer for experiment in the worker of pool,
+    the experiment is a copy of the one in the main process,
+    so its state after writing is returned for the main process to update.
+
+    Args:
+        id_exec (Hashable): ID of experiment.
+        exps (ExperimentPrototype): The experiment.
+        save_location (Union[Path, str]): Location of saving experiment.
+        mode (str, optional): The mode of writing. Defaults to "w+".
+        indent (int, optional): The indent of writing. Defaults to 2.
+        encoding (str, optional): The encoding of writing. Defaults to "utf-8".
+        jsonable (bool, optional): The jsonable of writing. Defaults to False.
+        mute (bool, optional): The mute of writing. Defaults to True.
+        export_transpiled_circuit (bool, optional):
+            Export the transpiled circuit. Defaults to False.
+        binary_counts (bool, optional):
+            Write the counts as a memory-mappable binary table. Defaults to False.
+
+    Returns:
+        tuple[Hashable, dict[str, Any], str]:
+            The ID of experiment, the files of experiment and its filename.
+    """
+    _, exps_export = exporter(
+        id_exec, exps, save_location, export_transpiled_circuit, binary_counts
+    )
+    qurryinfo_exp_id, qurryinfo_files = writer(
+        id_exec, exps_export, mode, indent, encoding, jsonable, mute
+    )
+    return qurryinfo_exp_id, qurryinfo_files, exps_export.filename
+
+
+def parallel_exporter_and_writer(
+    id_execs: Iterable[Hashable],
+    exps_container: Mapping[Hashable, ExperimentPrototype],
+    save_location: Union[Path, str],
+    pool: ParallelManager,
+    mode: str = "w+",
+    indent: int = 2,
+    encoding: str = "utf-8",
+    jsonable: bool = False,
+    mute: bool = True,
+    export_transpiled_circuit: bool = False,
+    binary_counts: bool = False,
+    batch_size: Optional[int] = None,
+    _pbar: Optional[tqdm.tqdm] = None,
+) -> dict[Hashable, dict[str, Any]]:
+    """Export and write experiments in batches by the pool of workers.
+
+    Each experiment is exported, skipping the sections unchanged since its last write,
+    and written by a worker, so the serialization is done concurrently.
+    The experiments are sent batch by batch,
+    so only one batch of them is copied to the workers at the same time.
+
+    Args:
+        id_execs (Iterable[Hashable]): IDs of experiments.
+        exps_container (Mapping[Hashable, ExperimentPrototype]): The experiments.
+        save_location (Union[Path, str]): Location of saving experiment.
+        pool (ParallelManager): The pool of workers.
+        mode (str, optional): The mode of writing. Defaults to "w+".
+        indent (int, optional): The indent of writing. Defaults to 2.
+        encoding (str, optional): The encoding of writing. Defaults to "utf-8".
+        jsonable (bool, optional): The jsonable of writing. Defaults to False.
+        mute (bool, optional): The mute of writing. Defaults to True.
+        export_transpiled_circuit (bool, optional):
+            Export the transpiled circuit. Defaults to False.
+        binary_counts (bool, optional):
+            Write the counts as a memory-mappable binary table. Defaults to False.
+        batch_size (Optional[int], optional):
+            The number of experiments exported in one batch.
+            Defaults to None for `CHUNKS_PER_WORKER` times of the number of workers.
+        _pbar (Optional[tqdm.tqdm], optional):
+            The progress bar, which will be updated after each batch. Defaults to None.
+
+    Returns:
+        dict[Hashable, dict[str, Any]]: The files of each experiment as `qurryinfo`.
+    """
+    if batch_size is None:
+        batch_size = pool.workers_num * CHUNKS_PER_WORKER
+    batch_size = max(batch_size, 1)
+
+    id_execs = list(id_execs)
+    all_qurryinfo: dict[Hashable, dict[str, Any]] = {}
+    for batch_start in range(0, len(id_execs), batch_size):
+        batch_ids = id_execs[batch_start : batch_start + batch_size]
+        for id_exec, files, filename in pool.starmap(
+            worker_exporter_and_writer,
+            [
+                (
+                    id_exec,
+                    exps_container[id_exec],
+                    save_location,
+                    mode,
+                    indent,
+                    encoding,
+                    jsonable,
+                    mute,
+                    export_transpiled_circuit,
+                    binary_counts,
+                )
+                for id_exec in batch_ids
+            ],
+        ):
+            exps = exps_container[id_exec]
+            exps.commons = exps.commons._replace(
+                save_location=Path(save_location), filename=filename
+            )
+            exps.mark_clean(files["hashes"])
+            all_qurryinfo[id_exec] = files
+
+        gc.collect()
+        if _pbar is not None:
+            _pbar.update(len(batch_ids))
+
+    return all_qurryinfo
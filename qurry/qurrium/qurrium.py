@@ -10,15 +10,18 @@ Refactoring from :mod:`qurry.qurrium.qurryV5`.
 import gc
 import inspect
 import warnings
+from functools import partial
 from abc import abstractmethod, ABC
 from typing import Literal, Union, Optional, Hashable, Any, overload, TypeVar, Type
 from pathlib import Path
 import tqdm
+import numpy as np
 
-from qiskit import execute, transpile, QuantumCircuit
+from qiskit import execute, QuantumCircuit
 from qiskit.providers import Backend, JobV1 as Job
+from qiskit.result import Result
 
-from ..tools import qurry_progressbar, ParallelManager
+from ..tools import qurry_progressbar, ParallelManager, workers_distribution
 from ..tools.backend import GeneralAerSimulator
 from ..tools.datetime import current_time, DatetimeDict
 from ..declare.default import (
@@ -33,11 +36,23 @@ from .multimanager import (
     MultiManager,
     PendingTargetProviderLiteral,
     PendingStrategyLiteral,
+    MultiFileTypeLiteral,
+)
+from .runner import ExtraBackendAccessor, collect_jobs
+
+
+from .utils import (
+    get_counts_and_exceptions,
+    qasm_drawer,
+    CircuitTemplate,
+    bind_templates,
+    transpile_in_batch,
+    TranspileCache,
+    TRANSPILE_CACHE_DIR,
+    CompressCodecLiteral,
+    ExperimentCatalog,
+    wave_statevector,
 )
-from .runner import ExtraBackendAccessor
-
-
-from .utils import get_counts_and_exceptions, qasm_drawer
 from .utils.inputfixer import outfields_check, outfields_hint
 from ..exceptions import QurryResetAccomplished, QurryResetSecurityActivated
 
@@ -124,6 +139,79 @@ class QurryPrototype(ABC):
         It will be None if no extra backend is loaded.
         """
 
+        self.parallel_managers: dict[int, ParallelManager] = {}
+        """The persistent process pools shared by this instance, keyed by workers number."""
+
+        self.transpile_cache: Optional[TranspileCache] = TranspileCache()
+        """The cache of transpiled circuits shared by the experiments of this instance,
+        set to None to disable it. It's kept in memory only,
+        give it a positive `disk_maxsize` to store the circuits under the save location."""
+
+        self.catalog: Optional[ExperimentCatalog] = None
+        """The catalog indexing the experiments and multimanagers written by this instance,
+        it will be None if no catalog is set."""
+
+        self.statevectors: dict[Hashable, tuple[QuantumCircuit, np.ndarray]] = {}
+        """The statevectors of waves simulated by :meth:`statevector`,
+        keyed by the key of wave with the simulated circuit."""
+
+    def statevector(self, wave_key: Hashable) -> np.ndarray:
+        """Get the statevector of the wave, which is simulated once and cached
+        until the wave of the key is replaced.
+
+        Args:
+            wave_key (Hashable): The key of wave in `.waves`.
+
+        Returns:
+            np.ndarray: The statevector in the little-endian order of Qiskit.
+        """
+        wave = self.waves[wave_key]
+        cached = self.statevectors.get(wave_key)
+        if cached is None or cached[0] is not wave:
+            cached = (wave, wave_statevector(wave))
+            self.statevectors[wave_key] = cached
+        return cached[1]
+
+    def simulate(self, exp_id: str) -> Optional[Result]:
+        """Get the result of the experiment without executing its circuits on backend,
+        like sampling from the cached statevector on a simulator.
+        It is called by :meth:`run` before executing.
+
+        Args:
+            exp_id (str): The ID of the experiment.
+
+        Returns:
+            Optional[Result]: The result,
+                or None for executing the circuits on backend as usual.
+        """
+        return None
+
+    def parallel_manager(self, workers_num: Optional[int] = None) -> ParallelManager:
+        """Get the persistent process pool shared by this instance.
+
+        The pool is started lazily on the first call of the manager
+        and reused until :meth:`close_parallel_managers` is called or the interpreter exits.
+
+        Args:
+            workers_num (Optional[int], optional):
+                Desired workers number. Defaults to None for DEFAULT_POOL_SIZE.
+
+        Returns:
+            ParallelManager: The process manager.
+        """
+        launch_worker = workers_distribution(workers_num)
+        if launch_worker not in self.parallel_managers:
+            self.parallel_managers[launch_worker] = ParallelManager(
+                launch_worker, persistent=True
+            )
+        return self.parallel_managers[launch_worker]
+
+    def close_parallel_managers(self) -> None:
+        """Close all persistent process pools shared by this instance."""
+        for manager in self.parallel_managers.values():
+            manager.close()
+        self.parallel_managers.clear()
+
     @abstractmethod
     def params_control(
         self, wave_key: Hashable, **other_kwargs
@@ -315,13 +403,14 @@ class QurryPrototype(ABC):
         self,
         exp_id: str,
         _pbar: Optional[tqdm.tqdm] = None,
-    ) -> list[QuantumCircuit]:
+    ) -> Union[list[QuantumCircuit], list[CircuitTemplate]]:
         """The method to construct circuit.
         Where should be overwritten by each construction of new measurement.
 
         Returns:
-            Union[QuantumCircuit, list[QuantumCircuit]]:
-                The quantum circuit of experiment.
+            Union[list[QuantumCircuit], list[CircuitTemplate]]:
+                The quantum circuit of experiment,
+                or the parameterized templates which will be transpiled once and bound.
         """
         raise NotImplementedError
 
@@ -330,13 +419,14 @@ class QurryPrototype(ABC):
     def method(
         self,
         exp_id: str,
-    ) -> list[QuantumCircuit]:
+    ) -> Union[list[QuantumCircuit], list[CircuitTemplate]]:
         """The method to construct circuit.
         Where should be overwritten by each construction of new measurement.
 
         Returns:
-            Union[QuantumCircuit, list[QuantumCircuit]]:
-                The quantum circuit of experiment.
+            Union[list[QuantumCircuit], list[CircuitTemplate]]:
+                The quantum circuit of experiment,
+                or the parameterized templates which will be transpiled once and bound.
         """
         raise NotImplementedError
 
@@ -367,6 +457,8 @@ class QurryPrototype(ABC):
                 The quantum backend. Defaults to AerSimulator().
             save_location (Optional[Union[Path, str]], optional):
                 The location to save the experiment. If None, will not save.
+                The transpiled circuits are also cached under it in `TRANSPILE_CACHE_DIR`
+                when the on-disk cache is enabled by `TranspileCache.disk_maxsize`.
                 Defaults to None.
             mode (str, optional):
                 The mode to open the file. Defaults to 'w+'.
@@ -384,6 +476,88 @@ class QurryPrototype(ABC):
             Hashable: The ID of the experiment.
         """
 
+        id_now, cirqs, is_revive = self._build_circuits(
+            exp_id=exp_id, backend=backend, _pbar=_pbar, **other_kwargs
+        )
+        if cirqs is None:
+            return id_now
+        current_exp = self.exps[id_now]
+
+        # transpile
+        if isinstance(_pbar, tqdm.tqdm):
+            _pbar.set_description_str("| Circuit transpiling...")
+        transpiled_circs = transpile_in_batch(
+            [cirqs],
+            backend=current_exp.commons.backend,
+            cache=self.transpile_cache,
+            cache_dir=self._transpile_cache_dir(save_location),
+            **current_exp.commons.transpile_args,
+        )[0]
+
+        self._load_transpiled(
+            id_now,
+            transpiled_circs,
+            is_revive,
+            save_location=save_location,
+            mode=mode,
+            indent=indent,
+            encoding=encoding,
+            jsonablize=jsonablize,
+            skip_export=skip_export,
+            _pbar=_pbar,
+        )
+
+        return id_now
+
+    def _transpile_cache_dir(
+        self,
+        save_location: Optional[Union[Path, str]],
+    ) -> Optional[Path]:
+        """The folder of on-disk transpile cache under the save location.
+
+        Args:
+            save_location (Optional[Union[Path, str]]): The location to save the experiment.
+
+        Returns:
+            Optional[Path]:
+                The folder, or None if there is no cache, no save location
+                or the on-disk cache is disabled.
+        """
+        if (
+            self.transpile_cache is None
+            or self.transpile_cache.disk_maxsize <= 0
+            or not isinstance(save_location, (Path, str))
+        ):
+            return None
+        return Path(save_location) / TRANSPILE_CACHE_DIR
+
+    def _build_circuits(
+        self,
+        exp_id: Optional[str] = None,
+        backend: Optional[Backend] = None,
+        _pbar: Optional[tqdm.tqdm] = None,
+        **other_kwargs: Any,
+    ) -> tuple[
+        str, Optional[Union[list[QuantumCircuit], list[CircuitTemplate]]], bool
+    ]:
+        """Construct the raw circuits of experiment, the first phase of :meth:`build`.
+
+        Args:
+            exp_id (Optional[str], optional):
+                The ID of experiment, create an new experiment if it's not existed.
+                Defaults to None.
+            backend (Optional[Backend], optional): The quantum backend. Defaults to None.
+
+            other_kwargs:
+                all arguments will handle by `self.paramsControl()` and export as specific format.
+
+        Returns:
+            tuple[str, Optional[Union[list[QuantumCircuit], list[CircuitTemplate]]], bool]:
+                The ID of the experiment, the circuits or templates to be transpiled,
+                and whether the circuits are revived.
+                The circuits are None if the experiment has been built.
+        """
+
         # preparing
         if isinstance(_pbar, tqdm.tqdm):
             _pbar.set_description_str("| Parameter loading...")
@@ -398,7 +572,7 @@ class QurryPrototype(ABC):
         if len(self.exps[id_now].beforewards.circuit) > 0 and isinstance(
             self.exps[id_now].beforewards.circuit[0], QuantumCircuit
         ):
-            return id_now
+            return id_now, None, False
 
         current_exp = self.exps[id_now]
         if not isinstance(current_exp.commons.backend, Backend):
@@ -420,6 +594,7 @@ class QurryPrototype(ABC):
         )
 
         is_revive = False
+        templates: Optional[list[CircuitTemplate]] = None
         # circuit
         if (
             len(current_exp.beforewards.circuit_qasm) > 0
@@ -441,8 +616,11 @@ class QurryPrototype(ABC):
                     cirqs = self.method(id_now)
             else:
                 cirqs = self.method(id_now)
+            if len(cirqs) > 0 and all(isinstance(c, CircuitTemplate) for c in cirqs):
+                templates = cirqs
+                cirqs = bind_templates(templates)
 
-            pool = ParallelManager()
+            pool = self.parallel_manager()
             # qasm
             if isinstance(_pbar, tqdm.tqdm):
                 _pbar.set_description_str("| Exporting OpenQASM string...")
@@ -450,14 +628,43 @@ class QurryPrototype(ABC):
             for qasm_str in tmp_qasm:
                 current_exp.beforewards.circuit_qasm.append(qasm_str)
 
-        # transpile
-        if isinstance(_pbar, tqdm.tqdm):
-            _pbar.set_description_str("| Circuit transpiling...")
-        transpiled_circs: list[QuantumCircuit] = transpile(
-            cirqs,
-            backend=current_exp.commons.backend,
-            **current_exp.commons.transpile_args,
-        )
+        return id_now, cirqs if templates is None else templates, is_revive
+
+    def _load_transpiled(
+        self,
+        id_now: str,
+        transpiled_circs: list[QuantumCircuit],
+        is_revive: bool,
+        save_location: Optional[Union[Path, str]] = None,
+        mode: str = "w+",
+        indent: int = 2,
+        encoding: str = "utf-8",
+        jsonablize: bool = False,
+        skip_export: bool = False,
+        _pbar: Optional[tqdm.tqdm] = None,
+    ) -> None:
+        """Load the transpiled circuits into experiment and export it,
+        the last phase of :meth:`build`.
+
+        Args:
+            id_now (str): The ID of the experiment.
+            transpiled_circs (list[QuantumCircuit]): The transpiled circuits.
+            is_revive (bool): Whether the circuits are revived.
+            save_location (Optional[Union[Path, str]], optional):
+                The location to save the experiment. If None, will not save.
+                Defaults to None.
+            mode (str, optional):
+                The mode to open the file. Defaults to 'w+'.
+            indent (int, optional):
+                The indent of json file. Defaults to 2.
+            encoding (str, optional):
+                The encoding of json file. Defaults to 'utf-8'.
+            jsonablize (bool, optional):
+                Whether to jsonablize the experiment output. Defaults to False.
+            skip_export (bool, optional):
+                Whether to skip the export. Defaults to False.
+        """
+        current_exp = self.exps[id_now]
         if isinstance(_pbar, tqdm.tqdm):
             _pbar.set_description_str("| Circuit loading...")
         for _w in transpiled_circs:
@@ -488,10 +695,9 @@ class QurryPrototype(ABC):
                     indent=indent,
                     encoding=encoding,
                     jsonable=jsonablize,
+                    catalog=self.catalog,
                 )
 
-        return id_now
-
     def run(
         self,
         *,
@@ -527,21 +733,28 @@ class QurryPrototype(ABC):
 
         if isinstance(_pbar, tqdm.tqdm):
             _pbar.set_description_str("Executing...")
-        execution: Job = execute(
-            current_exp.beforewards.circuit,
-            **current_exp.commons.run_args,
-            backend=current_exp.commons.backend,
-            shots=current_exp.commons.shots,
-        )
+        result = self.simulate(id_now)
+        if result is None:
+            execution: Job = execute(
+                current_exp.beforewards.circuit,
+                **current_exp.commons.run_args,
+                backend=current_exp.commons.backend,
+                shots=current_exp.commons.shots,
+            )
+            job_id = execution.job_id()
+        else:
+            execution = None
+            job_id = result.job_id
         # commons
         date = current_time()
         current_exp.commons.datetimes["run"] = date
         if isinstance(_pbar, tqdm.tqdm):
             _pbar.set_description_str(f"Running Completed, denoted date: {date}...")
         # beforewards
-        current_exp["job_id"] = execution.job_id()
+        current_exp["job_id"] = job_id
         # afterwards
-        result = execution.result()
+        if execution is not None:
+            result = execution.result()
         current_exp.unlock_afterward(mute_auto_lock=True)
         current_exp["result"].append(result)
 
@@ -555,6 +768,7 @@ class QurryPrototype(ABC):
         indent: int = 2,
         encoding: str = "utf-8",
         jsonablize: bool = False,
+        packed_counts: bool = False,
         _pbar: Optional[tqdm.tqdm] = None,
         **other_kwargs: Any,
     ) -> str:
@@ -572,6 +786,9 @@ class QurryPrototype(ABC):
                 The encoding of json file. Defaults to 'utf-8'.
             jsonablize (bool, optional):
                 Whether to jsonablize the experiment output. Defaults to False.
+            packed_counts (bool, optional):
+                Whether to store the counts as :cls:`PackedCounts`,
+                which keeps the bitstrings as integers in arrays. Defaults to False.
 
             allArgs:
                 all arguments will handle by `self.paramsControl()` and export as specific format.
@@ -605,19 +822,9 @@ class QurryPrototype(ABC):
         counts, exceptions = get_counts_and_exceptions(
             result=current_exp.afterwards.result[0],
             num=num,
+            packed=packed_counts,
         )
-        if len(exceptions) > 0:
-            if "exceptions" not in current_exp.outfields:
-                current_exp.outfields["exceptions"] = {}
-            for result_id, exception_item in exceptions.items():
-                current_exp.outfields["exceptions"][result_id] = exception_item
-        for _c in counts:
-            current_exp.afterwards.counts.append(_c)
-
-        # default analysis
-        if len(current_exp.commons.default_analysis) > 0:
-            for _analysis in current_exp.commons.default_analysis:
-                current_exp.analyze(**_analysis)
+        self._load_counts(current_exp, counts, exceptions)
 
         if isinstance(save_location, (Path, str)):
             if isinstance(_pbar, tqdm.tqdm):
@@ -628,10 +835,45 @@ class QurryPrototype(ABC):
                 indent=indent,
                 encoding=encoding,
                 jsonable=jsonablize,
+                catalog=self.catalog,
             )
 
         return id_now
 
+    def _load_counts(
+        self,
+        current_exp: ExperimentPrototype,
+        counts: list,
+        exceptions: dict[str, Exception],
+    ) -> None:
+        """Load the counts into the experiment and run its default analysis.
+
+        Args:
+            current_exp (ExperimentPrototype): The experiment.
+            counts (list): The counts of each circuit of the experiment.
+            exceptions (dict[str, Exception]): The exceptions raised during getting counts.
+        """
+        if len(exceptions) > 0:
+            if "exceptions" not in current_exp.outfields:
+                current_exp.outfields["exceptions"] = {}
+            for result_id, exception_item in exceptions.items():
+                current_exp.outfields["exceptions"][result_id] = exception_item
+        for _c in counts:
+            current_exp.afterwards.counts.append(_c)
+        current_exp.mark_dirty("legacy")
+
+        # default analysis
+        if len(current_exp.commons.default_analysis) > 0:
+            for _analysis in current_exp.commons.default_analysis:
+                current_exp.analyze(
+                    **_analysis,
+                    **(
+                        {"pool": self.parallel_manager()}
+                        if current_exp.pool_handleable and "workers_num" not in _analysis
+                        else {}
+                    ),
+                )
+
     def output(
         self,
         *args,
@@ -712,10 +954,13 @@ class QurryPrototype(ABC):
         jobstype: PendingTargetProviderLiteral = "local",
         pending_strategy: PendingStrategyLiteral = "tags",
         manager_run_args: Optional[dict[str, Any]] = None,
+        filetype: MultiFileTypeLiteral = "json",
         is_retrieve: bool = False,
         is_read: bool = False,
         read_version: Literal["v4", "v5"] = "v5",
         read_from_tarfile: bool = False,
+        read_from_archive: bool = False,
+        codec: Optional[CompressCodecLiteral] = None,
     ) -> tuple[list[dict[str, Any]], str]:
         """Control the experiment's parameters for running multiple jobs.
 
@@ -740,8 +985,9 @@ class QurryPrototype(ABC):
                 Where to save the export content as `json` file.
                 If `save_location == None`, then cancelled the file to be exported.
                 Defaults to Path('./').
-            filetype (TagList._availableFileType, optional):
-                The file type of export data. Defaults to 'json' (recommended).
+            filetype (MultiFileTypeLiteral, optional):
+                The file type of export data, "npy" writes the counts of experiments
+                as memory-mappable binary tables. Defaults to 'json'.
             manager_run_args (dict, optional):
                 defaultConfig of :func:`IBMQJobManager().run`.
                 Defaults to `{
@@ -760,6 +1006,14 @@ class QurryPrototype(ABC):
             read_version (Literal['v4', 'v5'], optional):
                 The version of the data to be read.
                 Defaults to 'v5'.
+            read_from_tarfile (bool, optional):
+                Whether to read from the compressed file. Defaults to False.
+            read_from_archive (bool, optional):
+                Whether to read straight from the compressed file without extracting it.
+                Defaults to False.
+            codec (Optional[CompressCodecLiteral], optional):
+                The expected codec of the compressed file.
+                Defaults to None for the codec recorded in its manifest.
 
         Returns:
             tuple[list[dict[str, Any]], str]:
@@ -794,6 +1048,8 @@ class QurryPrototype(ABC):
                 summoner_name=summoner_name,
                 is_read=is_read,
                 read_from_tarfile=read_from_tarfile,
+                read_from_archive=read_from_archive,
+                codec=codec,
                 save_location=save_location,
                 version=read_version,
             )
@@ -810,6 +1066,7 @@ class QurryPrototype(ABC):
                 jobstype=jobstype,
                 pending_strategy=pending_strategy,
                 manager_run_args=manager_run_args,
+                filetype=filetype,
                 datetimes=DatetimeDict(),
             )
 
@@ -846,9 +1103,14 @@ class QurryPrototype(ABC):
         save_location: Union[Path, str] = Path("./"),
         jobstype: Union[Literal["local"], PendingTargetProviderLiteral] = "local",
         pending_strategy: PendingStrategyLiteral = "tags",
+        filetype: MultiFileTypeLiteral = "json",
     ) -> str:
         """Buling the experiment's parameters for running multiple jobs.
 
+        The circuits of all experiments are constructed first,
+        then the circuits with the same backend and `transpile_args`
+        are transpiled together in one call to parallelize across the experiments.
+
         Args:
             configList (list, optional):
                 The list of default configurations of multiple experiment.
@@ -874,6 +1136,9 @@ class QurryPrototype(ABC):
                 'local', 'IBMQ', 'AWS_Bracket', 'Azure_Q'
             ], optional):
                 What types of the backend will run on. Defaults to "local".
+            filetype (MultiFileTypeLiteral, optional):
+                The file type of export data, "npy" writes the counts of experiments
+                as memory-mappable binary tables. Defaults to 'json'.
 
         Returns:
             Hashable: SummonerID (ID of multimanager).
@@ -895,6 +1160,7 @@ class QurryPrototype(ABC):
             save_location=save_location,
             jobstype=jobstype,
             pending_strategy=pending_strategy,
+            filetype=filetype,
             is_retrieve=False,
             is_read=False,
         )
@@ -903,12 +1169,62 @@ class QurryPrototype(ABC):
         initial_config_list_progress = qurry_progressbar(initial_config_list)
 
         initial_config_list_progress.set_description_str("MultiManager building...")
+        built_circuits: list[
+            tuple[str, Optional[Union[list[QuantumCircuit], list[CircuitTemplate]]], bool]
+        ] = []
         for config in initial_config_list_progress:
-            current_id = self.build(
-                **config,
-                skip_export=True,  # export later for it's not efficient for one by one
-                _pbar=initial_config_list_progress,
+            built_circuits.append(
+                self._build_circuits(
+                    **{k: v for k, v in config.items() if k != "save_location"},
+                    _pbar=initial_config_list_progress,
+                )
             )
+
+        # transpile all circuits with the same backend and transpile_args in one call
+        transpile_groups: dict[tuple[int, str], list[int]] = {}
+        for idx, (current_id, cirqs, _is_revive) in enumerate(built_circuits):
+            if cirqs is None:
+                continue
+            current_commons = self.exps[current_id].commons
+            transpile_groups.setdefault(
+                (
+                    id(current_commons.backend),
+                    repr(sorted(current_commons.transpile_args.items())),
+                ),
+                [],
+            ).append(idx)
+
+        transpiled_circuits: dict[int, list[QuantumCircuit]] = {}
+        for group_idx, idxs in enumerate(transpile_groups.values()):
+            initial_config_list_progress.set_description_str(
+                f"Transpiling {len(idxs)} experiments together "
+                + f"- {group_idx+1}/{len(transpile_groups)}..."
+            )
+            group_commons = self.exps[built_circuits[idxs[0]][0]].commons
+            for idx, transpiled in zip(
+                idxs,
+                transpile_in_batch(
+                    [built_circuits[idx][1] for idx in idxs],
+                    backend=group_commons.backend,
+                    cache=self.transpile_cache,
+                    cache_dir=self._transpile_cache_dir(
+                        current_multimanager.multicommons.save_location
+                    ),
+                    **group_commons.transpile_args,
+                ),
+            ):
+                transpiled_circuits[idx] = transpiled
+
+        for idx, (config, (current_id, cirqs, is_revive)) in enumerate(
+            zip(initial_config_list, built_circuits)
+        ):
+            if cirqs is not None:
+                self._load_transpiled(
+                    current_id,
+                    transpiled_circuits[idx],
+                    is_revive,
+                    skip_export=True,  # export later for it's not efficient for one by one
+                )
             initial_config_list_progress.set_description_str(
                 "Loading data to multimanager..."
             )
@@ -920,6 +1236,8 @@ class QurryPrototype(ABC):
         initial_config_list_progress.set_description_str("MultiManager writing...")
         current_multimanager.write(
             exps_container=self.exps,
+            catalog=self.catalog,
+            pool=self.parallel_manager(),
         )
 
         assert len(current_multimanager.beforewards.pending_pool) == 0
@@ -936,11 +1254,19 @@ class QurryPrototype(ABC):
         shots: int = 1024,
         backend: Backend = GeneralAerSimulator(),
         tags: Optional[list[str]] = None,
+        manager_run_args: Optional[dict[str, Any]] = None,
         save_location: Union[Path, str] = Path("./"),
         compress: bool = False,
+        max_workers: Optional[int] = None,
+        filetype: MultiFileTypeLiteral = "json",
     ) -> Hashable:
         """Running multiple jobs on local backend and output the analysis.
 
+        The circuits of all experiments are gathered and executed in as few jobs as possible,
+        experiments with the same shots and run arguments share the same jobs.
+        The jobs are submitted and waited concurrently,
+        then the counts are distributed back to each experiment by `circuits_map`.
+
         Args:
             configList (list, optional):
                 The list of default configurations of multiple experiment.
@@ -955,12 +1281,24 @@ class QurryPrototype(ABC):
             backend (Backend, optional):
                 The quantum backend.
                 Defaults to AerSimulator().
+            manager_run_args (Optional[dict[str, Any]], optional):
+                The arguments for the multimanager,
+                `max_experiments_per_job` limits the number of circuits in one job.
+                If it's not given, then use the `max_experiments` of the backend
+                or put all circuits into one job.
+                Defaults to None.
             save_location (Union[Path, str], optional):
                 Where to save the export content as `json` file.
                 If `save_location == None`, then cancelled the file to be exported.
                 Defaults to Path('./').
             compress (bool, optional):
                 Whether to compress the export file.
+            max_workers (Optional[int], optional):
+                The number of threads to submit and wait jobs.
+                Defaults to None for the number of jobs.
+            filetype (MultiFileTypeLiteral, optional):
+                The file type of export data, "npy" writes the counts of experiments
+                as memory-mappable binary tables. Defaults to 'json'.
             defaultMultiAnalysis (list[dict[str, Any]], optional):
                 The default configurations of multiple analysis,
                 if it's given, then will run automatically after the experiment results are ready.
@@ -974,6 +1312,8 @@ class QurryPrototype(ABC):
         """
         if tags is None:
             tags = []
+        if manager_run_args is None:
+            manager_run_args = {}
 
         print("| MultiOutput running...")
         besummonned = self.multiBuild(
@@ -982,41 +1322,137 @@ class QurryPrototype(ABC):
             backend=backend,
             # provider=provider,
             tags=tags,
-            manager_run_args={},
+            manager_run_args=manager_run_args,
             summoner_name=summoner_name,
             summoner_id=summoner_id,
             save_location=save_location,
             jobstype="local",
+            filetype=filetype,
         )
         current_multimanager = self.multimanagers[besummonned]
         assert current_multimanager.summoner_id == besummonned
-        circ_serial: list[int] = []
-
-        experiment_progress = qurry_progressbar(
-            current_multimanager.beforewards.exps_config
-        )
 
-        for id_exec in experiment_progress:
-            experiment_progress.set_description_str("Experiments running...")
-            current_id = self.output(
-                exp_id=id_exec,
-                save_location=current_multimanager.multicommons.save_location,
-            )
-
-            circ_serial_len = len(circ_serial)
+        max_circuits_per_job = manager_run_args.get("max_experiments_per_job", None)
+        if max_circuits_per_job is None:
+            try:
+                max_circuits_per_job = backend.configuration().max_experiments
+            except AttributeError:
+                max_circuits_per_job = None
+
+        # gather circuits, experiments with the same backend, shots and run_args share jobs.
+        # the experiments simulated without executing are skipped.
+        circ_serial: list[QuantumCircuit] = []
+        job_groups: dict[tuple[int, str], tuple[ExperimentPrototype, list[int]]] = {}
+        simulated_results: dict[str, Result] = {}
+        for id_exec in current_multimanager.beforewards.exps_config:
+            current_exp = self.exps[id_exec]
+            simulated = self.simulate(id_exec)
+            if simulated is not None:
+                simulated_results[id_exec] = simulated
+                continue
             tmp_circ_serial = [
-                idx + circ_serial_len
-                for idx in range(len(self.exps[current_id].beforewards.circuit))
+                idx + len(circ_serial)
+                for idx in range(len(current_exp.beforewards.circuit))
             ]
+            circ_serial += current_exp.beforewards.circuit
+            current_multimanager.beforewards.pending_pool[id_exec] = tmp_circ_serial
+            current_multimanager.beforewards.circuits_map[id_exec] = tmp_circ_serial
 
-            circ_serial += tmp_circ_serial
-            current_multimanager.beforewards.pending_pool[current_id] = tmp_circ_serial
-            current_multimanager.beforewards.circuits_map[current_id] = tmp_circ_serial
-            current_multimanager.beforewards.job_id.append((current_id, "local"))
+            group_key = (
+                id(current_exp.commons.backend),
+                repr((current_exp.commons.shots, current_exp.commons.run_args)),
+            )
+            if group_key not in job_groups:
+                job_groups[group_key] = (current_exp, [])
+            job_groups[group_key][1].extend(tmp_circ_serial)
+
+        # execute
+        job_chunks: list[tuple[ExperimentPrototype, list[int]]] = []
+        for sample_exp, group_circs in job_groups.values():
+            chunk_size = (
+                len(group_circs)
+                if max_circuits_per_job is None or max_circuits_per_job < 1
+                else max_circuits_per_job
+            )
+            for i in range(0, len(group_circs), max(chunk_size, 1)):
+                job_chunks.append((sample_exp, group_circs[i : i + chunk_size]))
+
+        counts_of_circuits: dict[int, dict[str, int]] = {}
+        exceptions_of_circuits: dict[int, dict[str, Exception]] = {}
+        job_of_circuits: dict[int, tuple[str, Any]] = {}
+        job_progress = qurry_progressbar(None, total=len(job_chunks))
+        job_progress.set_description_str(f"Executing {len(job_chunks)} jobs...")
+        for chunk_idx, execution, result, error in collect_jobs(
+            {
+                chunk_idx: partial(
+                    execute,
+                    [circ_serial[idx] for idx in chunk],
+                    **sample_exp.commons.run_args,
+                    backend=sample_exp.commons.backend,
+                    shots=sample_exp.commons.shots,
+                )
+                for chunk_idx, (sample_exp, chunk) in enumerate(job_chunks)
+            },
+            max_workers=max_workers,
+        ):
+            chunk = job_chunks[chunk_idx][1]
+            job_id = f"local.{chunk_idx}" if execution is None else execution.job_id()
+            for result_idx, idx in enumerate(chunk):
+                counts, exceptions = get_counts_and_exceptions(
+                    result=result,
+                    result_idx_list=[result_idx],
+                )
+                if error is not None:
+                    exceptions = {job_id: error}
+                counts_of_circuits[idx] = counts[0]
+                exceptions_of_circuits[idx] = exceptions
+                job_of_circuits[idx] = (job_id, result)
+            current_multimanager.beforewards.job_id.append((job_id, "local"))
+            job_progress.update()
+        job_progress.close()
+
+        # load the simulated results
+        for id_exec, result in simulated_results.items():
+            current_exp = self.exps[id_exec]
+            current_exp.commons.datetimes["run"] = current_time()
+            current_exp["job_id"] = result.job_id
+            current_exp.unlock_afterward(mute_auto_lock=True)
+            current_exp["result"].append(result)
+            counts, exceptions = get_counts_and_exceptions(
+                result=result,
+                num=len(current_exp.beforewards.circuit),
+            )
+            self._load_counts(current_exp, counts, exceptions)
+            current_multimanager.afterwards.allCounts[id_exec] = (
+                current_exp.afterwards.counts
+            )
 
-            current_multimanager.afterwards.allCounts[current_id] = self.exps[
-                current_id
-            ].afterwards.counts
+        # distribute counts back by circuits_map
+        experiment_progress = qurry_progressbar(
+            current_multimanager.beforewards.circuits_map.items()
+        )
+        experiment_progress.set_description_str("Loading counts...")
+        for id_exec, circ_idxs in experiment_progress:
+            current_exp = self.exps[id_exec]
+            current_exp.commons.datetimes["run"] = current_time()
+            current_exp["job_id"] = ",".join(
+                dict.fromkeys(job_of_circuits[idx][0] for idx in circ_idxs)
+            )
+            current_exp.unlock_afterward(mute_auto_lock=True)
+            for _, result in dict(job_of_circuits[idx] for idx in circ_idxs).items():
+                current_exp["result"].append(result)
+            self._load_counts(
+                current_exp,
+                [counts_of_circuits[idx] for idx in circ_idxs],
+                {
+                    k: v
+                    for idx in circ_idxs
+                    for k, v in exceptions_of_circuits[idx].items()
+                },
+            )
+            current_multimanager.afterwards.allCounts[id_exec] = (
+                current_exp.afterwards.counts
+            )
         current_multimanager.multicommons.datetimes.add_serial("output")
         bewritten = self.multiWrite(besummonned, compress=compress)
         assert bewritten == besummonned
@@ -1139,6 +1575,7 @@ class QurryPrototype(ABC):
             analysis_name=analysis_name,
             no_serialize=no_serialize,
             specific_analysis_args=specific_analysis_args,
+            pool=self.parallel_manager(),
             **analysis_args,
         )
         print(f'| "{report_name}" has been completed.')
@@ -1161,6 +1598,9 @@ class QurryPrototype(ABC):
         remain_only_compressed: bool = False,
         only_quantity: bool = False,
         export_transpiled_circuit: bool = False,
+        codec: CompressCodecLiteral = "xz",
+        compress_level: Optional[int] = None,
+        shards: int = 1,
     ) -> str:
         """Write the multimanager to the file.
 
@@ -1174,7 +1614,7 @@ class QurryPrototype(ABC):
                 Whether to compress the export file.
                 Defaults to False.
             compress_overwrite (bool, optional):
-                Whether to overwrite the compressed file.
+                Deprecated, the previous compressed file is always replaced.
                 Defaults to False.
             remain_only_compressed (bool, optional):
                 Whether to remain only compressed file.
@@ -1185,6 +1625,13 @@ class QurryPrototype(ABC):
             export_transpiled_circuit (bool, optional):
                 Whether to export the transpiled circuit.
                 Defaults to False.
+            codec (CompressCodecLiteral, optional):
+                The codec of the compressed file, "xz", "zstd" or uncompressed "tar".
+                Defaults to "xz".
+            compress_level (Optional[int], optional):
+                The compression level, the preset for "xz". Defaults to None.
+            shards (int, optional):
+                The number of shards compressed in parallel. Defaults to 1.
 
         Raises:
             ValueError: summoner_id not in multimanagers.
@@ -1203,6 +1650,8 @@ class QurryPrototype(ABC):
             save_location=save_location,
             exps_container=self.exps,
             export_transpiled_circuit=export_transpiled_circuit,
+            catalog=self.catalog,
+            pool=self.parallel_manager(),
             _only_quantity=only_quantity,
         )
 
@@ -1210,6 +1659,9 @@ class QurryPrototype(ABC):
             current_multimanager.compress(
                 compress_overwrite=compress_overwrite,
                 remain_only_compressed=remain_only_compressed,
+                codec=codec,
+                level=compress_level,
+                shards=shards,
             )
         else:
             if compress_overwrite or remain_only_compressed:
@@ -1226,6 +1678,9 @@ class QurryPrototype(ABC):
         summoner_id: Optional[str] = None,
         save_location: Union[Path, str] = Path("./"),
         read_from_tarfile: bool = False,
+        read_from_archive: bool = False,
+        codec: Optional[CompressCodecLiteral] = None,
+        lazy: bool = False,
         # defaultMultiAnalysis: list[dict[str, Any]] = []
         # analysisName: str = 'report',
     ) -> str:
@@ -1240,6 +1695,19 @@ class QurryPrototype(ABC):
                 Where to save the export content as `json` file.
                 If `save_location == None`, then cancelled the file to be exported.
                 Defaults to Path('./').
+            read_from_tarfile (bool, optional):
+                Whether to read from the compressed file. Defaults to False.
+            read_from_archive (bool, optional):
+                Whether to read the experiments straight from the compressed file
+                without extracting it to disk, see :cls:`ArchiveReader`.
+                Defaults to False.
+            codec (Optional[CompressCodecLiteral], optional):
+                The expected codec of the compressed file.
+                Defaults to None for the codec recorded in its manifest.
+            lazy (bool, optional):
+                Whether to read only the arguments of experiments,
+                and read their other data on first access.
+                See :meth:`ExperimentPrototype.read`. Defaults to False.
 
         Returns:
             str: SummonerID (ID of multimanager).
@@ -1253,6 +1721,8 @@ class QurryPrototype(ABC):
             save_location=save_location,
             is_read=True,
             read_from_tarfile=read_from_tarfile,
+            read_from_archive=read_from_archive,
+            codec=codec,
         )
 
         assert besummonned in self.multimanagers
@@ -1261,6 +1731,8 @@ class QurryPrototype(ABC):
         quene: list[ExperimentPrototype] = self.experiment.read(
             save_location=self.multimanagers[besummonned].multicommons.save_location,
             name_or_id=summoner_name,
+            lazy=lazy,
+            from_archive=self.multimanagers[besummonned].archive_reader or False,
         )
         for exp in quene:
             self.exps[exp.exp_id] = exp
@@ -1374,6 +1846,7 @@ class QurryPrototype(ABC):
         tmp_wave_container = dict(self.waves.items()) if keepWave else {}
 
         if security and isinstance(security, bool):
+            self.close_parallel_managers()
             # pylint: disable=unnecessary-dunder-call
             self.__init__()
             # pylint: enable=unnecessary-dunder-call
@@ -8,6 +8,7 @@ Runner for running on Different Backends (IBM, IBMQ, ThirdParty, etc.)
 
 from .runner import Runner, ThirdPartyRunner
 from .accesor import BACKEND_AVAILABLE, ExtraBackendAccessor
+from .jobcollector import collect_jobs, wait_for_job
 
 if BACKEND_AVAILABLE["IBMQ"]:
     from .ibmqrunner import IBMQRunner
@@ -7,14 +7,15 @@ Runner for IBM backend
 """
 
 import warnings
+from functools import partial
 from typing import Hashable, Union, Optional
 from qiskit import QuantumCircuit
+from qiskit.providers.exceptions import JobTimeoutError
 
 from ...exceptions import QurryExtraPackageRequired
 
 try:
     from qiskit_ibm_provider import IBMBackend, IBMProvider  # type: ignore
-    from qiskit_ibm_provider.job import IBMCircuitJob  # type: ignore
     from qiskit_ibm_provider.exceptions import IBMError  # type: ignore
 except ImportError:
     raise QurryExtraPackageRequired(
@@ -24,7 +25,7 @@ except ImportError:
 
 try:
     # pylint: disable=ungrouped-imports
-    from qiskit.providers.ibmq import IBMQBackend, IBMQJob, IBMQError  # type: ignore
+    from qiskit.providers.ibmq import IBMQBackend, IBMQError  # type: ignore
 
     # pylint: enable=ungrouped-imports
 
@@ -55,6 +56,7 @@ except ImportError:
 
 from .utils import pending_tags_decider, pk_from_list_to_tuple, retrieve_times_namer
 from .runner import Runner
+from .jobcollector import collect_jobs
 from ..multimanager import MultiManager, PendingStrategyLiteral, TagListKeyable
 from ..container import ExperimentContainer
 from ..utils import get_counts_and_exceptions
@@ -231,17 +233,27 @@ class IBMRunner(Runner):
     def retrieve(
         self,
         overwrite: bool = False,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
     ) -> list[tuple[Optional[str], TagListKeyable]]:
         """Retrieve jobs from remote backend.
 
+        All jobs are retrieved and waited concurrently,
+        the counts of each job are loaded into the multimanager as soon as it finishes,
+        and each experiment receives its counts once all of its circuits are collected.
+
         Args:
             overwrite (bool, optional): Overwrite the previous retrieve. Defaults to False.
+            max_workers (Optional[int], optional):
+                The number of threads to retrieve jobs. Defaults to None for the number of jobs.
+            timeout (Optional[float], optional):
+                The maximum time to wait for each job in seconds.
+                Defaults to None for no limit.
 
         Returns:
             list[tuple[Optional[str], str]]: The list of job_id and pending tags.
         """
 
-        pending_map: dict[Hashable, Union[IBMCircuitJob, "IBMQJob"]] = {}
         couts_tmp_container: dict[int, dict[str, int]] = {}
 
         already_retrieved: list[str] = [
@@ -278,11 +290,6 @@ class IBMRunner(Runner):
         if QISKIT_IBMQ_PROVIDER:
             print("| Downgrade compatibility with qiskit-ibmq-provider is available.")
 
-        retrieve_progressbar = qurry_progressbar(
-            self.current_multimanager.beforewards.job_id,
-            bar_format="| {n_fmt}/{total_fmt} - retrieve: {desc} - {elapsed} < {remaining}",
-            # leave=False,
-        )
         if self.provider is None:
             raise ValueError("provider should not be None.")
         assert isinstance(self.provider, IBMProvider), (
@@ -299,83 +306,42 @@ class IBMRunner(Runner):
             retrieve_principal, "retrieve_job"
         ), "retrieve_principal should not be None."
 
-        for pending_id, pk in retrieve_progressbar:
+        pending_ids: dict[Hashable, str] = {}
+        for pending_id, pk in self.current_multimanager.beforewards.job_id:
             pending_tags = pk_from_list_to_tuple(pk)
             if pending_id is None:
                 warnings.warn(f"Pending pool '{pending_tags}' is empty.")
                 continue
-            try:
-                retrieve_progressbar.set_description_str(
-                    f"{pending_tags}/{pending_id}", refresh=True
-                )
-                pending_map[pending_tags] = retrieve_principal.retrieve_job(
-                    job_id=pending_id
-                )
-            except IBMError as e:
-                retrieve_progressbar.set_description_str(
-                    f"{pending_tags}/{pending_id} - Error: {e}", refresh=True
-                )
-                pending_map[pending_tags] = None
-            except IBMQError as e:
-                retrieve_progressbar.set_description_str(
-                    f"{pending_tags}/{pending_id} - Error: {e}", refresh=True
-                )
-                pending_map[pending_tags] = None
+            pending_ids[pending_tags] = pending_id
 
-        pendingpool_progressbar = qurry_progressbar(
-            self.current_multimanager.beforewards.pending_pool.items(),
-            bar_format=(
-                "| {n_fmt}/{total_fmt} - get counts: {desc} - {elapsed} < {remaining}"
-            ),
-            # leave=False,
-        )
-
-        for pk, pcircs in pendingpool_progressbar:
+        pending_circs: dict[Hashable, list[int]] = {}
+        for pk, pcircs in self.current_multimanager.beforewards.pending_pool.items():
             pending_tags = pk_from_list_to_tuple(pk)
             if len(pcircs) == 0:
                 warnings.warn(f"Pending pool '{pending_tags}' is empty.")
                 continue
+            pending_circs[pending_tags] = pcircs
 
-            if pending_map[pending_tags] is not None:
-                pendingpool_progressbar.set_description_str(
-                    f"{pending_tags}/{pending_map[pending_tags].job_id()}"
-                    + f"/{pending_map[pending_tags].tags()}",
-                    refresh=True,
-                )
-                self.reports[pending_map[pending_tags].job_id()] = {
-                    "time": current,
-                    "type": "retrieve",
-                }
-                try:
-                    counts, exceptions = get_counts_and_exceptions(
-                        result=pending_map[pending_tags].result(),
-                        result_idx_list=[rk - pcircs[0] for rk in pcircs],
-                    )
-                except IBMError as e:
-                    counts, exceptions = [{} for _ in pcircs], {
-                        pending_map[pending_tags].job_id(): e
-                    }
-            else:
-                pendingpool_progressbar.set_description_str(
-                    f"{pending_tags} failed - No available tags", refresh=True
-                )
-                counts, exceptions = get_counts_and_exceptions(
-                    result=None, result_idx_list=[rk - pcircs[0] for rk in pcircs]
-                )
-                pendingpool_progressbar.set_description_str(
-                    f"{pending_tags} failed - No available tags - {len(counts)}",
-                    refresh=True,
-                )
+        undistributed = dict(self.current_multimanager.beforewards.circuits_map)
+        retrieve_progressbar = qurry_progressbar(
+            None,
+            total=len(pending_circs),
+            bar_format="| {n_fmt}/{total_fmt} - retrieve: {desc} - {elapsed} < {remaining}",
+            # leave=False,
+        )
+
+        def load_pending_counts(
+            pending_tags: Hashable,
+            counts: list[dict[str, int]],
+            exceptions: dict[str, Exception],
+        ) -> None:
+            pcircs = pending_circs[pending_tags]
             assert len(counts) == len(pcircs), (
                 f"Length of counts {len(counts)} not equal to length of "
                 + f"pcircs {len(pcircs)} in pending pool '{pending_tags}'."
             )
             for rk in pcircs:
                 couts_tmp_container[rk] = counts[rk - pcircs[0]]
-                pendingpool_progressbar.set_description_str(
-                    f"{pending_tags} - Packing: {rk} with len {len(counts[rk - pcircs[0]])}",
-                    refresh=True,
-                )
             if len(exceptions) > 0:
                 if "exceptions" not in self.current_multimanager.outfields:
                     self.current_multimanager.outfields["exceptions"] = {}
@@ -384,29 +350,83 @@ class IBMRunner(Runner):
                         result_id
                     ] = exception_item
 
-        distributing_progressbar = qurry_progressbar(
-            self.current_multimanager.beforewards.circuits_map.items(),
-            bar_format=(
-                "| {n_fmt}/{total_fmt} - Distributing {desc} - {elapsed} < {remaining}"
-            ),
-            # leave=False,
-        )
-        for current_id, idx_circs in distributing_progressbar:
-            distributing_progressbar.set_description_str(
-                f"{current_id} with {len(idx_circs)} circuits", refresh=True
-            )
-            self.experiment_container[current_id].reset_counts(
-                summoner_id=self.current_multimanager.summoner_id
-            )
-            for idx in idx_circs:
-                self.experiment_container[current_id].afterwards.counts.append(
-                    couts_tmp_container[idx]
+            # distribute the counts to the experiments which are completed.
+            for current_id, idx_circs in list(undistributed.items()):
+                if not all(idx in couts_tmp_container for idx in idx_circs):
+                    continue
+                del undistributed[current_id]
+                self.experiment_container[current_id].reset_counts(
+                    summoner_id=self.current_multimanager.summoner_id
                 )
-            self.experiment_container[current_id].commons.datetimes[
-                retrieve_times_name
-            ] = current
-            self.current_multimanager.afterwards.allCounts[current_id] = (
-                self.experiment_container[current_id].afterwards.counts
-            )
+                for idx in idx_circs:
+                    self.experiment_container[current_id].afterwards.counts.append(
+                        couts_tmp_container[idx]
+                    )
+                self.experiment_container[current_id].commons.datetimes[
+                    retrieve_times_name
+                ] = current
+                self.current_multimanager.afterwards.allCounts[current_id] = (
+                    self.experiment_container[current_id].afterwards.counts
+                )
+
+        for pending_tags in pending_circs:
+            if pending_tags not in pending_ids:
+                retrieve_progressbar.set_description_str(
+                    f"{pending_tags} failed - No available tags", refresh=True
+                )
+                load_pending_counts(
+                    pending_tags,
+                    *get_counts_and_exceptions(
+                        result=None,
+                        result_idx_list=[
+                            rk - pending_circs[pending_tags][0]
+                            for rk in pending_circs[pending_tags]
+                        ],
+                    ),
+                )
+                retrieve_progressbar.update()
+
+        for pending_tags, pending_job, result, error in collect_jobs(
+            {
+                pending_tags: partial(
+                    retrieve_principal.retrieve_job, job_id=pending_ids[pending_tags]
+                )
+                for pending_tags in pending_circs
+                if pending_tags in pending_ids
+            },
+            max_workers=max_workers,
+            timeout=timeout,
+        ):
+            pending_id = pending_ids[pending_tags]
+            pcircs = pending_circs[pending_tags]
+            if error is None:
+                retrieve_progressbar.set_description_str(
+                    f"{pending_tags}/{pending_id}/{pending_job.tags()}", refresh=True
+                )
+                self.reports[pending_id] = {
+                    "time": current,
+                    "type": "retrieve",
+                }
+                counts, exceptions = get_counts_and_exceptions(
+                    result=result,
+                    result_idx_list=[rk - pcircs[0] for rk in pcircs],
+                )
+            else:
+                if not isinstance(error, (IBMError, IBMQError, JobTimeoutError)):
+                    raise error
+                retrieve_progressbar.set_description_str(
+                    f"{pending_tags}/{pending_id} - Error: {error}", refresh=True
+                )
+                counts, _exceptions = get_counts_and_exceptions(
+                    result=None,
+                    result_idx_list=[rk - pcircs[0] for rk in pcircs],
+                )
+                exceptions = {pending_id: error}
+            load_pending_counts(pending_tags, counts, exceptions)
+            retrieve_progressbar.update()
+        retrieve_progressbar.close()
+
+        for current_id in undistributed:
+            warnings.warn(f"Counts of experiment '{current_id}' are not collected.")
 
         return self.current_multimanager.beforewards.job_id
@@ -0,0 +1,114 @@
+"""
+================================================================
+Concurrent Job Collector
+(:mod:`qurry.qurrium.runner.jobcollector`)
+================================================================
+
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Hashable, Callable, Iterator, Optional, Any
+
+from qiskit.providers import JobV1 as Job
+from qiskit.providers.exceptions import JobTimeoutError
+from qiskit.providers.jobstatus import JOB_FINAL_STATES
+from qiskit.result import Result
+
+
+DEFAULT_POLL_INTERVAL = 1.0
+"""The initial interval of polling the status of job in seconds."""
+DEFAULT_MAX_POLL_INTERVAL = 60.0
+"""The maximum interval of polling the status of job in seconds."""
+DEFAULT_POLL_BACKOFF = 2.0
+"""The multiplier of the interval after each polling."""
+DEFAULT_MAX_JOB_WORKERS = 32
+"""The maximum number of threads getting and waiting for jobs by default."""
+
+
+def wait_for_job(
+    job: Job,
+    timeout: Optional[float] = None,
+    interval: float = DEFAULT_POLL_INTERVAL,
+    max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+    backoff: float = DEFAULT_POLL_BACKOFF,
+) -> Result:
+    """Wait for the job to finish by polling its status with exponential backoff,
+    then return its result.
+
+    Args:
+        job (Job): The job.
+        timeout (Optional[float], optional):
+            The maximum time to wait in seconds. Defaults to None for no limit.
+        interval (float, optional):
+            The initial interval of polling in seconds. Defaults to DEFAULT_POLL_INTERVAL.
+        max_interval (float, optional):
+            The maximum interval of polling in seconds. Defaults to DEFAULT_MAX_POLL_INTERVAL.
+        backoff (float, optional):
+            The multiplier of the interval after each polling. Defaults to DEFAULT_POLL_BACKOFF.
+
+    Raises:
+        JobTimeoutError: The job does not finish in time.
+
+    Returns:
+        Result: The result of the job.
+    """
+    begin = time.time()
+    while job.status() not in JOB_FINAL_STATES:
+        elapsed = time.time() - begin
+        if timeout is not None and elapsed >= timeout:
+            raise JobTimeoutError(
+                f"Job {job.job_id()} does not finish in {timeout} seconds."
+            )
+        time.sleep(
+            interval if timeout is None else min(interval, timeout - elapsed)
+        )
+        interval = min(interval * backoff, max_interval)
+
+    return job.result()
+
+
+def collect_jobs(
+    job_getters: dict[Hashable, Callable[[], Job]],
+    max_workers: Optional[int] = None,
+    **wait_kwargs: Any,
+) -> Iterator[tuple[Hashable, Optional[Job], Optional[Result], Optional[Exception]]]:
+    """Get and wait for the jobs concurrently by threads,
+    and yield each of them as soon as it finishes.
+
+    Args:
+        job_getters (dict[Hashable, Callable[[], Job]]):
+            The functions to get each job, like submitting or retrieving the job,
+            they are called in the threads.
+        max_workers (Optional[int], optional):
+            The number of threads. Defaults to None for the number of jobs,
+            but no more than DEFAULT_MAX_JOB_WORKERS.
+        **wait_kwargs: The arguments for :func:`wait_for_job`.
+
+    Yields:
+        tuple[Hashable, Optional[Job], Optional[Result], Optional[Exception]]:
+            The key, the job, the result, and the exception raised during getting or waiting.
+            The job and the result are None if the exception is raised.
+    """
+    if len(job_getters) == 0:
+        return
+
+    jobs: dict[Hashable, Job] = {}
+
+    def get_and_wait(key: Hashable) -> Result:
+        jobs[key] = job_getters[key]()
+        return wait_for_job(jobs[key], **wait_kwargs)
+
+    if max_workers is None:
+        max_workers = min(DEFAULT_MAX_JOB_WORKERS, len(job_getters))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(get_and_wait, key): key for key in job_getters}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                result = future.result()
+            except Exception as err:  # pylint: disable=broad-except
+                yield key, jobs.get(key), None, err
+            else:
+                yield key, jobs[key], result, None
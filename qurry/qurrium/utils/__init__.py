@@ -5,11 +5,48 @@ Utility functions for qurry
 ================================================================
 """
 
-from .construct import qasm_drawer, decomposer, get_counts_and_exceptions
+from .construct import (
+    qasm_drawer,
+    decomposer,
+    get_counts_and_exceptions,
+    wave_statevector,
+    counts_to_result,
+)
+from .transpilecache import (
+    TranspileCache,
+    TranspileCacheStats,
+    DEFAULT_TRANSPILE_CACHE_SIZE,
+    DEFAULT_TRANSPILE_DISK_CACHE_SIZE,
+    TRANSPILE_CACHE_DIR,
+)
+from .template import (
+    CircuitTemplate,
+    bind_templates,
+    transpile_templates,
+    transpile_in_batch,
+)
 from .inputfixer import damerau_levenshtein_distance, outfields_check
 from .iocontrol import (
     naming,
     IOComplex,
     FULL_SUFFIX_OF_COMPRESS_FORMAT,
     STAND_COMPRESS_FORMAT,
+    ARCHIVE_MANIFEST_SUFFIX,
+)
+from .archive import (
+    CompressCodecLiteral,
+    COMPRESS_CODECS,
+    ArchiveStats,
+    ArchiveReader,
+    ArchiveMember,
+    write_archive,
+    read_archive,
+    find_archive,
+)
+from .catalog import (
+    DEFAULT_CATALOG_NAME,
+    CatalogRecord,
+    CatalogEntry,
+    ExperimentCatalog,
+    open_catalog,
 )
@@ -0,0 +1,735 @@
+"""
+================================================================
+Sharded Archives of Exports
+(:mod:`qurry.qurrium.utils.archive`)
+================================================================
+
+The export folder is split into shards of similar size,
+each shard is a tar file compressed by the selected codec,
+so all shards are compressed and decompressed in parallel.
+The shards are listed in a manifest next to them.
+
+The single-shard archive of "xz" is the same file as the legacy `.qurry.tar.xz`,
+and the legacy archive without manifest is still readable.
+
+The manifest also indexes the position of each file in the shards,
+so :cls:`ArchiveReader` reads a single file from the archive without extracting it.
+
+"""
+
+import io
+import os
+import json
+import lzma
+import time
+import tarfile
+import posixpath
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Literal, NamedTuple, Optional, Union, Iterable, Any
+import numpy as np
+
+from .iocontrol import FULL_SUFFIX_OF_COMPRESS_FORMAT, ARCHIVE_MANIFEST_SUFFIX
+from ...tools.parallelmanager import workers_distribution
+from ...exceptions import QurryExtraPackageRequired, QurryImportWarning
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+    FAILED_ZSTD_IMPORT = None
+except ImportError as err:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+    FAILED_ZSTD_IMPORT = err
+
+
+CompressCodecLiteral = Literal["xz", "zstd", "tar"]
+"""The codec of archive, "tar" is uncompressed."""
+COMPRESS_CODECS: tuple[CompressCodecLiteral, ...] = ("xz", "zstd", "tar")
+"""The available codecs of archive."""
+CODEC_SUFFIX: dict[CompressCodecLiteral, str] = {
+    "xz": "tar.xz",
+    "zstd": "tar.zst",
+    "tar": "tar",
+}
+"""The file suffix of each codec."""
+DEFAULT_COMPRESS_LEVEL: dict[CompressCodecLiteral, int] = {
+    "xz": 6,
+    "zstd": 3,
+    "tar": 0,
+}
+"""The default compression level of each codec, the preset for "xz"."""
+
+
+class ArchiveStats(NamedTuple):
+    """The statistics of compressing or decompressing an archive."""
+
+    codec: CompressCodecLiteral
+    """The codec of archive."""
+    shards: int
+    """The number of shards."""
+    raw_bytes: int
+    """The size of files in the archive."""
+    archive_bytes: int
+    """The size of all shards."""
+    seconds: float
+    """The time of compressing or decompressing."""
+
+    @property
+    def ratio(self) -> float:
+        """The compression ratio, the size of files over the size of shards."""
+        return self.raw_bytes / self.archive_bytes if self.archive_bytes > 0 else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """The throughput of the size of files in MB/s."""
+        return self.raw_bytes / 1e6 / self.seconds if self.seconds > 0 else float("inf")
+
+    def report(self, action: str) -> str:
+        """The report of throughput.
+
+        Args:
+            action (str): The action, like "Compressed" or "Decompressed".
+
+        Returns:
+            str: The report.
+        """
+        return (
+            f"| {action} {self.raw_bytes / 1e6:.2f} MB "
+            + f"in {self.shards} shard(s) of '{self.codec}' "
+            + f"as {self.archive_bytes / 1e6:.2f} MB (ratio {self.ratio:.2f}) "
+            + f"in {self.seconds:.3f}s, {self.throughput:.2f} MB/s."
+        )
+
+
+def manifest_location(save_location: Union[Path, str], exps_name: str) -> Path:
+    """The location of the manifest of the sharded archive.
+
+    Args:
+        save_location (Union[Path, str]): The folder of the archive.
+        exps_name (str): The name of the exported experiments.
+
+    Returns:
+        Path: The location of the manifest.
+    """
+    return Path(save_location) / f"{exps_name}.{ARCHIVE_MANIFEST_SUFFIX}"
+
+
+def shard_name(
+    exps_name: str,
+    codec: CompressCodecLiteral,
+    index: int,
+    shards: int,
+) -> str:
+    """The file name of a shard.
+
+    Args:
+        exps_name (str): The name of the exported experiments.
+        codec (CompressCodecLiteral): The codec of archive.
+        index (int): The index of shard.
+        shards (int): The number of shards.
+
+    Returns:
+        str: The file name, which is the legacy name for the single shard of "xz".
+    """
+    if shards == 1:
+        if codec == "xz":
+            return f"{exps_name}.{FULL_SUFFIX_OF_COMPRESS_FORMAT}"
+        return f"{exps_name}.qurry.{CODEC_SUFFIX[codec]}"
+    return f"{exps_name}.qurry.{str(index).rjust(3, '0')}.{CODEC_SUFFIX[codec]}"
+
+
+def check_codec(codec: str, is_read: bool = False) -> CompressCodecLiteral:
+    """Check the codec is available.
+
+    Args:
+        codec (str): The codec of archive.
+        is_read (bool, optional):
+            Whether for reading, which requires the codec strictly. Defaults to False.
+
+    Raises:
+        ValueError: The codec is not available.
+        QurryExtraPackageRequired: The package `zstandard` is required to read "zstd".
+
+    Returns:
+        CompressCodecLiteral: The codec, "xz" when "zstd" is not available for writing.
+    """
+    if codec not in COMPRESS_CODECS:
+        raise ValueError(f"Unknown codec '{codec}', available codecs: {COMPRESS_CODECS}.")
+    if codec == "zstd" and not ZSTD_AVAILABLE:
+        if is_read:
+            raise QurryExtraPackageRequired(
+                "The package 'zstandard' is required to read the archive of 'zstd'."
+            ) from FAILED_ZSTD_IMPORT
+        warnings.warn(
+            "The package 'zstandard' is not available, use 'xz' instead.",
+            category=QurryImportWarning,
+        )
+        return "xz"
+    return codec  # type: ignore[return-value]
+
+
+def distribute_shards(
+    files: list[tuple[Path, int]],
+    shards: int,
+) -> list[list[Path]]:
+    """Distribute the files into shards of similar size,
+    the largest file goes to the smallest shard first.
+
+    Args:
+        files (list[tuple[Path, int]]): The files and their sizes.
+        shards (int): The number of shards.
+
+    Returns:
+        list[list[Path]]: The files of each shard, the empty shards are dropped.
+    """
+    buckets: list[list[Path]] = [[] for _ in range(max(shards, 1))]
+    sizes = [0] * len(buckets)
+    for path, size in sorted(files, key=lambda item: (-item[1], str(item[0]))):
+        smallest = sizes.index(min(sizes))
+        buckets[smallest].append(path)
+        sizes[smallest] += size
+    return [sorted(bucket) for bucket in buckets if bucket] or [[]]
+
+
+def _open_tar_to_write(
+    location: Path,
+    codec: CompressCodecLiteral,
+    level: int,
+) -> tuple[tarfile.TarFile, Any]:
+    if codec == "xz":
+        return tarfile.open(location, "w:xz", preset=level), None
+    if codec == "zstd":
+        raw = open(location, "wb")  # pylint: disable=consider-using-with
+        writer = zstandard.ZstdCompressor(level=level).stream_writer(raw)  # type: ignore
+        return tarfile.open(fileobj=writer, mode="w|"), writer
+    return tarfile.open(location, "w"), None
+
+
+def _open_tar_to_read(
+    location: Path,
+    codec: CompressCodecLiteral,
+) -> tuple[tarfile.TarFile, Any]:
+    if codec == "xz":
+        return tarfile.open(location, "r:xz"), None
+    if codec == "zstd":
+        raw = open(location, "rb")  # pylint: disable=consider-using-with
+        reader = zstandard.ZstdDecompressor().stream_reader(raw)  # type: ignore
+        return tarfile.open(fileobj=reader, mode="r|"), reader
+    return tarfile.open(location, "r"), None
+
+
+def _write_shard(
+    location: Path,
+    codec: CompressCodecLiteral,
+    level: int,
+    base: Path,
+    files: list[Path],
+    directories: list[Path],
+) -> tuple[int, dict[str, tuple[int, int]]]:
+    tar, stream = _open_tar_to_write(location, codec, level)
+    members: dict[str, tuple[int, int]] = {}
+    try:
+        for directory in directories:
+            tar.add(directory, arcname=directory.relative_to(base).as_posix(), recursive=False)
+        for file in files:
+            arcname = file.relative_to(base).as_posix()
+            tar.add(file, arcname=arcname, recursive=False)
+            # The data of a file is padded to blocks right after its header.
+            size = tar.members[-1].size
+            blocks = -(-size // tarfile.BLOCKSIZE)
+            members[arcname] = (tar.offset - blocks * tarfile.BLOCKSIZE, size)
+    finally:
+        tar.close()
+        if stream is not None:
+            stream.close()
+    return os.path.getsize(location), members
+
+
+def _read_shard(
+    location: Path,
+    codec: CompressCodecLiteral,
+    destination: Path,
+) -> int:
+    tar, stream = _open_tar_to_read(location, codec)
+    raw_bytes = 0
+    try:
+        for member in tar:
+            # The shards are extracted in parallel, so their common folders are made first.
+            os.makedirs((destination / member.name).parent, exist_ok=True)
+            tar.extract(member, destination)
+            raw_bytes += member.size if member.isfile() else 0
+    finally:
+        tar.close()
+        if stream is not None:
+            stream.close()
+    return raw_bytes
+
+
+def write_archive(
+    export_location: Union[Path, str],
+    exps_name: str,
+    codec: CompressCodecLiteral = "xz",
+    level: Optional[int] = None,
+    shards: int = 1,
+    workers_num: Optional[int] = None,
+) -> tuple[Path, ArchiveStats]:
+    """Compress the export folder into the sharded archive next to it,
+    the previous archive of the same name is replaced.
+
+    Args:
+        export_location (Union[Path, str]): The export folder.
+        exps_name (str): The name of the exported experiments.
+        codec (CompressCodecLiteral, optional): The codec of archive. Defaults to "xz".
+        level (Optional[int], optional):
+            The compression level, the preset for "xz".
+            Defaults to None for :const:`DEFAULT_COMPRESS_LEVEL`.
+        shards (int, optional): The number of shards. Defaults to 1.
+        workers_num (Optional[int], optional):
+            The number of threads. Defaults to None for all cores.
+
+    Returns:
+        tuple[Path, ArchiveStats]: The location of manifest and the statistics.
+    """
+    begin = time.time()
+    export_location = Path(export_location)
+    save_location = export_location.parent
+    codec = check_codec(codec)
+    if level is None:
+        level = DEFAULT_COMPRESS_LEVEL[codec]
+
+    directories = [export_location]
+    files: list[tuple[Path, int]] = []
+    for root, dirs, filenames in os.walk(export_location):
+        directories += sorted(Path(root) / d for d in dirs)
+        files += [(Path(root) / f, os.path.getsize(Path(root) / f)) for f in filenames]
+    raw_bytes = sum(size for _, size in files)
+    buckets = distribute_shards(files, shards)
+
+    remove_archive(save_location, exps_name)
+    shard_names = [shard_name(exps_name, codec, i, len(buckets)) for i in range(len(buckets))]
+    with ThreadPoolExecutor(
+        max_workers=min(len(buckets), workers_distribution(workers_num))
+    ) as executor:
+        written = list(
+            executor.map(
+                lambda args: _write_shard(*args),
+                [
+                    (
+                        save_location / name,
+                        codec,
+                        level,
+                        save_location,
+                        bucket,
+                        directories if i == 0 else [],
+                    )
+                    for i, (name, bucket) in enumerate(zip(shard_names, buckets))
+                ],
+            )
+        )
+
+    manifest = manifest_location(save_location, exps_name)
+    with open(manifest, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "name": exps_name,
+                "codec": codec,
+                "level": level,
+                "shards": shard_names,
+                "members": {
+                    arcname: [i, offset, size]
+                    for i, (_, members) in enumerate(written)
+                    for arcname, (offset, size) in members.items()
+                },
+            },
+            f,
+            indent=2,
+        )
+    return manifest, ArchiveStats(
+        codec, len(buckets), raw_bytes, sum(size for size, _ in written), time.time() - begin
+    )
+
+
+def find_archive(
+    save_location: Union[Path, str],
+    exps_name: str,
+) -> Optional[tuple[CompressCodecLiteral, list[Path]]]:
+    """Find the archive of the exported experiments.
+
+    Args:
+        save_location (Union[Path, str]): The folder of the archive.
+        exps_name (str): The name of the exported experiments.
+
+    Returns:
+        Optional[tuple[CompressCodecLiteral, list[Path]]]:
+            The codec and the shards from the manifest,
+            or the legacy `.qurry.tar.xz`, or None if not found.
+    """
+    save_location = Path(save_location)
+    manifest = manifest_location(save_location, exps_name)
+    if manifest.exists():
+        with open(manifest, "r", encoding="utf-8") as f:
+            content = json.load(f)
+        return content["codec"], [save_location / name for name in content["shards"]]
+    legacy = save_location / f"{exps_name}.{FULL_SUFFIX_OF_COMPRESS_FORMAT}"
+    if legacy.exists():
+        return "xz", [legacy]
+    return None
+
+
+def remove_archive(save_location: Union[Path, str], exps_name: str) -> None:
+    """Remove the archive and its manifest.
+
+    Args:
+        save_location (Union[Path, str]): The folder of the archive.
+        exps_name (str): The name of the exported experiments.
+    """
+    found = find_archive(save_location, exps_name)
+    if found is None:
+        return
+    for shard in found[1]:
+        if shard.exists():
+            os.remove(shard)
+    manifest = manifest_location(save_location, exps_name)
+    if manifest.exists():
+        os.remove(manifest)
+
+
+def read_archive(
+    save_location: Union[Path, str],
+    exps_name: str,
+    codec: Optional[CompressCodecLiteral] = None,
+    workers_num: Optional[int] = None,
+) -> ArchiveStats:
+    """Decompress all shards of the archive into the folder of the archive.
+
+    Args:
+        save_location (Union[Path, str]): The folder of the archive.
+        exps_name (str): The name of the exported experiments.
+        codec (Optional[CompressCodecLiteral], optional):
+            The expected codec of archive, which is checked against the manifest.
+            Defaults to None for any codec.
+        workers_num (Optional[int], optional):
+            The number of threads. Defaults to None for all cores.
+
+    Raises:
+        FileNotFoundError: The archive is not found.
+        ValueError: The codec of archive is not the expected one.
+
+    Returns:
+        ArchiveStats: The statistics.
+    """
+    begin = time.time()
+    save_location = Path(save_location)
+    found = find_archive(save_location, exps_name)
+    if found is None:
+        raise FileNotFoundError(f"The archive of '{exps_name}' not found at '{save_location}'.")
+    found_codec, shards = found
+    if codec is not None and codec != found_codec:
+        raise ValueError(
+            f"The archive of '{exps_name}' is compressed by '{found_codec}' instead of '{codec}'."
+        )
+    found_codec = check_codec(found_codec, is_read=True)
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(shards), workers_distribution(workers_num))
+    ) as executor:
+        raw_sizes = list(
+            executor.map(lambda shard: _read_shard(shard, found_codec, save_location), shards)
+        )
+    return ArchiveStats(
+        found_codec,
+        len(shards),
+        sum(raw_sizes),
+        sum(os.path.getsize(shard) for shard in shards),
+        time.time() - begin,
+    )
+
+
+DEFAULT_ARCHIVE_READ_CHUNK = 1 << 20
+"""The size of chunks for skipping forward in a compressed shard."""
+
+
+def member_name(filename: Union[Path, str]) -> str:
+    """The name of a file in the archive, which is relative to the folder of the archive.
+
+    Args:
+        filename (Union[Path, str]): The file, like `./exps.qurry.001/qurryinfo.json`.
+
+    Returns:
+        str: The normalized name, like `exps.qurry.001/qurryinfo.json`.
+    """
+    return posixpath.normpath(Path(filename).as_posix())
+
+
+class ArchiveMember(NamedTuple):
+    """The position of a file in the sharded archive."""
+
+    shard: int
+    """The index of shard."""
+    offset: int
+    """The offset of the data in the uncompressed tar stream of shard."""
+    size: int
+    """The size of the data."""
+
+
+class ArchiveReader:
+    """The random-access reader of the sharded archive,
+    which serves the files in the archive without extracting them to disk.
+
+    The files are located by the member index in the manifest,
+    or by scanning all shards once for the legacy archive without manifest.
+    The uncompressed "tar" shard is read by seeking,
+    the compressed shard is decompressed forward from the last read position,
+    and restarted only when reading backward.
+    So the files read together should be passed to :meth:`prefetch` first.
+
+    ```python
+    with ArchiveReader(save_location, "exps.qurry.001") as reader:
+        qurryinfo = reader.read_json("exps.qurry.001/qurryinfo.json")
+    ```
+    """
+
+    def __init__(
+        self,
+        save_location: Union[Path, str],
+        exps_name: str,
+        codec: Optional[CompressCodecLiteral] = None,
+    ):
+        """Initialize the reader.
+
+        Args:
+            save_location (Union[Path, str]): The folder of the archive.
+            exps_name (str): The name of the exported experiments.
+            codec (Optional[CompressCodecLiteral], optional):
+                The expected codec of archive. Defaults to None for any codec.
+
+        Raises:
+            FileNotFoundError: The archive is not found.
+            ValueError: The codec of archive is not the expected one.
+        """
+        self.save_location = Path(save_location)
+        """The folder of the archive."""
+        self.exps_name = exps_name
+        """The name of the exported experiments."""
+        found = find_archive(self.save_location, exps_name)
+        if found is None:
+            raise FileNotFoundError(
+                f"The archive of '{exps_name}' not found at '{self.save_location}'."
+            )
+        if codec is not None and codec != found[0]:
+            raise ValueError(
+                f"The archive of '{exps_name}' is compressed by '{found[0]}' instead of '{codec}'."
+            )
+        self.codec: CompressCodecLiteral = check_codec(found[0], is_read=True)
+        """The codec of archive."""
+        self.shards: list[Path] = found[1]
+        """The shards of archive."""
+
+        members = None
+        manifest = manifest_location(self.save_location, exps_name)
+        if manifest.exists():
+            with open(manifest, "r", encoding="utf-8") as f:
+                members = json.load(f).get("members")
+        self.members: dict[str, ArchiveMember] = (
+            self._scan_members()
+            if members is None
+            else {name: ArchiveMember(*position) for name, position in members.items()}
+        )
+        """The member index of the files in the archive."""
+
+        self._streams: dict[int, tuple[io.BufferedIOBase, int]] = {}
+        self._prefetched: dict[str, bytes] = {}
+
+    def _scan_members(self) -> dict[str, ArchiveMember]:
+        members = {}
+        for i, shard in enumerate(self.shards):
+            tar, stream = _open_tar_to_read(shard, self.codec)
+            try:
+                for member in tar:
+                    if member.isfile():
+                        members[member_name(member.name)] = ArchiveMember(
+                            i, member.offset_data, member.size
+                        )
+            finally:
+                tar.close()
+                if stream is not None:
+                    stream.close()
+        return members
+
+    def _open_shard(self, shard: int) -> io.BufferedIOBase:
+        location = self.shards[shard]
+        if self.codec == "xz":
+            return lzma.open(location, "rb")  # type: ignore[return-value]
+        if self.codec == "zstd":
+            raw = open(location, "rb")  # pylint: disable=consider-using-with
+            return zstandard.ZstdDecompressor().stream_reader(raw)  # type: ignore
+        return open(location, "rb")  # pylint: disable=consider-using-with
+
+    def _read_member(self, member: ArchiveMember) -> bytes:
+        stream, position = self._streams.get(member.shard, (None, 0))
+        if stream is None or (member.offset < position and self.codec != "tar"):
+            if stream is not None:
+                stream.close()
+            stream, position = self._open_shard(member.shard), 0
+
+        if self.codec == "tar":
+            stream.seek(member.offset)
+        else:
+            while position < member.offset:
+                skipped = stream.read(min(member.offset - position, DEFAULT_ARCHIVE_READ_CHUNK))
+                if not skipped:
+                    raise EOFError(f"The shard '{self.shards[member.shard]}' is truncated.")
+                position += len(skipped)
+        data = stream.read(member.size)
+        self._streams[member.shard] = (stream, member.offset + len(data))
+        return data
+
+    def __contains__(self, filename: Union[Path, str]) -> bool:
+        return member_name(filename) in self.members
+
+    def prefetch(self, filenames: Iterable[Union[Path, str]]) -> None:
+        """Read the files in the order of their positions in the shards,
+        and keep them until they are read by :meth:`read_bytes`.
+
+        Args:
+            filenames (Iterable[Union[Path, str]]): The files.
+        """
+        names = {member_name(filename) for filename in filenames}
+        for name in sorted(
+            (name for name in names if name in self.members),
+            key=lambda name: self.members[name][:2],
+        ):
+            if name not in self._prefetched:
+                self._prefetched[name] = self._read_member(self.members[name])
+
+    def read_bytes(self, filename: Union[Path, str]) -> bytes:
+        """Read a file from the archive.
+
+        Args:
+            filename (Union[Path, str]): The file relative to the folder of the archive.
+
+        Raises:
+            FileNotFoundError: The file is not in the archive.
+
+        Returns:
+            bytes: The content of file.
+        """
+        name = member_name(filename)
+        if name in self._prefetched:
+            return self._prefetched.pop(name)
+        if name not in self.members:
+            raise FileNotFoundError(f"'{name}' is not in the archive of '{self.exps_name}'.")
+        return self._read_member(self.members[name])
+
+    def read_json(self, filename: Union[Path, str], encoding: str = "utf-8") -> Any:
+        """Read a json file from the archive.
+
+        Args:
+            filename (Union[Path, str]): The file relative to the folder of the archive.
+            encoding (str, optional): The encoding of file. Defaults to "utf-8".
+
+        Returns:
+            Any: The content of file.
+        """
+        return json.loads(self.read_bytes(filename).decode(encoding))
+
+    def read_array(self, filename: Union[Path, str]) -> np.ndarray:
+        """Read an array written by :func:`numpy.save` from the archive.
+
+        Args:
+            filename (Union[Path, str]): The file relative to the folder of the archive.
+
+        Returns:
+            np.ndarray: The array.
+        """
+        return np.load(io.BytesIO(self.read_bytes(filename)), allow_pickle=False)
+
+    def extract(
+        self,
+        filenames: Iterable[Union[Path, str]],
+        destination: Union[Path, str],
+    ) -> list[Path]:
+        """Extract some files from the archive.
+
+        Args:
+            filenames (Iterable[Union[Path, str]]): The files.
+            destination (Union[Path, str]): The folder to extract into.
+
+        Returns:
+            list[Path]: The extracted files.
+        """
+        filenames = list(filenames)
+        self.prefetch(filenames)
+        extracted = []
+        for filename in filenames:
+            location = Path(destination) / member_name(filename)
+            os.makedirs(location.parent, exist_ok=True)
+            with open(location, "wb") as f:
+                f.write(self.read_bytes(filename))
+            extracted.append(location)
+        return extracted
+
+    def close(self) -> None:
+        """Close the shards and drop the prefetched files."""
+        for stream, _ in self._streams.values():
+            stream.close()
+        self._streams.clear()
+        self._prefetched.clear()
+
+    def __enter__(self) -> "ArchiveReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_streams"] = {}
+        state["_prefetched"] = {}
+        return state
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}(exps_name={self.exps_name!r}, "
+            + f"codec={self.codec!r}, shards={len(self.shards)}, members={len(self.members)})>"
+        )
+
+
+ExportSource = Union[Path, ArchiveReader]
+"""The source of exported files, the folder or the archive of them."""
+
+
+def load_export_json(source: ExportSource, filename: Union[Path, str], encoding: str) -> Any:
+    """Read a json file from the folder or the archive.
+
+    Args:
+        source (ExportSource): The folder or the archive.
+        filename (Union[Path, str]): The file relative to the source.
+        encoding (str): The encoding of file.
+
+    Returns:
+        Any: The content of file.
+    """
+    if isinstance(source, ArchiveReader):
+        return source.read_json(filename, encoding=encoding)
+    with open(Path(source) / filename, "r", encoding=encoding) as f:
+        return json.load(f)
+
+
+def load_export_array(source: ExportSource, filename: Union[Path, str]) -> np.ndarray:
+    """Read an array written by :func:`numpy.save` from the folder or the archive,
+    the array from the folder is memory-mapped.
+
+    Args:
+        source (ExportSource): The folder or the archive.
+        filename (Union[Path, str]): The file relative to the source.
+
+    Returns:
+        np.ndarray: The array.
+    """
+    if isinstance(source, ArchiveReader):
+        return source.read_array(filename)
+    return np.load(Path(source) / filename, mmap_mode="r", allow_pickle=False)
@@ -0,0 +1,452 @@
+"""
+================================================================
+Experiment Catalog
+(:mod:`qurry.qurrium.utils.catalog`)
+================================================================
+
+An optional SQLite index of the written experiments across projects,
+which keeps their ids, summoners, tags, waves, datetimes, arguments,
+file locations and scalar quantities of reports,
+so the experiments can be found without reading all projects.
+
+"""
+
+import os
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple, Optional, Union, Iterable, Iterator, Hashable, Any
+
+DEFAULT_CATALOG_NAME = "qurry.catalog.sqlite"
+"""The default file name of the catalog."""
+
+CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS experiments (
+    exp_id TEXT PRIMARY KEY,
+    exp_name TEXT,
+    wave_key TEXT,
+    serial INTEGER,
+    summoner_id TEXT,
+    summoner_name TEXT,
+    save_location TEXT,
+    files TEXT,
+    updated REAL
+);
+CREATE TABLE IF NOT EXISTS tags (
+    exp_id TEXT, tag TEXT, PRIMARY KEY (exp_id, tag)
+);
+CREATE TABLE IF NOT EXISTS datetimes (
+    exp_id TEXT, name TEXT, time TEXT, PRIMARY KEY (exp_id, name)
+);
+CREATE TABLE IF NOT EXISTS arguments (
+    exp_id TEXT, name TEXT, value TEXT, PRIMARY KEY (exp_id, name)
+);
+CREATE TABLE IF NOT EXISTS quantities (
+    exp_id TEXT, analysis TEXT, name TEXT, value REAL, PRIMARY KEY (exp_id, analysis, name)
+);
+CREATE TABLE IF NOT EXISTS multimanagers (
+    summoner_id TEXT PRIMARY KEY,
+    summoner_name TEXT,
+    save_location TEXT,
+    export_location TEXT,
+    tags TEXT,
+    datetimes TEXT,
+    files TEXT,
+    updated REAL
+);
+CREATE INDEX IF NOT EXISTS idx_experiments_summoner ON experiments (summoner_name);
+CREATE INDEX IF NOT EXISTS idx_experiments_wave ON experiments (wave_key);
+CREATE INDEX IF NOT EXISTS idx_tags ON tags (tag);
+CREATE INDEX IF NOT EXISTS idx_datetimes ON datetimes (name, time);
+CREATE INDEX IF NOT EXISTS idx_arguments ON arguments (name, value);
+CREATE INDEX IF NOT EXISTS idx_quantities ON quantities (name, value);
+"""
+"""The tables of the catalog."""
+EXPERIMENT_CHILD_TABLES = ("tags", "datetimes", "arguments", "quantities")
+"""The tables keyed by `exp_id` besides `experiments`."""
+
+
+def catalog_value(value: Any) -> str:
+    """The text of an argument in the catalog, which is compared in :meth:`query`.
+
+    Args:
+        value (Any): The value of argument, the tuples are written as lists.
+
+    Returns:
+        str: The text.
+    """
+    return json.dumps(value, default=str)
+
+
+def catalog_time(value: Union[str, datetime]) -> str:
+    """The text of a datetime in the format of :func:`qurry.tools.datetime.current_time`.
+
+    Args:
+        value (Union[str, datetime]): The datetime.
+
+    Returns:
+        str: The text.
+    """
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    return value
+
+
+class CatalogRecord(NamedTuple):
+    """The record of an experiment to be written into the catalog."""
+
+    exp_id: str
+    """ID of experiment."""
+    exp_name: str
+    """Name of experiment."""
+    wave_key: Hashable
+    """Key of the chosen wave."""
+    serial: Optional[int]
+    """Index of experiment in a multimanager."""
+    summoner_id: Optional[str]
+    """ID of multimanager."""
+    summoner_name: Optional[str]
+    """Name of multimanager."""
+    tags: tuple[str, ...]
+    """Tags of experiment."""
+    datetimes: dict[str, str]
+    """The datetimes of experiment."""
+    arguments: dict[str, Any]
+    """The arguments of experiment."""
+    quantities: dict[str, dict[str, float]]
+    """The scalar quantities of each report, keyed by the report."""
+    save_location: Union[Path, str]
+    """The location of the files."""
+    files: dict[str, str]
+    """The files relative to :attr:`save_location`."""
+
+
+class CatalogEntry(NamedTuple):
+    """An experiment found in the catalog."""
+
+    exp_id: str
+    """ID of experiment."""
+    exp_name: str
+    """Name of experiment."""
+    summoner_name: Optional[str]
+    """Name of multimanager."""
+    save_location: Path
+    """The location of the files."""
+    files: dict[str, str]
+    """The files relative to :attr:`save_location`,
+    which is also the `file_index` for :meth:`ExperimentPrototype._read_core`."""
+
+    def path(self, filekey: str = "folder") -> Path:
+        """The location of a file of the experiment.
+
+        Args:
+            filekey (str, optional): The key of file. Defaults to "folder".
+
+        Returns:
+            Path: The location of file.
+        """
+        return self.save_location / self.files[filekey]
+
+
+class ExperimentCatalog:
+    """The SQLite catalog of the written experiments.
+
+    Each call opens its own connection, so the catalog can be shared by processes,
+    and the catalog can be placed anywhere to index multiple projects.
+
+    ```python
+    catalog = ExperimentCatalog("./qurry.catalog.sqlite")
+    entries = catalog.query(
+        tags=["GHZ"],
+        arguments={"degree": 3},
+        since="2024-05-01 00:00:00",
+    )
+    ```
+    """
+
+    __slots__ = ("location", "timeout")
+
+    def __init__(
+        self,
+        location: Union[Path, str] = Path(DEFAULT_CATALOG_NAME),
+        timeout: float = 30.0,
+    ):
+        """Initialize the catalog, the tables are created if they do not exist.
+
+        Args:
+            location (Union[Path, str], optional):
+                The file of catalog. Defaults to `./qurry.catalog.sqlite`.
+            timeout (float, optional):
+                The seconds to wait for other writers. Defaults to 30.0.
+        """
+        self.location = Path(location)
+        """The file of catalog."""
+        self.timeout = timeout
+        """The seconds to wait for other writers."""
+        if self.location.parent != Path(""):
+            os.makedirs(self.location.parent, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(CATALOG_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # The connection is committed and closed when leaving the context.
+        conn = sqlite3.connect(self.location, timeout=self.timeout)
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def add_experiments(self, records: Iterable[CatalogRecord]) -> int:
+        """Add or update the experiments in one transaction.
+
+        Args:
+            records (Iterable[CatalogRecord]): The records of experiments.
+
+        Returns:
+            int: The number of experiments.
+        """
+        now = time.time()
+        num = 0
+        with self._connect() as conn:
+            for record in records:
+                save_location = str(Path(record.save_location).resolve())
+                files = {
+                    k: str(v) for k, v in record.files.items() if not isinstance(v, dict)
+                }
+                for table in EXPERIMENT_CHILD_TABLES:
+                    conn.execute(f"DELETE FROM {table} WHERE exp_id = ?", (record.exp_id,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO experiments VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        record.exp_id,
+                        record.exp_name,
+                        str(record.wave_key),
+                        record.serial,
+                        record.summoner_id,
+                        record.summoner_name,
+                        save_location,
+                        json.dumps(files),
+                        now,
+                    ),
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO tags VALUES (?, ?)",
+                    [(record.exp_id, str(tag)) for tag in record.tags],
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO datetimes VALUES (?, ?, ?)",
+                    [(record.exp_id, k, str(v)) for k, v in record.datetimes.items()],
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO arguments VALUES (?, ?, ?)",
+                    [
+                        (record.exp_id, k, catalog_value(v))
+                        for k, v in record.arguments.items()
+                    ],
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO quantities VALUES (?, ?, ?, ?)",
+                    [
+                        (record.exp_id, str(analysis), name, float(value))
+                        for analysis, quantities in record.quantities.items()
+                        for name, value in quantities.items()
+                    ],
+                )
+                num += 1
+        return num
+
+    def add_multimanager(
+        self,
+        summoner_id: str,
+        summoner_name: str,
+        save_location: Union[Path, str],
+        export_location: Union[Path, str],
+        tags: Iterable[str],
+        datetimes: dict[str, str],
+        files: dict[str, Any],
+    ) -> None:
+        """Add or update a multimanager.
+
+        Args:
+            summoner_id (str): ID of multimanager.
+            summoner_name (str): Name of multimanager.
+            save_location (Union[Path, str]): The location of multimanager.
+            export_location (Union[Path, str]): The export folder of multimanager.
+            tags (Iterable[str]): Tags of multimanager.
+            datetimes (dict[str, str]): The datetimes of multimanager.
+            files (dict[str, Any]): The files of multimanager.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO multimanagers VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    summoner_id,
+                    summoner_name,
+                    str(Path(save_location).resolve()),
+                    str(Path(export_location).resolve()),
+                    json.dumps([str(tag) for tag in tags]),
+                    json.dumps(dict(datetimes)),
+                    json.dumps(files, default=str),
+                    time.time(),
+                ),
+            )
+
+    def remove(self, exp_ids: Iterable[str]) -> None:
+        """Remove the experiments from the catalog.
+
+        Args:
+            exp_ids (Iterable[str]): The ids of experiments.
+        """
+        params = [(exp_id,) for exp_id in exp_ids]
+        with self._connect() as conn:
+            for table in ("experiments",) + EXPERIMENT_CHILD_TABLES:
+                conn.executemany(f"DELETE FROM {table} WHERE exp_id = ?", params)
+
+    def query(
+        self,
+        tags: Optional[Iterable[str]] = None,
+        wave_key: Optional[Hashable] = None,
+        exp_name: Optional[str] = None,
+        summoner_name: Optional[str] = None,
+        summoner_id: Optional[str] = None,
+        arguments: Optional[dict[str, Any]] = None,
+        quantities: Optional[dict[str, tuple[Optional[float], Optional[float]]]] = None,
+        since: Optional[Union[str, datetime]] = None,
+        until: Optional[Union[str, datetime]] = None,
+        datetime_name: Optional[str] = None,
+    ) -> list[CatalogEntry]:
+        """Find the experiments matching all given conditions by the indexes.
+
+        Args:
+            tags (Optional[Iterable[str]], optional):
+                The tags which the experiments have all of them. Defaults to None.
+            wave_key (Optional[Hashable], optional): The key of wave. Defaults to None.
+            exp_name (Optional[str], optional): The name of experiment. Defaults to None.
+            summoner_name (Optional[str], optional):
+                The name of multimanager. Defaults to None.
+            summoner_id (Optional[str], optional): The ID of multimanager. Defaults to None.
+            arguments (Optional[dict[str, Any]], optional):
+                The values of arguments, like `{"degree": 3}`. Defaults to None.
+            quantities (Optional[dict[str, tuple[Optional[float], Optional[float]]]], optional):
+                The inclusive ranges of quantities in any report,
+                like `{"purity": (0.5, None)}`. Defaults to None.
+            since (Optional[Union[str, datetime]], optional):
+                The earliest datetime. Defaults to None.
+            until (Optional[Union[str, datetime]], optional):
+                The latest datetime. Defaults to None.
+            datetime_name (Optional[str], optional):
+                The name of datetime to compare with `since` and `until`,
+                like "build" which also matches "build.001".
+                Defaults to None for any datetime.
+
+        Returns:
+            list[CatalogEntry]: The experiments.
+        """
+        conditions: list[str] = []
+        params: list[Any] = []
+        for column, value in (
+            ("wave_key", None if wave_key is None else str(wave_key)),
+            ("exp_name", exp_name),
+            ("summoner_name", summoner_name),
+            ("summoner_id", summoner_id),
+        ):
+            if value is not None:
+                conditions.append(f"e.{column} = ?")
+                params.append(value)
+        for tag in tags or ():
+            conditions.append(
+                "EXISTS (SELECT 1 FROM tags t WHERE t.exp_id = e.exp_id AND t.tag = ?)"
+            )
+            params.append(str(tag))
+        for name, value in (arguments or {}).items():
+            conditions.append(
+                "EXISTS (SELECT 1 FROM arguments a "
+                + "WHERE a.exp_id = e.exp_id AND a.name = ? AND a.value = ?)"
+            )
+            params += [name, catalog_value(value)]
+        for name, (lower, upper) in (quantities or {}).items():
+            sub = "SELECT 1 FROM quantities q WHERE q.exp_id = e.exp_id AND q.name = ?"
+            params.append(name)
+            if lower is not None:
+                sub += " AND q.value >= ?"
+                params.append(lower)
+            if upper is not None:
+                sub += " AND q.value <= ?"
+                params.append(upper)
+            conditions.append(f"EXISTS ({sub})")
+        if since is not None or until is not None or datetime_name is not None:
+            sub = "SELECT 1 FROM datetimes d WHERE d.exp_id = e.exp_id"
+            if datetime_name is not None:
+                sub += " AND (d.name = ? OR d.name LIKE ?)"
+                params += [datetime_name, f"{datetime_name}.%"]
+            if since is not None:
+                sub += " AND d.time >= ?"
+                params.append(catalog_time(since))
+            if until is not None:
+                sub += " AND d.time <= ?"
+                params.append(catalog_time(until))
+            conditions.append(f"EXISTS ({sub})")
+
+        sql = "SELECT exp_id, exp_name, summoner_name, save_location, files FROM experiments e"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY e.save_location, e.summoner_name, e.serial, e.exp_id"
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [
+            CatalogEntry(exp_id, name, summoner, Path(location), json.loads(files))
+            for exp_id, name, summoner, location, files in rows
+        ]
+
+    def quantities(self, exp_ids: Iterable[str]) -> dict[str, dict[str, dict[str, float]]]:
+        """The scalar quantities of the experiments.
+
+        Args:
+            exp_ids (Iterable[str]): The ids of experiments.
+
+        Returns:
+            dict[str, dict[str, dict[str, float]]]:
+                The quantities of each report of each experiment.
+        """
+        result: dict[str, dict[str, dict[str, float]]] = {}
+        with self._connect() as conn:
+            for exp_id in exp_ids:
+                for analysis, name, value in conn.execute(
+                    "SELECT analysis, name, value FROM quantities WHERE exp_id = ?",
+                    (exp_id,),
+                ):
+                    result.setdefault(exp_id, {}).setdefault(analysis, {})[name] = value
+        return result
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM experiments").fetchone()[0]
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}(location={str(self.location)!r})>"
+
+
+def open_catalog(
+    catalog: Optional[Union[ExperimentCatalog, Path, str]],
+) -> Optional[ExperimentCatalog]:
+    """Open the catalog from its location.
+
+    Args:
+        catalog (Optional[Union[ExperimentCatalog, Path, str]]):
+            The catalog or its location, or None for no catalog.
+
+    Returns:
+        Optional[ExperimentCatalog]: The catalog.
+    """
+    if catalog is None or isinstance(catalog, ExperimentCatalog):
+        return catalog
+    return ExperimentCatalog(catalog)
@@ -5,13 +5,17 @@ Construct (:mod:`qurry.qurrium.utils.construct`)
 
 """
 import warnings
+import uuid
 from typing import Union, Optional
 
+import numpy as np
 from qiskit import QuantumCircuit
 from qiskit.result import Result
+from qiskit.quantum_info import Statevector
 from qiskit.exceptions import QiskitError
 
 from ...exceptions import QurryCountLost
+from ...process.utils.counts import PackedCounts
 
 
 def decomposer(
@@ -46,11 +50,73 @@ def qasm_drawer(qc: QuantumCircuit) -> str:
     return txt
 
 
+def wave_statevector(qc: QuantumCircuit) -> np.ndarray:
+    """Simulate the statevector of the circuit without its final measurements.
+
+    Args:
+        qc (QuantumCircuit): The circuit.
+
+    Returns:
+        np.ndarray: The statevector in the little-endian order of Qiskit.
+    """
+    return Statevector(qc.remove_final_measurements(inplace=False)).data
+
+
+def counts_to_result(
+    counts: list[dict[str, int]],
+    names: list[str],
+    shots: int,
+    backend_name: str = "statevector_reuse",
+    creg_name: str = "c1",
+) -> Result:
+    """Wrap the counts sampled without a job into :cls:`Result`,
+    so they are extracted by :func:`get_counts_and_exceptions` as the counts from backend.
+
+    Args:
+        counts (list[dict[str, int]]): The counts of each circuit.
+        names (list[str]): The name of each circuit.
+        shots (int): The number of shots of each circuit.
+        backend_name (str, optional):
+            The name of backend in the result. Defaults to "statevector_reuse".
+        creg_name (str, optional): The name of classical register. Defaults to "c1".
+
+    Returns:
+        Result: The result with a generated job ID.
+    """
+    results = []
+    for single_counts, name in zip(counts, names):
+        num_clbits = len(next(iter(single_counts), ""))
+        results.append(
+            {
+                "shots": shots,
+                "success": True,
+                "data": {"counts": {hex(int(k, 2)): v for k, v in single_counts.items()}},
+                "header": {
+                    "name": name,
+                    "creg_sizes": [[creg_name, num_clbits]],
+                    "memory_slots": num_clbits,
+                },
+            }
+        )
+    job_id = str(uuid.uuid4())
+    return Result.from_dict(
+        {
+            "backend_name": backend_name,
+            "backend_version": "0.0.0",
+            "qobj_id": job_id,
+            "job_id": job_id,
+            "success": True,
+            "results": results,
+        }
+    )
+
+
 def get_counts_and_exceptions(
     result: Optional[Result],
     num: Optional[int] = None,
     result_idx_list: Optional[list[int]] = None,
-) -> tuple[list[dict[str, int]], dict[str, Exception]]:
+    packed: bool = False,
+) -> tuple[list[Union[dict[str, int], PackedCounts]], dict[str, Exception]]:
     """Get counts and exceptions from result.
 
     Args:
@@ -59,9 +125,11 @@ def get_counts_and_exceptions(
             Defaults to None.
         result_idx_list (Optional[list[int]], optional): The index of counts wanted to be extracted.
             Defaults to None.
+        packed (bool, optional): Whether to pack the counts into :cls:`PackedCounts`,
+            which stores the bitstrings as integers in arrays. Defaults to False.
 
     Returns:
-        tuple[list[dict[str, int]], dict[str, Exception]]:
+        tuple[list[Union[dict[str, int], PackedCounts]], dict[str, Exception]]:
             Counts and exceptions.
     """
     counts: list[dict[str, int]] = []
@@ -105,6 +173,8 @@ def get_counts_and_exceptions(
         except QiskitError as err_1:
             exceptions[result.job_id] = err_1
             print("| Failed Job result skip, Job ID:", result.job_id, err_1)
+        if packed:
+            counts = [PackedCounts.from_dict(c) for c in counts]
         return counts, exceptions
 
     for i in idx_list:
@@ -120,6 +190,6 @@ def get_counts_and_exceptions(
                 err_2,
             )
             all_meas = {}
-        counts.append(all_meas)
+        counts.append(PackedCounts.from_dict(all_meas) if packed else all_meas)
 
     return counts, exceptions
@@ -10,6 +10,8 @@ from typing import Union, NamedTuple
 
 STAND_COMPRESS_FORMAT = "tar.xz"
 FULL_SUFFIX_OF_COMPRESS_FORMAT = f"qurry.{STAND_COMPRESS_FORMAT}"
+ARCHIVE_MANIFEST_SUFFIX = "qurry.archive.json"
+"""The suffix of the manifest of the sharded archive."""
 RJUST_LEN = 3
 """The length of the string to be right-justified for serial number."""
 
@@ -82,7 +84,12 @@ def naming(
         export_location = save_location / immutable_name
         tar_name = f"{immutable_name}.{FULL_SUFFIX_OF_COMPRESS_FORMAT}"
         tar_location = save_location / tar_name
-        if not (export_location.exists() or tar_location.exists()):
+        manifest_location = save_location / f"{immutable_name}.{ARCHIVE_MANIFEST_SUFFIX}"
+        if not (
+            export_location.exists()
+            or tar_location.exists()
+            or manifest_location.exists()
+        ):
             raise FileNotFoundError(
                 f"Such exportation data '{immutable_name}' or "
                 + f"'{tar_name}' not found at '{save_location}', "
@@ -8,6 +8,7 @@ Randomized Measure Kit for Qurry
 
 from typing import Union, Optional, Callable
 import numpy as np
+from qiskit.circuit import Parameter
 from qiskit.quantum_info import random_unitary, Operator
 
 RXmatrix = np.array([[0, 1], [1, 0]])
@@ -16,6 +17,10 @@ RYmatrix = np.array([[0, -1j], [1j, 0]])
 """Pauli-Y matrix"""
 RZmatrix = np.array([[1, 0], [0, -1]])
 """Pauli-Z matrix"""
+PAULI_MATRICES = np.stack([RXmatrix, RYmatrix, RZmatrix]).astype(np.complex128)
+"""Pauli-X, Pauli-Y and Pauli-Z matrices in shape of `(3, 2, 2)`"""
+STATEVECTOR_BATCH_ELEMENTS = 2**22
+"""The maximum number of amplitudes rotated at once by :func:`local_unitary_sampled_counts`."""
 
 
 # pylint: disable=unnecessary-direct-lambda-call
@@ -153,3 +158,259 @@ def local_random_unitary_pauli_coeff(
         i: qubit_operator_to_pauli_coeff(unitary_op_list[i])
         for i in range(*unitary_loc)
     }
+
+
+def unitary_to_u_angles(unitary: Union[np.ndarray, Operator]) -> np.ndarray:
+    """Decompose single qubit unitary operators into the Euler angles of
+    :cls:`qiskit.circuit.library.UGate`, which is equal up to a global phase.
+
+    The unitary is normalized into SU(2) first, then it is
+    `[[e^{-i(φ+λ)/2} cos(θ/2), -e^{i(λ-φ)/2} sin(θ/2)],
+    [e^{i(φ-λ)/2} sin(θ/2), e^{i(φ+λ)/2} cos(θ/2)]]`.
+
+    Args:
+        unitary (Union[np.ndarray, Operator]):
+            The unitary operator, or an array of them in shape of `(..., 2, 2)`.
+
+    Returns:
+        np.ndarray: The angles `(θ, φ, λ)` in shape of `(..., 3)`.
+    """
+    matrix = np.asarray(unitary, dtype=np.complex128)
+    special = matrix / np.sqrt(np.linalg.det(matrix))[..., np.newaxis, np.newaxis]
+    theta = 2 * np.arctan2(np.abs(special[..., 1, 0]), np.abs(special[..., 0, 0]))
+    phi_plus_lambda_half = np.angle(special[..., 1, 1])
+    phi_minus_lambda_half = np.angle(special[..., 1, 0])
+    return np.stack(
+        [
+            theta,
+            phi_plus_lambda_half + phi_minus_lambda_half,
+            phi_plus_lambda_half - phi_minus_lambda_half,
+        ],
+        axis=-1,
+    )
+
+
+def local_unitary_u_parameters(
+    unitary_loc: tuple[int, int],
+) -> dict[int, tuple[Parameter, Parameter, Parameter]]:
+    """Create the parameters of :cls:`qiskit.circuit.library.UGate` for each qubit.
+
+    Args:
+        unitary_loc (tuple[int, int]): The location of unitary operator.
+
+    Returns:
+        dict[int, tuple[Parameter, Parameter, Parameter]]: The parameters `(θ, φ, λ)`.
+    """
+    return {
+        j: (Parameter(f"theta_{j}"), Parameter(f"phi_{j}"), Parameter(f"lambda_{j}"))
+        for j in range(*unitary_loc)
+    }
+
+
+def batch_unitary_u_values(
+    u_parameters: dict[int, tuple[Parameter, Parameter, Parameter]],
+    unitary_loc: tuple[int, int],
+    unitaries: np.ndarray,
+) -> list[dict[Parameter, float]]:
+    """Derive the values of the parameters from :func:`local_unitary_u_parameters`
+    by the Euler angles of a batch of unitary operators.
+
+    Args:
+        u_parameters (dict[int, tuple[Parameter, Parameter, Parameter]]):
+            The parameters of each qubit.
+        unitary_loc (tuple[int, int]): The location of unitary operator.
+        unitaries (np.ndarray):
+            The unitary operators in shape of `(times, num_qubits, 2, 2)`
+            from :func:`random_unitary_batch`.
+
+    Returns:
+        list[dict[Parameter, float]]: The values of the parameters of each draw.
+    """
+    angles = unitary_to_u_angles(unitaries).tolist()
+    return [
+        {
+            param: angle
+            for j, params in u_parameters.items()
+            for param, angle in zip(params, angles_of_draw[j - unitary_loc[0]])
+        }
+        for angles_of_draw in angles
+    ]
+
+
+def random_unitary_batch(
+    times: int,
+    num_qubits: int,
+    seed: Optional[Union[int, np.random.SeedSequence]] = None,
+) -> np.ndarray:
+    """Sample a batch of single qubit Haar random unitary operators at once.
+
+    The complex Gaussian matrices are QR decomposed with the positive diagonal of R,
+    which makes Q distributed by Haar measure.
+    The decomposition of 2x2 matrices is written out by Gram-Schmidt process,
+    so it is vectorized over the whole batch for any version of NumPy.
+
+    The generator is created from :cls:`numpy.random.SeedSequence`,
+    so the sampling is reproducible with the same seed,
+    and the batch can be sharded across processes safely
+    by the children from :meth:`numpy.random.SeedSequence.spawn`.
+
+    Args:
+        times (int): The number of draws.
+        num_qubits (int): The number of qubits of each draw.
+        seed (Optional[Union[int, np.random.SeedSequence]], optional):
+            The seed or the seed sequence. Defaults to None for fresh entropy.
+
+    Returns:
+        np.ndarray: The unitary operators in shape of `(times, num_qubits, 2, 2)`.
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    rng = np.random.default_rng(seed)
+
+    ginibre = rng.standard_normal((times, num_qubits, 2, 2, 2)).view(np.complex128)[
+        ..., 0
+    ]
+    first = ginibre[..., 0]
+    first = first / np.linalg.norm(first, axis=-1, keepdims=True)
+    second = ginibre[..., 1]
+    second = second - np.sum(first.conj() * second, axis=-1, keepdims=True) * first
+    second = second / np.linalg.norm(second, axis=-1, keepdims=True)
+    return np.stack([first, second], axis=-1)
+
+
+def batch_unitary_operators(
+    unitary_loc: tuple[int, int],
+    unitaries: np.ndarray,
+) -> dict[int, dict[int, list[list[complex]]]]:
+    """Transform a batch of unitary operators into the format of `unitaryOP`,
+    which is the same as :func:`local_random_unitary_operators` on each draw.
+
+    Args:
+        unitary_loc (tuple[int, int]): The location of unitary operator.
+        unitaries (np.ndarray):
+            The unitary operators in shape of `(times, num_qubits, 2, 2)`.
+
+    Returns:
+        dict[int, dict[int, list[list[complex]]]]: The unitary operators of each draw.
+    """
+    return {
+        i: dict(zip(range(*unitary_loc), draw))
+        for i, draw in enumerate(unitaries.tolist())
+    }
+
+
+def pauli_coeff_array(unitaries: np.ndarray) -> np.ndarray:
+    """Calculate the pauli coefficients of a batch of unitary operators by one `einsum`,
+    which is the same as :func:`qubit_operator_to_pauli_coeff` on each operator.
+
+    Args:
+        unitaries (np.ndarray): The unitary operators in shape of `(..., 2, 2)`.
+
+    Returns:
+        np.ndarray: The real and image part of the coefficients of Pauli-X, Pauli-Y and Pauli-Z
+            in shape of `(..., 3, 2)`.
+    """
+    coeffs = np.einsum("...ij,pji->...p", unitaries, PAULI_MATRICES) / 2
+    return np.stack([coeffs.real, coeffs.imag], axis=-1)
+
+
+def batch_pauli_coeff(
+    unitary_loc: tuple[int, int],
+    unitaries: np.ndarray,
+) -> dict[int, dict[int, list[tuple[float, float]]]]:
+    """Transform a batch of unitary operators into the format of `randomized`,
+    which is the same as :func:`local_random_unitary_pauli_coeff` on each draw.
+
+    Args:
+        unitary_loc (tuple[int, int]): The location of unitary operator.
+        unitaries (np.ndarray):
+            The unitary operators in shape of `(times, num_qubits, 2, 2)`.
+
+    Returns:
+        dict[int, dict[int, list[tuple[float, float]]]]: The pauli coefficients of each draw.
+    """
+    coeffs_list = pauli_coeff_array(unitaries).tolist()
+    return {
+        i: {
+            j: [tuple(c) for c in qubit_coeffs]
+            for j, qubit_coeffs in zip(range(*unitary_loc), draw)
+        }
+        for i, draw in enumerate(coeffs_list)
+    }
+
+
+def local_unitary_sampled_counts(
+    state: np.ndarray,
+    unitaries: np.ndarray,
+    unitary_loc: tuple[int, int],
+    measure: tuple[int, int],
+    shots: int,
+    seed: Optional[Union[int, np.random.SeedSequence]] = None,
+    batch_elements: int = STATEVECTOR_BATCH_ELEMENTS,
+) -> list[dict[str, int]]:
+    """Sample the counts of each layer of local unitary operators applied on one statevector,
+    which are the same as measuring the circuits of randomized measurement on a simulator.
+
+    The layers are applied as batched tensor contractions on the qubits in `measure`,
+    since the unitary operators on the other qubits do not change the measured distribution.
+    The layers are processed in chunks of at most `batch_elements` amplitudes.
+
+    Args:
+        state (np.ndarray): The statevector in the little-endian order of Qiskit.
+        unitaries (np.ndarray):
+            The unitary operators in shape of `(times, num_qubits, 2, 2)`,
+            the second axis is the qubit from `unitary_loc[0]`.
+        unitary_loc (tuple[int, int]): The location of unitary operator.
+        measure (tuple[int, int]): The measure range, which is inside `unitary_loc`.
+        shots (int): The number of shots of each layer.
+        seed (Optional[Union[int, np.random.SeedSequence]], optional):
+            The seed of sampling. Defaults to None for fresh entropy.
+        batch_elements (int, optional):
+            The maximum number of amplitudes rotated at once.
+            Defaults to STATEVECTOR_BATCH_ELEMENTS.
+
+    Returns:
+        list[dict[str, int]]: The counts of each layer,
+            the bitstrings are from qubit `measure[1] - 1` to qubit `measure[0]`.
+    """
+    num_qubits = int(state.size).bit_length() - 1
+    assert 2**num_qubits == state.size, f"The size of statevector {state.size} is invalid."
+    assert unitary_loc[0] <= measure[0] and measure[1] <= unitary_loc[1], (
+        f"unitary_loc range '{unitary_loc}' does not contain measure range '{measure}'."
+    )
+    num_measured = measure[1] - measure[0]
+
+    # The first axis of C-order is the most significant qubit,
+    # so the measured qubits are the axes from qubit `measure[1] - 1` to qubit `measure[0]`.
+    psi = np.asarray(state, dtype=np.complex128).reshape(
+        2 ** (num_qubits - measure[1]), *([2] * num_measured), 2 ** measure[0]
+    )
+    measured_unitaries = np.asarray(unitaries)[
+        :, measure[0] - unitary_loc[0] : measure[1] - unitary_loc[0]
+    ]
+    chunk = max(1, batch_elements // state.size)
+    rng = np.random.default_rng(seed)
+
+    counts = []
+    for begin in range(0, len(measured_unitaries), chunk):
+        layers = measured_unitaries[begin : begin + chunk]
+        rotated = np.broadcast_to(psi, (len(layers),) + psi.shape)
+        for k in range(num_measured):
+            axis = num_measured + 1 - k
+            rotated = np.moveaxis(
+                np.einsum(
+                    "b...j,bij->b...i", np.moveaxis(rotated, axis, -1), layers[:, k]
+                ),
+                -1,
+                axis,
+            )
+        probs = (np.abs(rotated) ** 2).sum(axis=(1, -1)).reshape(len(layers), -1)
+        for prob in probs:
+            sampled = rng.multinomial(shots, prob / prob.sum())
+            counts.append(
+                {
+                    format(int(bits), f"0{num_measured}b"): int(sampled[bits])
+                    for bits in np.flatnonzero(sampled)
+                }
+            )
+    return counts
@@ -0,0 +1,159 @@
+"""
+================================================================
+Parameterized Template Circuits
+(:mod:`qurry.qurrium.utils.template`)
+================================================================
+
+"""
+
+from pathlib import Path
+from typing import NamedTuple, Optional, Union, Any
+
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import Parameter
+from qiskit.providers import Backend
+
+from .transpilecache import TranspileCache
+
+
+class CircuitTemplate(NamedTuple):
+    """A parameterized circuit with the parameter values of each circuit bound from it.
+
+    The method of :cls:`QurryPrototype` can return them instead of the circuits,
+    then the template will be transpiled only once and bound into each circuit.
+    """
+
+    circuit: QuantumCircuit
+    """The parameterized circuit."""
+    values: list[dict[Parameter, float]]
+    """The parameter values of each circuit."""
+    names: list[str]
+    """The name of each circuit."""
+
+    def bind(self, circuit: Optional[QuantumCircuit] = None) -> list[QuantumCircuit]:
+        """Bind the parameter values into circuits.
+
+        Args:
+            circuit (Optional[QuantumCircuit], optional):
+                The circuit to bind, like the transpiled template,
+                its parameters are matched by name.
+                Defaults to None for the template itself.
+
+        Returns:
+            list[QuantumCircuit]: The bound circuits.
+        """
+        if circuit is None:
+            circuit = self.circuit
+        parameters = circuit.parameters
+
+        bound_circuits = []
+        for values, name in zip(self.values, self.names):
+            values_by_name = {p.name: v for p, v in values.items()}
+            bound = circuit.assign_parameters(
+                {p: values_by_name[p.name] for p in parameters}, inplace=False
+            )
+            bound.name = name
+            bound_circuits.append(bound)
+        return bound_circuits
+
+
+def bind_templates(templates: list[CircuitTemplate]) -> list[QuantumCircuit]:
+    """Bind the templates into the circuits without transpiling.
+
+    Args:
+        templates (list[CircuitTemplate]): The templates.
+
+    Returns:
+        list[QuantumCircuit]: The bound circuits.
+    """
+    return [circ for template in templates for circ in template.bind()]
+
+
+def transpile_templates(
+    templates: list[CircuitTemplate],
+    backend: Optional[Backend] = None,
+    cache: Optional[TranspileCache] = None,
+    cache_dir: Optional[Union[Path, str]] = None,
+    **transpile_args: Any,
+) -> list[QuantumCircuit]:
+    """Transpile each template once, then bind it into the transpiled circuits.
+
+    Args:
+        templates (list[CircuitTemplate]): The templates.
+        backend (Optional[Backend], optional): The backend. Defaults to None.
+        cache (Optional[TranspileCache], optional):
+            The cache of transpiled circuits. Defaults to None for no cache.
+        cache_dir (Optional[Union[Path, str]], optional):
+            The folder of on-disk cache. Defaults to None for memory only.
+        **transpile_args: The arguments for :func:`qiskit.transpile`.
+
+    Returns:
+        list[QuantumCircuit]: The transpiled circuits.
+    """
+    return transpile_in_batch(
+        [templates],
+        backend=backend,
+        cache=cache,
+        cache_dir=cache_dir,
+        **transpile_args,
+    )[0]
+
+
+def transpile_in_batch(
+    batch: list[Union[list[QuantumCircuit], list[CircuitTemplate]]],
+    backend: Optional[Backend] = None,
+    cache: Optional[TranspileCache] = None,
+    cache_dir: Optional[Union[Path, str]] = None,
+    **transpile_args: Any,
+) -> list[list[QuantumCircuit]]:
+    """Transpile the circuits of multiple experiments in one call,
+    so the transpiler can parallelize across all of them.
+
+    Args:
+        batch (list[Union[list[QuantumCircuit], list[CircuitTemplate]]]):
+            The circuits or the templates of each experiment.
+        backend (Optional[Backend], optional): The backend. Defaults to None.
+        cache (Optional[TranspileCache], optional):
+            The cache of transpiled circuits. Defaults to None for no cache.
+        cache_dir (Optional[Union[Path, str]], optional):
+            The folder of on-disk cache. Defaults to None for memory only.
+        **transpile_args: The arguments for :func:`qiskit.transpile`.
+
+    Returns:
+        list[list[QuantumCircuit]]: The transpiled circuits of each experiment.
+    """
+    flatten_circuits: list[QuantumCircuit] = []
+    for items in batch:
+        if len(items) > 0 and isinstance(items[0], CircuitTemplate):
+            flatten_circuits += [template.circuit for template in items]
+        else:
+            flatten_circuits += items
+
+    if cache is None:
+        transpiled = transpile(flatten_circuits, backend=backend, **transpile_args)
+        if isinstance(transpiled, QuantumCircuit):
+            transpiled = [transpiled]
+    else:
+        transpiled = cache.transpile(
+            flatten_circuits,
+            backend=backend,
+            cache_dir=cache_dir,
+            **transpile_args,
+        )
+
+    result = []
+    offset = 0
+    for items in batch:
+        transpiled_items = transpiled[offset : offset + len(items)]
+        offset += len(items)
+        if len(items) > 0 and isinstance(items[0], CircuitTemplate):
+            result.append(
+                [
+                    circ
+                    for template, transpiled_template in zip(items, transpiled_items)
+                    for circ in template.bind(transpiled_template)
+                ]
+            )
+        else:
+            result.append(list(transpiled_items))
+    return result
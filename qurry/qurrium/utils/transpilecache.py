@@ -0,0 +1,370 @@
+"""
+================================================================
+Transpile Cache
+(:mod:`qurry.qurrium.utils.transpilecache`)
+================================================================
+
+"""
+
+import os
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple, Optional, Union, Any
+
+import numpy as np
+from qiskit import QuantumCircuit, transpile, qpy
+from qiskit.circuit import ParameterExpression
+from qiskit.providers import Backend
+
+try:
+    from qiskit.circuit.library import get_standard_gate_name_mapping
+
+    STANDARD_OPERATIONS: dict[str, Any] = get_standard_gate_name_mapping()
+except ImportError:
+    STANDARD_OPERATIONS = {}
+
+
+DEFAULT_TRANSPILE_CACHE_SIZE = 1024
+"""The default maximum number of transpiled circuits kept in memory."""
+DEFAULT_TRANSPILE_DISK_CACHE_SIZE = 0
+"""The default maximum number of transpiled circuits stored on disk,
+the on-disk cache is disabled by default."""
+TRANSPILE_CACHE_DIR = ".transpile_cache"
+"""The name of the folder of on-disk transpile cache under the save location."""
+
+
+def backend_fingerprint(backend: Optional[Backend]) -> str:
+    """The fingerprint of backend for transpiling,
+    which contains its name, version, basis gates and coupling map.
+
+    Args:
+        backend (Optional[Backend]): The backend.
+
+    Returns:
+        str: The fingerprint of backend.
+    """
+    if backend is None:
+        return "None"
+
+    name = backend.name() if callable(backend.name) else backend.name
+    parts: list[Any] = [name, getattr(backend, "backend_version", None)]
+    if hasattr(backend, "configuration"):
+        config = backend.configuration()
+        parts += [
+            getattr(config, "n_qubits", None),
+            getattr(config, "basis_gates", None),
+            getattr(config, "coupling_map", None),
+        ]
+    else:
+        target = backend.target
+        coupling_map = target.build_coupling_map()
+        parts += [
+            target.num_qubits,
+            sorted(target.operation_names),
+            None if coupling_map is None else sorted(coupling_map.get_edges()),
+        ]
+    return repr(parts)
+
+
+def _param_repr(param: Any) -> str:
+    """The representation of a parameter of instruction in :func:`circuit_fingerprint`.
+
+    Args:
+        param (Any): The parameter.
+
+    Returns:
+        str: The representation.
+    """
+    if isinstance(param, ParameterExpression):
+        return f"ParameterExpression({param})"
+    if isinstance(param, QuantumCircuit):
+        return f"QuantumCircuit({circuit_fingerprint(param)})"
+    if isinstance(param, np.ndarray):
+        content = hashlib.sha256(np.ascontiguousarray(param).tobytes()).hexdigest()
+        return f"ndarray({param.shape}, {param.dtype}, {content})"
+    return repr(param)
+
+
+def _is_standard_operation(operation: Any) -> bool:
+    """Whether the operation is a standard one of Qiskit, whose definition is fixed by its name.
+
+    Args:
+        operation (Any): The operation.
+
+    Returns:
+        bool: Whether it's standard.
+    """
+    standard = STANDARD_OPERATIONS.get(operation.name)
+    if standard is None:
+        return False
+    return getattr(operation, "base_class", type(operation)) is getattr(
+        standard, "base_class", type(standard)
+    )
+
+
+def _update_fingerprint(hasher: Any, circuit: QuantumCircuit) -> None:
+    """Feed the structure of circuit into the hasher for :func:`circuit_fingerprint`.
+
+    Args:
+        hasher (Any): The hasher from :func:`hashlib.sha256`.
+        circuit (QuantumCircuit): The circuit.
+    """
+    qubit_indices = {qubit: i for i, qubit in enumerate(circuit.qubits)}
+    clbit_indices = {clbit: i for i, clbit in enumerate(circuit.clbits)}
+    header = (
+        [(reg.name, reg.size) for reg in circuit.qregs],
+        [(reg.name, reg.size) for reg in circuit.cregs],
+        circuit.num_qubits,
+        circuit.num_clbits,
+        _param_repr(circuit.global_phase),
+    )
+    hasher.update(repr(header).encode("utf-8"))
+    for instruction in circuit.data:
+        operation = instruction.operation
+        content = (
+            operation.name,
+            operation.num_qubits,
+            operation.num_clbits,
+            [_param_repr(param) for param in operation.params],
+            [qubit_indices[qubit] for qubit in instruction.qubits],
+            [clbit_indices[clbit] for clbit in instruction.clbits],
+            repr(getattr(operation, "condition", None)),
+        )
+        hasher.update(repr(content).encode("utf-8"))
+        # The custom gates may share a name with different definitions.
+        if not _is_standard_operation(operation):
+            definition = getattr(operation, "definition", None)
+            if isinstance(definition, QuantumCircuit):
+                hasher.update(b"definition\0")
+                _update_fingerprint(hasher, definition)
+                hasher.update(b"\0definition")
+
+
+def circuit_fingerprint(circuit: QuantumCircuit) -> str:
+    """The structural content of circuit for the key of transpiling,
+    which works for the parameterized circuits as well,
+    since their parameters are included by name.
+
+    It contains the registers, the global phase and the instructions
+    with their parameters and the indices of their qubits and clbits,
+    the definitions of non-standard gates are included recursively,
+    but the name and the metadata of circuit are not.
+
+    Args:
+        circuit (QuantumCircuit): The circuit.
+
+    Returns:
+        str: The hexadecimal digest.
+    """
+    hasher = hashlib.sha256()
+    _update_fingerprint(hasher, circuit)
+    return hasher.hexdigest()
+
+
+def transpile_key(
+    content: str,
+    backend_print: str,
+    transpile_args: dict[str, Any],
+) -> str:
+    """The content-addressed key of transpiling a circuit.
+
+    Args:
+        content (str): The structural content of circuit from :func:`circuit_fingerprint`.
+        backend_print (str): The fingerprint of backend from :func:`backend_fingerprint`.
+        transpile_args (dict[str, Any]): The arguments for :func:`qiskit.transpile`.
+
+    Returns:
+        str: The key.
+    """
+    hasher = hashlib.sha256()
+    for part in (content, backend_print, repr(sorted(transpile_args.items()))):
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+class TranspileCacheStats(NamedTuple):
+    """The hit and miss statistics of :cls:`TranspileCache`."""
+
+    hits: int
+    """The number of circuits found in memory."""
+    disk_hits: int
+    """The number of circuits loaded from disk."""
+    misses: int
+    """The number of circuits transpiled."""
+    size: int
+    """The number of circuits kept in memory."""
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of circuits which are not transpiled."""
+        total = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / total if total > 0 else 0.0
+
+
+class TranspileCache:
+    """The content-addressed cache of transpiled circuits,
+    keyed by the structure of circuit, the backend and the transpile arguments.
+
+    The circuits are kept in an in-memory LRU,
+    and can be stored on disk as QPY files when `disk_maxsize` is positive,
+    where the least recently used files are removed beyond `disk_maxsize`.
+    """
+
+    __slots__ = ("maxsize", "disk_maxsize", "_memory", "_hits", "_disk_hits", "_misses")
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_TRANSPILE_CACHE_SIZE,
+        disk_maxsize: int = DEFAULT_TRANSPILE_DISK_CACHE_SIZE,
+    ):
+        self.maxsize = maxsize
+        """The maximum number of transpiled circuits kept in memory."""
+        self.disk_maxsize = disk_maxsize
+        """The maximum number of transpiled circuits stored in the folder of on-disk cache,
+        the on-disk cache is disabled when it's not positive."""
+        self._memory: OrderedDict[str, QuantumCircuit] = OrderedDict()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> TranspileCacheStats:
+        """The hit and miss statistics."""
+        return TranspileCacheStats(
+            self._hits, self._disk_hits, self._misses, len(self._memory)
+        )
+
+    def clear(self) -> None:
+        """Clear the in-memory cache and the statistics."""
+        self._memory.clear()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    def _remember(self, key: str, circuit: QuantumCircuit) -> None:
+        self._memory[key] = circuit
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def _prune_disk(self, cache_dir: Path) -> None:
+        """Remove the least recently used files beyond :attr:`disk_maxsize`.
+
+        Args:
+            cache_dir (Path): The folder of on-disk cache.
+        """
+        cache_files = []
+        for cache_file in cache_dir.glob("*.qpy"):
+            try:
+                cache_files.append((cache_file.stat().st_mtime_ns, cache_file))
+            except FileNotFoundError:
+                continue
+        if len(cache_files) <= self.disk_maxsize:
+            return
+        cache_files.sort()
+        for _, cache_file in cache_files[: len(cache_files) - self.disk_maxsize]:
+            try:
+                cache_file.unlink()
+            except FileNotFoundError:
+                continue
+
+    def _lookup(
+        self,
+        key: str,
+        cache_dir: Optional[Path],
+    ) -> Optional[QuantumCircuit]:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self._hits += 1
+            return self._memory[key]
+        if cache_dir is not None:
+            cache_file = cache_dir / f"{key}.qpy"
+            if cache_file.exists():
+                try:
+                    with open(cache_file, "rb") as f:
+                        circuit = qpy.load(f)[0]
+                except Exception:  # pylint: disable=broad-except
+                    return None
+                # The modified time marks the file as recently used for pruning.
+                os.utime(cache_file)
+                self._remember(key, circuit)
+                self._disk_hits += 1
+                return circuit
+        return None
+
+    def transpile(
+        self,
+        circuits: list[QuantumCircuit],
+        backend: Optional[Backend] = None,
+        cache_dir: Optional[Union[Path, str]] = None,
+        **transpile_args: Any,
+    ) -> list[QuantumCircuit]:
+        """Transpile the circuits which are not in the cache in one call,
+        and take the others from the cache.
+
+        Args:
+            circuits (list[QuantumCircuit]): The circuits, which can be parameterized.
+            backend (Optional[Backend], optional): The backend. Defaults to None.
+            cache_dir (Optional[Union[Path, str]], optional):
+                The folder of on-disk cache, which is used only when :attr:`disk_maxsize`
+                is positive. Defaults to None for memory only.
+            **transpile_args: The arguments for :func:`qiskit.transpile`.
+
+        Returns:
+            list[QuantumCircuit]: The transpiled circuits, named as the given circuits.
+        """
+        if self.disk_maxsize <= 0:
+            cache_dir = None
+        if cache_dir is not None:
+            cache_dir = Path(cache_dir)
+            os.makedirs(cache_dir, exist_ok=True)
+
+        backend_print = backend_fingerprint(backend)
+        keys = [
+            transpile_key(circuit_fingerprint(circ), backend_print, transpile_args)
+            for circ in circuits
+        ]
+        found: dict[str, QuantumCircuit] = {}
+        missing: dict[str, QuantumCircuit] = {}
+        for key, circ in zip(keys, circuits):
+            if key in found or key in missing:
+                self._hits += 1
+                continue
+            cached = self._lookup(key, cache_dir)
+            if cached is None:
+                missing[key] = circ
+            else:
+                found[key] = cached
+
+        if len(missing) > 0:
+            self._misses += len(missing)
+            transpiled = transpile(
+                list(missing.values()), backend=backend, **transpile_args
+            )
+            if isinstance(transpiled, QuantumCircuit):
+                transpiled = [transpiled]
+            for key, circ in zip(missing, transpiled):
+                found[key] = circ
+                self._remember(key, circ)
+                if cache_dir is not None:
+                    tmp_file = cache_dir / f"{key}.qpy.{os.getpid()}.tmp"
+                    with open(tmp_file, "wb") as f:
+                        qpy.dump(circ, f)
+                    os.replace(tmp_file, cache_dir / f"{key}.qpy")
+            if cache_dir is not None:
+                self._prune_disk(cache_dir)
+
+        result = []
+        for key, circ in zip(keys, circuits):
+            transpiled_circ = found[key].copy()
+            transpiled_circ.name = circ.name
+            result.append(transpiled_circ)
+        return result
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}(maxsize={self.maxsize}, "
+            + f"disk_maxsize={self.disk_maxsize}, stats={self.stats})>"
+        )
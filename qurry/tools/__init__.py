@@ -5,6 +5,12 @@ Tools (:mod:`qurry.tools`)
 """
 from .command import cmd_wrapper, pytorch_cuda_check
 from .backend import BackendWrapper, BackendManager, version_check, backendName
-from .parallelmanager import ParallelManager, workers_distribution, DEFAULT_POOL_SIZE
+from .parallelmanager import (
+    ParallelManager,
+    shared_parallel_manager,
+    workers_distribution,
+    chunksize_distribution,
+    DEFAULT_POOL_SIZE,
+)
 from .progressbar import qurry_progressbar
 from .datetime import current_time, DatetimeDict
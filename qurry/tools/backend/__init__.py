@@ -11,6 +11,7 @@ from .import_manage import (
     shorten_name,
     version_check,
     backendName,
+    is_noiseless_simulator,
     _real_backend_loader,
     fack_backend_loader,
     IBMQ,
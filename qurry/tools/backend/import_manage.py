@@ -218,6 +218,25 @@ backendName: Callable[[Union[BackendV1, BackendV2, Backend]], str] = lambda back
 )
 
 
+def is_noiseless_simulator(backend: Optional[Backend]) -> bool:
+    """Whether the backend is a simulator without noise model,
+    so its output distribution is the one of the exact statevector.
+
+    Args:
+        backend (Optional[Backend]): The backend.
+
+    Returns:
+        bool: Whether the backend is a noiseless simulator.
+    """
+    if backend is None or not hasattr(backend, "configuration"):
+        return False
+    if isinstance(backend, FakeBackend):
+        return False
+    if not getattr(backend.configuration(), "simulator", False):
+        return False
+    return getattr(getattr(backend, "options", None), "noise_model", None) is None
+
+
 def shorten_name(
     name: str,
     drop: Optional[list[str]] = None,
@@ -4,9 +4,12 @@ ProcessManager (:mod:`qurry.tools.processmanager`)
 ================================================================
 
 """
+import atexit
+import weakref
 import warnings
 from typing import Optional, Iterable, Callable, TypeVar, Any
 from multiprocessing import Pool, cpu_count
+from multiprocessing.pool import Pool as PoolType
 from tqdm.contrib.concurrent import process_map
 
 from .progressbar import default_setup
@@ -61,6 +64,46 @@ def workers_distribution(
     return launch_worker
 
 
+CHUNKS_PER_WORKER = 4
+"""The number of chunks distributed to each worker by :func:`chunksize_distribution`."""
+
+
+def chunksize_distribution(
+    tasks_num: int,
+    workers_num: int,
+    chunks_per_worker: int = CHUNKS_PER_WORKER,
+) -> int:
+    """Distribute the chunksize from the number of tasks and workers.
+
+    Small tasks are sent in chunks to reduce the pickling and IPC overhead,
+    but each worker still receives several chunks for load balancing.
+
+    Args:
+        tasks_num (int): The number of tasks.
+        workers_num (int): The number of workers.
+        chunks_per_worker (int, optional):
+            The number of chunks for each worker. Defaults to CHUNKS_PER_WORKER.
+
+    Returns:
+        int: Chunksize.
+    """
+    chunksize, extra = divmod(tasks_num, max(workers_num, 1) * max(chunks_per_worker, 1))
+    if extra:
+        chunksize += 1
+    return max(chunksize, 1)
+
+
+_LIVE_MANAGERS: "weakref.WeakSet[ParallelManager]" = weakref.WeakSet()
+"""The managers with a running pool, they will be closed at exit."""
+
+
+@atexit.register
+def _close_live_managers() -> None:
+    """Close all running pools at exit."""
+    for manager in list(_LIVE_MANAGERS):
+        manager.close()
+
+
 # pylint: disable=invalid-name
 T_map = TypeVar("T_map")
 T_tgt = TypeVar("T_tgt")
@@ -68,11 +111,23 @@ T_tgt = TypeVar("T_tgt")
 
 
 class ParallelManager:
-    """Process manager for multiprocessing."""
+    """Process manager for multiprocessing.
+
+    When `persistent` is True, or the manager is used as a context manager,
+    the pool is started lazily on the first call and reused by the following calls
+    until :meth:`close` is called. Otherwise, a new pool is created for each call.
+
+    ```python
+    with ParallelManager(4) as pool:
+        first = pool.starmap(func, args_list)
+        second = pool.map(func2, arg_list)  # reuse the same workers
+    ```
+    """
 
     def __init__(
         self,
         workers_num: Optional[int] = DEFAULT_POOL_SIZE,
+        persistent: bool = False,
         **pool_kwargs,
     ):
         """Initialize the process manager.
@@ -80,6 +135,8 @@ class ParallelManager:
         Args:
             workers_num (Optional[int], optional):
                 Desired workers number. Defaults to DEFAULT_POOL_SIZE.
+            persistent (bool, optional):
+                Whether to keep the pool alive between calls. Defaults to False.
             **pool_kwargs: Other arguments for Pool.
         """
 
@@ -92,17 +149,67 @@ class ParallelManager:
 
         self.pool_kwargs = pool_kwargs
         self.workers_num = workers_distribution(workers_num)
+        self.persistent = persistent
+        self._pool: Optional[PoolType] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the persistent pool is started."""
+        return self._pool is not None
+
+    def _get_pool(self) -> PoolType:
+        """Get the persistent pool, start it if it is not started yet.
+
+        Returns:
+            PoolType: The pool.
+        """
+        if self._pool is None:
+            self._pool = Pool(processes=self.workers_num, **self.pool_kwargs)
+            _LIVE_MANAGERS.add(self)
+        return self._pool
+
+    def close(self) -> None:
+        """Close the persistent pool and wait for the workers to exit.
+        The pool will be started again on the next call if the manager is persistent.
+        """
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            _LIVE_MANAGERS.discard(self)
+            pool.close()
+            pool.join()
+
+    def __enter__(self) -> "ParallelManager":
+        self.persistent = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        elif self._pool is not None:
+            pool, self._pool = self._pool, None
+            _LIVE_MANAGERS.discard(self)
+            pool.terminate()
+            pool.join()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
 
     def starmap(
         self,
         func: Callable[..., T_map],
         args_list: Iterable,
+        chunksize: Optional[int] = None,
     ) -> list[T_map]:
         """Multiprocessing starmap.
 
         Args:
             func (Callable[[Iterable[T_tgt]], T_map]): Function to be mapped.
             args_list (Iterable[Iterable[T_tgt]]): Arguments to be mapped.
+            chunksize (Optional[int], optional):
+                The chunksize for the pool.
+                Defaults to None for :func:`chunksize_distribution` by the number of tasks.
 
         Returns:
             list[T_map]: Results.
@@ -111,19 +218,29 @@ class ParallelManager:
         if self.workers_num == 1:
             return list(map(func, *zip(*args_list)))
 
+        args_list = list(args_list)
+        if chunksize is None:
+            chunksize = chunksize_distribution(len(args_list), self.workers_num)
+        if self.persistent:
+            return self._get_pool().starmap(func, args_list, chunksize)
+
         with Pool(processes=self.workers_num, **self.pool_kwargs) as pool:
-            return pool.starmap(func, args_list)
+            return pool.starmap(func, args_list, chunksize)
 
     def map(
         self,
         func: Callable[[T_tgt], T_map],
         arg_list: Iterable[T_tgt],
+        chunksize: Optional[int] = None,
     ) -> list[T_map]:
         """Multiprocessing starmap.
 
         Args:
             func (Callable[[Iterable[T_tgt]], T_map]): Function to be mapped.
             arg_list (Iterable[Iterable[T_tgt]]): Arguments to be mapped.
+            chunksize (Optional[int], optional):
+                The chunksize for the pool.
+                Defaults to None for :func:`chunksize_distribution` by the number of tasks.
 
         Returns:
             list[T_map]: Results.
@@ -132,8 +249,14 @@ class ParallelManager:
         if self.workers_num == 1:
             return list(map(func, arg_list))
 
+        arg_list = list(arg_list)
+        if chunksize is None:
+            chunksize = chunksize_distribution(len(arg_list), self.workers_num)
+        if self.persistent:
+            return self._get_pool().map(func, arg_list, chunksize)
+
         with Pool(processes=self.workers_num, **self.pool_kwargs) as pool:
-            return pool.map(func, arg_list)
+            return pool.map(func, arg_list, chunksize)
 
     def process_map(
         self,
@@ -151,11 +274,18 @@ class ParallelManager:
             bar_format (str, optional): Progress bar format. Defaults to "qurry-full".
             bar_ascii (str, optional): Progress bar ascii. Defaults to "4squares".
             **kwargs: Other arguments.
+                The `chunksize` defaults to :func:`chunksize_distribution` by the number of tasks.
 
         Returns:
             list[T_map]: Results.
         """
 
+        args_list = list(args_list)
+        if "chunksize" not in kwargs:
+            kwargs["chunksize"] = chunksize_distribution(
+                len(args_list), self.workers_num
+            )
+
         result_setup = default_setup(bar_format, bar_ascii)
         actual_bar_format = result_setup["bar_format"]
         actual_ascii = result_setup["ascii"]
@@ -168,3 +298,23 @@ class ParallelManager:
             bar_format=actual_bar_format,
             max_workers=self.workers_num,
         )
+
+
+_SHARED_MANAGERS: dict[int, ParallelManager] = {}
+"""The persistent managers shared by the post-processing, keyed by the number of workers."""
+
+
+def shared_parallel_manager(workers_num: Optional[int] = None) -> ParallelManager:
+    """Get the persistent process manager shared by the post-processing,
+    its pool is started on the first call and reused until it is closed or the interpreter exits.
+
+    Args:
+        workers_num (Optional[int], optional): Desired workers number. Defaults to None.
+
+    Returns:
+        ParallelManager: The process manager.
+    """
+    launch_worker = workers_distribution(workers_num)
+    if launch_worker not in _SHARED_MANAGERS:
+        _SHARED_MANAGERS[launch_worker] = ParallelManager(launch_worker, persistent=True)
+    return _SHARED_MANAGERS[launch_worker]
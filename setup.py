@@ -4,6 +4,7 @@ Setup Script for Qurry
 ================================================================
 
 """
+import sys
 from pathlib import Path
 from setuptools import setup, Extension
 from setuptools_rust import Binding, RustExtension
@@ -27,6 +28,19 @@ def re_cythonize(extensions, **kwargs) -> list[Extension]:
         return []
 
 
+def openmp_flags() -> tuple[list[str], list[str]]:
+    """The compile and link flags of OpenMP for `prange` in Cython extensions.
+    The compiler of macOS does not ship OpenMP, so `prange` runs serially there.
+    """
+    if sys.platform.startswith("linux"):
+        return ["-fopenmp"], ["-fopenmp"]
+    if sys.platform == "win32":
+        return ["/openmp"], []
+    return [], []
+
+
+openmp_compile_args, openmp_link_args = openmp_flags()
+
 rust_extension = [
     RustExtension(
         "qurry.boorust",
@@ -37,7 +51,12 @@ rust_extension = [
 ]
 
 cy_extensions = [
-    Extension("qurry.boost.randomized", ["qurry/boost/randomized.pyx"]),
+    Extension(
+        "qurry.boost.randomized",
+        ["qurry/boost/randomized.pyx"],
+        extra_compile_args=openmp_compile_args,
+        extra_link_args=openmp_link_args,
+    ),
     Extension("qurry.boost.inputfixer", ["qurry/boost/inputfixer.pyx"]),
 ]
 
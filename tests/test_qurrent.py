@@ -4,9 +4,19 @@ Test the qurry.qurrent module EntropyMeasure class.
 ================================================================
 
 """
+import os
+import json
+import shutil
 import pytest
 import numpy as np
 from qurry.qurrent import EntropyMeasure
+from qurry.exceptions import QurryStatevectorReuseUnavailable
+from qurry.qurrium.experiment.container import BINARY_TALES_SUFFIX
+from qurry.qurrium.experiment.export import file_content_hash
+from qurry.qurrium.multimanager.process import parallel_exporter_and_writer
+from qurry.qurrium.utils.archive import write_archive, member_name
+from qurry.qurrium.utils.catalog import ExperimentCatalog, DEFAULT_CATALOG_NAME
+from qurry.tools import ParallelManager
 from qurry.tools.backend import GeneralAerSimulator
 from qurry.capsule import mori, hoshi
 from qurry.recipe import TrivialParamagnet, GHZ, TopologicalParamagnet
@@ -63,3 +73,416 @@ def test_quantity_02(tgt):
     expDemo02.exps[exp_id].analyze(2)
     quantity = expDemo02.exps[exp_id].reports[0].content._asdict()
     assert all(["entropy" in quantity, "purity" in quantity])
+
+
+@pytest.mark.parametrize("tgt", wave_adds_02)
+def test_quantity_03(tgt):
+    """Test the quantity of entropy and purity with the parameterized template.
+
+    Args:
+        tgt (Hashable): The target wave key in Qurry.
+    """
+
+    exp_id = expDemo02.measure(wave=tgt, times=10, backend=backend, parameterized=True)
+    assert len(expDemo02.exps[exp_id].beforewards.circuit) == 10
+    assert all(
+        len(circ.parameters) == 0 for circ in expDemo02.exps[exp_id].beforewards.circuit
+    )
+    assert expDemo02.exps[exp_id].beforewards.side_product["unitaryOP"].shape[:2] == (
+        10,
+        expDemo02.waves[tgt].num_qubits,
+    )
+    expDemo02.exps[exp_id].analyze(2)
+    quantity = expDemo02.exps[exp_id].reports[0].content._asdict()
+    assert all(["entropy" in quantity, "purity" in quantity])
+
+
+def test_statevector_reuse():
+    """Test the counts are sampled from the statevector,
+    and the simulation falls back to the backend
+    when the measure range is not inside unitary_loc."""
+
+    exp_id = expDemo02.measure(
+        wave=wave_adds_02[0], times=10, backend=backend, statevector_reuse=True
+    )
+    counts = expDemo02.exps[exp_id].afterwards.counts
+    assert len(counts) == 10
+    assert all(sum(c.values()) == expDemo02.exps[exp_id].commons.shots for c in counts)
+
+    current_exp = expDemo02.exps[exp_id]
+    current_exp.args = current_exp.args._replace(measure=(0, 4), unitary_loc=(1, 3))
+    with pytest.warns(QurryStatevectorReuseUnavailable):
+        assert expDemo02.simulate(exp_id) is None
+
+
+def test_multi_output_statevector_reuse(tmp_path):
+    """Test the experiments with `statevector_reuse` are sampled
+    without executing their circuits in the jobs of multiOutput.
+
+    Args:
+        tmp_path (Path): The temporary folder.
+    """
+
+    config_list = [
+        {"wave": wave_adds_02[0], "times": 10, "statevector_reuse": True},
+        {"wave": wave_adds_02[1], "times": 10, "statevector_reuse": True},
+        {"wave": wave_adds_02[0], "times": 10},
+    ]
+    summoner_id = expDemo02.multiOutput(
+        config_list,
+        backend=backend,
+        summoner_name="statevector_reuse",
+        save_location=tmp_path,
+    )
+    current_multimanager = expDemo02.multimanagers[summoner_id]
+    exps_config = current_multimanager.beforewards.exps_config
+    assert len(current_multimanager.beforewards.job_id) == 1
+    assert len(current_multimanager.beforewards.circuits_map) == 1
+    for exp_id in exps_config:
+        counts = expDemo02.exps[exp_id].afterwards.counts
+        assert len(counts) == 10
+        shots = expDemo02.exps[exp_id].commons.shots
+        assert all(sum(c.values()) == shots for c in counts)
+        assert current_multimanager.afterwards.allCounts[exp_id] == counts
+
+
+def test_multi_output_parameterized(tmp_path):
+    """Test the plain and parameterized configs are built and executed together.
+
+    Args:
+        tmp_path (Path): The temporary folder.
+    """
+
+    config_list = [
+        {"wave": wave_adds_02[0], "times": 10},
+        {"wave": wave_adds_02[1], "times": 10, "parameterized": True},
+        {"wave": wave_adds_02[0], "times": 10, "parameterized": True},
+    ]
+    summoner_id = expDemo02.multiOutput(
+        config_list,
+        backend=backend,
+        summoner_name="mixed_parameterized",
+        save_location=tmp_path,
+    )
+    exps_config = expDemo02.multimanagers[summoner_id].beforewards.exps_config
+    assert len(exps_config) == len(config_list)
+    for exp_id in exps_config:
+        current_exp = expDemo02.exps[exp_id]
+        assert len(current_exp.beforewards.circuit) == 10
+        assert all(len(circ.parameters) == 0 for circ in current_exp.beforewards.circuit)
+        assert len(current_exp.afterwards.counts) == 10
+
+
+def test_multi_analysis_binary_counts(tmp_path):
+    """Test the analysis of multimanager with binary counts leaves the counts untouched.
+
+    Args:
+        tmp_path (Path): The temporary folder.
+    """
+
+    summoner_id = expDemo02.multiOutput(
+        [{"wave": wave_adds_02[0], "times": 10}] * 2,
+        backend=backend,
+        summoner_name="binary_counts_analysis",
+        save_location=tmp_path,
+        filetype="npy",
+    )
+    multimanager = expDemo02.multimanagers[summoner_id]
+    qurryinfo_location = multimanager.multicommons.export_location / "qurryinfo.json"
+    with open(qurryinfo_location, encoding="utf-8") as f:
+        qurryinfo = json.load(f)
+    counts_files = ["legacy", "legacy.counts"]
+    mtimes = {
+        (exp_id, k): os.stat(tmp_path / files[k]).st_mtime_ns
+        for exp_id, files in qurryinfo.items()
+        for k in counts_files
+    }
+
+    expDemo02.multiAnalysis(
+        summoner_id,
+        specific_analysis_args={
+            exp_id: {"degree": 2} for exp_id in multimanager.beforewards.exps_config
+        },
+    )
+    with open(qurryinfo_location, encoding="utf-8") as f:
+        analyzed_qurryinfo = json.load(f)
+    for exp_id, files in analyzed_qurryinfo.items():
+        for k in counts_files:
+            assert files[k] == qurryinfo[exp_id][k]
+            assert files["hashes"][k] == qurryinfo[exp_id]["hashes"][k]
+            assert os.stat(tmp_path / files[k]).st_mtime_ns == mtimes[(exp_id, k)]
+
+
+def test_parallel_exporter_and_writer(tmp_path):
+    """Test the experiments exported and written by workers are marked clean in main process.
+
+    Args:
+        tmp_path (Path): The temporary folder.
+    """
+
+    summoner_id = expDemo02.multiOutput(
+        [{"wave": wave_adds_02[1], "times": 10}] * 3,
+        backend=backend,
+        summoner_name="parallel_writer",
+        save_location=tmp_path,
+    )
+    multimanager = expDemo02.multimanagers[summoner_id]
+    with open(
+        multimanager.multicommons.export_location / "qurryinfo.json", encoding="utf-8"
+    ) as f:
+        qurryinfo = json.load(f)
+    exp_ids = list(multimanager.beforewards.exps_config)
+    for exp_id in exp_ids:
+        expDemo02.exps[exp_id].analyze(2)
+
+    with ParallelManager(2) as pool:
+        rewritten = parallel_exporter_and_writer(
+            exp_ids,
+            expDemo02.exps,
+            multimanager.multicommons.save_location,
+            pool,
+            jsonable=True,
+            batch_size=2,
+        )
+    for exp_id in exp_ids:
+        current_exp = expDemo02.exps[exp_id]
+        files = rewritten[exp_id]
+        assert current_exp.dirty_sections == set()
+        assert current_exp.written_hashes == files["hashes"]
+        assert files["args"].endswith(f"{current_exp.commons.filename}.args.json")
+        assert files["hashes"]["legacy"] == qurryinfo[exp_id]["hashes"]["legacy"]
+        assert files["hashes"]["reports"] != qurryinfo[exp_id]["hashes"]["reports"]
+        for k, file_hash in files["hashes"].items():
+            assert file_hash == file_content_hash(tmp_path / files[k])
+
+
+def test_multi_write_compress_overwrite(tmp_path):
+    """Test the deprecated `compress_overwrite` warns and the archive is still replaced.
+
+    Args:
+        tmp_path (Path): The temporary folder.
+    """
+
+    summoner_id = expDemo02.multiOutput(
+        [{"wave": wave_adds_02[0], "times": 10}],
+        backend=backend,
+        summoner_name="compress_overwrite",
+        save_location=tmp_path,
+    )
+    expDemo02.multiWrite(summoner_id, compress=True)
+    with pytest.warns(DeprecationWarning):
+        expDemo02.multiWrite(summoner_id, compress=True, compress_overwrite=True)
+    assert len(list(tmp_path.glob("compress_overwrite.*.tar.xz"))) == 1
+
+
+@pytest.mark.parametrize("binary_tales", [True, False])
+def test_binary_tales(tmp_path, binary_tales):
+    """Test the side products are written as `.npy` or json and read back the same.
+
+    Args:
+        tmp_path (Path): The temporary folder.
+        binary_tales (bool): Whether to write the side products as `.npy`.
+    """
+
+    exp_id = expDemo02.measure(wave=wave_adds_02[4], times=10, backend=backend)
+    side_product = expDemo02.exps[exp_id].beforewards.side_product
+    _, files = expDemo02.exps[exp_id].write(
+        save_location=tmp_path, binary_tales=binary_tales
+    )
+    for k, v in side_product.items():
+        assert files[f"tales.{k}"].endswith(BINARY_TALES_SUFFIX) == (
+            binary_tales and isinstance(v, np.ndarray)
+        )
+        assert (tmp_path / files[f"tales.{k}"]).exists()
+
+    read_exp = expDemo02.experiment.read(name_or_id=files["folder"], save_location=tmp_path)[0]
+    read_side_product = read_exp.beforewards.side_product
+    assert set(read_side_product) == set(side_product)
+    for k, v in side_product.items():
+        if isinstance(v, np.ndarray):
+            # The complex numbers in json are strings like '(1+0j)'.
+            read_array = np.asarray(read_side_product[k]).astype(v.dtype)
+            assert isinstance(read_side_product[k], np.ndarray) == binary_tales
+            assert np.array_equal(read_array, v)
+        else:
+            assert read_side_product[k] == v
+
+
+def test_incremental_write(tmp_path):
+    """Test the unchanged sections are not written again after read and analysis.
+
+    Args:
+        tmp_path (Path): The temporary folder.
+    """
+
+    exp_id = expDemo02.measure(wave=wave_adds_02[0], times=10, backend=backend)
+    _, files = expDemo02.exps[exp_id].write(save_location=tmp_path)
+    unchanged = ["advent", "legacy"] + [k for k in files if k.startswith("tales.")]
+    mtimes = {k: os.stat(tmp_path / files[k]).st_mtime_ns for k in unchanged}
+
+    read_exp = expDemo02.experiment.read(name_or_id=files["folder"], save_location=tmp_path)[0]
+    assert read_exp.dirty_sections == set()
+    assert read_exp.written_hashes == files["hashes"]
+    read_exp.analyze(2)
+    assert set(read_exp.unchanged_files(files, tmp_path)) == set(unchanged)
+
+    _, rewritten = read_exp.write(save_location=tmp_path)
+    assert rewritten["folder"] == files["folder"]
+    for k in unchanged:
+        assert rewritten["hashes"][k] == files["hashes"][k]
+        assert os.stat(tmp_path / files[k]).st_mtime_ns == mtimes[k]
+    assert rewritten["hashes"]["reports"] != files["hashes"]["reports"]
+    assert rewritten["hashes"]["reports"] == file_content_hash(tmp_path / files["reports"])
+    with open(tmp_path / files["qurryinfo"], encoding="utf-8") as f:
+        assert json.load(f)[exp_id]["hashes"] == rewritten["hashes"]
+
+
+def test_incremental_write_current_directory(tmp_path, monkeypatch):
+    """Test the experiment is written again into the same folder of the current directory.
+
+    Args:
+        tmp_path (Path): The temporary folder.
+        monkeypatch (pytest.MonkeyPatch): The monkeypatch.
+    """
+
+    monkeypatch.chdir(tmp_path)
+    exp_id = expDemo02.measure(wave=wave_adds_02[0], times=10, backend=backend)
+    _, files = expDemo02.exps[exp_id].write(save_location="./")
+    legacy_mtime = os.stat(tmp_path / files["legacy"]).st_mtime_ns
+
+    read_exp = expDemo02.experiment.read(name_or_id=files["folder"], save_location="./")[0]
+    _, rewritten = read_exp.write(save_location="./")
+    assert rewritten["folder"] == files["folder"]
+    assert rewritten["legacy"] == files["legacy"]
+    assert os.stat(tmp_path / files["legacy"]).st_mtime_ns == legacy_mtime
+    for k, file_hash in rewritten["hashes"].items():
+        assert file_hash == file_content_hash(tmp_path / rewritten[k])
+
+    another_id = expDemo02.measure(wave=wave_adds_02[0], times=10, backend=backend)
+    _, another_files = expDemo02.exps[another_id].write(save_location="./")
+    assert another_files["folder"] != files["folder"]
+
+
+def test_incremental_write_changed(tmp_path):
+    """Test the changed section is written again with its hash updated.
+
+    Args:
+        tmp_path (Path): The temporary folder.
+    """
+
+    exp_id = expDemo02.measure(wave=wave_adds_02[1], times=10, backend=backend)
+    _, files = expDemo02.exps[exp_id].write(save_location=tmp_path)
+    advent_mtime = os.stat(tmp_path / files["advent"]).st_mtime_ns
+
+    read_exp = expDemo02.experiment.read(name_or_id=files["folder"], save_location=tmp_path)[0]
+    read_exp.unlock_afterward(mute_auto_lock=True)
+    read_exp["counts"] = [
+        {"0" * len(next(iter(c))): sum(c.values())} for c in read_exp.afterwards.counts
+    ]
+    assert read_exp.dirty_sections == {"legacy"}
+    assert "legacy" not in read_exp.unchanged_files(files, tmp_path)
+
+    _, rewritten = read_exp.write(save_location=tmp_path)
+    assert rewritten["hashes"]["legacy"] != files["hashes"]["legacy"]
+    assert rewritten["hashes"]["legacy"] == file_content_hash(tmp_path / files["legacy"])
+    assert rewritten["hashes"]["advent"] == files["hashes"]["advent"]
+    assert os.stat(tmp_path / files["advent"]).st_mtime_ns == advent_mtime
+    assert read_exp.dirty_sections == set()
+
+    reread_exp = expDemo02.experiment.read(name_or_id=files["folder"], save_location=tmp_path)[0]
+    assert [dict(c) for c in reread_exp.afterwards.counts] == [
+        dict(c) for c in read_exp.afterwards.counts
+    ]
+
+
+def test_lazy_read(tmp_path):
+    """Test the experiment read lazily loads its sections on first access.
+
+    Args:
+        tmp_path (Path): The temporary folder.
+    """
+
+    exp_id = expDemo02.measure(wave=wave_adds_02[0], times=10, backend=backend)
+    expDemo02.exps[exp_id].analyze(2)
+    _, files = expDemo02.exps[exp_id].write(save_location=tmp_path)
+
+    lazy_exp = expDemo02.experiment.read(
+        name_or_id=files["folder"], save_location=tmp_path, lazy=True
+    )[0]
+    assert lazy_exp.exp_id == exp_id
+    assert lazy_exp.loaded_sections == ()
+
+    assert lazy_exp.afterwards.counts == expDemo02.exps[exp_id].afterwards.counts
+    assert lazy_exp.loaded_sections == ("legacy",)
+    lazy_report = next(iter(lazy_exp.reports.values()))
+    assert (
+        lazy_report.content._asdict()["purity"]
+        == expDemo02.exps[exp_id].reports[0].content._asdict()["purity"]
+    )
+    assert lazy_exp.release() == ("legacy", "reports")
+    assert lazy_exp.loaded_sections == ()
+
+    _, rewritten = lazy_exp.write(save_location=tmp_path)
+    assert lazy_exp.loaded_sections == ()
+    assert set(rewritten) == set(files)
+    for k in rewritten["hashes"]:
+        assert rewritten["hashes"][k] == files["hashes"][k], f"{k} is rewritten."
+
+
+def test_binary_counts(tmp_path):
+    """Test the counts written as binary table are read back as the same counts.
+
+    Args:
+        tmp_path (Path): The temporary folder.
+    """
+
+    exp_id = expDemo02.measure(wave=wave_adds_02[1], times=10, backend=backend)
+    _, files = expDemo02.exps[exp_id].write(save_location=tmp_path, binary_counts=True)
+    assert files["legacy.counts"].endswith(".counts.npy")
+
+    read_exp = expDemo02.experiment.read(
+        name_or_id=files["folder"], save_location=tmp_path
+    )[0]
+    assert [dict(c) for c in read_exp.afterwards.counts] == [
+        dict(c) for c in expDemo02.exps[exp_id].afterwards.counts
+    ]
+
+
+def test_read_from_archive(tmp_path):
+    """Test the experiment is read straight from the archive without extracting it.
+
+    Args:
+        tmp_path (Path): The temporary folder.
+    """
+
+    exp_id = expDemo02.measure(wave=wave_adds_02[2], times=10, backend=backend)
+    _, files = expDemo02.exps[exp_id].write(save_location=tmp_path)
+    folder = member_name(files["folder"])
+    write_archive(tmp_path / folder, folder, shards=2)
+    shutil.rmtree(tmp_path / folder)
+
+    read_exp = expDemo02.experiment.read(name_or_id=folder, save_location=tmp_path)[0]
+    assert not (tmp_path / folder).exists()
+    assert read_exp.exp_id == exp_id
+    assert [dict(c) for c in read_exp.afterwards.counts] == [
+        dict(c) for c in expDemo02.exps[exp_id].afterwards.counts
+    ]
+
+
+def test_catalog(tmp_path):
+    """Test the written experiment is indexed by the catalog with its quantities.
+
+    Args:
+        tmp_path (Path): The temporary folder.
+    """
+
+    catalog = ExperimentCatalog(tmp_path / DEFAULT_CATALOG_NAME)
+    exp_id = expDemo02.measure(wave=wave_adds_02[3], times=10, backend=backend)
+    expDemo02.exps[exp_id].analyze(2)
+    _, files = expDemo02.exps[exp_id].write(save_location=tmp_path, catalog=catalog)
+
+    entries = catalog.query(wave_key=wave_adds_02[3], quantities={"purity": (None, None)})
+    assert [entry.exp_id for entry in entries] == [exp_id]
+    assert entries[0].path() == tmp_path / files["folder"]
+    assert entries[0].path().exists()
+    assert "purity" in catalog.quantities([exp_id])[exp_id]["0"]
@@ -5,8 +5,23 @@ Test the qurry.qurrent module EntropyMeasure class.
 
 """
 
+import time
+import shutil
 import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.providers.jobstatus import JobStatus
 from qurry.qurrium import WavesExecuter, SamplingExecuter
+from qurry.qurrium.runner.jobcollector import collect_jobs
+from qurry.qurrium.utils import (
+    TranspileCache,
+    CircuitTemplate,
+    transpile_templates,
+    ArchiveReader,
+    write_archive,
+    read_archive,
+    find_archive,
+)
 from qurry.tools.backend import GeneralAerSimulator
 from qurry.capsule import mori, hoshi
 from qurry.recipe import TrivialParamagnet, GHZ, TopologicalParamagnet
@@ -61,3 +76,160 @@ def test_quantity_02(tgt):
     exp_demo_02.exps[exp_id].analyze()
     quantity = exp_demo_02.exps[exp_id].reports[0].content._asdict()
     assert all(["dummy" in quantity, "utlmatic_answer" in quantity])
+
+
+class SleepingJob:
+    """A fake job which finishes after sleeping."""
+
+    def __init__(self, name: str, duration: float):
+        self.name = name
+        self.finish_at = time.time() + duration
+
+    def job_id(self):
+        """The ID of the job."""
+        return self.name
+
+    def status(self):
+        """The status of the job."""
+        return JobStatus.DONE if time.time() >= self.finish_at else JobStatus.RUNNING
+
+    def result(self):
+        """The result of the job."""
+        return f"result-{self.name}"
+
+
+def test_collect_jobs():
+    """Test the jobs are waited concurrently and yielded when they finish."""
+
+    durations = {"slow": 0.6, "fast": 0.1, "medium": 0.3}
+    begin = time.time()
+    collected = list(
+        collect_jobs(
+            {k: (lambda k=k, d=d: SleepingJob(k, d)) for k, d in durations.items()},
+            interval=0.05,
+        )
+    )
+    taken = time.time() - begin
+
+    assert [key for key, _, _, _ in collected] == ["fast", "medium", "slow"]
+    assert all(
+        result == f"result-{key}" and error is None
+        for key, _, result, error in collected
+    )
+    assert taken < sum(durations.values()), "Jobs are not waited concurrently."
+
+
+def test_transpile_cache(tmp_path):
+    """Test the transpile cache skips the circuits transpiled before."""
+
+    circuits = [exp_demo_01.waves[tgt] for tgt in wave_adds_01]
+    cache = TranspileCache(disk_maxsize=len(circuits))
+    first = cache.transpile(circuits, backend=backend, cache_dir=tmp_path)
+    assert cache.stats.misses == len(circuits)
+
+    second = cache.transpile(circuits, backend=backend)
+    assert cache.stats.misses == len(circuits)
+    assert cache.stats.hits == len(circuits)
+    assert [c.name for c in second] == [c.name for c in circuits]
+    assert all(a == b for a, b in zip(first, second))
+
+    another_cache = TranspileCache()
+    another_cache.transpile(circuits, backend=backend, cache_dir=tmp_path / "memory")
+    assert another_cache.stats.misses == len(circuits)
+    assert not (tmp_path / "memory").exists(), "The on-disk cache is not opt-in."
+
+    another_cache = TranspileCache(disk_maxsize=len(circuits))
+    another_cache.transpile(circuits, backend=backend, cache_dir=tmp_path)
+    assert another_cache.stats.disk_hits == len(circuits)
+    assert another_cache.stats.misses == 0
+
+    bounded_cache = TranspileCache(disk_maxsize=2)
+    bounded_cache.transpile(circuits, backend=backend, cache_dir=tmp_path / "bounded")
+    assert len(list((tmp_path / "bounded").glob("*.qpy"))) == 2
+
+
+def test_transpile_cache_template():
+    """Test the parameterized template goes through the transpile cache."""
+
+    theta = Parameter("theta")
+    template_circuit = QuantumCircuit(2, 2)
+    template_circuit.rx(theta, 0)
+    template_circuit.cx(0, 1)
+    template_circuit.measure([0, 1], [0, 1])
+    template = CircuitTemplate(
+        template_circuit,
+        [{theta: 0.1 * i} for i in range(3)],
+        [f"bound-{i}" for i in range(3)],
+    )
+
+    cache = TranspileCache()
+    first = transpile_templates([template], backend=backend, cache=cache)
+    assert cache.stats.misses == 1
+    assert [c.name for c in first] == template.names
+    assert all(len(c.parameters) == 0 for c in first)
+
+    # The same structure with another Parameter object of the same name hits the cache.
+    another_theta = Parameter("theta")
+    another_circuit = template_circuit.assign_parameters({theta: another_theta})
+    second = transpile_templates(
+        [
+            CircuitTemplate(
+                another_circuit,
+                [{another_theta: v} for values in template.values for v in values.values()],
+                template.names,
+            )
+        ],
+        backend=backend,
+        cache=cache,
+    )
+    assert cache.stats.misses == 1 and cache.stats.hits == 1
+    assert all(a == b for a, b in zip(first, second))
+
+
+@pytest.mark.parametrize("codec, shards", [("xz", 1), ("xz", 3), ("tar", 2)])
+def test_sharded_archive(tmp_path, codec, shards):
+    """Test the sharded archive is decompressed as the same files."""
+
+    export_location = tmp_path / "exps.qurry.001"
+    (export_location / "exps").mkdir(parents=True)
+    contents = {
+        f"exps/{i}.json": "".join(str(j) for j in range(100 * i)) for i in range(8)
+    }
+    for name, content in contents.items():
+        (export_location / name).write_text(content, encoding="utf-8")
+
+    _, stats = write_archive(export_location, export_location.name, codec, shards=shards)
+    assert stats.shards == shards
+    found = find_archive(tmp_path, export_location.name)
+    assert found is not None and found[0] == codec and len(found[1]) == shards
+
+    for name in contents:
+        (export_location / name).unlink()
+    stats = read_archive(tmp_path, export_location.name, codec=codec)
+    assert stats.raw_bytes == sum(len(content) for content in contents.values())
+    for name, content in contents.items():
+        assert (export_location / name).read_text(encoding="utf-8") == content
+
+
+def test_archive_reader(tmp_path):
+    """Test the files are read from the archive by the member index in any order."""
+
+    export_location = tmp_path / "exps.qurry.002"
+    (export_location / "args").mkdir(parents=True)
+    contents = {
+        f"exps.qurry.002/args/{i}.json": f'{{"index": {i}, "pad": "{"x" * 1000 * i}"}}'
+        for i in range(6)
+    }
+    for name, content in contents.items():
+        (tmp_path / name).write_text(content, encoding="utf-8")
+    write_archive(export_location, export_location.name, shards=2)
+    shutil.rmtree(export_location)
+
+    with ArchiveReader(tmp_path, export_location.name) as reader:
+        assert len(reader.members) == len(contents)
+        for name in reversed(list(contents)):
+            assert reader.read_json(f"./{name}")["index"] == int(name.split("/")[-1][0])
+        reader.prefetch(contents)
+        for name, content in contents.items():
+            assert reader.read_bytes(name).decode("utf-8") == content
+    assert not export_location.exists()
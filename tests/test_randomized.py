@@ -10,10 +10,41 @@ import os
 import warnings
 import pytest
 import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Statevector, DensityMatrix, random_statevector, partial_trace
 
 from qurry.capsule import quickRead
 from qurry.process.exceptions import PostProcessingRustUnavailableWarning
 from qurry.process.randomized_measure.entangled_entropy import entangled_entropy_core
+from qurry.process.randomized_measure.entropy_core import (
+    entangled_entropy_core_batch,
+    PostProcessingBackendStatement as entropy_core_statement,
+)
+from qurry.process.utils.construct import (
+    PostProcessingBackendStatement as construct_statement,
+)
+from qurry.process.randomized_measure.wavefunction_overlap import overlap_echo_core
+from qurry.tools import ParallelManager, shared_parallel_manager
+from qurry.process.exact_purity import (
+    partial_trace_purity,
+    exact_entangled_entropy,
+    bitstring_range_qubits,
+)
+from qurry.process.utils.counts import (
+    PackedCounts,
+    pack_counts,
+    flatten_packed_counts,
+    share_counts,
+    shared_counts_item,
+    release_shared_counts,
+)
+from qurry.qurrium.utils.randomized import (
+    random_unitary_batch,
+    batch_pauli_coeff,
+    qubit_operator_to_pauli_coeff,
+    unitary_to_u_angles,
+    local_unitary_sampled_counts,
+)
 from qurry.process.utils.randomized import (
     RUST_AVAILABLE as rust_available_randomized,
     CYTHON_AVAILABLE as cython_available_randomized,
@@ -121,3 +152,344 @@ def test_entangled_entropy_core(
         )
         < 1e-10
     ), "Cython and Python results are not equal in entangled_entropy_core."
+
+
+@pytest.mark.parametrize("test_items", test_setup_core)
+def test_entangled_entropy_core_histogram(
+    test_items: tuple[
+        int, list[dict[str, int]], Union[int, tuple[int, int]], tuple[int, int]
+    ]
+):
+    """Test the entangled_entropy_core function with the histogram backend."""
+
+    hist = entangled_entropy_core(*test_items, backend="Histogram")
+    py = entangled_entropy_core(*test_items, backend="Python")
+
+    assert (
+        np.abs(
+            np.average(np.array(list(hist[0].values())))
+            - np.average(np.array(list(py[0].values())))
+        )
+        < 1e-10
+    ), "Histogram and Python results are not equal in entangled_entropy_core."
+
+
+@pytest.mark.parametrize("test_items", test_setup_core)
+def test_entangled_entropy_core_numpy(
+    test_items: tuple[
+        int, list[dict[str, int]], Union[int, tuple[int, int]], tuple[int, int]
+    ]
+):
+    """Test the entangled_entropy_core function with the NumPy backend."""
+
+    vectorized = entangled_entropy_core(*test_items, backend="NumPy")
+    py = entangled_entropy_core(*test_items, backend="Python")
+
+    for idx, value in py[0].items():
+        assert (
+            np.abs(vectorized[0][idx] - value) < 1e-10
+        ), f"NumPy and Python results are not equal in cell {idx}."
+
+
+def test_numpy_backend_availability():
+    """Test the NumPy backend is only declared by the modules which have it."""
+
+    assert entropy_core_statement[1]["NumPy"] is True
+    assert "NumPy" not in construct_statement[1]
+
+
+@pytest.mark.parametrize("test_items", test_setup_core)
+def test_entangled_entropy_core_packed(
+    test_items: tuple[
+        int, list[dict[str, int]], Union[int, tuple[int, int]], tuple[int, int]
+    ]
+):
+    """Test the entangled_entropy_core function with packed counts."""
+
+    shots, counts, degree, measure = test_items
+    packed_items = (shots, pack_counts(counts), degree, measure)
+
+    outcomes, values, offsets, num_bits = flatten_packed_counts(counts)
+    assert num_bits == len(next(iter(counts[0])))
+    assert offsets[-1] == len(outcomes) == len(values)
+    assert values[offsets[0] : offsets[1]].sum() == shots
+
+    backends = ["Python", "NumPy", "Histogram"] + (
+        ["Rust"] if rust_available_randomized else []
+    )
+    for backend in backends:
+        packed = entangled_entropy_core(*packed_items, backend=backend)
+        py = entangled_entropy_core(*test_items, backend="Python")
+
+        assert (
+            np.abs(
+                np.average(np.array(list(packed[0].values())))
+                - np.average(np.array(list(py[0].values())))
+            )
+            < 1e-10
+        ), f"Packed counts by {backend} and Python results are not equal."
+
+
+def test_packed_counts_keys():
+    """Test the keys of packed counts with register separators and empty slices."""
+
+    packed = PackedCounts.from_dict({"01 10": 3, "11 00": 5})
+    assert packed.num_bits == 4
+    assert packed.to_dict() == {"0110": 3, "1100": 5}
+    assert packed["01 10"] == packed["0110"] == 3
+    assert packed.marginal((2, 2)).to_dict() == {"": 8}
+
+
+def test_entangled_entropy_core_shared_counts():
+    """Test the entangled_entropy_core function with counts in shared memory."""
+
+    shm, block = share_counts(large_dummy_list[:5])
+    try:
+        for i, single_counts in enumerate(large_dummy_list[:5]):
+            assert shared_counts_item(block, i).to_dict() == single_counts
+    finally:
+        release_shared_counts(shm)
+
+    shared = entangled_entropy_core(
+        4096,
+        large_dummy_list,
+        6,
+        (0, 8),
+        backend="Python",
+        multiprocess_pool_size=2,
+        shared_counts=True,
+    )
+    py = entangled_entropy_core(4096, large_dummy_list, 6, (0, 8), backend="Python")
+    assert shared[0] == py[0], "Shared counts and Python results are not equal."
+
+
+@pytest.mark.skipif(
+    (os.cpu_count() or 1) < 2, reason="The pool is not started for a single worker."
+)
+def test_persistent_parallel_manager():
+    """Test the persistent process manager reuses its pool until closed."""
+
+    manager = ParallelManager(2, persistent=True)
+    assert manager.starmap(pow, [(2, 3), (3, 2)]) == [8, 9]
+    pool = manager._pool
+    assert pool is not None, "The pool should be kept after the first call."
+    assert manager.starmap(pow, [(2, 2), (3, 3)]) == [4, 27]
+    assert manager._pool is pool, "The pool should be reused by the second call."
+
+    manager.close()
+    assert not manager.is_running, "The pool should be shut down after closing."
+    assert shared_parallel_manager(2) is shared_parallel_manager(2)
+
+    with ParallelManager(2, persistent=True) as given:
+        pooled = entangled_entropy_core(
+            4096, large_dummy_list, 6, (0, 8), backend="Python", pool=given
+        )
+        assert given.is_running, "The given pool should be used by the core."
+    py = entangled_entropy_core(4096, large_dummy_list, 6, (0, 8), backend="Python")
+    assert pooled[0] == py[0], "Results with the given pool are not equal."
+
+
+test_setup_echo: list[
+    tuple[int, list[dict[str, int]], Union[int, tuple[int, int]], tuple[int, int]]
+] = [
+    (4096, large_dummy_list, 6, (0, 8)),
+    (4096, large_dummy_list, (2, 8), (0, 8)),
+    (4096, large_dummy_list, (0, 7), (0, 8)),
+]
+
+
+@pytest.mark.parametrize("test_items", test_setup_echo)
+def test_overlap_echo_core(
+    test_items: tuple[
+        int, list[dict[str, int]], Union[int, tuple[int, int]], tuple[int, int]
+    ]
+):
+    """Test the overlap_echo_core function."""
+
+    py = overlap_echo_core(*test_items, backend="Python")
+
+    if rust_available_randomized:
+        rust = overlap_echo_core(*test_items, backend="Rust")
+        assert (
+            np.abs(
+                np.average(np.array(list(rust[0].values())))
+                - np.average(np.array(list(py[0].values())))
+            )
+            < 1e-10
+        ), "Rust and Python results are not equal in overlap_echo_core."
+
+    if cython_available_randomized:
+        cy = overlap_echo_core(*test_items, backend="Cython")
+        assert (
+            np.abs(
+                np.average(np.array(list(cy[0].values())))
+                - np.average(np.array(list(py[0].values())))
+            )
+            < 1e-10
+        ), "Cython and Python results are not equal in overlap_echo_core."
+
+    vectorized = overlap_echo_core(*test_items, backend="NumPy")
+    for idx, value in py[0].items():
+        assert (
+            np.abs(vectorized[0][idx] - value) < 1e-10
+        ), f"NumPy and Python results are not equal in overlap_echo_core cell {idx}."
+
+
+def test_overlap_echo_core_expected():
+    """Test the overlap_echo_core function against the hand-computed echo cells.
+
+    The echo cell is `2^n * sum_{s, s'} (-2)^(-D(s, s')) * P_1(s) * P_2(s')`,
+    for the pair of `{"00": 2, "11": 2}` and `{"00": 4}`,
+    it is `4 * (0.5 * 1 + 0.25 * 0.5 * 1) = 2.5`,
+    and for the pair of `{"01": 4}` and `{"10": 4}`, it is `4 * 0.25 = 1.0`.
+    """
+
+    counts = [{"00": 2, "11": 2}, {"01": 4}, {"00": 4}, {"10": 4}]
+    expected = {0: 2.5, 1: 1.0}
+
+    backends = (
+        ["Python", "NumPy"]
+        + (["Rust"] if rust_available_randomized else [])
+        + (["Cython"] if cython_available_randomized else [])
+    )
+    for backend in backends:
+        for packed in (counts, pack_counts(counts)):
+            result = overlap_echo_core(4, packed, 2, (0, 2), 1, backend=backend)
+            for idx, value in expected.items():
+                assert (
+                    np.abs(result[0][idx] - value) < 1e-10
+                ), f"{backend} result {result[0][idx]} of cell {idx} is not {value}."
+
+
+def test_entangled_entropy_core_batch():
+    """Test the entangled_entropy_core_batch function."""
+
+    degrees = [test_items[2] for test_items in test_setup_core]
+    batch = entangled_entropy_core_batch(
+        4096, large_dummy_list, degrees, (0, 8), backend="Python"
+    )
+
+    for degree, batch_result in zip(degrees, batch):
+        py = entangled_entropy_core(
+            4096, large_dummy_list, degree, (0, 8), backend="Python"
+        )
+        assert batch_result[1] == py[1], f"Partition of degree {degree} is not equal."
+        assert (
+            np.abs(
+                np.average(np.array(list(batch_result[0].values())))
+                - np.average(np.array(list(py[0].values())))
+            )
+            < 1e-10
+        ), f"Batch and Python results are not equal in degree {degree}."
+
+
+def test_random_unitary_batch():
+    """Test the batch Haar random unitary sampler and its conversions."""
+
+    unitaries = random_unitary_batch(50, 3, seed=2019)
+    assert unitaries.shape == (50, 3, 2, 2)
+    assert np.allclose(
+        np.einsum("...ji,...jk->...ik", unitaries.conj(), unitaries), np.eye(2)
+    ), "The sampled matrices are not unitary."
+    assert np.array_equal(
+        unitaries, random_unitary_batch(50, 3, seed=2019)
+    ), "The sampling is not reproducible with the same seed."
+
+    randomized = batch_pauli_coeff((0, 3), unitaries)
+    for i in range(50):
+        for j in range(3):
+            assert np.allclose(
+                randomized[i][j], qubit_operator_to_pauli_coeff(unitaries[i, j])
+            ), f"Pauli coefficients of draw {i} qubit {j} are not equal."
+
+    for (theta, phi, lam), unitary in zip(
+        unitary_to_u_angles(unitaries).reshape(-1, 3), unitaries.reshape(-1, 2, 2)
+    ):
+        u_gate = np.array(
+            [
+                [np.cos(theta / 2), -np.exp(1j * lam) * np.sin(theta / 2)],
+                [
+                    np.exp(1j * phi) * np.sin(theta / 2),
+                    np.exp(1j * (phi + lam)) * np.cos(theta / 2),
+                ],
+            ]
+        )
+        overlap = np.trace(u_gate.conj().T @ unitary) / 2
+        assert np.isclose(np.abs(overlap), 1.0), "U gate is not equal up to phase."
+
+
+def test_local_unitary_sampled_counts():
+    """Test the counts sampled from the statevector rotated by local unitary layers."""
+
+    wave = QuantumCircuit(4)
+    wave.h(0)
+    wave.cx(0, 1)
+    wave.ry(0.7, 2)
+    wave.cx(2, 3)
+    state = Statevector(wave)
+    unitaries = random_unitary_batch(3, 3, seed=2019)
+    unitary_loc, measure, shots = (1, 4), (1, 3), 200000
+
+    counts = local_unitary_sampled_counts(
+        state.data, unitaries, unitary_loc, measure, shots, seed=2019
+    )
+    assert counts == local_unitary_sampled_counts(
+        state.data, unitaries, unitary_loc, measure, shots, seed=2019, batch_elements=1
+    ), "The counts are not equal between the chunks of layers."
+
+    for draw, single_counts in zip(unitaries, counts):
+        layer = QuantumCircuit(4)
+        for j in range(*unitary_loc):
+            layer.unitary(draw[j - unitary_loc[0]], [j])
+        exact = state.evolve(layer).probabilities_dict(qargs=list(range(*measure)))
+        assert sum(single_counts.values()) == shots
+        for bits, prob in exact.items():
+            assert (
+                np.abs(single_counts.get(bits, 0) / shots - prob) < 1e-2
+            ), f"The sampled probability of '{bits}' is not close to the exact one."
+
+
+def test_partial_trace_purity():
+    """Test the exact purity of subsystem from the statevector."""
+
+    state = random_statevector(2**6, seed=2019)
+    for subsystem in [(0, 1), (0, 3), (2, 5), (1, 6), (0, 6)]:
+        traced_out = [q for q in range(6) if q not in range(*subsystem)]
+        expected = partial_trace(state, traced_out).purity().real
+        assert np.isclose(
+            partial_trace_purity(state.data, subsystem), expected
+        ), f"The purity of subsystem {subsystem} is not equal to the one from Qiskit."
+
+    exact = exact_entangled_entropy(state.data, 2, (1, 5))
+    assert exact["subsystem"] == (1, 2)
+    assert np.isclose(exact["purity"], partial_trace_purity(state.data, (1, 3)))
+
+
+def test_exact_entangled_entropy_cycling():
+    """Test the exact purity of the cycling subsystem inside a partial measure range."""
+
+    state = random_statevector(2**6, seed=2019)
+    density_matrix = DensityMatrix(state)
+    # The bitstring of measure (1, 5) is from qubit 4 to qubit 1,
+    # so the cycling range (-1, 1) is the last and the first of bitstring, qubit 1 and 4.
+    for bitstring_range, subsystem in [
+        ((-1, 1), (1, 4)),
+        ((-2, 1), (1, 2, 4)),
+        ((-3, -1), (2, 3)),
+        ((1, 3), (2, 3)),
+    ]:
+        assert bitstring_range_qubits(bitstring_range, (1, 5)) == subsystem
+        traced_out = [q for q in range(6) if q not in subsystem]
+        expected = partial_trace(density_matrix, traced_out).purity().real
+        assert np.isclose(
+            partial_trace_purity(state.data, list(subsystem)), expected
+        ), f"The purity of bitstring range {bitstring_range} is not equal to Qiskit."
+
+    for degree in [(-1, 1), (1, 3), 3]:
+        exact = exact_entangled_entropy(state.data, degree, (1, 5))
+        traced_out = [q for q in range(6) if q not in exact["subsystem"]]
+        expected = partial_trace(density_matrix, traced_out).purity().real
+        assert all(1 <= q < 5 for q in exact["subsystem"])
+        assert np.isclose(
+            exact["purity"], expected
+        ), f"The exact purity of degree {degree} is not equal to the one from Qiskit."